@@ -1,97 +1,63 @@
 from .types import *
 
 # sub mod
-from . import credentials
-from . import retry
-from . import signer
-from . import transport
 from . import models
 from . import exceptions
-from . import checkpoint
 
-# all types in models
-from .models.enums import *
-from .models.service import *
-from .models.region import *
-from .models.bucket_basic import *
-from .models.object_basic import *
-from .models.access_point import *
-from .models.bucket_access_monitor import *
-from .models.bucket_archive_direct_read import *
-from .models.bucket_cname import *
-from .models.bucket_lifecycle import *
-from .models.bucket_cors import *
-from .models.bucket_policy import *
-from .models.bucket_encryption import *
-from .models.bucket_logging import *
-from .models.bucket_inventory import *
-from .models.bucket_website import *
-from .models.bucket_replication import *
-from .models.bucket_referer import *
-from .models.bucket_worm import *
-from .models.bucket_request_payment import *
-from .models.access_point_public_access_block import *
-from .models.bucket_data_redundancy_transition import *
-from .models.bucket_transfer_acceleration import *
-from .models.bucket_public_access_block import *
-from .models.public_access_block import *
-from .models.bucket_resource_group import *
-from .models.bucket_style import *
-from .models.bucket_tags import *
-from .models.bucket_meta_query import *
-from .models.bucket_https_config import *
-from .models.cloud_box import *
-from .models.select_object import *
-from .models.bucket_overwrite_config import *
-from .models.object_worm import *
-from .models.bucket_object_worm_configuration import *
-from .models.data_process import *
+# The submodules below and the names exported from them are imported on the first access (PEP 562),
+# so `import alibabacloud_oss_v2` only loads the modules which are used.
+from ._lazy import attach as _attach
 
-from .config import Config
-from .client import Client
+_submodules = [
+    'credentials',
+    'retry',
+    'signer',
+    'transport',
+    'checkpoint',
+    'operations',
+    'crypto',
+    'tables',
+    'vectors',
+    'aio',
+]
 
-# If the Crypto(pycryptodome) module was not imported, the encryption feature is not supported.
-try:
-    from . import crypto
-    from .encryption_client import EncryptionClient, EncryptionMultiPartContext
-except ImportError:
-    pass
+_import_structure = {
+    # all types in models
+    **{f'models.{k}': v for k, v in models._import_structure.items()},  # pylint: disable=protected-access
 
-from .downloader import (
-    Downloader,
-    DownloadResult,
-    DownloadError,
-)
-
-from .uploader import (
-    Uploader,
-    UploadResult,
-    UploadError
-)
+    # CaseInsensitiveDict comes from requests, which is loaded on the first access
+    'types': ['CaseInsensitiveDict'],
 
-from .copier import (
-    Copier,
-    CopyResult,
-    CopyError
-)
+    'config': ['Config'],
+    'client': ['Client'],
 
-from .paginator import (
-    ListObjectsPaginator,
-    ListObjectsV2Paginator,
-    ListObjectVersionsPaginator,
-    ListBucketsPaginator,
-    ListPartsPaginator,
-    ListMultipartUploadsPaginator
-)
+    # If the Crypto(pycryptodome) module was not installed, the encryption feature is not supported.
+    'encryption_client': ['EncryptionClient', 'EncryptionMultiPartContext'],
 
-from .filelike import (
-    AppendOnlyFile,
-    ReadOnlyFile,
-    PathError
-)
+    'downloader': ['Downloader', 'DownloadResult', 'DownloadError'],
+    'uploader': ['Uploader', 'UploadResult', 'UploadError'],
+    'copier': ['Copier', 'CopyResult', 'CopyError'],
+    'paginator': [
+        'ListObjectsPaginator',
+        'ListObjectsV2Paginator',
+        'ListObjectVersionsPaginator',
+        'ListBucketsPaginator',
+        'ListPartsPaginator',
+        'ListMultipartUploadsPaginator',
+    ],
+    'lister': ['ShardedLister', 'ListShard'],
+    'filelike': ['AppendOnlyFile', 'ReadOnlyFile', 'PathError'],
+    'io_utils': ['StreamBodyDiscarder'],
+    'progress': ['ThrottledProgress', 'ProgressStats'],
+    'columnar': ['ObjectBatch'],
+    'hedge': ['HedgePolicy'],
+}
 
-from .io_utils import (
-    StreamBodyDiscarder
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=_submodules,
+    structure=_import_structure,
+    optional=['crypto', 'encryption_client', 'aio'],
 )
 
 from ._version import VERSION
@@ -2,7 +2,7 @@ import copy
 import time
 import base64
 import re
-from typing import Any, Optional, Dict, Iterable, List, Union, cast, Tuple, Iterator
+from typing import Any, Optional, Dict, Iterable, List, Mapping, Union, cast, Tuple, Iterator
 from urllib.parse import urlparse, ParseResult, urlencode, quote
 from xml.etree import ElementTree as ET
 import json
@@ -17,6 +17,7 @@ from . import io_utils
 from . import endpoints
 from .signer import SignerV4, SignerV1
 from .credentials import AnonymousCredentialsProvider
+from .hedge import HedgePolicy
 from .config import Config
 from .types import (
     Retryer,
@@ -112,6 +113,8 @@ class _Options:
         additional_headers: Optional[List[str]] = None,
         operation_timeout: Optional[Union[int, float]] = None,
         endpoint_provider: Optional[EndpointProvider] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        progress_flush_size: Optional[int] = None,
     ) -> None:
         self.product = product
         self.region = region
@@ -130,6 +133,8 @@ class _Options:
         self.additional_headers = additional_headers
         self.operation_timeout = operation_timeout
         self.endpoint_provider = endpoint_provider
+        self.hedge_policy = hedge_policy
+        self.progress_flush_size = progress_flush_size
 
 class _InnerOptions:
     """client runtime's information."""
@@ -180,6 +185,8 @@ class _ClientImplMixIn:
         options.readwrite_timeout = kwargs.get("readwrite_timeout", options.readwrite_timeout)
         options.auth_method = kwargs.get("auth_method", None)
         options.additional_headers = kwargs.get("additional_headers", options.additional_headers)
+        options.hedge_policy = kwargs.get("hedge_policy", options.hedge_policy)
+        options.progress_flush_size = kwargs.get("progress_flush_size", options.progress_flush_size)
 
 
     def resolve_operation_kwargs(self, options: _Options, **kwargs):
@@ -194,6 +201,8 @@ class _ClientImplMixIn:
         options.readwrite_timeout = kwargs.get("readwrite_timeout", options.readwrite_timeout)
         options.auth_method = kwargs.get("auth_method", options.auth_method)
         options.operation_timeout = kwargs.get("operation_timeout", None)
+        options.hedge_policy = kwargs.get("hedge_policy", options.hedge_policy)
+        options.progress_flush_size = kwargs.get("progress_flush_size", options.progress_flush_size)
 
     def verify_operation(self, op_input: OperationInput, options: _Options) -> None:
         """verify input and options"""
@@ -230,7 +239,12 @@ class _ClientImplMixIn:
             url = _build_url(op_input, options)
 
         # queries
-        if op_input.parameters is not None:
+        encoded_query = None
+        if '?' not in url:
+            encoded_query = _encode_query(op_input.parameters)
+            if len(encoded_query) > 0:
+                url = url + "?" + '&'.join(f'{k}={v}' for k, v in encoded_query)
+        elif op_input.parameters is not None:
             query = urlencode(op_input.parameters, quote_via=quote)
             if len(query) > 0:
                 url = url + "?" + query
@@ -254,6 +268,8 @@ class _ClientImplMixIn:
                 for t in tracker:
                     if hasattr(t, 'write'):
                         writers.append(t)
+                    if options.progress_flush_size is not None and hasattr(t, 'flush_size'):
+                        t.flush_size = options.progress_flush_size
                 if len(writers) > 0:
                     body = io_utils.TeeIterator.from_source(body, writers)
 
@@ -278,6 +294,8 @@ class _ClientImplMixIn:
             context.expiration_time = expiration_time
 
         context.sub_resource = op_input.op_metadata.get("sub-resource", [])
+        context.encoded_url = url
+        context.encoded_query = encoded_query
 
         return context
 
@@ -401,6 +419,8 @@ class _SyncClientImpl(_ClientImplMixIn):
             options.response_stream = stream
 
     def _sent_request(self, op_input: OperationInput, options: _Options) -> OperationOutput:
+        if options.hedge_policy is not None and not options.hedge_policy.is_hedgeable(op_input):
+            options.hedge_policy = None
         context = self.build_request_context(op_input, options, self._inner)
         response = self._sent_http_request(context, options)
         output = OperationOutput(
@@ -436,6 +456,7 @@ class _SyncClientImpl(_ClientImplMixIn):
 
         reset_time = context.signing_time is None
         error: Optional[Exception] = None
+        retry_tokens = 0
         response: HttpResponse = None
         for tries in range(max_attempts):
             if tries > 0:
@@ -455,12 +476,21 @@ class _SyncClientImpl(_ClientImplMixIn):
                 if dealline is not None and (time.time() > dealline):
                     break
 
+            delay = retryer.send_delay()
+            if delay > 0:
+                time.sleep(delay)
+
             try:
                 error = None
-                response = self._sent_http_request_once(context, options)
+                if options.hedge_policy is not None:
+                    response = self._sent_http_request_hedged(context, options)
+                else:
+                    response = self._sent_http_request_once(context, options)
+                retryer.record_attempt(tries, None, retry_tokens)
                 break
             except Exception as e:
                 error = e
+                retryer.record_attempt(tries, error, retry_tokens)
 
             # operation timeout
             if dealline is not None and (time.time() > dealline):
@@ -472,11 +502,30 @@ class _SyncClientImpl(_ClientImplMixIn):
             if not retryer.is_error_retryable(error):
                 break
 
+            if tries + 1 < max_attempts:
+                # the tokens taken for the next attempt are put back if it succeeds
+                retry_tokens = retryer.acquire_retry(error)
+                if not retry_tokens:
+                    break
+
         if error is not None:
             raise error
 
         return response
 
+    def _sent_http_request_hedged(self, context: SigningContext, options: _Options) -> HttpResponse:
+        # the request is sent on this thread, the hedge is signed and sent by a thread of the policy
+        # with its own copy of the context and the request, taken before the request is signed
+        hedge_context = copy.copy(context)
+        hedge_context.request = copy.copy(context.request)
+        hedge_context.request.headers = context.request.headers.copy()
+        hedge_context.signed_headers = {}
+
+        def _attempt(index: int) -> HttpResponse:
+            return self._sent_http_request_once(hedge_context if index > 0 else context, options)
+
+        return options.hedge_policy.send(_attempt, lambda response: response.close())
+
     def _sent_http_request_once(self, context: SigningContext, options: _Options) -> HttpResponse:
         # sign request
         if not isinstance(options.credentials_provider, AnonymousCredentialsProvider):
@@ -617,6 +666,18 @@ def _resolve_cloud_box(config: Config, options: _Options) -> None:
 
 
 
+def _encode_query(parameters: Optional[Mapping[str, str]]) -> List[Tuple[str, str]]:
+    """Encodes the query parameters like urlencode(parameters, quote_via=quote)."""
+    if parameters is None:
+        return []
+    encoded = []
+    for k, v in parameters.items():
+        k = quote(k if isinstance(k, bytes) else str(k), safe='')
+        v = quote(v if isinstance(v, bytes) else str(v), safe='')
+        encoded.append((k, v))
+    return encoded
+
+
 def _build_url(op_input: OperationInput, options: _Options) -> str:
     host = ""
     paths = []
@@ -0,0 +1,92 @@
+"""Lazy loading of the submodules and their names (PEP 562)"""
+import sys
+import importlib
+import importlib.util
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def attach(
+    package: str,
+    submodules: Optional[Iterable[str]] = None,
+    structure: Optional[Dict[str, List[str]]] = None,
+    optional: Optional[Iterable[str]] = None,
+    aliases: Optional[Dict[str, str]] = None,
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Returns the __getattr__ and __dir__ functions of the package,
+    which import the submodules and their names on the first access.
+
+    Args:
+        package (str): The name of the package.
+        submodules (Iterable[str], optional): The submodules imported when they are accessed as the attributes.
+        structure (Dict[str, List[str]], optional): Maps the submodule (relative to the package, may be dotted)
+            to the names imported from it when they are accessed. If a name appears in several submodules,
+            the last one takes precedence, as the star imports do.
+        optional (Iterable[str], optional): The submodules which depend on the optional packages,
+            an ImportError raised by them is turned into an AttributeError,
+            so the missing feature looks like a missing attribute.
+        aliases (Dict[str, str], optional): Maps the names to the absolute names of the modules bound to them,
+            for the modules outside the package which used to be exported by the star imports.
+
+    Returns:
+        Tuple[Callable, Callable]: The __getattr__ and __dir__ functions.
+    """
+    submodules = set(submodules or [])
+    optional = set(optional or [])
+    aliases = dict(aliases or {})
+    names: Dict[str, str] = {}
+    for module, items in (structure or {}).items():
+        for item in items:
+            names[item] = module
+
+    def _import(module: str):
+        try:
+            return importlib.import_module(f'{package}.{module}')
+        except ImportError as err:
+            if module.split('.')[0] in optional:
+                raise AttributeError(f'module {package!r} has no attribute {module!r}, {err}') from err
+            raise
+
+    def __getattr__(name: str) -> Any:
+        if name in submodules:
+            return _import(name)
+
+        module = names.get(name)
+        if module is not None:
+            value = getattr(_import(module), name)
+            # cache the value, __getattr__ is not called for it any more
+            setattr(sys.modules[package], name, value)
+            return value
+
+        if name in aliases:
+            value = importlib.import_module(aliases[name])
+            setattr(sys.modules[package], name, value)
+            return value
+
+        if name == '__all__':
+            return _public_names()
+
+        # the other submodules, which used to be bound as the side effect of the eager imports
+        if not name.startswith('__') and importlib.util.find_spec(f'{package}.{name}') is not None:
+            return _import(name)
+
+        raise AttributeError(f'module {package!r} has no attribute {name!r}')
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | submodules | set(names) | set(aliases))
+
+    def _public_names() -> List[str]:
+        # the names of 'from package import *', the ones of the missing optional features are skipped
+        public = [n for n in vars(sys.modules[package]) if not n.startswith('_')]
+        for name, module in names.items():
+            if name in public:
+                continue
+            try:
+                __getattr__(name)
+            except AttributeError:
+                if module.split('.')[0] not in optional:
+                    raise
+                continue
+            public.append(name)
+        return public
+
+    return __getattr__, __dir__
@@ -1 +1,4 @@
 from .client import AsyncClient
+from .downloader import AsyncDownloader
+from .uploader import AsyncUploader
+from .copier import AsyncCopier
@@ -18,7 +18,8 @@ from .._client import (
     _ClientImplMixIn,
     _Options,
     _InnerOptions,
-    _build_url
+    _build_url,
+    _encode_query
 )
 from ..types import (
     AsyncHttpResponse,
@@ -184,7 +185,12 @@ class _AsyncClientImpl(_ClientImplMixIn):
         url = _build_url(op_input, options)
 
         # queries
-        if op_input.parameters is not None:
+        encoded_query = None
+        if '?' not in url:
+            encoded_query = _encode_query(op_input.parameters)
+            if len(encoded_query) > 0:
+                url = url + "?" + '&'.join(f'{k}={v}' for k, v in encoded_query)
+        elif op_input.parameters is not None:
             query = urlencode(op_input.parameters, quote_via=quote)
             if len(query) > 0:
                 url = url + "?" + query
@@ -208,6 +214,8 @@ class _AsyncClientImpl(_ClientImplMixIn):
                 for t in tracker:
                     if hasattr(t, 'write'):
                         writers.append(t)
+                    if options.progress_flush_size is not None and hasattr(t, 'flush_size'):
+                        t.flush_size = options.progress_flush_size
                 if len(writers) > 0:
                     body = aio_utils.TeeAsyncIterator.from_source(body, writers)
 
@@ -232,6 +240,8 @@ class _AsyncClientImpl(_ClientImplMixIn):
             context.expiration_time = expiration_time
 
         context.sub_resource = op_input.op_metadata.get("sub-resource", [])
+        context.encoded_url = url
+        context.encoded_query = encoded_query
 
         return context
 
@@ -272,6 +282,7 @@ class _AsyncClientImpl(_ClientImplMixIn):
 
         reset_time = context.signing_time is None
         error: Optional[Exception] = None
+        retry_tokens = 0
         response: AsyncHttpResponse = None
         for tries in range(max_attempts):
             if tries > 0:
@@ -291,12 +302,18 @@ class _AsyncClientImpl(_ClientImplMixIn):
                 if dealline is not None and (time.time() > dealline):
                     break                
 
+            delay = retryer.send_delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
             try:
                 error = None
                 response = await self._sent_http_request_once(context, options)
+                retryer.record_attempt(tries, None, retry_tokens)
                 break
             except Exception as e:
                 error = e
+                retryer.record_attempt(tries, error, retry_tokens)
 
             # operation timeout
             if dealline is not None and (time.time() > dealline):
@@ -308,6 +325,12 @@ class _AsyncClientImpl(_ClientImplMixIn):
             if not retryer.is_error_retryable(error):
                 break
 
+            if tries + 1 < max_attempts:
+                # the tokens taken for the next attempt are put back if it succeeds
+                retry_tokens = retryer.acquire_retry(error)
+                if not retry_tokens:
+                    break
+
         if error is not None:
             raise error
 
@@ -31,7 +31,11 @@ class TeeAsyncIterator:
         return self.aiter_bytes()
 
     async def __anext__(self):
-        d = await self.anext()
+        try:
+            d = await self.anext()
+        except StopAsyncIteration:
+            self.flush()
+            raise
         if self._writers is not None:
             for w in self._writers:
                 w.write(d)
@@ -50,6 +54,14 @@ class TeeAsyncIterator:
                 if hasattr(w, 'reset'):
                     w.reset()
 
+    def flush(self) -> None:
+        """Flushes the writers at the end of the data.
+        """
+        if self._writers is not None:
+            for w in self._writers:
+                if hasattr(w, 'flush'):
+                    w.flush()
+
     @staticmethod
     def from_source(source: Any, writers: List[Any], **kwargs: Any) -> "TeeAsyncIterator":
         """Converts source to TeeAsyncIterator
@@ -1,13 +1,18 @@
 # pylint: disable=line-too-long
 """Client used to interact with **Alibaba Cloud Object Storage Service (OSS)**."""
-from typing import Optional, Type
+import copy
+from typing import Optional, Type, AsyncIterator
 from types import TracebackType
 from ..config import Config
 from ..types import OperationInput, OperationOutput
 from .. import models
 from .. import exceptions
+from ..columnar import ObjectBatch
 from ._aioclient import _AsyncClientImpl
 from . import operations
+from .downloader import AsyncDownloader
+from .uploader import AsyncUploader
+from .copier import AsyncCopier
 from .paginator import (
     AsyncListObjectsPaginator,
     AsyncListObjectsV2Paginator,
@@ -184,6 +189,27 @@ class AsyncClient:
 
         return await operations.list_objects_v2(self._client, request, **kwargs)
 
+    async def list_objects_v2_columnar(self, request: models.ListObjectsV2Request, **kwargs
+                                       ) -> AsyncIterator[ObjectBatch]:
+        """
+        Lists all the objects in a bucket page by page,
+        each page is decoded into columns without creating ObjectProperties.
+
+        Args:
+            request (ListObjectsV2Request): Request parameters for ListObjectsV2 operation.
+
+        Yields:
+            ObjectBatch: The objects of a page in columns.
+        """
+        req = copy.copy(request)
+        while True:
+            batch = await operations.list_objects_v2_columnar(self._client, req, **kwargs)
+            yield batch
+
+            if not batch.result.is_truncated:
+                break
+            req.continuation_token = batch.result.next_continuation_token
+
     async def get_bucket_stat(self, request: models.GetBucketStatRequest, **kwargs
                         ) -> models.GetBucketStatResult:
         """
@@ -827,6 +853,57 @@ class AsyncClient:
         """
         return await presign_inner(self._client, request, **kwargs)
 
+    # transfer managers
+    def downloader(self, **kwargs) -> AsyncDownloader:
+        """Creates a downloader to download objects.
+
+        Args:
+            kwargs: Extra keyword arguments used to initialize the downloader.
+                - part_size (int): The part size. Default value: 6 MiB.
+                - parallel_num (int): The number of the download tasks in parallel. Default value: 3.
+                - block_size (int): The block size is the number of bytes it should read into memory. Default value: 16 KiB.
+                - use_temp_file (bool): Whether to use a temporary file when you download an object. A temporary file is used by default.
+                - enable_checkpoint (bool): Whether to enable checkpoint. Defaults to False.
+                - checkpoint_dir (str): The directory to store checkpoint.
+                - verify_data (bool): Whether to verify data when the download is resumed. Defaults to False.
+
+        Returns:
+            AsyncDownloader: a downloader instance.
+        """
+        return AsyncDownloader(self, **kwargs)
+
+    def uploader(self, **kwargs) -> AsyncUploader:
+        """Creates a uploader to upload data to server.
+
+        Args:
+            kwargs: Extra keyword arguments used to initialize the uploader.
+                - part_size (int): The part size. Default value: 6 MiB.
+                - parallel_num (int): The number of the upload tasks in parallel. Default value: 3.
+                - leave_parts_on_error (bool): Whether to retain the uploaded parts when an upload task fails. By default, the uploaded parts are not retained.
+                - enable_checkpoint (bool): Whether to enable checkpoint. Defaults to False.
+                - checkpoint_dir (str): The directory to store checkpoint.
+
+        Returns:
+            AsyncUploader: a uploader instance.
+        """
+        return AsyncUploader(self, **kwargs)
+
+    def copier(self, **kwargs) -> AsyncCopier:
+        """Creates a copier to copy source object to destination object.
+
+        Args:
+            kwargs: Extra keyword arguments used to initialize the copier.
+            - part_size (int): The part size. Default value: 64 MiB.
+            - parallel_num (int): The number of the copy tasks in parallel. Default value: 3.
+            - multipart_copy_threshold (int): The minimum object size for calling the multipart copy operation. Default value: 200 MiB.
+            - leave_parts_on_error (bool): Whether to retain the copied parts when an upload task fails. By default, the copied parts are not retained.
+            - disable_shallow_copy (bool): Whether to use shallow copy capability. Defaults to True.
+
+        Returns:
+            AsyncCopier: a copier instance.
+        """
+        return AsyncCopier(self, **kwargs)
+
     # paginator
     def list_objects_paginator(self, **kwargs) -> AsyncListObjectsPaginator:
         """Creates a paginator for ListObjects
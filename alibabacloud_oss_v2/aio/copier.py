@@ -0,0 +1,398 @@
+"""AsyncCopier for handling objects for copies."""
+# pylint: disable=line-too-long, broad-exception-caught
+import abc
+import asyncio
+import copy
+import datetime
+from typing import Any, Optional
+from .. import exceptions
+from .. import models
+from .. import validation
+from .. import utils
+from .. import defaults
+from ..serde import copy_request
+from ..copier import (
+    CopierOptions,
+    CopyResult,
+    _CopierDelegate,
+)
+
+
+class AsyncCopyAPIClient(abc.ABC):
+    """Abstract base class for async copier client."""
+
+    @abc.abstractmethod
+    async def copy_object(self, request: models.CopyObjectRequest, **kwargs) -> models.CopyObjectResult:
+        """Copies objects."""
+
+    @abc.abstractmethod
+    async def head_object(self, request: models.HeadObjectRequest, **kwargs) -> models.HeadObjectResult:
+        """Queries information about the object in a bucket."""
+
+    @abc.abstractmethod
+    async def initiate_multipart_upload(self, request: models.InitiateMultipartUploadRequest, **kwargs
+                    ) -> models.InitiateMultipartUploadResult:
+        """
+        Initiates a multipart upload task before you can upload data
+        in parts to Object Storage Service (OSS).
+        """
+
+    @abc.abstractmethod
+    async def upload_part_copy(self, request: models.UploadPartCopyRequest, **kwargs) -> models.UploadPartCopyResult:
+        """
+        You can call this operation to copy data from an existing object to upload a part
+        by adding a x-oss-copy-request header to UploadPart.
+        """
+
+    @abc.abstractmethod
+    async def complete_multipart_upload(self, request: models.CompleteMultipartUploadRequest, **kwargs
+                    ) -> models.CompleteMultipartUploadResult:
+        """
+        Completes the multipart upload task of an object after all parts
+        of the object are uploaded.
+        """
+
+    @abc.abstractmethod
+    async def abort_multipart_upload(self, request: models.AbortMultipartUploadRequest, **kwargs
+                    ) -> models.AbortMultipartUploadResult:
+        """
+        Cancels a multipart upload task and deletes the parts uploaded in the task.
+        """
+
+    @abc.abstractmethod
+    async def list_parts(self, request: models.ListPartsRequest, **kwargs
+                    ) -> models.ListPartsResult:
+        """
+        Lists all parts that are uploaded by using a specified upload ID.
+        """
+
+    @abc.abstractmethod
+    async def get_object_tagging(self, request: models.GetObjectTaggingRequest, **kwargs
+                    ) -> models.GetObjectTaggingResult:
+        """
+        You can call this operation to query the tags of an object.
+        """
+
+
+class AsyncCopier:
+    """AsyncCopier for handling objects for copies.
+    The parts are copied by asyncio tasks, at most parallel_num parts are in flight at the same time.
+    """
+
+    def __init__(
+        self,
+        client: AsyncCopyAPIClient,
+        **kwargs: Any
+    ) -> None:
+        """
+            client (AsyncCopyAPIClient): A agent that implements the CopyObject and Multipart Copy api.
+            kwargs: Extra keyword arguments.
+            - part_size (int, optional): The part size. Default value: 64 MiB.
+            - parallel_num (int, optional): The number of the upload tasks in parallel. Default value: 3.
+            - multipart_copy_threshold (int, optional): The minimum object size for calling the multipart copy operation.
+                Default value: 200 MiB.
+            - leave_parts_on_error (bool, optional): Specifies whether to retain the copied parts when an copy task fails.
+                By default, the copied parts are not retained.
+            - disable_shallow_copy (bool, optional): Specifies that the shallow copy capability is not used.
+                By default, the shallow copy capability is used.
+        """
+        part_size = kwargs.get('part_size', defaults.DEFAULT_COPY_PART_SIZE)
+        parallel_num = kwargs.get('parallel_num', defaults.DEFAULT_COPY_PARALLEL)
+        multipart_copy_threshold = kwargs.get('multipart_copy_threshold', defaults.DEFAULT_COPY_THRESHOLD)
+        leave_parts_on_error = kwargs.get('leave_parts_on_error', False)
+        disable_shallow_copy = kwargs.get('disable_shallow_copy', False)
+
+        self._client = client
+        self._options = CopierOptions(
+            part_size=part_size,
+            parallel_num=parallel_num,
+            multipart_copy_threshold=multipart_copy_threshold,
+            leave_parts_on_error=leave_parts_on_error,
+            disable_shallow_copy=disable_shallow_copy,
+        )
+
+        feature_flags = 0
+        if str(client) == '<OSSAsyncClient>':
+            feature_flags = client._client._options.feature_flags
+        self._feature_flags = feature_flags
+
+    async def copy(
+        self,
+        request: models.CopyObjectRequest,
+        **kwargs: Any
+    ) -> CopyResult:
+        """copy source object to destination object.
+
+        Args:
+            request (CopyObjectRequest): the request parameters for the copy operation.
+            kwargs: Extra keyword arguments.
+            - part_size (int, optional): The part size. Default value: 64 MiB.
+            - parallel_num (int, optional): The number of the upload tasks in parallel. Default value: 3.
+            - multipart_copy_threshold (int, optional): The minimum object size for calling the multipart copy operation.
+                Default value: 200 MiB.
+            - leave_parts_on_error (bool, optional): Specifies whether to retain the copied parts when an copy task fails.
+                By default, the copied parts are not retained.
+            - disable_shallow_copy (bool, optional): Specifies that the shallow copy capability is not used.
+                By default, the shallow copy capability is used.
+
+        Returns:
+            CopyResult: The result for the copy operation.
+        """
+        delegate = self._delegate(request, **kwargs)
+        await delegate.check_source()
+        delegate.apply_source()
+        return await delegate.copy()
+
+    def _delegate(
+        self,
+        request: models.CopyObjectRequest,
+        **kwargs: Any
+    ) -> "_AsyncCopierDelegate":
+
+        if not validation.is_valid_bucket_name(utils.safety_str(request.bucket)):
+            raise exceptions.ParamInvalidError(field='request.bucket')
+
+        if not validation.is_valid_object_name(utils.safety_str(request.key)):
+            raise exceptions.ParamInvalidError(field='request.key')
+
+        if not validation.is_valid_object_name(utils.safety_str(request.source_key)):
+            raise exceptions.ParamInvalidError(field='request.source_key')
+
+        options = copy.copy(self._options)
+        options.part_size = kwargs.get('part_size', self._options.part_size)
+        options.parallel_num = kwargs.get('parallel_num', self._options.parallel_num)
+        options.multipart_copy_threshold = kwargs.get('multipart_copy_threshold', self._options.multipart_copy_threshold)
+        options.leave_parts_on_error = kwargs.get('leave_parts_on_error', self._options.leave_parts_on_error)
+        options.disable_shallow_copy = kwargs.get('disable_shallow_copy', self._options.disable_shallow_copy)
+
+        if options.part_size <= 0:
+            options.part_size = defaults.DEFAULT_COPY_PART_SIZE
+
+        if options.parallel_num <= 0:
+            options.parallel_num = defaults.DEFAULT_COPY_PARALLEL
+
+        if options.multipart_copy_threshold <= 0:
+            options.multipart_copy_threshold = defaults.DEFAULT_COPY_THRESHOLD
+
+        delegate = _AsyncCopierDelegate(
+            base=self,
+            client=self._client,
+            request=request,
+            options=options,
+            metadata_prop=kwargs.get('metadata_properties', None),
+            tag_prop=kwargs.get('tag_properties', None)
+        )
+
+        return delegate
+
+
+class _AsyncCopierDelegate(_CopierDelegate):
+    def __init__(
+        self,
+        base: AsyncCopier,
+        client: AsyncCopyAPIClient,
+        request: models.CopyObjectRequest,
+        options: CopierOptions,
+        metadata_prop: Optional[models.HeadObjectResult] = None,
+        tag_prop: Optional[models.GetObjectTaggingResult] = None,
+    ) -> None:
+        super().__init__(base, client, request, options, metadata_prop, tag_prop)
+        # all the tasks run in one event loop, no lock is needed
+        self._progress_lock = None
+
+    async def check_source(self):
+        """
+        """
+        if self._metadata_prop is not None:
+            return
+
+        request = models.HeadObjectRequest()
+        copy_request(request, self._request)
+        if self._request.source_bucket is not None:
+            request.bucket = self._request.source_bucket
+        request.key = self._request.source_key
+        request.version_id = self._request.source_version_id
+        result = await self._client.head_object(request)
+        self._metadata_prop = result
+
+    async def copy(self) -> CopyResult:
+        """copy object
+        """
+        try:
+            if self._total_size <= self._options.multipart_copy_threshold:
+                return await self._single_copy()
+            elif self.can_use_shallow_copy():
+                return await self._shallow_copy()
+            return await self._multipart_copy()
+        except Exception as err:
+            raise self._wrap_error(self._upload_id, err)
+
+    async def _single_copy(self) -> CopyResult:
+        result = await self._client.copy_object(self._request)
+
+        self._update_progress(self._total_size)
+
+        ret = CopyResult(
+            etag=result.etag,
+            version_id=result.version_id,
+            hash_crc64=result.hash_crc64,
+        )
+        ret.status = result.status
+        ret.status_code = result.status_code
+        ret.request_id = result.request_id
+        ret.headers = result.headers
+
+        return ret
+
+    async def _shallow_copy(self) -> CopyResult:
+        # use signle copy first, if meets timeout, use multiCopy
+        starttime = datetime.datetime.now()
+        try:
+            result = await self._client.copy_object(self._request, readwrite_timeout=10, operation_timeout=30)
+        except Exception:
+            if (datetime.datetime.now() > starttime + datetime.timedelta(seconds=30)):
+                return await self._multipart_copy()
+            raise
+
+        self._update_progress(self._total_size)
+
+        ret = CopyResult(
+            etag=result.etag,
+            version_id=result.version_id,
+            hash_crc64=result.hash_crc64,
+        )
+        ret.status = result.status
+        ret.status_code = result.status_code
+        ret.request_id = result.request_id
+        ret.headers = result.headers
+
+        return ret
+
+    async def _multipart_copy(self) -> CopyResult:
+        # get tag prop if nesssessary
+        await self._get_tag_props()
+
+        # init the multipart
+        await self._init_upload()
+
+        # upload part
+        part_size = self._options.part_size
+        while self._total_size/part_size >= defaults.MAX_UPLOAD_PARTS:
+            part_size += self._options.part_size
+        self._options.part_size = part_size
+
+        sem = asyncio.Semaphore(self._options.parallel_num)
+        tasks = []
+        for part in self._iter_part():
+            await sem.acquire()
+            # When an error occurs, stop copy
+            if len(self._copy_errors) > 0:
+                sem.release()
+                break
+            tasks.append(asyncio.ensure_future(self._copy_part_task(sem, part)))
+
+        if len(tasks) > 0:
+            await asyncio.gather(*tasks)
+
+        # complete upload
+        cmresult: models.CompleteMultipartUploadResult = None
+        if len(self._copy_errors) == 0:
+            request = models.CompleteMultipartUploadRequest()
+            copy_request(request, self._request)
+            parts = sorted(self._copy_parts, key=lambda p: p.part_number)
+            request.upload_id = self._upload_id
+            request.complete_multipart_upload = models.CompleteMultipartUpload(parts=parts)
+            try:
+                cmresult = await self._client.complete_multipart_upload(request)
+            except Exception as err:
+                self._copy_errors.append(err)
+
+        # check last error
+        if len(self._copy_errors) > 0:
+            if not self._options.leave_parts_on_error:
+                try:
+                    abort_request = models.AbortMultipartUploadRequest()
+                    copy_request(abort_request, self._request)
+                    abort_request.upload_id = self._upload_id
+                    await self._client.abort_multipart_upload(abort_request)
+                except Exception as _:
+                    pass
+            raise self._copy_errors[-1]
+
+        self._assert_crc_same(cmresult.headers)
+
+        ret = CopyResult(
+            upload_id=self._upload_id,
+            etag=cmresult.etag,
+            version_id=cmresult.version_id,
+            hash_crc64=cmresult.hash_crc64,
+        )
+        ret.status = cmresult.status
+        ret.status_code = cmresult.status_code
+        ret.request_id = cmresult.request_id
+        ret.headers = cmresult.headers
+
+        return ret
+
+    async def _get_tag_props(self):
+        if self._tag_prop is not None:
+            return
+
+        if utils.safety_int(self._metadata_prop.tagging_count) <= 0:
+            return
+
+        # if directive is copy, get tags
+        directive = utils.safety_str(self._request.tagging_directive)
+        if directive == "" or directive.lower() == "copy":
+            request = models.GetObjectTaggingRequest()
+            copy_request(request, self._request)
+            if self._request.source_bucket is not None:
+                request.bucket = self._request.source_bucket
+            request.key = self._request.source_key
+            request.version_id = self._request.source_version_id
+            result = await self._client.get_object_tagging(request)
+            self._tag_prop = result
+
+    async def _init_upload(self):
+        request = models.InitiateMultipartUploadRequest()
+        copy_request(request, self._request)
+        self.overwrite_metadata_prop(request)
+        self.overwrite_tag_prop(request)
+        request.disable_auto_detect_mime_type = True
+
+        result = await self._client.initiate_multipart_upload(request)
+        self._upload_id = result.upload_id
+
+    async def _copy_part_task(self, sem: asyncio.Semaphore, part):
+        try:
+            self._update_upload_result(await self._copy_part(part))
+        finally:
+            sem.release()
+
+    async def _copy_part(self, part):
+        # When an error occurs, ignore other upload requests
+        if len(self._copy_errors) > 0:
+            return None
+
+        upload_id = part[0]
+        part_number = part[1]
+        source_range = part[2]
+        timeout = part[3]
+        part_size = part[4]
+        error: Exception = None
+        etag = None
+
+        try:
+            request = models.UploadPartCopyRequest()
+            copy_request(request, self._request)
+            request.part_number = part_number
+            request.upload_id = upload_id
+            request.source_range = source_range
+            result = await self._client.upload_part_copy(request, readwrite_timeout=timeout)
+            etag = result.etag
+
+            self._update_progress(part_size)
+        except Exception as err:
+            error = err
+
+        return part_number, etag, error
@@ -0,0 +1,336 @@
+"""AsyncDownloader for handling objects for downloads."""
+import abc
+import asyncio
+import copy
+import os
+from typing import Any, IO
+from .. import exceptions
+from .. import models
+from .. import validation
+from .. import utils
+from .. import defaults
+from ..serde import copy_request
+from ..downloader import (
+    DownloaderOptions,
+    DownloadResult,
+    _DownloaderDelegate,
+)
+
+
+class AsyncDownloadAPIClient(abc.ABC):
+    """Abstract base class for async downloader client."""
+
+    @abc.abstractmethod
+    async def head_object(self, request: models.HeadObjectRequest, **kwargs) -> models.HeadObjectResult:
+        """Queries information about the object in a bucket."""
+
+    @abc.abstractmethod
+    async def get_object(self, request: models.GetObjectRequest, **kwargs) -> models.GetObjectResult:
+        """
+        Queries an object. To call this operation, you must have read permissions on the object.
+        """
+
+
+class AsyncDownloader:
+    """AsyncDownloader for handling objects for downloads.
+    The parts are downloaded by asyncio tasks, at most parallel_num parts are in flight at the same time.
+    """
+
+    def __init__(
+        self,
+        client: AsyncDownloadAPIClient,
+        **kwargs: Any
+    ) -> None:
+        """
+            client (AsyncDownloadAPIClient): A agent that implements the HeadObject and GetObject api.
+            kwargs: Extra keyword arguments used to initialize the downloader.
+                - part_size (int): The part size. Default value: 6 MiB.
+                - parallel_num (int): The number of the download tasks in parallel. Default value: 3.
+                - block_size (int): The block size is the number of bytes it should read into memory. Default value: 16 KiB.
+                - use_temp_file (bool): Whether to use a temporary file when you download an object. A temporary file is used by default.
+                - enable_checkpoint (bool): Whether to enable checkpoint. Defaults to False.
+                - checkpoint_dir (str): The directory to store checkpoint.
+                - verify_data (bool): Whether to verify data when the download is resumed. Defaults to False.
+        """
+        part_size = kwargs.get('part_size', defaults.DEFAULT_DOWNLOAD_PART_SIZE)
+        parallel_num = kwargs.get('parallel_num', defaults.DEFAULT_DOWNLOAD_PARALLEL)
+        self._client = client
+        self._options = DownloaderOptions(
+            part_size=part_size,
+            parallel_num=parallel_num,
+            block_size=kwargs.get('block_size', None),
+            use_temp_file=kwargs.get('use_temp_file', None),
+            enable_checkpoint=kwargs.get('enable_checkpoint', None),
+            checkpoint_dir=kwargs.get('checkpoint_dir', None),
+            verify_data=kwargs.get('verify_data', None),
+        )
+
+        feature_flags = 0
+        if str(client) == '<OSSAsyncClient>':
+            feature_flags = client._client._options.feature_flags
+        self._feature_flags = feature_flags
+
+    async def download_file(
+        self,
+        request: models.GetObjectRequest,
+        filepath: str,
+        **kwargs: Any
+    ) -> DownloadResult:
+        """Downloads an object into a local file.
+
+        Args:
+            request (models.GetObjectRequest):  the request parameters for the download operation.
+            filepath (str): The path of a local file.
+            kwargs: Extra keyword arguments.
+                - part_size (int): The part size.
+                - parallel_num (int): The number of the download tasks in parallel.
+                - block_size (int): The block size is the number of bytes it should read into memory.
+                - use_temp_file (bool): Whether to use a temporary file when you download an object.
+                - enable_checkpoint (bool): Whether to enable checkpoint.
+                - checkpoint_dir (str): The directory to store checkpoint.
+                - verify_data (bool): Whether to verify data when the download is resumed.
+        Returns:
+            DownloadResult: The result for the download operation.
+        """
+        delegate = self._delegate(request, **kwargs)
+
+        await delegate.check_source()
+
+        delegate.check_destination(filepath)
+
+        delegate.adjust_range()
+
+        delegate.check_checkpoint()
+
+        with open(delegate.writer_filepath, 'ab') as _:
+            pass
+        with open(delegate.writer_filepath, 'rb+') as writer:
+
+            delegate.adjust_writer(writer)
+
+            delegate.update_crc_flag()
+
+            result = await delegate.download()
+
+            delegate.close_writer(writer)
+
+        return result
+
+    async def download_to(
+        self,
+        request: models.GetObjectRequest,
+        writer: IO[bytes],
+        **kwargs: Any
+    ) -> DownloadResult:
+        """Downloads an object into a stream.
+
+        Args:
+            request (models.GetObjectRequest):  the request parameters for the download operation.
+            writer (IO[bytes]): writes the data into writer
+            kwargs: Extra keyword arguments.
+                - part_size (int): The part size.
+                - parallel_num (int): The number of the download tasks in parallel.
+                - block_size (int): The block size is the number of bytes it should read into memory.
+        Returns:
+            DownloadResult: The result for the download operation.
+        """
+        delegate = self._delegate(request, **kwargs)
+
+        await delegate.check_source()
+
+        delegate.adjust_range()
+
+        delegate.adjust_writer(writer)
+
+        result = await delegate.download()
+
+        return result
+
+    def _delegate(
+        self,
+        request: models.GetObjectRequest,
+        **kwargs: Any
+    ) -> "_AsyncDownloaderDelegate":
+
+        if request is None:
+            raise exceptions.ParamNullError(field='request')
+
+        if not validation.is_valid_bucket_name(utils.safety_str(request.bucket)):
+            raise exceptions.ParamInvalidError(field='request.bucket')
+
+        if not validation.is_valid_object_name(utils.safety_str(request.key)):
+            raise exceptions.ParamInvalidError(field='request.key')
+
+        if request.range_header and not validation.is_valid_range(request.range_header):
+            raise exceptions.ParamNullError(field='request.range_header')
+
+        options = copy.copy(self._options)
+        options.part_size = kwargs.get('part_size', self._options.part_size)
+        options.parallel_num = kwargs.get('parallel_num', self._options.parallel_num)
+        options.block_size = kwargs.get('block_size', self._options.block_size)
+        options.use_temp_file = kwargs.get('use_temp_file', self._options.use_temp_file)
+        options.enable_checkpoint = kwargs.get('enable_checkpoint', self._options.enable_checkpoint)
+        options.checkpoint_dir = kwargs.get('checkpoint_dir', self._options.checkpoint_dir)
+        options.verify_data = kwargs.get('verify_data', self._options.verify_data)
+
+        if options.part_size <= 0:
+            options.part_size = defaults.DEFAULT_DOWNLOAD_PART_SIZE
+
+        if options.parallel_num <= 0:
+            options.parallel_num = defaults.DEFAULT_DOWNLOAD_PARALLEL
+
+        delegate = _AsyncDownloaderDelegate(
+            base=self,
+            client=self._client,
+            request=request,
+            options=options
+        )
+
+        return delegate
+
+
+class _AsyncDownloaderDelegate(_DownloaderDelegate):
+    def __init__(
+        self,
+        base: AsyncDownloader,
+        client: AsyncDownloadAPIClient,
+        request: models.GetObjectRequest,
+        options: DownloaderOptions,
+    ) -> None:
+        super().__init__(base, client, request, options)
+        # all the tasks run in one event loop, no lock is needed
+        self._writer_lock = None
+        self._progress_lock = None
+
+        # the finished parts which are waiting for the previous parts, key is the part's start
+        self._pending_results = {}
+        self._seek_on_write = False
+
+    async def check_source(self):
+        """check source
+        """
+        request = models.HeadObjectRequest(self._request.bucket, self._request.key)
+        copy_request(request, self._request)
+        result = await self._client.head_object(request)
+
+        self._size_in_bytes = result.content_length
+        self._modtime = result.last_modified
+        self._etag = result.etag
+        self._headers = result.headers
+
+    async def download(self) -> DownloadResult:
+        """Breakpoint download
+        """
+        parallel = self._options.parallel_num > 1
+        seekable = utils.is_seekable(self._writer)
+        if not seekable:
+            parallel = False
+        if self._epos - self._pos  <= self._options.part_size:
+            parallel = False
+
+        if parallel:
+            self._seek_on_write = True
+            sem = asyncio.Semaphore(self._options.parallel_num)
+            tasks = []
+            for start in self._iter_part_start():
+                await sem.acquire()
+                # When an error occurs, stop download
+                if len(self._download_errors) > 0:
+                    sem.release()
+                    break
+                tasks.append(asyncio.ensure_future(self._process_part_task(sem, start)))
+
+            if len(tasks) > 0:
+                await asyncio.gather(*tasks)
+        else:
+            if seekable:
+                self._writer.seek(self._pos - self._rstart, os.SEEK_SET)
+            for start in self._iter_part_start():
+                self._update_process_result(await self._process_part(start))
+                if len(self._download_errors) > 0:
+                    break
+
+        if len(self._download_errors) > 0:
+            raise self._wrap_error(self._download_errors[-1])
+
+        self._assert_crc_same()
+
+        return DownloadResult(written=self._written)
+
+    async def _process_part_task(self, sem: asyncio.Semaphore, start: int):
+        try:
+            result = await self._process_part(start)
+        finally:
+            sem.release()
+
+        if result is None:
+            return
+
+        if result[2] is not None:
+            self._download_errors.append(result[2])
+            return
+
+        # the crc and checkpoint must be updated in the order of the parts
+        self._pending_results[start] = result
+        while self._next_offset in self._pending_results:
+            self._update_process_result(self._pending_results.pop(self._next_offset))
+            if len(self._download_errors) > 0:
+                break
+
+    async def _process_part(self, start:int):
+        # When an error occurs, ignore other download requests
+        if len(self._download_errors) > 0:
+            return None
+
+        size = self._calc_part_size(start)
+        request = copy.copy(self._request)
+
+        got = 0
+        error: Exception = None
+
+        chash: "Crc64" = None
+        if self._calc_crc:
+            from ..crc import Crc64  # lazy import to avoid loading crcmod unless crc check is enabled
+            chash = Crc64(0)
+
+        while True:
+            request.range_header = f'bytes={start + got}-{start + size - 1}'
+            request.range_behavior = 'standard'
+
+            try:
+                result = await self._client.get_object(request)
+            except Exception as err:
+                error = err
+                break
+
+            kwargs = {}
+            if self._options.block_size:
+                kwargs['block_size'] = self._options.block_size
+
+            try:
+                gotlen = 0
+                async for d in await result.body.iter_bytes(**kwargs):
+                    l = len(d)
+                    if l > 0:
+                        self._write_to_stream(d, start + got)
+                        self._update_progress(l)
+                        got += l
+                        gotlen += l
+                        if chash:
+                            chash.update(d)
+
+                if result.content_length is not None and gotlen < result.content_length:
+                    if not result.body.is_closed:
+                        await result.body.close()
+                    continue
+                break
+            except Exception:
+                pass
+
+        return start, got, error, (chash.sum64() if chash else 0)
+
+    def _write_to_stream(self, data, start):
+        # seek and write are not interrupted by other tasks
+        if self._seek_on_write:
+            self._writer.seek(start - self._rstart)
+        self._writer.write(data)
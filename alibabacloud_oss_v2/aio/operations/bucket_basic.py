@@ -5,6 +5,7 @@ from ...types import OperationInput, CaseInsensitiveDict
 from ... import serde
 from ... import serde_utils
 from ... import models
+from ... import columnar
 from .._aioclient import _AsyncClientImpl
 
 
@@ -85,6 +86,7 @@ async def list_objects(client: _AsyncClientImpl, request: models.ListObjectsRequ
     Args:
         client (_AsyncClientImpl): A agent that sends the request.
         request (ListObjectsRequest): The request for the ListObjects operation.
+        compact (bool, optional): Whether to build the entries as ObjectRecord instead of the models.
 
     Returns:
         ListObjectsResult: The result for the ListObjects operation.
@@ -114,7 +116,8 @@ async def list_objects(client: _AsyncClientImpl, request: models.ListObjectsRequ
         result=models.ListObjectsResult(),
         op_output=op_output,
         custom_deserializer=[
-            serde.deserialize_output_xmlbody,
+            (serde_utils.deserialize_output_xmlbody_compact if kwargs.get('compact', False)
+             else serde.deserialize_output_xmlbody),
             serde_utils.deserialize_encode_type
         ],
     )
@@ -199,6 +202,7 @@ async def list_objects_v2(client: _AsyncClientImpl, request: models.ListObjectsV
     Args:
         client (_AsyncClientImpl): A agent that sends the request.
         request (ListObjectsV2Request): The request for the ListObjectsV2 operation.
+        compact (bool, optional): Whether to build the entries as ObjectRecord instead of the models.
 
     Returns:
         ListObjectsV2Result: The result for the ListObjectsV2 operation.
@@ -229,11 +233,54 @@ async def list_objects_v2(client: _AsyncClientImpl, request: models.ListObjectsV
         result=models.ListObjectsV2Result(),
         op_output=op_output,
         custom_deserializer=[
-            serde.deserialize_output_xmlbody,
+            (serde_utils.deserialize_output_xmlbody_compact if kwargs.get('compact', False)
+             else serde.deserialize_output_xmlbody_stream),
             serde_utils.deserialize_encode_type
         ],
     )
 
+async def list_objects_v2_columnar(client: _AsyncClientImpl, request: models.ListObjectsV2Request, **kwargs) -> columnar.ObjectBatch:
+    """
+    list objects asynchronously, the objects are decoded into columns without creating ObjectProperties.
+
+    Args:
+        client (_AsyncClientImpl): A agent that sends the request.
+        request (ListObjectsV2Request): The request for the ListObjectsV2 operation.
+
+    Returns:
+        ObjectBatch: The objects of the page in columns, its result field holds the result
+            for the ListObjectsV2 operation without the contents field.
+    """
+
+    op_input = serde.serialize_input(
+        request=request,
+        op_input=OperationInput(
+            op_name='ListObjectsV2',
+            method='GET',
+            headers=CaseInsensitiveDict({
+                'Content-Type': 'application/octet-stream',
+            }),
+            parameters={
+                'encoding-type': 'url',
+                'list-type': 2,
+            },
+            bucket=request.bucket,
+        ),
+        custom_serializer=[
+            serde_utils.add_content_md5
+        ]
+    )
+
+    op_output = await client.invoke_operation(op_input, **kwargs)
+
+    result = serde.deserialize_output(
+        result=models.ListObjectsV2Result(),
+        op_output=op_output,
+    )
+    batch = columnar.deserialize_output_object_batch(result, op_output)
+    serde_utils.deserialize_encode_type(result, op_output)
+    return batch
+
 async def get_bucket_stat(client: _AsyncClientImpl, request: models.GetBucketStatRequest, **kwargs) -> models.GetBucketStatResult:
     """
     GetBucketStat Queries the storage capacity of a specified bucket and the number of objects that are stored in the bucket.
@@ -431,6 +478,7 @@ async def list_object_versions(client: _AsyncClientImpl, request: models.ListObj
     Args:
         client (_AsyncClientImpl): A agent that sends the request.
         request (ListObjectVersionsRequest): The request for the ListObjectVersions operation.
+        compact (bool, optional): Whether to build the entries as ObjectVersionRecord instead of the models.
 
     Returns:
         ListObjectVersionsResult: The result for the ListObjectVersions operation.
@@ -461,7 +509,8 @@ async def list_object_versions(client: _AsyncClientImpl, request: models.ListObj
         result=models.ListObjectVersionsResult(),
         op_output=op_output,
         custom_deserializer=[
-            serde.deserialize_output_xmlbody,
+            (serde_utils.deserialize_output_xmlbody_compact if kwargs.get('compact', False)
+             else serde.deserialize_output_xmlbody_stream),
             serde_utils.deserialize_encode_type
         ],
     )
@@ -642,6 +642,7 @@ async def list_multipart_uploads(client: _AsyncClientImpl, request: models.ListM
     Args:
         client (_AsyncClientImpl): A agent that sends the request.
         request (ListMultipartUploadsRequest): The request for the ListMultipartUploads operation.
+        compact (bool, optional): Whether to build the entries as UploadRecord instead of the models.
 
     Returns:
         ListMultipartUploadsResult: The result for the ListMultipartUploads operation.
@@ -669,7 +670,8 @@ async def list_multipart_uploads(client: _AsyncClientImpl, request: models.ListM
         result=models.ListMultipartUploadsResult(),
         op_output=op_output,
         custom_deserializer=[
-            serde.deserialize_output_xmlbody,
+            (serde_utils.deserialize_output_xmlbody_compact if kwargs.get('compact', False)
+             else serde.deserialize_output_xmlbody_stream),
             serde_utils.deserialize_encode_type
         ],
     )
@@ -683,6 +685,7 @@ async def list_parts(client: _AsyncClientImpl, request: models.ListPartsRequest,
     Args:
         client (_AsyncClientImpl): A agent that sends the request.
         request (ListPartsRequest): The request for the ListParts operation.
+        compact (bool, optional): Whether to build the entries as PartRecord instead of the models.
 
     Returns:
         ListPartsResult: The result for the ListParts operation.
@@ -710,7 +713,8 @@ async def list_parts(client: _AsyncClientImpl, request: models.ListPartsRequest,
         result=models.ListPartsResult(),
         op_output=op_output,
         custom_deserializer=[
-            serde.deserialize_output_xmlbody,
+            (serde_utils.deserialize_output_xmlbody_compact if kwargs.get('compact', False)
+             else serde.deserialize_output_xmlbody_stream),
             serde_utils.deserialize_encode_type
         ],
     )
@@ -24,9 +24,11 @@ class AsyncListObjectsPaginator:
         """
             client (AsyncListObjectsAPIClient): A agent that sends the request.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as ObjectRecord instead of the models.
         """
         self._client = client
         self._limit = kwargs.get('limit', None)
+        self._compact = kwargs.get('compact', False)
 
     async def iter_page(self, request: models.ListObjectsRequest, **kwargs: Any) -> AsyncIterator[models.ListObjectsResult]:
         """Iterates over the objects.
@@ -34,11 +36,15 @@ class AsyncListObjectsPaginator:
         Args:
             request (models.ListObjectsRequest): The request for the ListObjects operation.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as ObjectRecord instead of the models.
 
         Yields:
             AsyncIterator[models.ListObjectsResult]: An async iterator of ListObjectsResult from the response
         """
         limit = kwargs.get('limit', self._limit)
+        compact = kwargs.get('compact', self._compact)
+        # the records are built by the deserializer, the models are not created
+        op_kwargs = {'compact': True} if compact else {}
         req = copy.copy(request)
         if limit is not None:
             req.max_keys = limit
@@ -47,7 +53,9 @@ class AsyncListObjectsPaginator:
         is_truncated = False
 
         while first_page or is_truncated:
-            result = await self._client.list_objects(req)
+            result = await self._client.list_objects(req, **op_kwargs)
+            if compact:
+                result.contents = models.ObjectRecord.as_records(result.contents)
             yield result
 
             first_page = False
@@ -77,9 +85,11 @@ class AsyncListObjectsV2Paginator:
         """
             client (AsyncListObjectsV2APIClient): A agent that sends the request.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as ObjectRecord instead of the models.
         """
         self._client = client
         self._limit = kwargs.get('limit', None)
+        self._compact = kwargs.get('compact', False)
 
     async def iter_page(self, request: models.ListObjectsV2Request, **kwargs: Any) -> AsyncIterator[models.ListObjectsV2Result]:
         """Iterates over the objects with v2.
@@ -87,11 +97,15 @@ class AsyncListObjectsV2Paginator:
         Args:
             request (models.ListObjectsV2Request): The request for the ListObjectsV2 operation.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as ObjectRecord instead of the models.
 
         Yields:
             AsyncIterator[models.ListObjectsV2Result]: An async iterator of ListObjectsV2Result from the response
         """
         limit = kwargs.get('limit', self._limit)
+        compact = kwargs.get('compact', self._compact)
+        # the records are built by the deserializer, the models are not created
+        op_kwargs = {'compact': True} if compact else {}
         req = copy.copy(request)
         if limit is not None:
             req.max_keys = limit
@@ -100,7 +114,9 @@ class AsyncListObjectsV2Paginator:
         is_truncated = False
 
         while first_page or is_truncated:
-            result = await self._client.list_objects_v2(req)
+            result = await self._client.list_objects_v2(req, **op_kwargs)
+            if compact:
+                result.contents = models.ObjectRecord.as_records(result.contents)
             yield result
 
             first_page = False
@@ -130,9 +146,11 @@ class AsyncListObjectVersionsPaginator:
         """
             client (AsyncListObjectVersionsAPIClient): A agent that sends the request.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as ObjectVersionRecord instead of the models.
         """
         self._client = client
         self._limit = kwargs.get('limit', None)
+        self._compact = kwargs.get('compact', False)
 
     async def iter_page(self, request: models.ListObjectVersionsRequest, **kwargs: Any) -> AsyncIterator[models.ListObjectVersionsResult]:
         """Iterates over the object versions.
@@ -140,11 +158,15 @@ class AsyncListObjectVersionsPaginator:
         Args:
             request (models.ListObjectVersionsRequest): The request for the ListObjectVersions operation.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as ObjectVersionRecord instead of the models.
 
         Yields:
             AsyncIterator[models.ListObjectVersionsResult]: An async iterator of ListObjectVersionsResult from the response
         """
         limit = kwargs.get('limit', self._limit)
+        compact = kwargs.get('compact', self._compact)
+        # the records are built by the deserializer, the models are not created
+        op_kwargs = {'compact': True} if compact else {}
         req = copy.copy(request)
         if limit is not None:
             req.max_keys = limit
@@ -153,7 +175,9 @@ class AsyncListObjectVersionsPaginator:
         is_truncated = False
 
         while first_page or is_truncated:
-            result = await self._client.list_object_versions(req)
+            result = await self._client.list_object_versions(req, **op_kwargs)
+            if compact:
+                result.version = models.ObjectVersionRecord.as_records(result.version)
             yield result
 
             first_page = False
@@ -237,9 +261,11 @@ class AsyncListPartsPaginator:
         """
             client (AsyncListPartsAPIClient): A agent that sends the request.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as PartRecord instead of the models.
         """
         self._client = client
         self._limit = kwargs.get('limit', None)
+        self._compact = kwargs.get('compact', False)
 
     async def iter_page(self, request: models.ListPartsRequest, **kwargs: Any) -> AsyncIterator[models.ListPartsResult]:
         """Iterates over the parts.
@@ -247,11 +273,15 @@ class AsyncListPartsPaginator:
         Args:
             request (models.ListPartsRequest): The request for the ListParts operation.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as PartRecord instead of the models.
 
         Yields:
             AsyncIterator[models.ListPartsResult]: An async iterator of ListPartsResult from the response
         """
         limit = kwargs.get('limit', self._limit)
+        compact = kwargs.get('compact', self._compact)
+        # the records are built by the deserializer, the models are not created
+        op_kwargs = {'compact': True} if compact else {}
         req = copy.copy(request)
         if limit is not None:
             req.max_parts = limit
@@ -260,7 +290,9 @@ class AsyncListPartsPaginator:
         is_truncated = False
 
         while first_page or is_truncated:
-            result = await self._client.list_parts(req)
+            result = await self._client.list_parts(req, **op_kwargs)
+            if compact:
+                result.parts = models.PartRecord.as_records(result.parts)
             yield result
 
             first_page = False
@@ -290,9 +322,11 @@ class AsyncListMultipartUploadsPaginator:
         """
             client (AsyncListMultipartUploadsAPIClient): A agent that sends the request.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as UploadRecord instead of the models.
         """
         self._client = client
         self._limit = kwargs.get('limit', None)
+        self._compact = kwargs.get('compact', False)
 
     async def iter_page(self, request: models.ListMultipartUploadsRequest, **kwargs: Any) -> AsyncIterator[models.ListMultipartUploadsResult]:
         """Iterates over the objects.
@@ -300,11 +334,15 @@ class AsyncListMultipartUploadsPaginator:
         Args:
             request (models.ListMultipartUploadsRequest): The request for the ListMultipartUploads operation.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as UploadRecord instead of the models.
 
         Yields:
             AsyncIterator[models.ListMultipartUploadsResult]: An async iterator of ListMultipartUploadsResult from the response
         """
         limit = kwargs.get('limit', self._limit)
+        compact = kwargs.get('compact', self._compact)
+        # the records are built by the deserializer, the models are not created
+        op_kwargs = {'compact': True} if compact else {}
         req = copy.copy(request)
         if limit is not None:
             req.max_uploads = limit
@@ -313,7 +351,9 @@ class AsyncListMultipartUploadsPaginator:
         is_truncated = False
 
         while first_page or is_truncated:
-            result = await self._client.list_multipart_uploads(req)
+            result = await self._client.list_multipart_uploads(req, **op_kwargs)
+            if compact:
+                result.uploads = models.UploadRecord.as_records(result.uploads)
             yield result
 
             first_page = False
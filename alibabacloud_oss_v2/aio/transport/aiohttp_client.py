@@ -15,6 +15,8 @@ from ...types import AsyncHttpClient, HttpRequest, AsyncHttpResponse
 from ... import exceptions
 from ... import defaults
 
+_UNSET = object()
+
 class _ResponseStopIteration(Exception):
     pass
 
@@ -166,8 +168,25 @@ class AioHttpClient(AsyncHttpClient):
     """
 
     def __init__(self, **kwargs) -> None:
+        """
+        Args:
+            session (aiohttp.ClientSession, optional): Client session to use instead of the default one,
+                the connection pool settings are ignored if it is set.
+            connector (aiohttp.BaseConnector, optional): Connector to use instead of the default one.
+                It can be shared by several clients, the clients do not close a shared connector.
+            max_connections (int, optional): The total number of simultaneous connections. Default value: 20.
+            max_connections_per_host (int, optional): The number of simultaneous connections to one endpoint.
+                0 means no limit. Default value: 0.
+            idle_connection_timeout (int|float, optional): The time in seconds an idle connection
+                is kept alive in the pool. Default value: 50.
+            dns_cache_ttl (int, optional): The time in seconds to cache the resolved addresses,
+                None means caching forever. Default value: 10.
+            happy_eyeballs_delay (float, optional): The delay in seconds before trying the next address
+                when connecting (RFC 8305), None disables it. aiohttp's default is used if it is not set.
+        """
         self.session_owner = False
         self.session = kwargs.get("session", None)
+        self.connector = kwargs.get("connector", None)
         # client's configuration
         self._connect_timeout = kwargs.get(
             "connect_timeout", defaults.DEFAULT_CONNECT_TIMEOUT)
@@ -175,6 +194,11 @@ class AioHttpClient(AsyncHttpClient):
             "readwrite_timeout", defaults.DEFAULT_READWRITE_TIMEOUT)
         self._max_connections = kwargs.get(
             "max_connections", defaults.DEFAULT_MAX_CONNECTIONS)
+        self._max_connections_per_host = kwargs.get("max_connections_per_host", 0)
+        self._idle_connection_timeout = kwargs.get(
+            "idle_connection_timeout", defaults.DEFAULT_IDLE_CONNECTION_TIMEOUT)
+        self._dns_cache_ttl = kwargs.get("dns_cache_ttl", defaults.DEFAULT_DNS_CACHE_TTL)
+        self._happy_eyeballs_delay = kwargs.get("happy_eyeballs_delay", _UNSET)
         self._verify = True
         if kwargs.get("insecure_skip_verify") is True:
             self._verify = False
@@ -194,9 +218,31 @@ class AioHttpClient(AsyncHttpClient):
     ) -> None:
         await self.close()
 
+    def _init_connector(self) -> aiohttp.BaseConnector:
+        """Init the connection pool, all the requests to the same endpoint share it.
+        """
+        connector_kwargs = {
+            "limit": self._max_connections,
+            "limit_per_host": self._max_connections_per_host,
+            "keepalive_timeout": self._idle_connection_timeout,
+            "ttl_dns_cache": self._dns_cache_ttl,
+        }
+        if not self._verify:
+            connector_kwargs["ssl"] = False
+        if self._happy_eyeballs_delay is not _UNSET:
+            # supported since aiohttp 3.10
+            connector_kwargs["happy_eyeballs_delay"] = self._happy_eyeballs_delay
+
+        return aiohttp.TCPConnector(**connector_kwargs)
+
     async def open(self):
         if not self.session:
             clientsession_kwargs = {}
+            if self.connector is not None:
+                clientsession_kwargs["connector"] = self.connector
+                clientsession_kwargs["connector_owner"] = False
+            else:
+                clientsession_kwargs["connector"] = self._init_connector()
             self.session = aiohttp.ClientSession(**clientsession_kwargs)
             self.session_owner = True
         self.session = cast(aiohttp.ClientSession, self.session)
@@ -208,6 +254,45 @@ class AioHttpClient(AsyncHttpClient):
             self.session_owner = False
             self.session = None
 
+    def pool_stats(self) -> MutableMapping[str, Any]:
+        """Returns the occupancy of the connection pool.
+
+        Returns:
+            MutableMapping[str, Any]: The pool's limits, the number of the connections in use (acquired)
+                and kept alive (idle), in total and per endpoint, the key of an endpoint is 'host:port'.
+        """
+        connector = self.session.connector if self.session else None
+        stats = {
+            "limit": self._max_connections,
+            "limit_per_host": self._max_connections_per_host,
+            "acquired": 0,
+            "idle": 0,
+            "hosts": {},
+        }
+        if connector is None:
+            return stats
+
+        stats["limit"] = connector.limit
+        stats["limit_per_host"] = connector.limit_per_host
+
+        hosts = {}
+        def _host_stats(key):
+            name = f'{key.host}:{key.port}'
+            if name not in hosts:
+                hosts[name] = {"acquired": 0, "idle": 0}
+            return hosts[name]
+
+        # aiohttp does not expose the pool's occupancy, read it from its internal state
+        for key, conns in getattr(connector, "_acquired_per_host", {}).items():
+            _host_stats(key)["acquired"] += len(conns)
+        for key, conns in getattr(connector, "_conns", {}).items():
+            _host_stats(key)["idle"] += len(conns)
+
+        stats["acquired"] = len(getattr(connector, "_acquired", ()))
+        stats["idle"] = sum(v["idle"] for v in hosts.values())
+        stats["hosts"] = hosts
+        return stats
+
     async def send(self, request: HttpRequest, **kwargs: Any) -> AsyncHttpResponse:
         await self.open()
         error: Optional[Exception] = None
@@ -0,0 +1,480 @@
+"""AsyncUploader for handling objects for uploads."""
+# pylint: disable=line-too-long, broad-exception-caught
+import abc
+import asyncio
+import copy
+from typing import Any, IO, List
+from .. import exceptions
+from .. import models
+from .. import validation
+from .. import utils
+from .. import io_utils
+from .. import defaults
+from ..serde import copy_request
+from ..uploader import (
+    UploaderOptions,
+    UploadResult,
+    _UploadContext,
+    _UploaderDelegate,
+)
+from .paginator import AsyncListPartsPaginator
+
+
+class AsyncUploadAPIClient(abc.ABC):
+    """Abstract base class for async uploader client."""
+
+    @abc.abstractmethod
+    async def put_object(self, request: models.PutObjectRequest, **kwargs) -> models.PutObjectResult:
+        """Uploads objects."""
+
+    @abc.abstractmethod
+    async def head_object(self, request: models.HeadObjectRequest, **kwargs) -> models.HeadObjectResult:
+        """Queries information about the object in a bucket."""
+
+    @abc.abstractmethod
+    async def initiate_multipart_upload(self, request: models.InitiateMultipartUploadRequest, **kwargs
+                    ) -> models.InitiateMultipartUploadResult:
+        """
+        Initiates a multipart upload task before you can upload data
+        in parts to Object Storage Service (OSS).
+        """
+
+    @abc.abstractmethod
+    async def upload_part(self, request: models.UploadPartRequest, **kwargs) -> models.UploadPartResult:
+        """
+        Call the UploadPart interface to upload data in blocks (parts)
+        based on the specified Object name and uploadId.
+        """
+
+    @abc.abstractmethod
+    async def complete_multipart_upload(self, request: models.CompleteMultipartUploadRequest, **kwargs
+                    ) -> models.CompleteMultipartUploadResult:
+        """
+        Completes the multipart upload task of an object after all parts
+        of the object are uploaded.
+        """
+
+    @abc.abstractmethod
+    async def abort_multipart_upload(self, request: models.AbortMultipartUploadRequest, **kwargs
+                    ) -> models.AbortMultipartUploadResult:
+        """
+        Cancels a multipart upload task and deletes the parts uploaded in the task.
+        """
+
+    @abc.abstractmethod
+    async def list_parts(self, request: models.ListPartsRequest, **kwargs
+                    ) -> models.ListPartsResult:
+        """
+        Lists all parts that are uploaded by using a specified upload ID.
+        """
+
+
+class AsyncUploader:
+    """AsyncUploader for handling objects for uploads.
+    The parts are uploaded by asyncio tasks, at most parallel_num parts are in flight at the same time.
+    """
+
+    def __init__(
+        self,
+        client: AsyncUploadAPIClient,
+        **kwargs: Any
+    ) -> None:
+        """
+            client (AsyncUploadAPIClient): A agent that implements the PutObject and Multipart Upload api.
+            kwargs: Extra keyword arguments used to initialize the uploader.
+                - part_size (int): The part size. Default value: 6 MiB.
+                - parallel_num (int): The number of the upload tasks in parallel. Default value: 3.
+                - leave_parts_on_error (bool): Whether to retain the uploaded parts when an upload task fails. By default, the uploaded parts are not retained.
+                - enable_checkpoint (bool): Whether to enable checkpoint. Defaults to False.
+                - checkpoint_dir (str): The directory to store checkpoint.
+        """
+        part_size = kwargs.get('part_size', defaults.DEFAULT_UPLOAD_PART_SIZE)
+        parallel_num = kwargs.get('parallel_num', defaults.DEFAULT_UPLOAD_PARALLEL)
+        leave_parts_on_error = kwargs.get('leave_parts_on_error', False)
+        self._client = client
+        self._options = UploaderOptions(
+            part_size=part_size,
+            parallel_num=parallel_num,
+            leave_parts_on_error=leave_parts_on_error,
+            enable_checkpoint=kwargs.get('enable_checkpoint', None),
+            checkpoint_dir=kwargs.get('checkpoint_dir', None),
+        )
+
+        feature_flags = 0
+        if str(client) == '<OSSAsyncClient>':
+            feature_flags = client._client._options.feature_flags
+        self._feature_flags = feature_flags
+        # there is no async encryption client
+        self._is_eclient = False
+
+    async def upload_file(
+        self,
+        request: models.PutObjectRequest,
+        filepath: str,
+        **kwargs: Any
+    ) -> UploadResult:
+        """Uploads a local file.
+
+        Args:
+            request (models.PutObjectRequest):  the request parameters for the upload operation.
+            filepath (str): The path of a local file.
+            kwargs: Extra keyword arguments.
+                - part_size (int): The part size.
+                - parallel_num (int): The number of the upload tasks in parallel.
+                - leave_parts_on_error (bool): Whether to retain the uploaded parts when an upload task fails.
+                - enable_checkpoint (bool): Whether to enable checkpoint.
+                - checkpoint_dir (str): The directory to store checkpoint.
+
+        Returns:
+            UploadResult: The result for the upload operation.
+        """
+        delegate = self._delegate(request, **kwargs)
+
+        delegate.check_source(filepath)
+
+        with open(delegate.reader_filepath, 'rb') as reader:
+
+            delegate.apply_source(reader)
+
+            delegate.check_checkpoint()
+
+            delegate.update_crc_flag()
+
+            await delegate.adjust_source()
+
+            result = await delegate.upload()
+
+            delegate.close_reader()
+
+        return result
+
+    async def upload_from(
+        self,
+        request: models.PutObjectRequest,
+        reader: IO[bytes],
+        **kwargs: Any
+    ) -> UploadResult:
+        """Uploads a stream.
+
+        Args:
+            request (models.PutObjectRequest):  The request parameters for the upload operation.
+            reader (IO[bytes]): The stream to be uploaded.
+            kwargs: Extra keyword arguments.
+                - part_size (int): The part size.
+                - parallel_num (int): The number of the upload tasks in parallel.
+                - leave_parts_on_error (bool): Whether to retain the uploaded parts when an upload task fails.
+        Returns:
+            UploadResult: The result for the upload operation.
+        """
+        delegate = self._delegate(request, **kwargs)
+        delegate.apply_source(reader)
+        delegate.update_crc_flag()
+        return await delegate.upload()
+
+    def _delegate(
+        self,
+        request: models.PutObjectRequest,
+        **kwargs: Any
+    ) -> "_AsyncUploaderDelegate":
+
+        if request is None:
+            raise exceptions.ParamNullError(field='request')
+
+        if not validation.is_valid_bucket_name(utils.safety_str(request.bucket)):
+            raise exceptions.ParamInvalidError(field='request.bucket')
+
+        if not validation.is_valid_object_name(utils.safety_str(request.key)):
+            raise exceptions.ParamInvalidError(field='request.key')
+
+        options = copy.copy(self._options)
+        options.part_size = kwargs.get('part_size', self._options.part_size)
+        options.parallel_num = kwargs.get('parallel_num', self._options.parallel_num)
+        options.leave_parts_on_error = kwargs.get('leave_parts_on_error', self._options.leave_parts_on_error)
+        options.enable_checkpoint = kwargs.get('enable_checkpoint', self._options.enable_checkpoint)
+        options.checkpoint_dir = kwargs.get('checkpoint_dir', self._options.checkpoint_dir)
+
+        if options.part_size <= 0:
+            options.part_size = defaults.DEFAULT_UPLOAD_PART_SIZE
+
+        if options.parallel_num <= 0:
+            options.parallel_num = defaults.DEFAULT_UPLOAD_PARALLEL
+
+        delegate = _AsyncUploaderDelegate(
+            base=self,
+            client=self._client,
+            request=request,
+            options=options
+        )
+
+        return delegate
+
+
+
+class _AsyncUploaderDelegate(_UploaderDelegate):
+    def __init__(
+        self,
+        base: AsyncUploader,
+        client: AsyncUploadAPIClient,
+        request: models.PutObjectRequest,
+        options: UploaderOptions,
+    ) -> None:
+        super().__init__(base, client, request, options)
+        # all the tasks run in one event loop, no lock is needed
+        self._progress_lock = None
+
+    async def adjust_source(self):
+        """	resume from upload id
+        """
+        if not self._upload_id:
+            return
+
+        uploaded_parts:List[models.UploadPart] = []
+        ccrc = 0
+
+        async for part in self._iter_uploaded_part():
+            uploaded_parts.append(models.UploadPart(part_number=part.part_number, etag=part.etag))
+            if self._check_crc and part.hash_crc64 is not None:
+                from ..crc import Crc64  # lazy import to avoid loading crcmod unless crc check is enabled
+                ccrc = Crc64.combine(ccrc, int(part.hash_crc64), part.size)
+
+        # If upload_id was cleared during iteration (error occurred), discard partial results
+        if not self._upload_id:
+            return
+
+        if len(uploaded_parts) == 0:
+            return
+
+        # update from upload's result
+        part_number = uploaded_parts[-1].part_number
+        next_offset = part_number * self._options.part_size
+
+        self._uploaded_parts = uploaded_parts
+        self._reader_pos = next_offset
+        self._part_number = part_number + 1
+        self._ccrc = ccrc
+        self._transferred = next_offset
+
+    async def upload(self) -> UploadResult:
+        """Breakpoint upload
+        """
+        if self._total_size >= 0 and self._total_size < self._options.part_size:
+            return await self._single_part()
+
+        return await self._multipart_part()
+
+    async def _single_part(self) -> UploadResult:
+        request = models.PutObjectRequest()
+        copy_request(request, self._request)
+        request.body = self._reader
+        if request.content_type is None:
+            request.content_type = self._get_content_type()
+
+        try:
+            result = await self._client.put_object(request)
+        except Exception as err:
+            raise self._wrap_error('', err)
+
+        ret = UploadResult(
+            etag=result.etag,
+            version_id=result.version_id,
+            hash_crc64=result.hash_crc64,
+        )
+        ret.status = result.status
+        ret.status_code = result.status_code
+        ret.request_id = result.request_id
+        ret.headers = result.headers
+
+        return ret
+
+    async def _multipart_part(self) -> UploadResult:
+        # init the multipart
+        try:
+            upload_ctx = await self._get_upload_context()
+        except Exception as err:
+            raise self._wrap_error('', err)
+
+        # update checkpoint
+        if self._checkpoint:
+            self._checkpoint.upload_id = upload_ctx.upload_id
+            self._checkpoint.dump()
+
+        # upload part, the semaphore is acquired before the part's body is read,
+        # so that at most parallel_num part buffers exist at the same time.
+        sem = asyncio.Semaphore(self._options.parallel_num)
+        tasks = []
+        # the parts finish out of order, their results are applied in part order
+        self._next_part_number = upload_ctx.start_num + 1
+        self._finished_parts = {}
+        parts = self._iter_part(upload_ctx)
+        while True:
+            await sem.acquire()
+            try:
+                part = await parts.__anext__()
+            except StopAsyncIteration:
+                sem.release()
+                break
+            tasks.append(asyncio.ensure_future(self._upload_part_task(sem, part)))
+
+        if len(tasks) > 0:
+            await asyncio.gather(*tasks)
+
+        # complete upload
+        cmresult: models.CompleteMultipartUploadResult = None
+        if len(self._upload_errors) == 0:
+            request = models.CompleteMultipartUploadRequest()
+            copy_request(request, self._request)
+            parts = sorted(self._uploaded_parts, key=lambda p: p.part_number)
+            request.upload_id = upload_ctx.upload_id
+            request.complete_multipart_upload = models.CompleteMultipartUpload(parts=parts)
+            try:
+                cmresult = await self._client.complete_multipart_upload(request)
+            except Exception as err:
+                self._upload_errors.append(err)
+
+        # check last error
+        if len(self._upload_errors) > 0:
+            if not self._options.leave_parts_on_error:
+                try:
+                    abort_request = models.AbortMultipartUploadRequest()
+                    copy_request(abort_request, self._request)
+                    abort_request.upload_id = upload_ctx.upload_id
+                    await self._client.abort_multipart_upload(abort_request)
+                except Exception as _:
+                    pass
+            raise self._wrap_error(upload_ctx.upload_id, self._upload_errors[-1])
+
+        self._assert_crc_same(cmresult.headers)
+
+        ret = UploadResult(
+            upload_id=upload_ctx.upload_id,
+            etag=cmresult.etag,
+            version_id=cmresult.version_id,
+            hash_crc64=cmresult.hash_crc64,
+        )
+        ret.status = cmresult.status
+        ret.status_code = cmresult.status_code
+        ret.request_id = cmresult.request_id
+        ret.headers = cmresult.headers
+
+        return ret
+
+    async def _get_upload_context(self) -> _UploadContext:
+        if self._upload_id and self._part_number is not None:
+            return _UploadContext(
+                upload_id=self._upload_id,
+                start_num=self._part_number - 1,
+            )
+
+        #if not exist or fail, create a new upload id
+        request = models.InitiateMultipartUploadRequest()
+        copy_request(request, self._request)
+        if request.content_type is None:
+            request.content_type = self._get_content_type()
+
+        result = await self._client.initiate_multipart_upload(request)
+
+        return _UploadContext(
+            upload_id=result.upload_id,
+            start_num=0,
+        )
+
+    async def _iter_part(self, upload_ctx: _UploadContext):
+        loop = asyncio.get_running_loop()
+        start_part_num = upload_ctx.start_num
+        reader = self._reader
+        if self._reader_seekable:
+            reader = io_utils.ReadAtReader(reader)
+
+        def next_body():
+            n = self._options.part_size
+            if self._reader_seekable:
+                bytes_left = self._total_size - self._reader_pos
+                if bytes_left < n:
+                    n = bytes_left
+                body = reader.read_at(self._reader_pos, n) if n > 0 else b''
+            else:
+                body = reader.read(n)
+
+            self._reader_pos += len(body)
+            return body
+
+        while len(self._upload_errors) == 0:
+            try:
+                # the reads of the source block, so they run in the default executor
+                body = await loop.run_in_executor(None, next_body)
+                if len(body) == 0:
+                    break
+            except Exception as err:
+                self._save_error(err)
+                break
+
+            start_part_num += 1
+            yield upload_ctx.upload_id, start_part_num, body
+
+    async def _upload_part_task(self, sem: asyncio.Semaphore, part):
+        try:
+            self._update_upload_result_in_order(part[1], await self._upload_part(part))
+        finally:
+            sem.release()
+
+    def _update_upload_result_in_order(self, part_number: int, result):
+        """Applies the results in part order, so that the crc64 of the parts is combined in order.
+        """
+        if result is not None and result[2] is not None:
+            self._update_upload_result(result)
+            return
+
+        self._finished_parts[part_number] = result
+        while self._next_part_number in self._finished_parts:
+            self._update_upload_result(self._finished_parts.pop(self._next_part_number))
+            self._next_part_number += 1
+
+    async def _upload_part(self, part):
+        # When an error occurs, ignore other upload requests
+        if len(self._upload_errors) > 0:
+            return None
+
+        upload_id = part[0]
+        part_number = part[1]
+        body = part[2]
+        error: Exception = None
+        etag = None
+        size = len(body)
+        hash_crc64 = None
+        try:
+            result = await self._client.upload_part(models.UploadPartRequest(
+                bucket=self._request.bucket,
+                key=self._request.key,
+                upload_id=upload_id,
+                part_number=part_number,
+                body=body,
+                request_payer=self._request.request_payer
+            ))
+            etag = result.etag
+            hash_crc64 = result.hash_crc64
+        except Exception as err:
+            error = err
+
+        return part_number, etag, error, hash_crc64, size
+
+    async def _iter_uploaded_part(self):
+        if self._upload_id is None:
+            return
+        try:
+            paginator = AsyncListPartsPaginator(self._client)
+            iterator = paginator.iter_page(models.ListPartsRequest(
+                bucket=self._request.bucket,
+                key=self._request.key,
+                request_payer=self._request.request_payer,
+                upload_id=self._upload_id,
+            ))
+            check_part_number = 1
+            async for page in iterator:
+                for part in page.parts:
+                    if (part.part_number != check_part_number or
+                        part.size != self._options.part_size):
+                        return
+                    yield part
+                    check_part_number += 1
+        except Exception:
+            self._upload_id = None
@@ -296,6 +296,8 @@ class UploadCheckpoint:
             },
         }
         self.upload_id = ''
+        # the envelope of the client side encryption, the content key is saved encrypted
+        self.cse_context = None
 
     def load(self):
         """load checkpoint from local file
@@ -345,6 +347,7 @@ class UploadCheckpoint:
                 return False
 
             self.upload_id = uploadid
+            self.cse_context = ucpid["UploadInfo"].get("CseContext", None)
 
             return True
         except Exception:
@@ -360,6 +363,8 @@ class UploadCheckpoint:
         self.cp_info["Data"]["UploadInfo"] = {
             "UploadId": self.upload_id,
         }
+        if self.cse_context is not None:
+            self.cp_info["Data"]["UploadInfo"]["CseContext"] = self.cse_context
         js = json.dumps(self.cp_info["Data"]).encode()
         h = hashlib.md5()
         h.update(js)
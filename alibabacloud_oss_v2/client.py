@@ -1,14 +1,17 @@
 # pylint: disable=line-too-long
 """Client used to interact with **Alibaba Cloud Object Storage Service (OSS)**."""
+# The annotations are not evaluated, so the model modules are imported only when they are used
+from __future__ import annotations
 import copy
-from typing import Optional
+from typing import Optional, Generator, Iterator
 from .config import Config
 from .types import OperationInput, OperationOutput
 from ._client import _SyncClientImpl
-from .defaults import FF_ENABLE_CRC64_CHECK_DOWNLOAD
+from .defaults import FF_ENABLE_CRC64_CHECK_DOWNLOAD, DEFAULT_PROGRESS_FLUSH_SIZE
 from . import models
 from . import operations
 from . import exceptions
+from . import utils
 from .downloader import Downloader
 from .uploader import Uploader
 from .copier import Copier
@@ -27,6 +30,8 @@ from .presigner import (
     presign_inner
 )
 from .filelike import AppendOnlyFile, ReadOnlyFile
+from .columnar import ObjectBatch
+from .lister import ShardedLister
 
 class Client:
     """Client
@@ -173,6 +178,45 @@ class Client:
 
         return operations.list_objects_v2(self._client, request, **kwargs)
 
+    def list_objects_v2_iter(self, request: models.ListObjectsV2Request, **kwargs
+                             ) -> Generator[models.ObjectProperties, None, models.ListObjectsV2Result]:
+        """
+        Lists the objects in a bucket, the objects are yielded one by one
+        while the response body is being read.
+
+        Args:
+            request (ListObjectsV2Request): Request parameters for ListObjectsV2 operation.
+
+        Yields:
+            ObjectProperties: The metadata of the objects in the page.
+
+        Returns:
+            ListObjectsV2Result: Response result for ListObjectsV2 operation without the contents field.
+        """
+
+        return operations.list_objects_v2_iter(self._client, request, **kwargs)
+
+    def list_objects_v2_columnar(self, request: models.ListObjectsV2Request, **kwargs
+                                 ) -> Iterator[ObjectBatch]:
+        """
+        Lists all the objects in a bucket page by page,
+        each page is decoded into columns without creating ObjectProperties.
+
+        Args:
+            request (ListObjectsV2Request): Request parameters for ListObjectsV2 operation.
+
+        Yields:
+            ObjectBatch: The objects of a page in columns.
+        """
+        req = copy.copy(request)
+        while True:
+            batch = operations.list_objects_v2_columnar(self._client, req, **kwargs)
+            yield batch
+
+            if not batch.result.is_truncated:
+                break
+            req.continuation_token = batch.result.next_continuation_token
+
     def get_bucket_stat(self, request: models.GetBucketStatRequest, **kwargs
                         ) -> models.GetBucketStatResult:
         """
@@ -757,6 +801,23 @@ class Client:
         """
         return ListMultipartUploadsPaginator(self, **kwargs)
 
+    def sharded_lister(self, **kwargs) -> ShardedLister:
+        """Creates a sharded lister to list the objects in parallel.
+
+        Args:
+            kwargs: Extra keyword arguments used to initialize the lister.
+                - parallel_num (int): The number of the list requests in parallel. Default value: 3.
+                - limit (int): The maximum number of items in the response.
+                - ordered (bool): Whether to yield the objects in lexicographic order. Default value: True.
+                - delimiter (str): The delimiter used to discover the shards. Default value: '/'.
+                - max_buffered_pages (int): The maximum number of the pages received ahead of the yielded ones.
+                - compact (bool): Whether to return the entries as ObjectRecord instead of the models.
+
+        Returns:
+            ShardedLister: a sharded lister instance.
+        """
+        return ShardedLister(self, **kwargs)
+
 
     # transfer managers
     def downloader(self, **kwargs) -> Downloader:
@@ -771,6 +832,7 @@ class Client:
                 - enable_checkpoint (bool): Whether to enable checkpoint. Defaults to False.
                 - checkpoint_dir (str): The directory to store checkpoint.
                 - verify_data (bool): Whether to verify data when the download is resumed. Defaults to False.
+                - use_pwrite (bool): Whether to write the parts at their own offsets with os.pwrite. Defaults to False.
 
         Returns:
             Downloader: a downloader instance.
@@ -823,17 +885,21 @@ class Client:
             create_parameter (AppendObjectRequest, optional): The parameters when the object is first generated, supports below
                 CacheControl, ContentEncoding, Expires, ContentType, ContentType, Metadata,SSE's parameters, Acl, StorageClass, Tagging.
                 If the object exists, ignore this parameters
+            enable_buffering (bool, optional): Whether to buffer the written data, and append them in batches.
+            buffer_size (int, optional): The buffered data are appended when they reach this size.
+            flush_interval (float, optional): The buffered data are appended when they are kept longer than this time in second.
+            enable_async_flush (bool, optional): Whether to append the buffered data in a background thread.
 
         Returns:
             AppendOnlyFile: _description_
         """
-        _ = kwargs
         return AppendOnlyFile(
             self,
             bucket=bucket,
             key=key,
             request_payer=request_payer,
-            create_parameter=create_parameter
+            create_parameter=create_parameter,
+            **kwargs
         )
 
     def open_file(self, bucket: str, key: str,
@@ -948,6 +1014,10 @@ class Client:
     def get_object_to_file(self, request: models.GetObjectRequest, filepath: str, **kwargs) -> models.GetObjectResult:
         """get an object to file
 
+        If the download fails in the middle, it is resumed from the last written offset
+        with a ranged request which must match the etag of the first response.
+        The crc64 of the whole object is checked across the attempts.
+
         Args:
             request (GetObjectRequest): Request parameters for GetObject operation.
             filepath (str): The path of the file to download.
@@ -957,7 +1027,10 @@ class Client:
         """
         prog = None
         if request.progress_fn:
-            prog = Progress(request.progress_fn, -1)
+            flush_size = kwargs.get('progress_flush_size', self._client._options.progress_flush_size)
+            if flush_size is None:
+                flush_size = DEFAULT_PROGRESS_FLUSH_SIZE
+            prog = Progress(request.progress_fn, -1, flush_size)
 
         chash = None
         if self._client.has_feature(FF_ENABLE_CRC64_CHECK_DOWNLOAD):
@@ -979,43 +1052,79 @@ class Client:
                     server_crc=scrc
                 )
 
-        def _get_object_to_file_no_retry(client: Client, request: models.GetObjectRequest, filepath: str, **kwargs):
-            with open(filepath, 'wb') as f:
-                err = None
-                result = client.get_object(request, **kwargs)
-                if prog:
-                    prog._total = result.content_length
-
-                try:
-                    for d in result.body.iter_bytes():
-                        f.write(d)
-                        if prog:
-                            prog.write(d)
-                        if chash:
-                            chash.write(d)
-                    _crc_checker(result.headers)
-                except Exception as e:
-                    err = e
-
-                result.body.close()
-                return result, err
-
-        result = None
-        err = None
-        for _ in range(1, self._client.get_retry_attempts()):
-            result, err = _get_object_to_file_no_retry(self, request, filepath, **kwargs)
-            if err is None:
-                break
-
+        # a failed download is resumed from the last written offset with a ranged request,
+        # the suffix ranges are downloaded again from the start
+        start, end = 0, -1
+        if request.range_header:
+            try:
+                start, end = utils.parse_http_range(request.range_header)
+            except ValueError:
+                start = -1
+
+        def _get_object_to_file_no_retry(client: Client, request: models.GetObjectRequest, f, written: int, **kwargs):
+            err = None
+            result = client.get_object(request, **kwargs)
+            if written > 0 and result.status_code != 206:
+                # the range is ignored, the whole object is downloaded again
+                written = _reset(f)
+            if prog and written == 0:
+                prog._total = result.content_length
+
+            try:
+                for d in result.body.iter_bytes():
+                    f.write(d)
+                    written += len(d)
+                    if prog:
+                        prog.write(d)
+                    if chash:
+                        chash.write(d)
+                _crc_checker(result.headers)
+            except Exception as e:
+                err = e
+
+            result.body.close()
+            return result, err, written
+
+        def _reset(f) -> int:
+            f.seek(0)
+            f.truncate()
             if prog:
                 prog.reset()
-
             if chash:
                 chash.reset()
+            return 0
+
+        result = None
+        err = None
+        etag = None
+        written = 0
+        with open(filepath, 'wb') as f:
+            for _ in range(1, self._client.get_retry_attempts()):
+                req = request
+                if written > 0:
+                    if start >= 0 and etag is not None and not isinstance(err, exceptions.InconsistentError):
+                        # the object must not be changed since the first response
+                        f.seek(written)
+                        f.truncate()
+                        req = copy.copy(request)
+                        req.range_header = f'bytes={start + written}-{end if end >= 0 else ""}'
+                        req.range_behavior = 'standard'
+                        req.if_match = etag
+                    else:
+                        written = _reset(f)
+
+                result, err, written = _get_object_to_file_no_retry(self, req, f, written, **kwargs)
+                if etag is None:
+                    etag = result.etag
+                if err is None:
+                    break
 
         if err is not None:
             raise err
 
+        if prog:
+            prog.flush()
+
         return result
 
 
@@ -0,0 +1,159 @@
+"""Columnar batches for the bulk listing APIs"""
+import sys
+import datetime
+import itertools
+from array import array
+from typing import Any, Dict, List, Optional, Iterable
+from urllib.parse import unquote
+from . import serde
+from .models import ListObjectsV2Result
+from .types import OperationOutput, HttpResponse
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_EPOCH_UTC = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MILLISECOND = datetime.timedelta(milliseconds=1)
+
+
+def _parse_epoch_ms(value: Optional[str]) -> int:
+    """Parses the ISO-8601 time into epoch milliseconds, -1 is returned for the missing value"""
+    if not value:
+        return -1
+    if value[-1] == 'Z':
+        try:
+            return (datetime.datetime.fromisoformat(value[:-1]) - _EPOCH) // _MILLISECOND
+        except ValueError:
+            pass
+    return (serde.deserialize_iso(value) - _EPOCH_UTC) // _MILLISECOND
+
+
+class ObjectBatch:
+    """A batch of the objects in columns, decoded from a page of the ListObjectsV2 response.
+
+    The sizes and the last modified times (epoch milliseconds) are int64 arrays,
+    -1 means the value is missing. The storage classes are interned.
+    """
+
+    def __init__(self, result: Optional[ListObjectsV2Result] = None) -> None:
+        """
+        Args:
+            result (ListObjectsV2Result, optional): The result of the page without the contents field.
+        """
+        self.result = result
+        self.keys: List[str] = []
+        self.sizes = array('q')
+        self.last_modified = array('q')
+        self.etags: List[str] = []
+        self.storage_classes: List[str] = []
+
+    @property
+    def num_rows(self) -> int:
+        """The number of the objects in the batch"""
+        return len(self.keys)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __repr__(self) -> str:
+        return f'<ObjectBatch rows: {len(self.keys)}>'
+
+    def to_pydict(self) -> Dict[str, List[Any]]:
+        """Returns the columns as lists"""
+        return {
+            'key': list(self.keys),
+            'size': self.sizes.tolist(),
+            'last_modified': self.last_modified.tolist(),
+            'etag': list(self.etags),
+            'storage_class': list(self.storage_classes),
+        }
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Returns the columns as numpy arrays, last_modified is in datetime64[ms]
+
+        It requires numpy.
+        """
+        import numpy  # pylint: disable=import-outside-toplevel
+        return {
+            'key': numpy.array(self.keys, dtype=object),
+            'size': numpy.array(self.sizes, dtype=numpy.int64),
+            'last_modified': numpy.array(self.last_modified, dtype=numpy.int64).view('datetime64[ms]'),
+            'etag': numpy.array(self.etags, dtype=object),
+            'storage_class': numpy.array(self.storage_classes, dtype=object),
+        }
+
+    def to_arrow(self) -> Any:
+        """Returns the columns as a pyarrow.RecordBatch, last_modified is timestamp[ms, tz=UTC]
+
+        It requires pyarrow.
+        """
+        import pyarrow  # pylint: disable=import-outside-toplevel
+        rows = len(self.keys)
+        return pyarrow.RecordBatch.from_arrays([
+            pyarrow.array(self.keys, type=pyarrow.string()),
+            pyarrow.Array.from_buffers(pyarrow.int64(), rows, [None, pyarrow.py_buffer(self.sizes)]),
+            pyarrow.Array.from_buffers(pyarrow.timestamp('ms', tz='UTC'), rows,
+                                       [None, pyarrow.py_buffer(self.last_modified)]),
+            pyarrow.array(self.etags, type=pyarrow.string()),
+            pyarrow.array(self.storage_classes, type=pyarrow.string()),
+        ], names=['key', 'size', 'last_modified', 'etag', 'storage_class'])
+
+
+def decode_object_batch(xml_chunks: Iterable[bytes], result: ListObjectsV2Result) -> ObjectBatch:
+    """Decodes the ListObjectsV2 response into an ObjectBatch,
+    the Contents elements are appended to the columns directly without creating ObjectProperties,
+    the other fields are set to the result.
+    """
+    batch = ObjectBatch(result)
+    keys = batch.keys
+    sizes = batch.sizes
+    last_modified = batch.last_modified
+    etags = batch.etags
+    storage_classes = batch.storage_classes
+
+    def _append(elem) -> None:
+        key = etag = storage_class = None
+        size = mtime = -1
+        for child in elem:
+            tag = child.tag
+            if tag == 'Key':
+                key = child.text
+            elif tag == 'Size':
+                if child.text:
+                    size = int(child.text)
+            elif tag == 'LastModified':
+                mtime = _parse_epoch_ms(child.text)
+            elif tag == 'ETag':
+                etag = child.text
+            elif tag == 'StorageClass':
+                if child.text is not None:
+                    storage_class = sys.intern(child.text)
+
+        keys.append(key)
+        sizes.append(size)
+        last_modified.append(mtime)
+        etags.append(etag)
+        storage_classes.append(storage_class)
+
+    for _ in serde.iter_deserialize_xml(xml_chunks, result, stream_attrs=['contents'],
+                                        converters={'contents': _append}):
+        pass
+
+    # the keys are decoded after the whole document, the EncodingType may follow the Contents
+    if result.encoding_type == 'url':
+        keys[:] = [unquote(k) if k is not None else None for k in keys]
+
+    return batch
+
+
+def deserialize_output_object_batch(result: ListObjectsV2Result, op_output: OperationOutput) -> ObjectBatch:
+    """Decodes the body of the ListObjectsV2 output into an ObjectBatch,
+    the body is fed to the parser chunk by chunk.
+    """
+    try:
+        chunks = (chunk for chunk in serde.iter_output_body(op_output) if len(chunk) > 0)
+        first = next(chunks, None)
+        if first is None:
+            return ObjectBatch(result)
+        return decode_object_batch(itertools.chain([first], chunks), result)
+    finally:
+        if isinstance(op_output.http_response, HttpResponse):
+            op_output.http_response.close()
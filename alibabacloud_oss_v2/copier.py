@@ -169,10 +169,13 @@ class Copier:
         )
 
         feature_flags = 0
+        http_client = None
         cstr = str(client)
         if cstr == '<OssClient>':
             feature_flags = client._client._options.feature_flags
+            http_client = client._client._options.http_client
         self._feature_flags = feature_flags
+        self._http_client = http_client
 
 
     def copy(
@@ -230,6 +233,10 @@ class Copier:
         if options.parallel_num <= 0:
             options.parallel_num = defaults.DEFAULT_COPY_PARALLEL
 
+        # each worker holds a connection
+        if hasattr(self._http_client, 'reserve_connections'):
+            self._http_client.reserve_connections(options.parallel_num)
+
         if options.multipart_copy_threshold <= 0:
             options.multipart_copy_threshold = defaults.DEFAULT_COPY_THRESHOLD
 
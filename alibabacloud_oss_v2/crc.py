@@ -1,7 +1,15 @@
 """crc utils"""
 
 import sys
-import crcmod
+import struct
+import threading
+
+try:
+    import crcmod
+    from crcmod.crcmod import _usingExtension as _CRCMOD_EXTENSION
+except ImportError:
+    crcmod = None
+    _CRCMOD_EXTENSION = False
 
 MAX_INT = sys.maxsize
 
@@ -79,48 +87,68 @@ def gf2_matrix_times(mat, vec):
     return summary
 
 
+# The operators which append 2^k zero bytes to a crc, keyed by (poly, rev).
+# They only depend on the polynomial, so they are computed once and shared by
+# all the combine calls, each combine call is O(log(len2)) matrix-vector products.
+_GF2_ZEROS_OPERATORS = {}
+_GF2_ZEROS_OPERATORS_LOCK = threading.Lock()
+
+
+def _gf2_zeros_operators(poly, rev, count):
+    """Returns at least count operators, the k-th one appends 2^k zero bytes."""
+    ops = _GF2_ZEROS_OPERATORS.get((poly, rev))
+    if ops is not None and len(ops) >= count:
+        return ops
+
+    with _GF2_ZEROS_OPERATORS_LOCK:
+        ops = list(_GF2_ZEROS_OPERATORS.get((poly, rev), []))
+        if len(ops) == 0:
+            even = [0] * GF2_DIM
+            odd = [0] * GF2_DIM
+            if (rev):
+                # put operator for one zero bit in odd
+                odd[0] = poly  # CRC-64 polynomial
+                row = 1
+                for n in range(1, GF2_DIM):
+                    odd[n] = row
+                    row <<= 1
+            else:
+                row = 2
+                for n in range(0, GF2_DIM - 1):
+                    odd[n] = row
+                    row <<= 1
+                odd[GF2_DIM - 1] = poly
+
+            # 2 bits, 4 bits, then one zero byte
+            gf2_matrix_square(even, odd)
+            gf2_matrix_square(odd, even)
+            gf2_matrix_square(even, odd)
+            ops.append(even)
+
+        while len(ops) < count:
+            square = [0] * GF2_DIM
+            gf2_matrix_square(square, ops[-1])
+            ops.append(square)
+
+        # publish a new list, readers without the lock never see a partial one
+        _GF2_ZEROS_OPERATORS[(poly, rev)] = ops
+
+    return ops
+
+
 def _combine64(poly, initCrc, rev, xorOut, crc1, crc2, len2):
     if len2 == 0:
         return crc1
 
-    even = [0] * GF2_DIM
-    odd = [0] * GF2_DIM
-
     crc1 ^= initCrc ^ xorOut
 
-    if (rev):
-        # put operator for one zero bit in odd
-        odd[0] = poly  # CRC-64 polynomial
-        row = 1
-        for n in range(1, GF2_DIM):
-            odd[n] = row
-            row <<= 1
-    else:
-        row = 2
-        for n in range(0, GF2_DIM - 1):
-            odd[n] = row
-            row <<= 1
-        odd[GF2_DIM - 1] = poly
-
-    gf2_matrix_square(even, odd)
-
-    gf2_matrix_square(odd, even)
-
-    while True:
-        gf2_matrix_square(even, odd)
-        if len2 & int(1):
-            crc1 = gf2_matrix_times(even, crc1)
+    ops = _gf2_zeros_operators(poly, rev, len2.bit_length())
+    k = 0
+    while len2:
+        if len2 & 1:
+            crc1 = gf2_matrix_times(ops[k], crc1)
         len2 >>= 1
-        if len2 == 0:
-            break
-
-        gf2_matrix_square(odd, even)
-        if len2 & int(1):
-            crc1 = gf2_matrix_times(odd, crc1)
-        len2 >>= 1
-
-        if len2 == 0:
-            break
+        k += 1
 
     crc1 ^= crc2
 
@@ -183,45 +211,189 @@ def _verifyParams(poly, initCrc, xorOut):
 _COMBINE_FUNC = mkCombineFun(0x142F0E1EBA9EA3693, 0, True, 0XFFFFFFFFFFFFFFFF)
 
 
+#-----------------------------------------------------------------------------
+# CRC-64/ECMA-182 engines.
+#
+# Every engine has the signature fun(crc, data) -> crc, the crc value is the one
+# returned by sum64(), that is, the shift register XORed with the final XOR value.
+#
+#  - crcmod: crcmod's C extension, used when it is available.
+#  - numpy:  slicing-by-8 tables applied to many lanes of the data at the same time,
+#            the lanes are merged with the gf2 shift operator.
+#  - table:  slicing-by-8 tables in pure python.
+#
+# crcmod without its C extension falls back to a per-byte python loop,
+# which is slower than the table engine, so it is never selected.
+
+_CRC64_POLY_REV = 0xC96C5795D7870F42
+_CRC64_XOROUT = 0xFFFFFFFFFFFFFFFF
+
+
+def _make_slicing_tables():
+    t0 = []
+    for b in range(256):
+        c = b
+        for _ in range(8):
+            c = (c >> 1) ^ _CRC64_POLY_REV if c & 1 else c >> 1
+        t0.append(c)
+    tables = [t0]
+    for _ in range(1, 8):
+        prev = tables[-1]
+        tables.append([(prev[b] >> 8) ^ t0[prev[b] & 0xFF] for b in range(256)])
+    return tables
+
+
+_SLICING_TABLES = _make_slicing_tables()
+
+
+def _crc64_update_table(crc, data):
+    t0, t1, t2, t3, t4, t5, t6, t7 = _SLICING_TABLES
+    mv = memoryview(data).cast('B')
+    n8 = len(mv) & ~7
+    c = crc ^ _CRC64_XOROUT
+    for (w,) in struct.iter_unpack('<Q', mv[:n8]):
+        c ^= w
+        c = (t7[c & 0xFF] ^ t6[(c >> 8) & 0xFF] ^ t5[(c >> 16) & 0xFF] ^ t4[(c >> 24) & 0xFF] ^
+             t3[(c >> 32) & 0xFF] ^ t2[(c >> 40) & 0xFF] ^ t1[(c >> 48) & 0xFF] ^ t0[c >> 56])
+    for x in mv[n8:]:
+        c = t0[(c ^ x) & 0xFF] ^ (c >> 8)
+    return c ^ _CRC64_XOROUT
+
+
+_crc64_update_crcmod = None
+if crcmod is not None:
+    _crcmod_fun = crcmod.mkCrcFun(0x142F0E1EBA9EA3693, initCrc=0, rev=True, xorOut=_CRC64_XOROUT)
+
+    def _crc64_update_crcmod(crc, data):
+        return _crcmod_fun(data, crc)
+
+
+# the bytes of each lane, and the lanes' number range of the numpy engine
+_NUMPY_LANE_SIZE = 1024
+_NUMPY_MIN_LANES = 64
+_NUMPY_MAX_LANES = 4096
+
+def _make_numpy_engine():
+    """Returns the numpy engine, or None if numpy is not installed."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    np_tables = [np.array(t, dtype=np.uint64) for t in _SLICING_TABLES]
+    np_mask = np.uint64(0xFF)
+    np_shifts = [np.uint64(8 * i) for i in range(8)]
+    merge_tables = {}
+
+    def _shift_tables(size):
+        """byte tables of the operator which appends size zero bytes to a shift register"""
+        tables = merge_tables.get(size)
+        if tables is not None:
+            return tables
+
+        # the lanes' sizes are always power of 2
+        op = _gf2_zeros_operators(_CRC64_POLY_REV, True, size.bit_length())[size.bit_length() - 1]
+
+        tables = []
+        for k in range(8):
+            t = [0] * 256
+            for b in range(1, 256):
+                low = (b & -b).bit_length() - 1
+                t[b] = t[b & (b - 1)] ^ op[8 * k + low]
+            tables.append(np.array(t, dtype=np.uint64))
+        merge_tables[size] = tables
+        return tables
+
+    def _crc64_update_numpy(crc, data):
+        mv = memoryview(data).cast('B')
+        n0, n1, n2, n3, n4, n5, n6, n7 = np_tables
+        mask = np_mask
+        _, s8, s16, s24, s32, s40, s48, s56 = np_shifts
+        c = crc ^ _CRC64_XOROUT
+        pos = 0
+        while len(mv) - pos >= _NUMPY_LANE_SIZE * _NUMPY_MIN_LANES:
+            lanes = min((len(mv) - pos) // _NUMPY_LANE_SIZE, _NUMPY_MAX_LANES)
+            lanes = 1 << (lanes.bit_length() - 1)
+            words = np.frombuffer(mv, dtype='<u8', count=lanes * _NUMPY_LANE_SIZE // 8, offset=pos)
+            # one row per step, one column per lane
+            rows = words.reshape(lanes, _NUMPY_LANE_SIZE // 8).T.copy()
+            regs = np.zeros(lanes, dtype=np.uint64)
+            regs[0] = c
+            for row in rows:
+                v = regs ^ row
+                regs = (n7[v & mask] ^ n6[(v >> s8) & mask] ^ n5[(v >> s16) & mask] ^ n4[(v >> s24) & mask] ^
+                        n3[(v >> s32) & mask] ^ n2[(v >> s40) & mask] ^ n1[(v >> s48) & mask] ^ n0[v >> s56])
+
+            # merge the neighbouring lanes, crc(a + b) = shift(crc(a), len(b)) ^ crc(b)
+            size = _NUMPY_LANE_SIZE
+            while len(regs) > 1:
+                tables = _shift_tables(size)
+                v = regs[0::2]
+                merged = tables[0][v & mask]
+                for k in range(1, 8):
+                    merged ^= tables[k][(v >> np_shifts[k]) & mask]
+                regs = merged ^ regs[1::2]
+                size *= 2
+
+            c = int(regs[0])
+            pos += lanes * _NUMPY_LANE_SIZE
+
+        return _crc64_update_table(c ^ _CRC64_XOROUT, mv[pos:])
+
+    return _crc64_update_numpy
+
+
+def _probe_crc64_engine():
+    """Picks the fastest crc64 engine in the current environment."""
+    if _CRCMOD_EXTENSION:
+        return 'crcmod', _crc64_update_crcmod
+    fun = _make_numpy_engine()
+    if fun is not None:
+        return 'numpy', fun
+    return 'table', _crc64_update_table
+
+
+# The name of the crc64 engine in use, one of 'crcmod', 'numpy' and 'table'.
+CRC64_ENGINE, _CRC64_UPDATE = _probe_crc64_engine()
+
+
 class Crc64:
     """Compute a CRC based on the ECMA-182 standard. """
 
     def __init__(self, init_crc: int) -> None:
         """Create a new crc64 hash instance."""
-        self._crc = crcmod.Crc(0x142F0E1EBA9EA3693,
-                               initCrc=init_crc,
-                               rev=True,
-                               xorOut=0XFFFFFFFFFFFFFFFF)
+        self._init_crc = init_crc & _CRC64_XOROUT
+        self._crc = self._init_crc
 
     def update(self, data) -> None:
         """Update the current CRC value using the string specified as the data
         parameter.
         """
-        self._crc.update(data)
+        self._crc = _CRC64_UPDATE(self._crc, data)
 
     def digest(self):
         """Return the digest of the bytes passed to the update() method so far.
         """
-        return self._crc.digest()
+        return self._crc.to_bytes(8, 'big')
 
     def hexdigest(self):
         """Return digest() as hexadecimal string.
         """
-        return self._crc.hexdigest()
+        return f'{self._crc:016X}'
 
     def reset(self):
         """Resets the hash object to its initial state."""
-        self._crc.crcValue = self._crc.initCrc
+        self._crc = self._init_crc
 
     def sum64(self):
         """Return CRC64 value as int."""
-        return self._crc.crcValue
+        return self._crc
 
     def write(self, data: bytes):
         """Update the current CRC value using the string specified as the data
         parameter.
         """
-        self._crc.update(data)
+        self._crc = _CRC64_UPDATE(self._crc, data)
 
     @staticmethod
     def combine(crc1, crc2, size) -> int:
@@ -234,6 +406,8 @@ class Crc32(object):
     _XOROUT = 0xFFFFFFFF
 
     def __init__(self, init_crc=0):
+        if crcmod is None:
+            raise ImportError('crc32 requires crcmod')
         self.crc32 = crcmod.Crc(self._POLY, initCrc=init_crc, rev=True, xorOut=self._XOROUT)
 
     def __call__(self, data):
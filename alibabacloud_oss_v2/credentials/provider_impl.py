@@ -1,7 +1,11 @@
 import os
-from typing import Optional, Callable
+import time
+import datetime
+import threading
+from typing import Optional, Callable, Union
 from ..types import Credentials, CredentialsProvider
 from ..exceptions import CredentialsEmptyError
+from .. import defaults
 
 
 class AnonymousCredentialsProvider(CredentialsProvider):
@@ -69,3 +73,111 @@ class CredentialsProviderFunc(CredentialsProvider):
 
     def get_credentials(self) -> Credentials:
         return self._func()
+
+
+class RefreshingCredentialsProvider(CredentialsProvider):
+    """Caches the credentials and refreshes them before they expire.
+
+    The cached credentials are returned without locking until they come within refresh_ahead seconds
+    of the expiration, then one background thread fetches the new ones while the cached ones keep being
+    returned. A caller waits for the fetch only when the credentials are missing or have expired.
+    If the lifetime of the credentials is shorter than refresh_ahead, the refresh starts at the half
+    of their lifetime. The credentials without expiration are cached forever.
+    """
+
+    def __init__(
+        self,
+        fetcher: Union[Callable[[], Credentials], CredentialsProvider],
+        refresh_ahead: Optional[float] = None,
+        retry_interval: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            fetcher (Callable | CredentialsProvider): The function or the provider that fetches the credentials.
+            refresh_ahead (float, optional): The seconds before the expiration when the refresh starts.
+                Default value: 300.
+            retry_interval (float, optional): The seconds to wait before the next background refresh
+                after a failed one. Default value: 10.
+        """
+        if isinstance(fetcher, CredentialsProvider):
+            fetcher = fetcher.get_credentials
+        self._fetcher = fetcher
+        self._refresh_ahead = refresh_ahead if refresh_ahead is not None else defaults.DEFAULT_CREDENTIALS_REFRESH_AHEAD
+        self._retry_interval = retry_interval if retry_interval is not None else defaults.DEFAULT_CREDENTIALS_RETRY_INTERVAL
+        self._credentials: Optional[Credentials] = None
+        self._lock = threading.Lock()
+        self._next_refresh = 0.0
+        self._last_error: Optional[Exception] = None
+
+    @property
+    def last_error(self) -> Optional[Exception]:
+        """The error of the last failed background refresh"""
+        return self._last_error
+
+    def get_credentials(self) -> Credentials:
+        cred = self._credentials
+        if cred is not None:
+            remaining = _remaining_seconds(cred)
+            if remaining is None or remaining > self._refresh_ahead:
+                return cred
+            if remaining > 0:
+                self._refresh_in_background()
+                return cred
+
+        return self._refresh()
+
+    def _refresh(self) -> Credentials:
+        with self._lock:
+            # the credentials may have been refreshed by another caller while waiting
+            cred = self._credentials
+            if cred is not None and not cred.is_expired():
+                return cred
+            cred = self._fetch()
+            self._set_credentials(cred)
+            return cred
+
+    def _refresh_in_background(self) -> None:
+        if time.monotonic() < self._next_refresh:
+            return
+
+        if not self._lock.acquire(blocking=False):
+            # a refresh is in flight
+            return
+
+        def _run():
+            try:
+                self._set_credentials(self._fetch())
+            except Exception as err: # pylint: disable=broad-except
+                self._last_error = err
+                self._next_refresh = time.monotonic() + self._retry_interval
+            finally:
+                self._lock.release()
+
+        try:
+            threading.Thread(target=_run, name='oss-credentials-refresh', daemon=True).start()
+        except Exception:
+            self._lock.release()
+            raise
+
+    def _set_credentials(self, cred: Credentials) -> None:
+        remaining = _remaining_seconds(cred)
+        if remaining is not None:
+            # at least the half of the lifetime passes before the next refresh
+            self._next_refresh = time.monotonic() + max(remaining - self._refresh_ahead, remaining / 2)
+        self._credentials = cred
+        self._last_error = None
+
+    def _fetch(self) -> Credentials:
+        cred = self._fetcher()
+        if cred is None or not cred.has_keys():
+            raise CredentialsEmptyError()
+        return cred
+
+
+def _remaining_seconds(cred: Credentials) -> Optional[float]:
+    if cred.expiration is None:
+        return None
+    expiration = cred.expiration
+    if expiration.tzinfo is None:
+        expiration = expiration.replace(tzinfo=datetime.timezone.utc)
+    return (expiration - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
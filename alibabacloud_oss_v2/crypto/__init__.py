@@ -1,3 +1,4 @@
 
 from .types import *
-from .master_rsa_cipher import MasterRsaCipher
\ No newline at end of file
+from .master_rsa_cipher import MasterRsaCipher
+from .key_cache import ContentKeyCache
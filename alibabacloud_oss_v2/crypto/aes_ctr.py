@@ -1,10 +1,11 @@
 
 import struct
-from typing import Any, Iterator, Iterable, AnyStr
+from typing import Any, Iterator, Iterable, AnyStr, Optional
 from Crypto.Cipher import AES
 from Crypto.Util import Counter
 from Crypto import Random
 from ..types import StreamBody
+from .. import defaults
 from .types import CipherData
 
 _KEY_LEN = 32
@@ -18,22 +19,30 @@ def _iv_to_big_int(iv: bytes) -> int:
   
 class IteratorEncryptor():
     """Iterator Encryptor
+
+    The small pieces from the iterator are coalesced into a reusable buffer and encrypted
+    in chunks of chunk_size bytes, the pieces not smaller than chunk_size are encrypted as they are.
+    The CTR cipher keeps its key stream position between the calls, so the chunks need not be block aligned.
     """
 
     def __init__(
         self,
         iterator: Iterator,
         cipher_data: CipherData,
-        counter: int
+        counter: int,
+        chunk_size: Optional[int] = None
     ) -> None:
         self._iterator = iterator
         self._cipher_data = cipher_data
         self._counter = counter
+        self._chunk_size = chunk_size or defaults.DEFAULT_CRYPTO_CHUNK_SIZE
 
         ctr = Counter.new(_BLOCK_BITS_LEN, initial_value=self._counter)
         self._cipher =  AES.new(self._cipher_data.key, AES.MODE_CTR, counter=ctr)
         self._finished = False
-        self._remains_bytes = None
+        self._buffer = None
+        self._filled = 0
+        self._remains = None
 
     def __iter__(self):
         return self
@@ -43,34 +52,50 @@ class IteratorEncryptor():
         if self._finished:
             raise StopIteration
 
-        data = self._remains_bytes or b''
-        self._remains_bytes = None
-        try:
-            while True:
-                d = next(self._iterator)
+        while True:
+            if self._remains is not None:
+                d = self._remains
+                self._remains = None
+            else:
+                try:
+                    d = next(self._iterator)
+                except StopIteration as err:
+                    self._finished = True
+                    if self._filled > 0:
+                        return self._flush()
+                    raise err
                 if isinstance(d, int):
                     d = d.to_bytes()
                 elif isinstance(d, str):
                     d = d.encode()
-                if len(d) < _BLOCK_SIZE_LEN:
-                    data += d
-                else:
-                    if len(data) > 0:
-                        data += d
-                    else:
-                        data = d
-                if len(data) >= _BLOCK_SIZE_LEN:
-                    data_len = len(data)
-                    align_len = (data_len // _BLOCK_SIZE_LEN) * _BLOCK_SIZE_LEN
-                    edata = self._cipher.encrypt(data[:align_len])
-                    if data_len > align_len:
-                        self._remains_bytes = data[align_len:]
-                    return edata
-        except StopIteration as err:
-            self._finished = True
-            if len(data) > 0:
-                return self._cipher.encrypt(data)
-            raise err
+
+            n = len(d)
+            if n == 0:
+                continue
+
+            if self._filled == 0 and n >= self._chunk_size:
+                return self._cipher.encrypt(d)
+
+            if self._buffer is None:
+                self._buffer = memoryview(bytearray(self._chunk_size))
+
+            room = self._chunk_size - self._filled
+            if n < room:
+                self._buffer[self._filled:self._filled + n] = d
+                self._filled += n
+                continue
+
+            view = memoryview(d)
+            self._buffer[self._filled:] = view[:room]
+            self._filled = self._chunk_size
+            if n > room:
+                self._remains = view[room:]
+            return self._flush()
+
+    def _flush(self) -> bytes:
+        data = self._cipher.encrypt(self._buffer[:self._filled])
+        self._filled = 0
+        return data
 
 class IterableEncryptor():
     """Iterable Encryptor
@@ -80,17 +105,20 @@ class IterableEncryptor():
         self,
         iterable: Iterable,
         cipher_data: CipherData,
-        counter: int
+        counter: int,
+        chunk_size: Optional[int] = None
     ) -> None:
         self._iterable = iterable
         self._cipher_data = cipher_data
         self._counter = counter
+        self._chunk_size = chunk_size
 
     def __iter__(self):
         return IteratorEncryptor(
             iterator=iter(self._iterable),
             cipher_data=self._cipher_data,
-            counter=self._counter)
+            counter=self._counter,
+            chunk_size=self._chunk_size)
 
 class FileLikeEncryptor():
     """File Like Encryptor
@@ -197,7 +225,12 @@ class StreamBodyDecryptor(StreamBody):
     def iter_bytes(self, **kwargs: Any) -> Iterator[bytes]:
         cipher = self._get_cipher()
         for d in self._stream.iter_bytes(**kwargs):
-            yield cipher.decrypt(d)
+            if isinstance(d, bytearray):
+                # the writable chunks are decrypted in place
+                cipher.decrypt(d, output=d)
+                yield d
+            else:
+                yield cipher.decrypt(d)
 
     def _get_cipher(self):
         ctr = Counter.new(_BLOCK_BITS_LEN, initial_value=self._counter)
@@ -208,10 +241,12 @@ class _AesCtr:
     def __init__(
         self,
         cipher_data: CipherData,
-        offset: int
+        offset: int,
+        chunk_size: Optional[int] = None
     ):
         self.cipher_data = cipher_data
         self.offset = offset
+        self.chunk_size = chunk_size
         if not 0 == offset % _BLOCK_SIZE_LEN:
             raise ValueError('offset is not align to encrypt block')
         self.counter = _iv_to_big_int(cipher_data.iv) + offset//_BLOCK_SIZE_LEN
@@ -232,10 +267,12 @@ class _AesCtr:
             return FileLikeEncryptor(reader=src, cipher_data=self.cipher_data, offset=self.offset)
 
         if isinstance(src, Iterator):
-            return IteratorEncryptor(iterator=src, cipher_data=self.cipher_data, counter=self.counter)
+            return IteratorEncryptor(iterator=src, cipher_data=self.cipher_data, counter=self.counter,
+                                     chunk_size=self.chunk_size)
 
         if isinstance(src, Iterable):
-            return IterableEncryptor(iterable=src, cipher_data=self.cipher_data, counter=self.counter)
+            return IterableEncryptor(iterable=src, cipher_data=self.cipher_data, counter=self.counter,
+                                     chunk_size=self.chunk_size)
 
         raise TypeError(f'src is not str/bytes/file-like/Iterable type, got {type(src)}')
 
@@ -1,5 +1,5 @@
 
-from typing import Any
+from typing import Any, Optional
 from .types import (
     ContentCipherBuilder,
     MasterCipher,
@@ -8,15 +8,18 @@ from .types import (
     Envelope
 )
 from .aes_ctr import _AesCtr
+from .key_cache import ContentKeyCache
 
 class _AESCtrCipher(ContentCipher):
     def __init__(
         self,
         cipher_data: CipherData,
-        offset: int
+        offset: int,
+        chunk_size: Optional[int] = None
     ):
         self._cipher_data = cipher_data
-        self._cipher = _AesCtr(cipher_data, offset)
+        self._chunk_size = chunk_size
+        self._cipher = _AesCtr(cipher_data, offset, chunk_size=chunk_size)
 
     def encrypt_content(self, data: Any) -> Any:
         """encrypt content
@@ -34,7 +37,8 @@ class _AESCtrCipher(ContentCipher):
         """
         return _AESCtrCipher(
             cipher_data=self._cipher_data,
-            offset = kwargs.get("offset", 0)
+            offset = kwargs.get("offset", 0),
+            chunk_size=self._chunk_size
         )
 
     def get_encrypted_len(self, plain_text_len: int) -> int:
@@ -58,8 +62,12 @@ class AESCtrCipherBuilder(ContentCipherBuilder):
     def __init__(
         self,
         master_cipher: MasterCipher,
+        key_cache: Optional[ContentKeyCache] = None,
+        chunk_size: Optional[int] = None,
     ):
         self.master_cipher = master_cipher
+        self.key_cache = key_cache
+        self.chunk_size = chunk_size
 
     def content_cipher(self) -> ContentCipher:
         cd = self._create_cipher_data()
@@ -68,8 +76,13 @@ class AESCtrCipherBuilder(ContentCipherBuilder):
     def content_cipher_from_env(self, env: Envelope, **kwargs) -> ContentCipher:
         encrypted_key = env.cipher_key
         encrypted_iv = env.iv
-        key = self.master_cipher.decrypt(encrypted_key)
-        iv = self.master_cipher.decrypt(encrypted_iv)
+        if self.key_cache is not None:
+            key, iv = self.key_cache.get_or_unwrap(
+                (self.master_cipher, env.wrap_algorithm, encrypted_key, encrypted_iv),
+                lambda: (self.master_cipher.decrypt(encrypted_key), self.master_cipher.decrypt(encrypted_iv)))
+        else:
+            key = self.master_cipher.decrypt(encrypted_key)
+            iv = self.master_cipher.decrypt(encrypted_iv)
         offset = kwargs.get("offset", 0)
         return self._content_cipher_from_cd(
             CipherData(
@@ -102,4 +115,4 @@ class AESCtrCipherBuilder(ContentCipherBuilder):
         )
 
     def _content_cipher_from_cd(self, cd:CipherData, offset: int) -> ContentCipher:
-        return _AESCtrCipher(cipher_data=cd, offset=offset)
+        return _AESCtrCipher(cipher_data=cd, offset=offset, chunk_size=self.chunk_size)
@@ -0,0 +1,107 @@
+"""Cache of the unwrapped content keys"""
+import collections
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional, Tuple
+from .. import defaults
+
+
+class ContentKeyCache:
+    """ContentKeyCache keeps the content keys and ivs decrypted by the master cipher,
+    so the ranged reads of the same object decrypt its envelope only once.
+
+    The entries are keyed by the encrypted key and iv of the envelope, evicted in LRU order
+    when the cache is full, and expire after ttl seconds. If zero_on_evict is set,
+    the cached copies of the keys and ivs are overwritten with zeros when they are evicted.
+    The keys handed out are copies, so the ciphers in use are not affected.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+        zero_on_evict: bool = True,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
+        """
+        Args:
+            max_entries (int, optional): The maximum number of the cached keys, 0 disables the cache. Default value: 256.
+            ttl (float, optional): The seconds a key is kept after it is decrypted. Default value: 60.
+            zero_on_evict (bool, optional): Whether to overwrite the evicted keys with zeros. Default value: True.
+            clock (Callable[[], float], optional): The clock in second, time.monotonic by default.
+        """
+        self._max_entries = max_entries if max_entries is not None else defaults.DEFAULT_KEY_CACHE_MAX_ENTRIES
+        self._ttl = ttl if ttl is not None else defaults.DEFAULT_KEY_CACHE_TTL
+        self._zero_on_evict = zero_on_evict
+        self._clock = clock or time.monotonic
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """The number of the lookups which found the key"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of the lookups which did not find the key"""
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_unwrap(
+        self,
+        cache_key: Hashable,
+        unwrap: Callable[[], Tuple[bytes, bytes]],
+    ) -> Tuple[bytes, bytes]:
+        """Returns the cached key and iv, or unwraps and caches them.
+
+        Args:
+            cache_key (Hashable): The key of the entry, e.g. the master cipher and the encrypted key and iv.
+            unwrap (Callable[[], Tuple[bytes, bytes]]): Decrypts the key and iv.
+
+        Returns:
+            Tuple[bytes, bytes]: The content key and iv.
+        """
+        if self._max_entries <= 0:
+            return unwrap()
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                key, iv, expires = entry
+                if self._clock() < expires:
+                    self._entries.move_to_end(cache_key)
+                    self._hits += 1
+                    return bytes(key), bytes(iv)
+                self._evict(cache_key)
+            self._misses += 1
+
+        # the envelope is decrypted out of the lock, the concurrent misses of the same key may decrypt it twice
+        key, iv = unwrap()
+
+        with self._lock:
+            if cache_key in self._entries:
+                self._evict(cache_key)
+            self._entries[cache_key] = (bytearray(key), bytearray(iv), self._clock() + self._ttl)
+            while len(self._entries) > self._max_entries:
+                self._evict(next(iter(self._entries)))
+        return key, iv
+
+    def clear(self) -> None:
+        """Evicts all the keys"""
+        with self._lock:
+            for cache_key in list(self._entries):
+                self._evict(cache_key)
+
+    def _evict(self, cache_key: Any) -> None:
+        key, iv, _ = self._entries.pop(cache_key)
+        if self._zero_on_evict:
+            key[:] = bytes(len(key))
+            iv[:] = bytes(len(iv))
+
+    def __repr__(self) -> str:
+        return f'<ContentKeyCache entries: {len(self._entries)}, hits: {self._hits}, misses: {self._misses}>'
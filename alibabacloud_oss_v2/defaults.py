@@ -7,6 +7,9 @@ DEFAULT_READWRITE_TIMEOUT = 20
 # Default signature version is v4
 DEFAULT_SIGNATURE_VERSION = "v4"
 
+# The number of the v4 signing keys kept in the cache
+DEFAULT_SIGNING_KEY_CACHE_SIZE = 64
+
 # Product for signing
 DEFAULT_PRODUCT = "oss"
 
@@ -20,17 +23,47 @@ DEFAULT_MAX_ATTEMPTS = 3
 DEFAULT_MAX_BACKOFF_S = 20.0
 DEFAULT_BASE_DELAY_S = 0.2
 
+# Default number of tokens in the retry quota of AdaptiveRetryer
+DEFAULT_RETRY_QUOTA_CAPACITY = 500
+
+# Default tokens a retry takes from the retry quota
+DEFAULT_RETRY_QUOTA_RETRY_COST = 5
+
+# Default tokens a retry of a timeout or connection error takes from the retry quota
+DEFAULT_RETRY_QUOTA_TIMEOUT_COST = 10
+
+# Default tokens a request which succeeds at the first attempt puts back to the retry quota
+DEFAULT_RETRY_QUOTA_NO_RETRY_INCREMENT = 1
+
+# Default factor the send rate is multiplied by on a throttling error
+DEFAULT_RATE_LIMITER_BETA = 0.7
+
+# Default scale constant of the cubic growth of the send rate
+DEFAULT_RATE_LIMITER_SCALE_CONSTANT = 0.4
+
+# Default minimum send rate in requests per second
+DEFAULT_RATE_LIMITER_MIN_FILL_RATE = 0.5
+
+# Default weight of the newest measured send rate
+DEFAULT_RATE_LIMITER_SMOOTHING = 0.8
+
 DEFAULT_IDLE_CONNECTION_TIMEOUT = 50
 DEFAULT_KEEP_ALIVE_TIMEOUT = 30
 DEFAULT_EXPECT_CONTINUE_TIMEOUT = 30
 
 DEFAULT_MAX_CONNECTIONS = 20
 
+# The time in seconds to cache the resolved addresses of a host
+DEFAULT_DNS_CACHE_TTL = 10
+
 # TLS 1.2 for all HTTPS requests.
 # DEFAULT_TLS_MIN_VERSION = 1.2
 
 DEFAULT_BLOCK_SIZE = 16 * 1024
 
+# The size of the chunks fed to the incremental xml decoder, 64K
+DEFAULT_XML_CHUNK_SIZE = 64 * 1024
+
 # Default part size, 6M
 DEFAULT_PART_SIZE = 6 * 1024 * 1024
 
@@ -55,6 +88,24 @@ DEFAULT_DOWNLOAD_PARALLEL = DEFAULT_PARALLEL
 # Default parallel for copier copys object
 DEFAULT_COPY_PARALLEL = DEFAULT_PARALLEL
 
+# Default parallel for sharded lister lists objects
+DEFAULT_LIST_PARALLEL = DEFAULT_PARALLEL
+
+# Default maximum number of the pages listed with the delimiter to discover the shards
+DEFAULT_LIST_DISCOVERY_PAGES = 10
+
+# Upper bound of the parallel number when the transfer managers tune it automatically
+DEFAULT_AUTO_TUNE_MAX_PARALLEL = 16
+
+# Upper bound of the part size when the transfer managers tune it automatically, 64M
+DEFAULT_AUTO_TUNE_MAX_PART_SIZE = 64 * 1024 * 1024
+
+# The part size grows when a part takes less than this time, the unit is second
+DEFAULT_AUTO_TUNE_MIN_PART_LATENCY = 1.0
+
+# The part size shrinks when a part takes more than this time, the unit is second
+DEFAULT_AUTO_TUNE_MAX_PART_LATENCY = 10.0
+
 # Default prefetch threshold to swith to async read in ReadOnlyFile
 DEFAULT_PREFETCH_THRESHOLD  = 20 * 1024 * 1024
 
@@ -64,9 +115,51 @@ DEFAULT_PREFETCH_NUM = DEFAULT_PARALLEL
 # Default prefetch chunk size for async read in ReadOnlyFile
 DEFAULT_PREFETCH_CHUNK_SIZE = DEFAULT_PART_SIZE
 
+# Default write buffer size of the buffered AppendOnlyFile, 1MiB
+DEFAULT_APPEND_BUFFER_SIZE = 1024 * 1024
+
+# Default time interval in seconds to flush the write buffer of AppendOnlyFile
+DEFAULT_APPEND_FLUSH_INTERVAL = 1.0
+
 # Default threshold to use muitipart copy in Copier, 200MiB
 DEFAULT_COPY_THRESHOLD = 200 * 1024 * 1024
 
+# Default time interval in seconds between the reports of ThrottledProgress
+DEFAULT_PROGRESS_INTERVAL = 0.5
+
+# Number of bytes a transfer writes before it reports the progress
+DEFAULT_PROGRESS_FLUSH_SIZE = 256 * 1024
+
+# Seconds before the expiration when RefreshingCredentialsProvider refreshes the credentials
+DEFAULT_CREDENTIALS_REFRESH_AHEAD = 5 * 60
+
+# Seconds between the background refreshes of RefreshingCredentialsProvider after a failure
+DEFAULT_CREDENTIALS_RETRY_INTERVAL = 10
+
+# Default seconds HedgePolicy waits before sending the hedge
+DEFAULT_HEDGE_DELAY = 0.05
+
+# Default lower bound of the hedge delay computed from the observed latencies
+DEFAULT_HEDGE_MIN_DELAY = 0.005
+
+# Default number of the recent latencies HedgePolicy keeps
+DEFAULT_HEDGE_WINDOW = 200
+
+# Number of the observed latencies before HedgePolicy uses their percentile as the delay
+DEFAULT_HEDGE_MIN_SAMPLES = 20
+
+# Default maximum number of the threads HedgePolicy sends the requests with
+DEFAULT_HEDGE_MAX_WORKERS = 32
+
+# Default maximum number of the content keys EncryptionClient caches
+DEFAULT_KEY_CACHE_MAX_ENTRIES = 256
+
+# Default seconds a decrypted content key is cached
+DEFAULT_KEY_CACHE_TTL = 60
+
+# Default size of the chunks the iterator bodies are encrypted in
+DEFAULT_CRYPTO_CHUNK_SIZE = 64 * 1024
+
 # Temp file suffix
 DEFAULT_TEMP_FILE_SUFFIX = ".temp"
 
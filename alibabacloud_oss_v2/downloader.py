@@ -4,7 +4,8 @@ import copy
 import os
 import concurrent.futures
 import threading
-from typing import Iterator, Any, Optional, IO
+import time
+from typing import Iterator, Any, Optional, IO, List
 from . import exceptions
 from . import models
 from . import validation
@@ -13,6 +14,7 @@ from . import io_utils
 from . import defaults
 from .serde import copy_request
 from .checkpoint import DownloadCheckpoint
+from .tuner import TransferTuner, TuneDecision
 
 class DownloadAPIClient(abc.ABC):
     """Abstract base class for downloader client."""
@@ -40,6 +42,9 @@ class DownloaderOptions:
         enable_checkpoint: Optional[bool] = None,
         checkpoint_dir: Optional[str] = None,
         verify_data: Optional[bool] = None,
+        use_pwrite: Optional[bool] = None,
+        auto_tune: Optional[bool] = None,
+        progress_flush_size: Optional[int] = None,
     ) -> None:
         """
         part_size (int, optional): The part size. Default value: 6 MiB.
@@ -54,6 +59,14 @@ class DownloaderOptions:
             This parameter is valid only if enable_checkpoint is set to true.
         verify_data (bool, optional): Specifies whether to verify the CRC-64 of the downloaded object when the download is resumed.
             By default, the CRC-64 is not verified. This parameter is valid only if enable_checkpoint is set to true.
+        use_pwrite (bool, optional): Specifies whether the download tasks write the data at their own offsets with os.pwrite
+            instead of sharing one file pointer under a lock. The file is preallocated before the parts start.
+            This parameter is valid only for download_file and the platforms that support os.pwrite.
+        auto_tune (bool, optional): Specifies whether to tune the parallel number and the part size
+            from the observed throughput and latency of the parts during the download.
+            The part size is not tuned when the checkpoint is enabled. By default, no tuning is made.
+        progress_flush_size (int, optional): The number of bytes a download task transfers before it reports the progress.
+            Default value: 256 KiB. Set it to 0 to report the progress for every block.
         """
         self.part_size = part_size
         self.parallel_num = parallel_num
@@ -62,6 +75,9 @@ class DownloaderOptions:
         self.enable_checkpoint = enable_checkpoint or False
         self.checkpoint_dir = checkpoint_dir
         self.verify_data = verify_data
+        self.use_pwrite = use_pwrite or False
+        self.auto_tune = auto_tune or False
+        self.progress_flush_size = progress_flush_size
 
 
 class DownloadResult:
@@ -76,6 +92,7 @@ class DownloadResult:
         written (int, optional): The size of the downloaded data, in bytes.
         """
         self.written = written
+        self.tune_decisions: List[TuneDecision] = []
 
 class DownloadError(exceptions.BaseError):
     """
@@ -109,7 +126,11 @@ class Downloader:
                 - use_temp_file (bool): Whether to use a temporary file when you download an object. A temporary file is used by default.
                 - enable_checkpoint (bool): Whether to enable checkpoint. Defaults to False.
                 - checkpoint_dir (str): The directory to store checkpoint.
-                - verify_data (bool): Whether to verify data when the download is resumed. Defaults to False.            
+                - verify_data (bool): Whether to verify data when the download is resumed. Defaults to False.
+                - use_pwrite (bool): Whether to write the parts at their own offsets with os.pwrite. Defaults to False.
+                - auto_tune (bool): Whether to tune the parallel number and the part size automatically. Defaults to False.
+                - progress_flush_size (int): The number of bytes a download task transfers before it reports the progress.
+                    Default value: 256 KiB.
         """
         part_size = kwargs.get('part_size', defaults.DEFAULT_DOWNLOAD_PART_SIZE)
         parallel_num = kwargs.get('parallel_num', defaults.DEFAULT_DOWNLOAD_PARALLEL)
@@ -122,15 +143,26 @@ class Downloader:
             enable_checkpoint=kwargs.get('enable_checkpoint', None),
             checkpoint_dir=kwargs.get('checkpoint_dir', None),
             verify_data=kwargs.get('verify_data', None),
+            use_pwrite=kwargs.get('use_pwrite', None),
+            auto_tune=kwargs.get('auto_tune', None),
+            progress_flush_size=kwargs.get('progress_flush_size', None),
         )
 
         feature_flags = 0
+        http_client = None
+        retryer = None
         cstr = str(client)
         if cstr == '<OssClient>':
             feature_flags = client._client._options.feature_flags
+            http_client = client._client._options.http_client
+            retryer = client._client._options.retryer
         elif cstr == '<OssEncryptionClient>':
             feature_flags = client.unwrap()._client._options.feature_flags
+            http_client = client.unwrap()._client._options.http_client
+            retryer = client.unwrap()._client._options.retryer
         self._feature_flags = feature_flags
+        self._http_client = http_client
+        self._retryer = retryer
 
 
     def download_file(
@@ -152,6 +184,9 @@ class Downloader:
                 - enable_checkpoint (bool): Whether to enable checkpoint.
                 - checkpoint_dir (str): The directory to store checkpoint.
                 - verify_data (bool): Whether to verify data when the download is resumed.
+                - use_pwrite (bool): Whether to write the parts at their own offsets with os.pwrite.
+                - auto_tune (bool): Whether to tune the parallel number and the part size automatically.
+                - progress_flush_size (int): The number of bytes a download task transfers before it reports the progress.
         Returns:
             DownloadResult: The result for the download operation.
         """
@@ -171,6 +206,8 @@ class Downloader:
 
             delegate.adjust_writer(writer)
 
+            delegate.apply_pwrite(writer)
+
             delegate.update_crc_flag()
 
             result = delegate.download()
@@ -195,6 +232,8 @@ class Downloader:
                 - part_size (int): The part size.
                 - parallel_num (int): The number of the download tasks in parallel.
                 - block_size (int): The block size is the number of bytes it should read into memory.
+                - auto_tune (bool): Whether to tune the parallel number and the part size automatically.
+                - progress_flush_size (int): The number of bytes a download task transfers before it reports the progress.
         Returns:
             DownloadResult: The result for the download operation.
         """
@@ -236,13 +275,26 @@ class Downloader:
         options.enable_checkpoint = kwargs.get('enable_checkpoint', self._options.enable_checkpoint)
         options.checkpoint_dir = kwargs.get('checkpoint_dir', self._options.checkpoint_dir)
         options.verify_data = kwargs.get('verify_data', self._options.verify_data)
+        options.use_pwrite = kwargs.get('use_pwrite', self._options.use_pwrite)
+        options.auto_tune = kwargs.get('auto_tune', self._options.auto_tune)
+        options.progress_flush_size = kwargs.get('progress_flush_size', self._options.progress_flush_size)
 
         if options.part_size <= 0:
             options.part_size = defaults.DEFAULT_DOWNLOAD_PART_SIZE
 
+        if options.progress_flush_size is None or options.progress_flush_size < 0:
+            options.progress_flush_size = defaults.DEFAULT_PROGRESS_FLUSH_SIZE
+
         if options.parallel_num <= 0:
             options.parallel_num = defaults.DEFAULT_DOWNLOAD_PARALLEL
 
+        # each worker holds a connection
+        if hasattr(self._http_client, 'reserve_connections'):
+            parallel_num = options.parallel_num
+            if options.auto_tune:
+                parallel_num = max(parallel_num, defaults.DEFAULT_AUTO_TUNE_MAX_PARALLEL)
+            self._http_client.reserve_connections(parallel_num)
+
         delegate = _DownloaderDelegate(
             base=self,
             client=self._client,
@@ -275,6 +327,7 @@ class _DownloaderDelegate:
 
         parallel = options.parallel_num > 1
         self._writer = None
+        self._writer_fd = None
         self._writer_lock = threading.Lock() if parallel else None
         self._progress_lock = threading.Lock() if parallel else None
 
@@ -299,6 +352,12 @@ class _DownloaderDelegate:
 
         #use mulitpart download
         self._download_errors = []
+        self._part_sizes = {}
+
+        # auto tune
+        self._tuner: TransferTuner = None
+        # the extra options of the part requests
+        self._part_kwargs = {}
 
     @property
     def writer_filepath(self) -> str:
@@ -391,6 +450,28 @@ class _DownloaderDelegate:
 
         self._writer = writer
 
+    def apply_pwrite(self, writer:IO[bytes]):
+        """Writes the data with os.pwrite at the part's offset, no lock is needed.
+        The file is extended to its final size before the parts start, the unwritten region stays sparse.
+
+        Args:
+            writer (IO[bytes]): the file object opened by download_file
+        """
+        if not self._options.use_pwrite or not hasattr(os, 'pwrite'):
+            return
+
+        try:
+            writer.flush()
+            fd = writer.fileno()
+            size = self._epos - self._rstart
+            if os.fstat(fd).st_size < size:
+                os.ftruncate(fd, size)
+        except (OSError, ValueError):
+            return
+
+        self._writer_fd = fd
+        self._writer_lock = None
+
     def close_writer(self, writer:IO[bytes]):
         """close writer
 
@@ -407,6 +488,7 @@ class _DownloaderDelegate:
             self._checkpoint.remove()
 
         self._writer = None
+        self._writer_fd = None
         self._checkpoint = None
 
     def update_crc_flag(self):
@@ -420,7 +502,18 @@ class _DownloaderDelegate:
     def download(self) -> DownloadResult:
         """Breakpoint download
         """
-        parallel = self._options.parallel_num > 1
+        # the checkpoint requires the same part size for all parts
+        if self._options.auto_tune:
+            self._tuner = TransferTuner(
+                parallel_num=self._options.parallel_num,
+                part_size=self._options.part_size,
+                tune_part_size=self._checkpoint is None,
+            )
+            # the throttled attempts are seen by the tuner, even if they are retried successfully
+            if self._base._retryer is not None:
+                self._part_kwargs['retryer'] = self._tuner.wrap_retryer(self._base._retryer)
+
+        parallel = self._options.parallel_num > 1 or self._tuner is not None
         seekable = utils.is_seekable(self._writer)
         if not seekable:
             parallel = False
@@ -428,8 +521,9 @@ class _DownloaderDelegate:
             parallel = False
 
         if parallel:
-            with concurrent.futures.ThreadPoolExecutor(self._options.parallel_num) as executor:
-                for result in executor.map(self._process_part, self._iter_part_start()):
+            max_workers = self._tuner.max_parallel_num if self._tuner else self._options.parallel_num
+            with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+                for result in self._iter_process_result(executor):
                     self._update_process_result(result)
         else:
             if seekable:
@@ -444,23 +538,68 @@ class _DownloaderDelegate:
 
         self._assert_crc_same()
 
-        return DownloadResult(written=self._written)
+        ret = DownloadResult(written=self._written)
+        if self._tuner:
+            ret.tune_decisions = self._tuner.decisions
+
+        return ret
 
     def _iter_part_start(self) -> Iterator[int]:
         start = self._pos
         while start < self._epos:
+            if self._tuner:
+                self._part_sizes[start] = self._tuner.part_size
             yield start
-            start += self._options.part_size
+            start += self._part_sizes.get(start, self._options.part_size)
 
             # When an error occurs, stop download
             if len(self._download_errors) > 0:
                 break
 
+    def _iter_process_result(self, executor: concurrent.futures.Executor):
+        """Submits at most parallel_num parts to the executor at a time and yields the results in offset order.
+        No more parts are scheduled after a part fails.
+        """
+        starts = self._iter_part_start()
+        running = {}
+        finished = {}
+        next_start = self._pos
+        eof = False
+        while True:
+            window = self._tuner.parallel_num if self._tuner else self._options.parallel_num
+            while not eof and len(running) < window and len(self._download_errors) == 0:
+                start = next(starts, None)
+                if start is None:
+                    eof = True
+                    break
+                running[executor.submit(self._process_part, start)] = start
+
+            if len(running) == 0:
+                break
+
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                start = running.pop(future)
+                result = future.result()
+                if result is not None and result[2] is not None:
+                    # early abort, the running parts are skipped
+                    yield result
+                    return
+                finished[start] = result
+
+            while next_start in finished:
+                result = finished.pop(next_start)
+                yield result
+                if result is None:
+                    return
+                next_start += self._calc_part_size(next_start)
+
     def _calc_part_size(self, start:int):
-        if start + self._options.part_size > self._epos:
+        part_size = self._part_sizes.get(start, self._options.part_size)
+        if start + part_size > self._epos:
             size = self._epos - start
         else:
-            size = self._options.part_size
+            size = part_size
         return size
 
     def _process_part(self, start:int):
@@ -479,12 +618,17 @@ class _DownloaderDelegate:
             from .crc import Crc64  # lazy import to avoid loading crcmod unless crc check is enabled
             chash = Crc64(0)
 
+        # the progress is summed up in the task, and reported every flush_size bytes
+        pending = 0
+        flush_size = self._options.progress_flush_size
+
+        tstart = time.monotonic()
         while True:
             request.range_header = f'bytes={start + got}-{start + size - 1}'
             request.range_behavior = 'standard'
 
             try:
-                result = self._client.get_object(request)
+                result = self._client.get_object(request, **self._part_kwargs)
             except Exception as err:
                 error = err
                 break
@@ -499,7 +643,10 @@ class _DownloaderDelegate:
                     l = len(d)
                     if l > 0:
                         self._write_to_stream(d, start + got)
-                        self._update_progress(l)
+                        pending += l
+                        if pending >= flush_size:
+                            self._update_progress(pending)
+                            pending = 0
                         got += l
                         gotlen += l
                         if chash:
@@ -513,11 +660,24 @@ class _DownloaderDelegate:
             except Exception:
                 pass
 
+        if pending > 0:
+            self._update_progress(pending)
+
+        if self._tuner:
+            self._tuner.record(got, time.monotonic() - tstart, error)
+
         return start, got, error, (chash.sum64() if chash else 0)
 
 
     def _write_to_stream(self, data, start):
-        if self._writer_lock:
+        if self._writer_fd is not None:
+            offset = start - self._rstart
+            view = memoryview(data)
+            while len(view) > 0:
+                n = os.pwrite(self._writer_fd, view, offset)
+                view = view[n:]
+                offset += n
+        elif self._writer_lock:
             with self._writer_lock:
                 self._writer.seek(start - self._rstart)
                 self._writer.write(data)
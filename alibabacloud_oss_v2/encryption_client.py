@@ -2,7 +2,7 @@
 """Encryption Client"""
 import copy
 import base64
-from typing import MutableMapping, List, Optional, cast
+from typing import Any, Dict, MutableMapping, List, Optional, cast
 from .types import StreamBody, CaseInsensitiveDict
 from .client import Client
 from . import models
@@ -11,6 +11,7 @@ from . import utils
 from . import io_utils
 from .crypto import MasterCipher, Envelope, ContentCipherBuilder, ContentCipher, CipherData
 from .crypto.aes_ctr_cipher import AESCtrCipherBuilder
+from .crypto.key_cache import ContentKeyCache
 from .crypto.aes_ctr import _BLOCK_SIZE_LEN
 
 class EncryptionMultiPartContext:
@@ -27,15 +28,29 @@ class EncryptionMultiPartContext:
         self.part_size = part_size
 
     def is_valid(self) -> bool:
-        """is valid
+        """is valid, the data size may be 0 if the total size is unknown
         """
         if (self.content_cipher is None or
-            self.data_size == 0 or
             self.part_size == 0):
             return False
 
         return True
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the envelope and the sizes as a dict, which can be saved to resume the upload.
+        The content key and iv are saved encrypted by the master cipher.
+        """
+        cd = self.content_cipher.get_cipher_data()
+        return {
+            'EncryptedKey': base64.b64encode(cd.encrypted_key).decode(),
+            'EncryptedIV': base64.b64encode(cd.encrypted_iv).decode(),
+            'MatDesc': cd.mat_desc or '',
+            'WrapAlgorithm': cd.wrap_algorithm,
+            'CekAlgorithm': cd.cek_algorithm,
+            'PartSize': self.part_size,
+            'DataSize': self.data_size,
+        }
+
 class EncryptionClient:
     """Encryption Client
     """
@@ -45,16 +60,30 @@ class EncryptionClient:
         client: Client,
         master_cipher: MasterCipher,
         decrypt_master_ciphers: Optional[List[MasterCipher]] = None,
+        key_cache: Optional[ContentKeyCache] = None,
+        chunk_size: Optional[int] = None,
     ) -> None:
+        """
+        Args:
+            client (Client): The client which sends the requests.
+            master_cipher (MasterCipher): The master cipher which encrypts and decrypts the content keys.
+            decrypt_master_ciphers (List[MasterCipher], optional): The master ciphers for the objects
+                encrypted with the other master keys, they are selected by the mat desc.
+            key_cache (ContentKeyCache, optional): The cache of the decrypted content keys,
+                so the ranged reads of an object decrypt its envelope only once.
+                Default value: ContentKeyCache(), pass ContentKeyCache(max_entries=0) to disable it.
+            chunk_size (int, optional): The size of the chunks the iterator bodies are encrypted in. Default value: 64 KiB.
+        """
         self._client = client
         self._master_cipher = master_cipher
-        self._defualt_ccbuilder = AESCtrCipherBuilder(master_cipher)
+        self._key_cache = key_cache if key_cache is not None else ContentKeyCache()
+        self._defualt_ccbuilder = AESCtrCipherBuilder(master_cipher, key_cache=self._key_cache, chunk_size=chunk_size)
         self._decrypt_master_ciphers = decrypt_master_ciphers or []
         self._ccbuilders = {}
         for mc in self._decrypt_master_ciphers:
             mat_desc = mc.get_mat_desc() or ''
             if len(mat_desc) > 0:
-                self._ccbuilders[mat_desc] = AESCtrCipherBuilder(mc)
+                self._ccbuilders[mat_desc] = AESCtrCipherBuilder(mc, key_cache=self._key_cache, chunk_size=chunk_size)
 
     def unwrap(self) -> Client:
         """unwrap
@@ -64,6 +93,11 @@ class EncryptionClient:
         """
         return self._client
 
+    @property
+    def key_cache(self) -> ContentKeyCache:
+        """The cache of the decrypted content keys"""
+        return self._key_cache
+
     def __repr__(self) -> str:
         return "<OssEncryptionClient>"
 
@@ -180,6 +214,36 @@ class EncryptionClient:
 
         return self._client.list_parts(request, **kwargs)
 
+    def load_multipart_context(self, value: Dict[str, Any]) -> EncryptionMultiPartContext:
+        """Restores the multipart context saved by EncryptionMultiPartContext.to_dict,
+        the content key and iv are decrypted by the master cipher.
+
+        Args:
+            value (Dict[str, Any]): The dict returned by EncryptionMultiPartContext.to_dict.
+
+        Returns:
+            EncryptionMultiPartContext: The context for the upload_part requests.
+        """
+        envelope = Envelope(
+            iv=base64.b64decode(utils.safety_str(value.get('EncryptedIV'))),
+            cipher_key=base64.b64decode(utils.safety_str(value.get('EncryptedKey'))),
+            mat_desc=value.get('MatDesc', ''),
+            wrap_algorithm=value.get('WrapAlgorithm', ''),
+            cek_algorithm=value.get('CekAlgorithm', ''),
+        )
+
+        if not _is_valid_content_alg(envelope.cek_algorithm or ''):
+            raise exceptions.ParamInvalidError(field='envelope.cek_algorithm')
+
+        if not envelope.is_valid():
+            raise exceptions.ParamInvalidError(field='envelope')
+
+        return EncryptionMultiPartContext(
+            content_cipher=self._get_ccbuilder(envelope).content_cipher_from_env(envelope),
+            part_size=utils.safety_int(value.get('PartSize')),
+            data_size=utils.safety_int(value.get('DataSize')),
+        )
+
     def _get_ccbuilder(self, envelope: Envelope ) -> ContentCipherBuilder:
         return self._ccbuilders.get(envelope.mat_desc or '', self._defualt_ccbuilder)
 
@@ -345,7 +409,7 @@ def _add_crypto_header_initpart(request: models.InitiateMultipartUploadRequest,
         headers = CaseInsensitiveDict()
 
     # data size
-    if utils.safety_int(int(request.cse_data_size)) > 0:
+    if utils.safety_int(request.cse_data_size) > 0:
         headers['x-oss-meta-client-side-encryption-data-size'] = str(request.cse_data_size)
 
     # part size
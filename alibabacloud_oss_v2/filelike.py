@@ -2,6 +2,7 @@
 import abc
 import queue
 import threading
+import time
 from typing import Optional, Iterator, List, Generator
 from concurrent.futures import ThreadPoolExecutor, Future
 from .types import StreamBody, BodyType
@@ -53,6 +54,7 @@ class AppendOnlyFile:
         key: str,
         request_payer: Optional[str] = None,
         create_parameter: Optional[models.AppendObjectRequest] = None,
+        **kwargs
     ) -> None:
         """
             client (AppendFileAPIClient, required): A agent that sends the request.
@@ -62,6 +64,12 @@ class AppendOnlyFile:
             create_parameter (AppendObjectRequest, optional): The parameters when the object is first generated, supports below
                 CacheControl, ContentEncoding, Expires, ContentType, ContentType, Metadata,SSE's parameters, Acl, StorageClass, Tagging.
                 If the object exists, ignore this parameters
+            enable_buffering (bool, optional): Whether to buffer the written data, and append them in batches.
+            buffer_size (int, optional): The buffered data are appended when they reach this size.
+            flush_interval (float, optional): The buffered data are appended when they are kept longer than this time in second.
+                Without the background flusher, it is checked on the next write.
+            enable_async_flush (bool, optional): Whether to append the buffered data in a background thread,
+                the next batch is buffered while the previous one is in flight. It implies enable_buffering.
         """
         self._client = client
 
@@ -79,6 +87,25 @@ class AppendOnlyFile:
 
         self._try_open_object(bucket, key, request_payer)
 
+        # write-behind buffer parameters
+        self._enable_async_flush = kwargs.get('enable_async_flush', False)
+        self._enable_buffering = kwargs.get('enable_buffering', False) or self._enable_async_flush
+        self._buffer_size = kwargs.get('buffer_size', defaults.DEFAULT_APPEND_BUFFER_SIZE)
+        self._flush_interval = kwargs.get('flush_interval', defaults.DEFAULT_APPEND_FLUSH_INTERVAL)
+
+        # the buffered data, and the size of the append in flight
+        self._buffer = bytearray()
+        self._buffer_time = 0.0
+        self._inflight = 0
+        self._flush_waiters = 0
+        self._flush_error: Exception = None
+        self._stopping = False
+        self._condition = threading.Condition()
+        self._flusher: threading.Thread = None
+        if self._enable_async_flush:
+            self._flusher = threading.Thread(target=self._flush_loop, name='oss-append-flusher', daemon=True)
+            self._flusher.start()
+
         self._closed = False
 
     @property
@@ -106,20 +133,31 @@ class AppendOnlyFile:
 
     ### io apis ###
     def close(self) -> None:
-        """Close the file."""
-        self._closed = True
+        """Close the file.
+        The buffered data are appended before it returns, or the error is raised.
+        """
+        if self._closed:
+            return
+        try:
+            self._flush_buffer()
+        finally:
+            self._stop_flusher()
+            self._closed = True
 
     def flush(self) -> None:
         """Flush write buffers.
+        The buffered data are appended before it returns, or the error is raised.
         """
         self._check_closed('flush')
+        self._flush_buffer()
         if not self._created:
             self._write_bytes(b'')
 
     def tell(self) -> int:
         """Return an int indicating the current stream position."""
         self._check_closed('tell')
-        return self._offset
+        with self._condition:
+            return self._offset + self._inflight + len(self._buffer)
 
     def writable(self) -> bool:
         """True if file was opened in a write mode."""
@@ -137,6 +175,9 @@ class AppendOnlyFile:
         if not isinstance(b, bytes):
             raise self._wrap_error('write', TypeError(f'Not a bytes type, got {type(b)}'))
 
+        if self._enable_buffering:
+            return self._write_buffered(b)
+
         return self._write_bytes(b)
 
 
@@ -148,6 +189,9 @@ class AppendOnlyFile:
         if b is None:
             return 0
 
+        # keeps the order of the data
+        self._flush_buffer()
+
         return self._write_any(b)
 
 
@@ -198,7 +242,18 @@ class AppendOnlyFile:
         request.tagging = self._create_parameter.tagging
 
     def _write_bytes(self, b):
-        offset = self._offset
+        offset, hash_crc64 = self._append_bytes(b, self._offset)
+
+        writern = offset - self._offset
+        self._created = True
+        self._offset = offset
+        self._hash_crc64 = hash_crc64
+
+        return writern
+
+    def _append_bytes(self, b, offset: int):
+        """Internal: appends b at offset, returns the next position and the crc64 of the object
+        """
         hash_crc64 = self._hash_crc64
         error: Exception = None
         request = models.AppendObjectRequest(
@@ -230,12 +285,111 @@ class AppendOnlyFile:
         if error:
             raise self._wrap_error('write', error)
 
-        writern = offset - self._offset
-        self._created = True
-        self._offset = offset
-        self._hash_crc64 = hash_crc64
+        return offset, hash_crc64
 
-        return writern
+    def _write_buffered(self, b):
+        with self._condition:
+            self._raise_flush_error()
+            if len(self._buffer) == 0:
+                self._buffer_time = time.monotonic()
+            self._buffer += b
+
+            if self._flusher is None:
+                if len(self._buffer) >= self._buffer_size or self._buffer_expired():
+                    self._flush_buffer_locked()
+                return len(b)
+
+            self._condition.notify_all()
+            # at most one full buffer waits for the append in flight
+            while self._inflight > 0 and len(self._buffer) >= self._buffer_size and self._flush_error is None:
+                self._condition.wait()
+        return len(b)
+
+    def _buffer_expired(self) -> bool:
+        return bool(self._flush_interval) and time.monotonic() - self._buffer_time >= self._flush_interval
+
+    def _flush_buffer(self):
+        """Internal: appends all the buffered data
+        """
+        if not self._enable_buffering:
+            return
+
+        with self._condition:
+            if self._flusher is None:
+                if len(self._buffer) > 0:
+                    self._flush_buffer_locked()
+                return
+
+            self._flush_waiters += 1
+            self._condition.notify_all()
+            try:
+                while (len(self._buffer) > 0 or self._inflight > 0) and self._flush_error is None:
+                    self._condition.wait()
+            finally:
+                self._flush_waiters -= 1
+            self._raise_flush_error()
+
+    def _flush_buffer_locked(self):
+        data = bytes(self._buffer)
+        # the data are kept in the buffer if the append fails
+        self._write_bytes(data)
+        del self._buffer[:len(data)]
+
+    def _raise_flush_error(self):
+        if self._flush_error is not None:
+            error = self._flush_error
+            self._flush_error = None
+            raise error
+
+    def _ready_to_flush(self) -> bool:
+        if len(self._buffer) == 0 or self._flush_error is not None:
+            return False
+        return len(self._buffer) >= self._buffer_size or self._flush_waiters > 0 or self._buffer_expired()
+
+    def _flush_loop(self):
+        """Internal: appends the buffered data in the background,
+        the writes go on buffering while an append is in flight
+        """
+        while True:
+            with self._condition:
+                while not self._stopping and not self._ready_to_flush():
+                    timeout = None
+                    if len(self._buffer) > 0 and self._flush_error is None and self._flush_interval:
+                        timeout = max(self._buffer_time + self._flush_interval - time.monotonic(), 0)
+                    self._condition.wait(timeout)
+                if self._stopping:
+                    return
+                data = bytes(self._buffer)
+                self._buffer.clear()
+                self._inflight = len(data)
+                offset = self._offset
+
+            error = None
+            try:
+                offset, hash_crc64 = self._append_bytes(data, offset)
+            except Exception as err:
+                error = err
+
+            with self._condition:
+                if error is None:
+                    self._created = True
+                    self._offset = offset
+                    self._hash_crc64 = hash_crc64
+                else:
+                    # the data are appended again on the next flush
+                    self._buffer[0:0] = data
+                    self._flush_error = error
+                self._inflight = 0
+                self._condition.notify_all()
+
+    def _stop_flusher(self):
+        if self._flusher is None:
+            return
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._flusher.join()
+        self._flusher = None
 
     def _write_any(self, b):
         offset = self._offset
@@ -0,0 +1,232 @@
+"""Hedged requests for the latency sensitive operations"""
+import collections
+import concurrent.futures
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional
+from . import defaults
+from .types import OperationInput
+
+
+class _Hedge:
+    """The state shared by a request sent on the caller's thread and its hedge"""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.primary_done = threading.Event()
+        self.hedge_done = threading.Event()
+        self.sent = False
+        self.finished = False
+        self.discarded = False
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class HedgePolicy:
+    """Sends a duplicate of a slow idempotent request and takes the response which comes first.
+
+    The request is sent on the caller's thread. If it has not completed after the hedge delay,
+    the same request is sent again by a thread of the policy, it gets another connection from the pool.
+    The response which comes first is returned and the other one is closed when it comes,
+    the hedge's response is also returned if the request fails.
+
+    The hedge is only sent when a thread of the policy is free, so no hedge waits in a queue
+    and no hedge is added when the policy is saturated. The delay is measured from the time
+    the request is sent.
+
+    Only the GET and HEAD requests without a body are hedged. A policy can be shared
+    by the clients and the operations.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: Optional[float] = None,
+        min_delay: Optional[float] = None,
+        window: Optional[int] = None,
+        operations: Optional[Iterable[str]] = None,
+        max_workers: Optional[int] = None,
+        max_hedge_percent: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            delay (float, optional): The seconds to wait before sending the hedge. If percentile is set,
+                it is used until enough latencies have been observed. Default value: 0.05.
+            percentile (float, optional): Uses the percentile of the recently observed latencies as the delay, e.g. 95.
+            min_delay (float, optional): The lower bound of the delay computed from the percentile. Default value: 0.005.
+            window (int, optional): The number of the recent latencies kept for the percentile. Default value: 200.
+            operations (Iterable[str], optional): The names of the operations to hedge, e.g. ['GetObject', 'HeadObject'].
+                All the GET and HEAD operations are hedged if it is not set.
+            max_workers (int, optional): The maximum number of the threads which send the hedges,
+                the requests beyond it are not hedged. Default value: 32.
+            max_hedge_percent (float, optional): The maximum percentage of the requests which are hedged, e.g. 10.
+                The hedges are not limited if it is not set.
+        """
+        self._delay = delay if delay is not None else defaults.DEFAULT_HEDGE_DELAY
+        self._percentile = percentile
+        self._min_delay = min_delay if min_delay is not None else defaults.DEFAULT_HEDGE_MIN_DELAY
+        self._window = window or defaults.DEFAULT_HEDGE_WINDOW
+        self._operations = set(operations) if operations is not None else None
+        self._max_workers = max_workers or defaults.DEFAULT_HEDGE_MAX_WORKERS
+        self._max_hedge_percent = max_hedge_percent
+        self._latencies = collections.deque(maxlen=self._window)
+        self._lock = threading.Lock()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        # a worker is reserved before a hedge is submitted, so the executor never queues
+        self._free_workers = threading.BoundedSemaphore(self._max_workers)
+        self._requests = 0
+        self._hedges_issued = 0
+        self._hedges_won = 0
+
+    @property
+    def requests(self) -> int:
+        """The number of the requests sent with the policy"""
+        return self._requests
+
+    @property
+    def hedges_issued(self) -> int:
+        """The number of the hedges sent"""
+        return self._hedges_issued
+
+    @property
+    def hedges_won(self) -> int:
+        """The number of the hedges whose responses were returned"""
+        return self._hedges_won
+
+    def is_hedgeable(self, op_input: OperationInput) -> bool:
+        """Whether the requests of the operation can be hedged"""
+        if op_input.method not in ('GET', 'HEAD'):
+            return False
+        if op_input.body:
+            return False
+        return self._operations is None or op_input.op_name in self._operations
+
+    def hedge_delay(self) -> float:
+        """The seconds to wait before sending the hedge"""
+        if self._percentile is None:
+            return self._delay
+        with self._lock:
+            if len(self._latencies) < min(self._window, defaults.DEFAULT_HEDGE_MIN_SAMPLES):
+                return self._delay
+            latencies = sorted(self._latencies)
+        index = min(len(latencies) - 1, int(len(latencies) * self._percentile / 100))
+        return max(self._min_delay, latencies[index])
+
+    def send(self, attempt: Callable[[int], Any], close: Callable[[Any], None]) -> Any:
+        """Calls attempt(0) on the caller's thread, and attempt(1) on a thread of the policy
+        if the first one has not returned after the hedge delay,
+        returns the first successful result and closes the other one with close.
+
+        Args:
+            attempt (Callable[[int], Any]): Sends the request, 0 for the original one and 1 for the hedge.
+            close (Callable[[Any], None]): Closes the result which is not returned.
+
+        Returns:
+            Any: The first successful result. If both fail, the error of the original request is raised.
+        """
+        with self._lock:
+            self._requests += 1
+
+        hedge = None
+        if self._free_workers.acquire(blocking=False):
+            hedge = _Hedge()
+            try:
+                self._get_executor().submit(self._send_hedge, hedge, attempt, close, self.hedge_delay())
+            except BaseException:
+                self._free_workers.release()
+                raise
+
+        start = time.monotonic()
+        result = None
+        error = None
+        try:
+            result = attempt(0)
+        except Exception as e:  # pylint: disable=broad-except
+            error = e
+
+        if hedge is None:
+            if error is not None:
+                raise error
+            self._record(time.monotonic() - start)
+            return result
+
+        with hedge.lock:
+            hedge.finished = True
+            sent = hedge.sent
+            hedge_won = sent and hedge.hedge_done.is_set() and hedge.error is None
+            if error is None and not hedge_won:
+                # the hedge closes its own response when it comes
+                hedge.discarded = True
+        hedge.primary_done.set()
+
+        if error is None and not hedge_won:
+            self._record(time.monotonic() - start)
+            return result
+
+        if not sent:
+            raise error
+
+        hedge.hedge_done.wait()
+        if hedge.error is not None:
+            raise error
+
+        if error is None:
+            close(result)
+        with self._lock:
+            self._hedges_won += 1
+        self._record(time.monotonic() - start)
+        return hedge.result
+
+    def close(self) -> None:
+        """Shuts down the threads of the policy"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _send_hedge(self, hedge: _Hedge, attempt: Callable[[int], Any],
+                    close: Callable[[Any], None], delay: float) -> None:
+        try:
+            if hedge.primary_done.wait(delay):
+                return
+
+            with hedge.lock:
+                if hedge.finished:
+                    return
+                with self._lock:
+                    if (self._max_hedge_percent is not None and
+                            self._hedges_issued * 100 >= self._requests * self._max_hedge_percent):
+                        return
+                    self._hedges_issued += 1
+                hedge.sent = True
+
+            try:
+                hedge.result = attempt(1)
+            except Exception as e:  # pylint: disable=broad-except
+                hedge.error = e
+
+            with hedge.lock:
+                hedge.hedge_done.set()
+                discarded = hedge.discarded
+            if discarded and hedge.error is None:
+                close(hedge.result)
+        finally:
+            self._free_workers.release()
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = concurrent.futures.ThreadPoolExecutor(
+                        self._max_workers, thread_name_prefix='oss-hedge')
+        return self._executor
+
+    def _record(self, latency: float) -> None:
+        if self._percentile is None:
+            return
+        with self._lock:
+            self._latencies.append(latency)
+
+    def __repr__(self) -> str:
+        return (f'<HedgePolicy requests: {self._requests}, hedges issued: {self._hedges_issued}, '
+                f'hedges won: {self._hedges_won}>')
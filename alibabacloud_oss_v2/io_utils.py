@@ -19,7 +19,11 @@ class TeeIterator:
         return self.iter_bytes()
 
     def __next__(self):
-        d = self.next()
+        try:
+            d = self.next()
+        except StopIteration:
+            self.flush()
+            raise
         if self._writers is not None:
             for w in self._writers:
                 w.write(d)
@@ -38,6 +42,14 @@ class TeeIterator:
                 if hasattr(w, 'reset'):
                     w.reset()
 
+    def flush(self) -> None:
+        """Flushes the writers at the end of the data.
+        """
+        if self._writers is not None:
+            for w in self._writers:
+                if hasattr(w, 'flush'):
+                    w.flush()
+
     @staticmethod
     def from_source(source: Any, writers: List[Any], **kwargs: Any) -> "TeeIterator":
         """Converts source to TeeIterator
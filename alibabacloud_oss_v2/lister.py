@@ -0,0 +1,329 @@
+"""Sharded lister for listing the objects in parallel."""
+import copy
+import collections
+import concurrent.futures
+from typing import Iterator, Any, Optional, List, Dict, Iterable
+from . import models
+from . import exceptions
+from . import defaults
+from .paginator import ListObjectsV2APIClient
+
+
+class ListShard:
+    """A shard of the key space.
+
+    A shard covers the objects whose names start with prefix, are greater than start_after
+    and are not greater than end_key. The shard with a delimiter lists only the objects
+    directly under the prefix, the common prefixes in its responses are ignored.
+
+    The continuation_token and done fields are updated while the shard is being listed,
+    they can be saved and passed back to resume the listing.
+    """
+
+    def __init__(
+        self,
+        prefix: Optional[str] = None,
+        start_after: Optional[str] = None,
+        end_key: Optional[str] = None,
+        delimiter: Optional[str] = None,
+        continuation_token: Optional[str] = None,
+        done: Optional[bool] = False,
+    ) -> None:
+        """
+        Args:
+            prefix (str, optional): The prefix that the names of the listed objects must contain.
+            start_after (str, optional): The name of the object after which the listing starts.
+            end_key (str, optional): The name of the last object to list. The shard is unbounded if it is not set.
+            delimiter (str, optional): The delimiter, only the objects directly under the prefix are listed if it is set.
+            continuation_token (str, optional): The token from which the listing resumes.
+            done (bool, optional): Whether all the objects of the shard have been listed.
+        """
+        self.prefix = prefix
+        self.start_after = start_after
+        self.end_key = end_key
+        self.delimiter = delimiter
+        self.continuation_token = continuation_token
+        self.done = done
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the state of the shard as a dict, which can be serialized to json"""
+        return {
+            'prefix': self.prefix,
+            'start_after': self.start_after,
+            'end_key': self.end_key,
+            'delimiter': self.delimiter,
+            'continuation_token': self.continuation_token,
+            'done': self.done,
+        }
+
+    @classmethod
+    def from_dict(cls, value: Dict[str, Any]) -> "ListShard":
+        """Creates a shard from the dict returned by to_dict"""
+        return cls(**value)
+
+    def __repr__(self) -> str:
+        return f'<ListShard {self.to_dict()}>'
+
+
+class _ShardState:
+    """The state of a shard during the listing"""
+
+    def __init__(self, shard: ListShard, request: models.ListObjectsV2Request) -> None:
+        self.shard = shard
+        self.request = request
+        self.pages = collections.deque()
+        self.future = None
+        self.exhausted = False
+
+
+class ShardedLister:
+    """A lister for ListObjectsV2 that splits the key space into shards and lists them in parallel.
+
+    The shards are discovered by the common prefixes under the prefix of the request,
+    or split by the given keys with start_after.
+    """
+
+    def __init__(
+        self,
+        client: ListObjectsV2APIClient,
+        **kwargs: Any
+    ) -> None:
+        """
+            client (ListObjectsV2APIClient): A agent that sends the request.
+            parallel_num (int, optional): The number of the list requests in parallel. Default value: 3.
+            limit (int, optional): The maximum number of items in the response.
+            ordered (bool, optional): Whether to yield the objects in lexicographic order. Default value: True.
+                The objects are yielded as soon as their pages are received if it is False.
+            delimiter (str, optional): The delimiter used to discover the shards. Default value: '/'.
+            max_buffered_pages (int, optional): The maximum number of the pages received ahead
+                of the yielded ones. Default value: 2 * parallel_num.
+            compact (bool, optional): Whether to return the entries as ObjectRecord instead of the models.
+            max_discovery_pages (int, optional): The maximum number of the pages listed with the delimiter
+                to discover the shards. Default value: 10.
+        """
+        self._client = client
+        self._parallel_num = kwargs.get('parallel_num', defaults.DEFAULT_LIST_PARALLEL)
+        self._limit = kwargs.get('limit', None)
+        self._ordered = kwargs.get('ordered', True)
+        self._delimiter = kwargs.get('delimiter', '/')
+        self._max_buffered_pages = kwargs.get('max_buffered_pages', 2 * self._parallel_num)
+        self._compact = kwargs.get('compact', False)
+        # the records are built by the deserializer, the models are not created
+        self._op_kwargs = {'compact': True} if self._compact else {}
+        self._max_discovery_pages = kwargs.get('max_discovery_pages', defaults.DEFAULT_LIST_DISCOVERY_PAGES)
+        self._prefetched = {}
+        self._shards: List[ListShard] = []
+
+        if self._parallel_num < 1:
+            raise exceptions.ParamInvalidError(field='parallel_num')
+
+    @property
+    def shards(self) -> List[ListShard]:
+        """The shards of the last listing, including the finished ones"""
+        return self._shards
+
+    def discover_shards(
+        self,
+        request: models.ListObjectsV2Request,
+        split_keys: Optional[Iterable[str]] = None
+    ) -> List[ListShard]:
+        """Splits the key space under the prefix of the request into shards.
+
+        If split_keys is set, the shards are the ranges between the sorted keys, listed with start_after.
+        Otherwise the objects are listed with the delimiter first, every common prefix becomes a shard,
+        and the objects directly under the prefix become a shard with the delimiter.
+        If the listing with the delimiter does not end within max_discovery_pages pages,
+        the common prefixes and the last listed key found so far are used as the split keys.
+
+        Args:
+            request (models.ListObjectsV2Request): The request for the ListObjectsV2 operation.
+            split_keys (Iterable[str], optional): The keys used to split the key space.
+
+        Returns:
+            List[ListShard]: The shards in lexicographic order.
+        """
+        if split_keys is not None:
+            keys = sorted(set(k for k in split_keys if not request.start_after or k > request.start_after))
+            bounds = [request.start_after] + keys + [None]
+            return [ListShard(prefix=request.prefix, start_after=bounds[i], end_key=bounds[i + 1])
+                    for i in range(len(bounds) - 1)]
+
+        root = ListShard(prefix=request.prefix, start_after=request.start_after, delimiter=self._delimiter)
+        pages, prefixes, last = self._list_root(request, root)
+        if pages[-1].is_truncated:
+            return self.discover_shards(request, split_keys=prefixes + ([last] if last else []))
+        self._prefetched[id(root)] = pages
+
+        shards = [root]
+        for prefix in prefixes:
+            start_after = None
+            if request.start_after and request.start_after > prefix:
+                start_after = request.start_after
+            shards.append(ListShard(prefix=prefix, start_after=start_after))
+        return shards
+
+    def iter_objects(
+        self,
+        request: models.ListObjectsV2Request,
+        **kwargs: Any
+    ) -> Iterator[models.ObjectProperties]:
+        """Iterates over the objects of all the shards.
+
+        The state of the shards is updated when all the objects of a page have been yielded,
+        so the listing resumed from the saved shards may yield the objects of a partly consumed page again.
+
+        Args:
+            request (models.ListObjectsV2Request): The request for the ListObjectsV2 operation.
+                The delimiter, continuation_token and the prefix of the shards take the place of its own.
+            shards (List[ListShard], optional): The shards to list, e.g. the saved ones to resume the listing.
+                They are discovered by discover_shards if it is not set.
+            split_keys (Iterable[str], optional): The keys used to split the key space, see discover_shards.
+
+        Yields:
+            Iterator[models.ObjectProperties]: An iterator of ObjectProperties from the responses
+        """
+        shards = kwargs.get('shards', None)
+        if shards is None:
+            shards = self.discover_shards(request, kwargs.get('split_keys', None))
+        self._shards = shards
+
+        root = None
+        ranges = []
+        for shard in shards:
+            if shard.done:
+                continue
+            if shard.delimiter:
+                root = shard
+            else:
+                ranges.append(shard)
+
+        root_objects = self._iter_root(request, root)
+        if self._ordered:
+            head = next(root_objects, None)
+            for obj in self._iter_ranges(request, ranges):
+                while head is not None and head.key < obj.key:
+                    yield head
+                    head = next(root_objects, None)
+                yield obj
+            while head is not None:
+                yield head
+                head = next(root_objects, None)
+        else:
+            yield from root_objects
+            yield from self._iter_ranges(request, ranges)
+
+    def _new_request(self, request: models.ListObjectsV2Request, shard: ListShard) -> models.ListObjectsV2Request:
+        req = copy.copy(request)
+        req.prefix = shard.prefix
+        req.start_after = shard.start_after
+        req.delimiter = shard.delimiter
+        req.continuation_token = shard.continuation_token
+        if self._limit is not None:
+            req.max_keys = self._limit
+        return req
+
+    def _list_root(self, request: models.ListObjectsV2Request, shard: ListShard):
+        """Lists at most max_discovery_pages pages with the delimiter,
+        returns the pages, the common prefixes and the last listed key"""
+        req = self._new_request(request, shard)
+        pages = []
+        prefixes = []
+        last = None
+        while True:
+            result = self._client.list_objects_v2(req, **self._op_kwargs)
+            pages.append(result)
+            if result.contents:
+                last = max(last or '', result.contents[-1].key)
+            prefixes.extend(p.prefix for p in result.common_prefixes or [])
+            if not result.is_truncated or len(pages) >= self._max_discovery_pages:
+                break
+            req.continuation_token = result.next_continuation_token
+        return pages, prefixes, last
+
+    def _iter_root(self, request: models.ListObjectsV2Request, shard: Optional[ListShard]):
+        if shard is None:
+            return
+
+        # the pages listed by discover_shards are used first, the others are listed one by one
+        pages = collections.deque(self._prefetched.pop(id(shard), []))
+        req = self._new_request(request, shard)
+        while True:
+            result = pages.popleft() if pages else self._client.list_objects_v2(copy.copy(req), **self._op_kwargs)
+            contents = result.contents or []
+            if self._compact:
+                contents = models.ObjectRecord.as_records(contents)
+            yield from contents
+            if not result.is_truncated:
+                break
+            shard.continuation_token = result.next_continuation_token
+            req.continuation_token = result.next_continuation_token
+        shard.continuation_token = None
+        shard.done = True
+
+    def _iter_ranges(self, request: models.ListObjectsV2Request, shards: List[ListShard]):
+        if len(shards) == 0:
+            return
+
+        states = [_ShardState(shard, self._new_request(request, shard)) for shard in shards]
+        running = {}
+        buffered = 0
+        head = 0
+
+        with concurrent.futures.ThreadPoolExecutor(self._parallel_num) as executor:
+            while head < len(states):
+                # submits the next pages in the order of the shards
+                for i in range(head, len(states)):
+                    if len(running) >= self._parallel_num:
+                        break
+                    state = states[i]
+                    if state.future is not None or state.exhausted:
+                        continue
+                    if i > head and buffered + len(running) >= self._max_buffered_pages:
+                        break
+                    state.future = executor.submit(self._client.list_objects_v2, copy.copy(state.request), **self._op_kwargs)
+                    running[state.future] = state
+
+                # yields the received pages
+                emitted = False
+                for i in range(head, len(states) if not self._ordered else head + 1):
+                    state = states[i]
+                    while state.pages:
+                        contents, token, last = state.pages.popleft()
+                        buffered -= 1
+                        emitted = True
+                        yield from contents
+                        state.shard.continuation_token = token
+                        if last:
+                            state.shard.continuation_token = None
+                            state.shard.done = True
+
+                while head < len(states) and states[head].shard.done:
+                    head += 1
+
+                if emitted or len(running) == 0:
+                    continue
+
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    state = running.pop(future)
+                    state.future = None
+                    self._update_state(state, future.result())
+                    buffered += 1
+
+    def _update_state(self, state: _ShardState, result: models.ListObjectsV2Result) -> None:
+        contents = result.contents or []
+        end_key = state.shard.end_key
+        last = not result.is_truncated
+        if end_key is not None and len(contents) > 0 and contents[-1].key > end_key:
+            contents = [o for o in contents if o.key <= end_key]
+            last = True
+
+        if self._compact:
+            contents = models.ObjectRecord.as_records(contents)
+
+        state.pages.append((contents, result.next_continuation_token, last))
+        state.exhausted = last
+        state.request.continuation_token = result.next_continuation_token
+
+    def __repr__(self) -> str:
+        return "<ShardedLister>"
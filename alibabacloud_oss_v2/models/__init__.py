@@ -1,37 +1,294 @@
+# The models are imported on the first access of their names (PEP 562), so importing
+# the package only loads the modules which are used.
+# _import_structure lists the names of each module, a later module takes precedence like
+# the star imports do. tests/unit/test_lazy_import.py checks that it matches the modules.
+from typing import TYPE_CHECKING
+from .._lazy import attach
 
-from .enums import *
-from .service import *
-from .region import *
-from .bucket_basic import *
-from .object_basic import *
-from .access_point import *
-from .bucket_access_monitor import *
-from .bucket_archive_direct_read import *
-from .bucket_cname import *
-from .bucket_lifecycle import *
-from .bucket_cors import *
-from .bucket_inventory import *
-from .bucket_policy import *
-from .bucket_logging import *
-from .bucket_encryption import *
-from .bucket_website import *
-from .bucket_replication import *
-from .bucket_referer import *
-from .bucket_worm import *
-from .bucket_request_payment import *
-from .access_point_public_access_block import *
-from .bucket_data_redundancy_transition import *
-from .bucket_transfer_acceleration import *
-from .bucket_public_access_block import *
-from .public_access_block import *
-from .bucket_resource_group import *
-from .bucket_style import *
-from .bucket_tags import *
-from .bucket_meta_query import *
-from .bucket_https_config import *
-from .cloud_box import *
-from .select_object import *
-from .bucket_overwrite_config import *
-from .object_worm import *
-from .bucket_object_worm_configuration import *
-from .data_process import *
+_import_structure = {
+    'enums': [
+        'BucketACLType', 'StorageClassType', 'DataRedundancyType', 'ObjectACLType'
+    ],
+    'service': [
+        'ListBucketsRequest', 'BucketProperties', 'ListBucketsResult'
+    ],
+    'region': [
+        'DescribeRegionsRequest', 'RegionInfo', 'DescribeRegionsResult'
+    ],
+    'bucket_basic': [
+        'CreateBucketConfiguration', 'PutBucketRequest', 'PutBucketResult', 'DeleteBucketRequest',
+        'DeleteBucketResult', 'Owner', 'ObjectProperties', 'CommonPrefix', 'ListObjectsRequest',
+        'ListObjectsResult', 'PutBucketAclRequest', 'PutBucketAclResult', 'GetBucketAclRequest',
+        'AccessControlList', 'GetBucketAclResult', 'ListObjectsV2Request', 'ListObjectsV2Result',
+        'GetBucketStatRequest', 'GetBucketStatResult', 'GetBucketLocationRequest',
+        'GetBucketLocationResult', 'SSERule', 'BucketPolicy', 'BucketInfo', 'GetBucketInfoRequest',
+        'GetBucketInfoResult', 'VersioningConfiguration', 'PutBucketVersioningRequest',
+        'PutBucketVersioningResult', 'GetBucketVersioningRequest', 'GetBucketVersioningResult',
+        'ListObjectVersionsRequest', 'ObjectVersionProperties', 'DeleteMarkerProperties',
+        'ListObjectVersionsResult'
+    ],
+    'object_basic': [
+        'PutObjectRequest', 'PutObjectResult', 'HeadObjectRequest', 'HeadObjectResult',
+        'GetObjectRequest', 'GetObjectResult', 'AppendObjectRequest', 'AppendObjectResult',
+        'CopyObjectRequest', 'CopyObjectResult', 'DeleteObjectRequest', 'DeleteObjectResult',
+        'DeleteObject', 'ObjectIdentifier', 'Delete', 'DeleteMultipleObjectsRequest', 'DeletedInfo',
+        'DeleteMultipleObjectsResult', 'GetObjectMetaRequest', 'GetObjectMetaResult',
+        'JobParameters', 'RestoreRequest', 'RestoreObjectRequest', 'RestoreObjectResult',
+        'PutObjectAclRequest', 'PutObjectAclResult', 'GetObjectAclRequest', 'GetObjectAclResult',
+        'InitiateMultipartUploadRequest', 'InitiateMultipartUploadResult', 'UploadPartRequest',
+        'UploadPartResult', 'UploadPartCopyRequest', 'UploadPartCopyResult', 'UploadPart',
+        'CompleteMultipartUpload', 'CompleteMultipartUploadRequest',
+        'CompleteMultipartUploadResult', 'AbortMultipartUploadRequest',
+        'AbortMultipartUploadResult', 'ListMultipartUploadsRequest', 'Upload',
+        'ListMultipartUploadsResult', 'ListPartsRequest', 'Part', 'ListPartsResult',
+        'PutSymlinkRequest', 'PutSymlinkResult', 'GetSymlinkRequest', 'GetSymlinkResult', 'Tag',
+        'TagSet', 'Tagging', 'PutObjectTaggingRequest', 'PutObjectTaggingResult',
+        'GetObjectTaggingRequest', 'GetObjectTaggingResult', 'DeleteObjectTaggingRequest',
+        'DeleteObjectTaggingResult', 'ProcessObjectRequest', 'ProcessObjectResult',
+        'AsyncProcessObjectRequest', 'AsyncProcessObjectResult', 'CleanRestoredObjectRequest',
+        'CleanRestoredObjectResult', 'SealAppendObjectRequest', 'SealAppendObjectResult'
+    ],
+    'access_point': [
+        'AccessPointVpcConfiguration', 'CreateAccessPointConfiguration', 'CreateAccessPointRequest',
+        'CreateAccessPointResult', 'Endpoints', 'PublicAccessBlockConfiguration',
+        'GetAccessPointRequest', 'GetAccessPointResult', 'AccessPoint', 'ListAccessPointsRequest',
+        'ListAccessPointsResult', 'DeleteAccessPointRequest', 'DeleteAccessPointResult',
+        'PutAccessPointPolicyRequest', 'PutAccessPointPolicyResult', 'GetAccessPointPolicyRequest',
+        'GetAccessPointPolicyResult', 'DeleteAccessPointPolicyRequest',
+        'DeleteAccessPointPolicyResult'
+    ],
+    'bucket_access_monitor': [
+        'AccessMonitorStatusType', 'AccessMonitorConfiguration', 'PutBucketAccessMonitorRequest',
+        'PutBucketAccessMonitorResult', 'GetBucketAccessMonitorRequest',
+        'GetBucketAccessMonitorResult'
+    ],
+    'bucket_archive_direct_read': [
+        'ArchiveDirectReadConfiguration', 'PutBucketArchiveDirectReadRequest',
+        'PutBucketArchiveDirectReadResult', 'GetBucketArchiveDirectReadRequest',
+        'GetBucketArchiveDirectReadResult'
+    ],
+    'bucket_cname': [
+        'CnameCertificate', 'CnameToken', 'CertificateConfiguration', 'Cname',
+        'BucketCnameConfiguration', 'CnameInfo', 'PutCnameRequest', 'PutCnameResult',
+        'ListCnameRequest', 'ListCnameResult', 'DeleteCnameRequest', 'DeleteCnameResult',
+        'GetCnameTokenRequest', 'GetCnameTokenResult', 'CreateCnameTokenRequest',
+        'CreateCnameTokenResult'
+    ],
+    'bucket_lifecycle': [
+        'LifecycleRuleTransition', 'NoncurrentVersionExpiration',
+        'LifecycleRuleAbortMultipartUpload', 'LifecycleRuleExpiration',
+        'NoncurrentVersionTransition', 'LifecycleRuleNot', 'LifecycleRuleFilter', 'LifecycleRule',
+        'LifecycleConfiguration', 'PutBucketLifecycleRequest', 'PutBucketLifecycleResult',
+        'GetBucketLifecycleRequest', 'GetBucketLifecycleResult', 'DeleteBucketLifecycleRequest',
+        'DeleteBucketLifecycleResult'
+    ],
+    'bucket_cors': [
+        'CORSRule', 'CORSConfiguration', 'PutBucketCorsRequest', 'PutBucketCorsResult',
+        'GetBucketCorsRequest', 'GetBucketCorsResult', 'DeleteBucketCorsRequest',
+        'DeleteBucketCorsResult', 'OptionObjectRequest', 'OptionObjectResult'
+    ],
+    'bucket_inventory': [
+        'InventoryFormatType', 'InventoryFrequencyType', 'InventoryOptionalFieldType',
+        'IncrementalInventoryOptionalFieldType', 'SSEKMS', 'InventorySchedule', 'InventoryFilter',
+        'OptionalFields', 'IncrementInventorySchedule', 'IncrementalInventory',
+        'InventoryEncryption', 'InventoryOSSBucketDestination', 'InventoryDestination',
+        'InventoryConfiguration', 'ListInventoryConfigurationsResult', 'PutBucketInventoryRequest',
+        'PutBucketInventoryResult', 'GetBucketInventoryRequest', 'GetBucketInventoryResult',
+        'ListBucketInventoryRequest', 'ListBucketInventoryResult', 'DeleteBucketInventoryRequest',
+        'DeleteBucketInventoryResult'
+    ],
+    'bucket_policy': [
+        'PolicyStatus', 'PutBucketPolicyRequest', 'PutBucketPolicyResult', 'GetBucketPolicyRequest',
+        'GetBucketPolicyResult', 'DeleteBucketPolicyRequest', 'DeleteBucketPolicyResult',
+        'GetBucketPolicyStatusRequest', 'GetBucketPolicyStatusResult'
+    ],
+    'bucket_logging': [
+        'LoggingHeaderSet', 'LoggingParamSet', 'LoggingEnabled',
+        'UserDefinedLogFieldsConfiguration', 'BucketLoggingStatus', 'PutBucketLoggingRequest',
+        'PutBucketLoggingResult', 'GetBucketLoggingRequest', 'GetBucketLoggingResult',
+        'DeleteBucketLoggingRequest', 'DeleteBucketLoggingResult',
+        'PutUserDefinedLogFieldsConfigRequest', 'PutUserDefinedLogFieldsConfigResult',
+        'GetUserDefinedLogFieldsConfigRequest', 'GetUserDefinedLogFieldsConfigResult',
+        'DeleteUserDefinedLogFieldsConfigRequest', 'DeleteUserDefinedLogFieldsConfigResult'
+    ],
+    'bucket_encryption': [
+        'ApplyServerSideEncryptionByDefault', 'ServerSideEncryptionRule',
+        'PutBucketEncryptionRequest', 'PutBucketEncryptionResult', 'GetBucketEncryptionRequest',
+        'GetBucketEncryptionResult', 'DeleteBucketEncryptionRequest', 'DeleteBucketEncryptionResult'
+    ],
+    'bucket_website': [
+        'IndexDocument', 'MirrorHeadersSet', 'ErrorDocument', 'RoutingRuleIncludeHeader',
+        'MirrorAuth', 'RoutingRuleCondition', 'MirrorHeaders', 'MirrorTagging', 'MirrorTaggings',
+        'MirrorMultiAlternate', 'MirrorMultiAlternates', 'ReturnHeader', 'MirrorReturnHeaders',
+        'RoutingRuleRedirect', 'RoutingRuleLuaConfig', 'RoutingRule', 'RoutingRules',
+        'WebsiteConfiguration', 'GetBucketWebsiteRequest', 'GetBucketWebsiteResult',
+        'PutBucketWebsiteRequest', 'PutBucketWebsiteResult', 'DeleteBucketWebsiteRequest',
+        'DeleteBucketWebsiteResult'
+    ],
+    'bucket_replication': [
+        'TransferType', 'StatusType', 'HistoricalObjectReplicationType', 'TransferTypes',
+        'ReplicationProgressInformation', 'ReplicationPrefixSet', 'ReplicationRules',
+        'LocationRTCConstraint', 'ReplicationDestination', 'ReplicationTimeControl',
+        'LocationTransferType', 'SseKmsEncryptedObjects', 'ReplicationEncryptionConfiguration',
+        'LocationTransferTypeConstraint', 'RtcConfiguration', 'ReplicationProgressRule',
+        'ReplicationSourceSelectionCriteria', 'ReplicationRule', 'ReplicationConfiguration',
+        'ReplicationProgress', 'ReplicationLocation', 'PutBucketRtcRequest', 'PutBucketRtcResult',
+        'PutBucketReplicationRequest', 'PutBucketReplicationResult', 'GetBucketReplicationRequest',
+        'GetBucketReplicationResult', 'GetBucketReplicationLocationRequest',
+        'GetBucketReplicationLocationResult', 'GetBucketReplicationProgressRequest',
+        'GetBucketReplicationProgressResult', 'DeleteBucketReplicationRequest',
+        'DeleteBucketReplicationResult'
+    ],
+    'bucket_referer': [
+        'RefererList', 'RefererBlacklist', 'RefererConfiguration', 'PutBucketRefererRequest',
+        'PutBucketRefererResult', 'GetBucketRefererRequest', 'GetBucketRefererResult'
+    ],
+    'bucket_worm': [
+        'BucketWormStateType', 'InitiateWormConfiguration', 'ExtendWormConfiguration',
+        'WormConfiguration', 'InitiateBucketWormRequest', 'InitiateBucketWormResult',
+        'AbortBucketWormRequest', 'AbortBucketWormResult', 'CompleteBucketWormRequest',
+        'CompleteBucketWormResult', 'ExtendBucketWormRequest', 'ExtendBucketWormResult',
+        'GetBucketWormRequest', 'GetBucketWormResult'
+    ],
+    'bucket_request_payment': [
+        'RequestPaymentConfiguration', 'PutBucketRequestPaymentRequest',
+        'PutBucketRequestPaymentResult', 'GetBucketRequestPaymentRequest',
+        'GetBucketRequestPaymentResult'
+    ],
+    'access_point_public_access_block': [
+        'PublicAccessBlockConfiguration', 'PutAccessPointPublicAccessBlockRequest',
+        'PutAccessPointPublicAccessBlockResult', 'GetAccessPointPublicAccessBlockRequest',
+        'GetAccessPointPublicAccessBlockResult', 'DeleteAccessPointPublicAccessBlockRequest',
+        'DeleteAccessPointPublicAccessBlockResult'
+    ],
+    'bucket_data_redundancy_transition': [
+        'BucketDataRedundancyTransition', 'ListBucketDataRedundancyTransition',
+        'CreateBucketDataRedundancyTransitionRequest', 'CreateBucketDataRedundancyTransitionResult',
+        'GetBucketDataRedundancyTransitionRequest', 'GetBucketDataRedundancyTransitionResult',
+        'ListBucketDataRedundancyTransitionRequest', 'ListBucketDataRedundancyTransitionResult',
+        'ListUserDataRedundancyTransitionRequest', 'ListUserDataRedundancyTransitionResult',
+        'DeleteBucketDataRedundancyTransitionRequest', 'DeleteBucketDataRedundancyTransitionResult'
+    ],
+    'bucket_transfer_acceleration': [
+        'TransferAccelerationConfiguration', 'PutBucketTransferAccelerationRequest',
+        'PutBucketTransferAccelerationResult', 'GetBucketTransferAccelerationRequest',
+        'GetBucketTransferAccelerationResult'
+    ],
+    'bucket_public_access_block': [
+        'PublicAccessBlockConfiguration', 'GetBucketPublicAccessBlockRequest',
+        'GetBucketPublicAccessBlockResult', 'PutBucketPublicAccessBlockRequest',
+        'PutBucketPublicAccessBlockResult', 'DeleteBucketPublicAccessBlockRequest',
+        'DeleteBucketPublicAccessBlockResult'
+    ],
+    'public_access_block': [
+        'PublicAccessBlockConfiguration', 'GetPublicAccessBlockRequest',
+        'GetPublicAccessBlockResult', 'PutPublicAccessBlockRequest', 'PutPublicAccessBlockResult',
+        'DeletePublicAccessBlockRequest', 'DeletePublicAccessBlockResult'
+    ],
+    'bucket_resource_group': [
+        'BucketResourceGroupConfiguration', 'GetBucketResourceGroupRequest',
+        'GetBucketResourceGroupResult', 'PutBucketResourceGroupRequest',
+        'PutBucketResourceGroupResult'
+    ],
+    'bucket_style': [
+        'StyleInfo', 'StyleList', 'StyleContent', 'PutStyleRequest', 'PutStyleResult',
+        'ListStyleRequest', 'ListStyleResult', 'GetStyleRequest', 'GetStyleResult',
+        'DeleteStyleRequest', 'DeleteStyleResult'
+    ],
+    'bucket_tags': [
+        'Tagging', 'PutBucketTagsRequest', 'PutBucketTagsResult', 'GetBucketTagsRequest',
+        'GetBucketTagsResult', 'DeleteBucketTagsRequest', 'DeleteBucketTagsResult'
+    ],
+    'bucket_meta_query': [
+        'MetaQueryOrderType', 'MetaQueryAudioStream', 'MetaQueryVideoStream', 'MetaQuerySubtitle',
+        'MetaQueryGroup', 'MetaQueryGroups', 'MetaQueryAddress', 'MetaQueryAudioStreams',
+        'MetaQuerySubtitles', 'MetaQueryAddresses', 'MetaQueryVideoStreams', 'MetaQueryStatus',
+        'MetaQueryAggregation', 'MetaQueryTagging', 'MetaQueryUserMeta', 'MetaQueryOSSTagging',
+        'MetaQueryAggregations', 'MetaQueryRespFileInsightsImage', 'MetaQueryRespFileInsightsVideo',
+        'MetaQueryRespFileInsights', 'MetaQueryMediaTypes', 'MetaQuery', 'MetaQueryOSSUserMeta',
+        'MetaQueryFile', 'MetaQueryFiles', 'OpenMetaQueryRequest', 'OpenMetaQueryResult',
+        'GetMetaQueryStatusRequest', 'GetMetaQueryStatusResult', 'DoMetaQueryRequest',
+        'DoMetaQueryResult', 'CloseMetaQueryRequest', 'CloseMetaQueryResult'
+    ],
+    'bucket_https_config': [
+        'CipherSuite', 'TLS', 'HttpsConfiguration', 'GetBucketHttpsConfigRequest',
+        'GetBucketHttpsConfigResult', 'PutBucketHttpsConfigRequest', 'PutBucketHttpsConfigResult'
+    ],
+    'cloud_box': [
+        'CloudBoxProperties', 'ListCloudBoxesRequest', 'ListCloudBoxesResult'
+    ],
+    'select_object': [
+        'JSONInput', 'CSVOutput', 'JSONOutput', 'CSVInput', 'SelectRequestOptions',
+        'InputSerialization', 'OutputSerialization', 'SelectRequest', 'SelectObjectRequest',
+        'SelectObjectResult', 'CSVMetaRequest', 'JSONMetaRequest', 'CreateSelectObjectMetaRequest',
+        'CreateSelectObjectMetaResult'
+    ],
+    'bucket_overwrite_config': [
+        'OverwritePrincipals', 'OverwriteRule', 'OverwriteConfiguration',
+        'PutBucketOverwriteConfigRequest', 'PutBucketOverwriteConfigResult',
+        'GetBucketOverwriteConfigRequest', 'GetBucketOverwriteConfigResult',
+        'DeleteBucketOverwriteConfigRequest', 'DeleteBucketOverwriteConfigResult'
+    ],
+    'object_worm': [
+        'ObjectRetentionModeType', 'ObjectLegalHoldStatusType', 'Retention', 'LegalHold',
+        'PutObjectRetentionRequest', 'PutObjectRetentionResult', 'GetObjectRetentionRequest',
+        'GetObjectRetentionResult', 'PutObjectLegalHoldRequest', 'PutObjectLegalHoldResult',
+        'GetObjectLegalHoldRequest', 'GetObjectLegalHoldResult'
+    ],
+    'bucket_object_worm_configuration': [
+        'ObjectWormConfigurationModeType', 'ObjectWormConfigurationRuleDefaultRetention',
+        'ObjectWormConfigurationRule', 'ObjectWormConfiguration',
+        'PutBucketObjectWormConfigurationRequest', 'PutBucketObjectWormConfigurationResult',
+        'GetBucketObjectWormConfigurationRequest', 'GetBucketObjectWormConfigurationResult'
+    ],
+    'data_process': [
+        'DoMetaQueryActionRequest', 'DoMetaQueryActionResult', 'DoDataPipelineActionRequest',
+        'DoDataPipelineActionResult'
+    ],
+    'records': [
+        'ObjectRecord', 'ObjectVersionRecord', 'PartRecord', 'UploadRecord'
+    ],
+}
+
+# serde was exported by the star imports of the models
+__getattr__, __dir__ = attach(__name__, submodules=_import_structure, structure=_import_structure,
+                              aliases={'serde': 'alibabacloud_oss_v2.serde'})
+
+if TYPE_CHECKING:
+    from .enums import *
+    from .service import *
+    from .region import *
+    from .bucket_basic import *
+    from .object_basic import *
+    from .access_point import *
+    from .bucket_access_monitor import *
+    from .bucket_archive_direct_read import *
+    from .bucket_cname import *
+    from .bucket_lifecycle import *
+    from .bucket_cors import *
+    from .bucket_inventory import *
+    from .bucket_policy import *
+    from .bucket_logging import *
+    from .bucket_encryption import *
+    from .bucket_website import *
+    from .bucket_replication import *
+    from .bucket_referer import *
+    from .bucket_worm import *
+    from .bucket_request_payment import *
+    from .access_point_public_access_block import *
+    from .bucket_data_redundancy_transition import *
+    from .bucket_transfer_acceleration import *
+    from .bucket_public_access_block import *
+    from .public_access_block import *
+    from .bucket_resource_group import *
+    from .bucket_style import *
+    from .bucket_tags import *
+    from .bucket_meta_query import *
+    from .bucket_https_config import *
+    from .cloud_box import *
+    from .select_object import *
+    from .bucket_overwrite_config import *
+    from .object_worm import *
+    from .bucket_object_worm_configuration import *
+    from .data_process import *
+    from .records import *
@@ -0,0 +1,295 @@
+"""Compact records for the entries of the listing results"""
+# pylint: disable=too-few-public-methods, attribute-defined-outside-init, protected-access
+import sys
+import datetime
+from typing import Optional, Any, List, Tuple, Dict, Callable
+from xml.etree import ElementTree as ET
+from .. import serde
+from .bucket_basic import ObjectProperties, ObjectVersionProperties, Owner
+from .object_basic import Part, Upload
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def _to_epoch_us(value: Optional[datetime.datetime]) -> Optional[int]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_epoch_us(value: Optional[int]) -> Optional[datetime.datetime]:
+    if value is None:
+        return None
+    return _EPOCH + datetime.timedelta(microseconds=value)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    return sys.intern(value)
+
+
+def _plain_setter(name: str) -> Callable[[Any, Any], None]:
+    def _set(record, value):
+        setattr(record, name, value)
+    return _set
+
+
+def _interned_setter(name: str) -> Callable[[Any, Any], None]:
+    def _set(record, value):
+        setattr(record, name, _intern(value))
+    return _set
+
+
+def _time_setter(name: str) -> Callable[[Any, Any], None]:
+    slot = '_' + name
+
+    def _set(record, value):
+        setattr(record, slot, _to_epoch_us(value))
+    return _set
+
+
+def _owner_converter() -> Callable[[ET.Element], Tuple[Optional[str], Optional[str]]]:
+    """Returns the function to convert the owner element into the interned (id, display_name),
+    the Owner model is not created.
+    """
+    fields = {attr: (attr_key, convert) for attr, attr_key, _, convert
+              in serde._compile_xml_plan(Owner, Owner._attribute_map)}
+
+    def _value(elem: ET.Element, attr: str) -> Optional[str]:
+        attr_key, convert = fields[attr]
+        child = elem.find(attr_key)
+        return _intern(convert(child)) if child is not None else None
+
+    def _convert(elem: ET.Element) -> Tuple[Optional[str], Optional[str]]:
+        return _value(elem, 'id'), _value(elem, 'display_name')
+    return _convert
+
+
+def _set_owner(record, value: Optional[Tuple[Optional[str], Optional[str]]]) -> None:
+    record._owner_id, record._owner_display_name = value or (None, None)
+
+
+# compiled xml plans of the records, keyed by the record class
+_XML_PLANS: Dict[type, List[Any]] = {}
+
+
+def _time_property(name: str) -> property:
+    slot = '_' + name
+
+    def _get(self) -> Optional[datetime.datetime]:
+        return _from_epoch_us(getattr(self, slot))
+
+    def _set(self, value: Optional[datetime.datetime]) -> None:
+        setattr(self, slot, _to_epoch_us(value))
+
+    return property(_get, _set)
+
+
+class _Record:
+    """Base class of the compact records.
+
+    A record keeps the fields of a listing entry in __slots__,
+    the time fields as epoch microseconds and the repeated strings interned.
+    """
+    __slots__ = ()
+
+    # the model class the record is converted to
+    _model: Any = None
+
+    # the fields stored as they are
+    _plain: Tuple[str, ...] = ()
+
+    # the fields whose values are interned
+    _interned: Tuple[str, ...] = ()
+
+    # the datetime fields, stored as epoch microseconds in the '_' prefixed slots
+    _times: Tuple[str, ...] = ()
+
+    # the owner field, stored as the interned id and display name
+    _has_owner = False
+
+    # all the fields, in the order of the model's arguments
+    _fields: Tuple[str, ...] = ()
+
+    def __init__(self, **kwargs: Any) -> None:
+        for name in self._fields:
+            setattr(self, name, kwargs.get(name, None))
+
+    @classmethod
+    def from_model(cls, model: Any) -> "_Record":
+        """Creates a record from the model"""
+        record = cls.__new__(cls)
+        for name in cls._plain:
+            setattr(record, name, getattr(model, name, None))
+        for name in cls._interned:
+            setattr(record, name, _intern(getattr(model, name, None)))
+        for name in cls._times:
+            setattr(record, '_' + name, _to_epoch_us(getattr(model, name, None)))
+        if cls._has_owner:
+            record.owner = getattr(model, 'owner', None)
+        return record
+
+    @classmethod
+    def from_xml(cls, elem: ET.Element) -> "_Record":
+        """Creates a record from the xml element of the model, the model is not created"""
+        plan = _XML_PLANS.get(cls)
+        if plan is None:
+            plan = cls._compile_xml_plan()
+            _XML_PLANS[cls] = plan
+        fields, missing = plan
+        record = cls.__new__(cls)
+        for setter, attr_key, convert in fields:
+            child = elem.find(attr_key)
+            setter(record, convert(child) if child is not None else None)
+        for setter in missing:
+            setter(record, None)
+        return record
+
+    @classmethod
+    def _compile_xml_plan(cls) -> Tuple[List[Any], List[Any]]:
+        """Compiles the model's xml plan into (fields, missing),
+        fields is a list of (setter, key, convert), missing is the setters of the fields not in the xml
+        """
+        fields = []
+        done = set()
+        for attr, attr_key, _, convert in serde._compile_xml_plan(cls._model, cls._model._attribute_map):
+            if attr not in cls._fields:
+                continue
+            if attr == 'owner' and cls._has_owner:
+                setter, convert = _set_owner, _owner_converter()
+            elif attr in cls._interned:
+                setter = _interned_setter(attr)
+            elif attr in cls._times:
+                setter = _time_setter(attr)
+            else:
+                setter = _plain_setter(attr)
+            fields.append((setter, attr_key, convert))
+            done.add(attr)
+
+        missing = []
+        for name in cls._fields:
+            if name in done:
+                continue
+            if name == 'owner':
+                missing.append(_set_owner)
+            elif name in cls._times:
+                missing.append(_time_setter(name))
+            else:
+                missing.append(_plain_setter(name))
+        return fields, missing
+
+    @classmethod
+    def from_models(cls, models: Optional[List[Any]]) -> Optional[List["_Record"]]:
+        """Creates the records from a list of the models, None is kept as it is"""
+        if models is None:
+            return None
+        return [cls.from_model(m) for m in models]
+
+    @classmethod
+    def as_records(cls, items: Optional[List[Any]]) -> Optional[List["_Record"]]:
+        """Returns the items as the records, the records are kept and the models are converted"""
+        if not items or isinstance(items[0], cls):
+            return items
+        return cls.from_models(items)
+
+    def to_model(self) -> Any:
+        """Converts the record to the model"""
+        return self._model(**{name: getattr(self, name) for name in self._fields})
+
+    def _as_dict(self):
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, self.__class__):
+            return self._as_dict() == other._as_dict()
+        return False
+
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+
+    def __str__(self) -> str:
+        return str(self._as_dict())
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self._as_dict()}>'
+
+
+class _OwnerRecord(_Record):
+    """Base class of the compact records which have the owner field"""
+    __slots__ = ('_owner_id', '_owner_display_name')
+
+    _has_owner = True
+
+    @property
+    def owner(self) -> Optional[Owner]:
+        """The owner of the object, a new Owner is returned on every access"""
+        if self._owner_id is None and self._owner_display_name is None:
+            return None
+        return Owner(id=self._owner_id, display_name=self._owner_display_name)
+
+    @owner.setter
+    def owner(self, value: Optional[Owner]) -> None:
+        if value is None:
+            self._owner_id = None
+            self._owner_display_name = None
+        else:
+            self._owner_id = _intern(value.id)
+            self._owner_display_name = _intern(value.display_name)
+
+
+class ObjectRecord(_OwnerRecord):
+    """The compact form of ObjectProperties"""
+    __slots__ = ('key', 'object_type', 'size', 'etag', '_last_modified',
+                 'storage_class', 'restore_info', 'transition_time')
+
+    _model = ObjectProperties
+    _plain = ('key', 'size', 'etag', 'restore_info', 'transition_time')
+    _interned = ('object_type', 'storage_class')
+    _times = ('last_modified',)
+    _fields = ('key', 'object_type', 'size', 'etag', 'last_modified',
+               'storage_class', 'owner', 'restore_info', 'transition_time')
+
+    last_modified = _time_property('last_modified')
+
+
+class ObjectVersionRecord(_OwnerRecord):
+    """The compact form of ObjectVersionProperties"""
+    __slots__ = ('key', 'version_id', 'is_latest', 'object_type', 'size', 'etag',
+                 '_last_modified', 'storage_class', 'restore_info', 'transition_time')
+
+    _model = ObjectVersionProperties
+    _plain = ('key', 'version_id', 'is_latest', 'size', 'etag', 'restore_info', 'transition_time')
+    _interned = ('object_type', 'storage_class')
+    _times = ('last_modified',)
+    _fields = ('key', 'version_id', 'is_latest', 'object_type', 'size', 'etag',
+               'last_modified', 'storage_class', 'owner', 'restore_info', 'transition_time')
+
+    last_modified = _time_property('last_modified')
+
+
+class PartRecord(_Record):
+    """The compact form of Part"""
+    __slots__ = ('part_number', 'etag', '_last_modified', 'size', 'hash_crc64')
+
+    _model = Part
+    _plain = ('part_number', 'etag', 'size', 'hash_crc64')
+    _times = ('last_modified',)
+    _fields = ('part_number', 'etag', 'last_modified', 'size', 'hash_crc64')
+
+    last_modified = _time_property('last_modified')
+
+
+class UploadRecord(_Record):
+    """The compact form of Upload"""
+    __slots__ = ('key', 'upload_id', '_initiated')
+
+    _model = Upload
+    _plain = ('key', 'upload_id')
+    _times = ('initiated',)
+    _fields = ('key', 'upload_id', 'initiated')
+
+    initiated = _time_property('initiated')
@@ -1,37 +1,175 @@
+# The operations are imported on the first access of their names (PEP 562), so importing
+# the package only loads the modules which are used.
+# _import_structure lists the names of each module, a later module takes precedence like
+# the star imports do. tests/unit/test_lazy_import.py checks that it matches the modules.
+from typing import TYPE_CHECKING
+from .._lazy import attach
 
-from .service import *
-from .region import *
-from .bucket_basic import *
-from .object_basic import *
-from .access_point import *
-from .bucket_access_monitor import *
-from .bucket_archive_direct_read import *
-from .bucket_cname import *
-from .bucket_cors import *
-from .bucket_inventory import *
-from .bucket_policy import *
-from .bucket_lifecycle import *
-from .bucket_cors import *
-from .bucket_logging import *
-from .bucket_encryption import *
-from .bucket_website import *
-from .bucket_replication import *
-from .bucket_referer import *
-from .bucket_worm import *
-from .bucket_request_payment import *
-from .access_point_public_access_block import *
-from .bucket_data_redundancy_transition import *
-from .bucket_transfer_acceleration import *
-from .bucket_public_access_block import *
-from .public_access_block import *
-from .bucket_resource_group import *
-from .bucket_style import *
-from .bucket_tags import *
-from .bucket_meta_query import *
-from .bucket_https_config import *
-from .cloud_box import *
-from .select_object import select_object, create_select_object_meta
-from .bucket_overwrite_config import *
-from .object_worm import *
-from .bucket_object_worm_configuration import *
-from .data_process import *
+_import_structure = {
+    'service': [
+        'list_buckets'
+    ],
+    'region': [
+        'describe_regions'
+    ],
+    'bucket_basic': [
+        'put_bucket', 'delete_bucket', 'list_objects', 'put_bucket_acl', 'get_bucket_acl',
+        'list_objects_v2', 'list_objects_v2_iter', 'list_objects_v2_columnar', 'get_bucket_stat',
+        'get_bucket_location', 'get_bucket_info', 'put_bucket_versioning', 'get_bucket_versioning',
+        'list_object_versions'
+    ],
+    'object_basic': [
+        'put_object', 'head_object', 'get_object', 'append_object', 'copy_object', 'delete_object',
+        'delete_multiple_objects', 'get_object_meta', 'restore_object', 'put_object_acl',
+        'get_object_acl', 'initiate_multipart_upload', 'upload_part', 'upload_part_copy',
+        'complete_multipart_upload', 'abort_multipart_upload', 'list_multipart_uploads',
+        'list_parts', 'put_symlink', 'get_symlink', 'put_object_tagging', 'get_object_tagging',
+        'delete_object_tagging', 'process_object', 'async_process_object', 'clean_restored_object',
+        'seal_append_object'
+    ],
+    'access_point': [
+        'create_access_point', 'get_access_point', 'list_access_points', 'delete_access_point',
+        'put_access_point_policy', 'get_access_point_policy', 'delete_access_point_policy'
+    ],
+    'bucket_access_monitor': [
+        'put_bucket_access_monitor', 'get_bucket_access_monitor'
+    ],
+    'bucket_archive_direct_read': [
+        'get_bucket_archive_direct_read', 'put_bucket_archive_direct_read'
+    ],
+    'bucket_cname': [
+        'put_cname', 'list_cname', 'delete_cname', 'get_cname_token', 'create_cname_token'
+    ],
+    'bucket_cors': [
+        'put_bucket_cors', 'get_bucket_cors', 'delete_bucket_cors', 'option_object'
+    ],
+    'bucket_inventory': [
+        'put_bucket_inventory', 'get_bucket_inventory', 'list_bucket_inventory',
+        'delete_bucket_inventory'
+    ],
+    'bucket_policy': [
+        'put_bucket_policy', 'get_bucket_policy', 'delete_bucket_policy', 'get_bucket_policy_status'
+    ],
+    'bucket_lifecycle': [
+        'put_bucket_lifecycle', 'get_bucket_lifecycle', 'delete_bucket_lifecycle'
+    ],
+    'bucket_logging': [
+        'put_bucket_logging', 'get_bucket_logging', 'delete_bucket_logging',
+        'put_user_defined_log_fields_config', 'get_user_defined_log_fields_config',
+        'delete_user_defined_log_fields_config'
+    ],
+    'bucket_encryption': [
+        'put_bucket_encryption', 'get_bucket_encryption', 'delete_bucket_encryption'
+    ],
+    'bucket_website': [
+        'get_bucket_website', 'put_bucket_website', 'delete_bucket_website'
+    ],
+    'bucket_replication': [
+        'put_bucket_rtc', 'put_bucket_replication', 'get_bucket_replication',
+        'get_bucket_replication_location', 'get_bucket_replication_progress',
+        'delete_bucket_replication'
+    ],
+    'bucket_referer': [
+        'put_bucket_referer', 'get_bucket_referer'
+    ],
+    'bucket_worm': [
+        'initiate_bucket_worm', 'abort_bucket_worm', 'complete_bucket_worm', 'extend_bucket_worm',
+        'get_bucket_worm'
+    ],
+    'bucket_request_payment': [
+        'put_bucket_request_payment', 'get_bucket_request_payment'
+    ],
+    'access_point_public_access_block': [
+        'put_access_point_public_access_block', 'get_access_point_public_access_block',
+        'delete_access_point_public_access_block'
+    ],
+    'bucket_data_redundancy_transition': [
+        'create_bucket_data_redundancy_transition', 'get_bucket_data_redundancy_transition',
+        'list_bucket_data_redundancy_transition', 'list_user_data_redundancy_transition',
+        'delete_bucket_data_redundancy_transition'
+    ],
+    'bucket_transfer_acceleration': [
+        'put_bucket_transfer_acceleration', 'get_bucket_transfer_acceleration'
+    ],
+    'bucket_public_access_block': [
+        'get_bucket_public_access_block', 'put_bucket_public_access_block',
+        'delete_bucket_public_access_block'
+    ],
+    'public_access_block': [
+        'get_public_access_block', 'put_public_access_block', 'delete_public_access_block'
+    ],
+    'bucket_resource_group': [
+        'get_bucket_resource_group', 'put_bucket_resource_group'
+    ],
+    'bucket_style': [
+        'put_style', 'list_style', 'get_style', 'delete_style'
+    ],
+    'bucket_tags': [
+        'put_bucket_tags', 'get_bucket_tags', 'delete_bucket_tags'
+    ],
+    'bucket_meta_query': [
+        'get_meta_query_status', 'close_meta_query', 'do_meta_query', 'open_meta_query'
+    ],
+    'bucket_https_config': [
+        'get_bucket_https_config', 'put_bucket_https_config'
+    ],
+    'cloud_box': [
+        'list_cloud_boxes'
+    ],
+    'select_object': [
+        'select_object', 'create_select_object_meta'
+    ],
+    'bucket_overwrite_config': [
+        'put_bucket_overwrite_config', 'get_bucket_overwrite_config',
+        'delete_bucket_overwrite_config'
+    ],
+    'object_worm': [
+        'put_object_retention', 'get_object_retention', 'put_object_legal_hold',
+        'get_object_legal_hold'
+    ],
+    'bucket_object_worm_configuration': [
+        'put_bucket_object_worm_configuration', 'get_bucket_object_worm_configuration'
+    ],
+    'data_process': [
+        'do_meta_query_action', 'do_data_pipeline_action'
+    ],
+}
+
+__getattr__, __dir__ = attach(__name__, submodules=_import_structure, structure=_import_structure)
+
+if TYPE_CHECKING:
+    from .service import *
+    from .region import *
+    from .bucket_basic import *
+    from .object_basic import *
+    from .access_point import *
+    from .bucket_access_monitor import *
+    from .bucket_archive_direct_read import *
+    from .bucket_cname import *
+    from .bucket_cors import *
+    from .bucket_inventory import *
+    from .bucket_policy import *
+    from .bucket_lifecycle import *
+    from .bucket_logging import *
+    from .bucket_encryption import *
+    from .bucket_website import *
+    from .bucket_replication import *
+    from .bucket_referer import *
+    from .bucket_worm import *
+    from .bucket_request_payment import *
+    from .access_point_public_access_block import *
+    from .bucket_data_redundancy_transition import *
+    from .bucket_transfer_acceleration import *
+    from .bucket_public_access_block import *
+    from .public_access_block import *
+    from .bucket_resource_group import *
+    from .bucket_style import *
+    from .bucket_tags import *
+    from .bucket_meta_query import *
+    from .bucket_https_config import *
+    from .cloud_box import *
+    from .select_object import select_object, create_select_object_meta
+    from .bucket_overwrite_config import *
+    from .object_worm import *
+    from .bucket_object_worm_configuration import *
+    from .data_process import *
@@ -1,10 +1,12 @@
 """APIs for bucket basic operation."""
 # pylint: disable=line-too-long
 
+from typing import Generator
 from ..types import OperationInput, CaseInsensitiveDict
 from .. import serde
 from .. import serde_utils
 from .. import models
+from .. import columnar
 from .._client import _SyncClientImpl
 
 
@@ -91,6 +93,7 @@ def list_objects(client: _SyncClientImpl, request: models.ListObjectsRequest, **
     Args:
         client (_SyncClientImpl): A agent that sends the request.
         request (ListObjectsRequest): The request for the ListObjects operation.
+        compact (bool, optional): Whether to build the entries as ObjectRecord instead of the models.
 
     Returns:
         ListObjectsResult: The result for the ListObjects operation.
@@ -120,7 +123,8 @@ def list_objects(client: _SyncClientImpl, request: models.ListObjectsRequest, **
         result=models.ListObjectsResult(),
         op_output=op_output,
         custom_deserializer=[
-            serde.deserialize_output_xmlbody,
+            (serde_utils.deserialize_output_xmlbody_compact if kwargs.get('compact', False)
+             else serde.deserialize_output_xmlbody),
             serde_utils.deserialize_encode_type
         ],
     )
@@ -208,6 +212,7 @@ def list_objects_v2(client: _SyncClientImpl, request: models.ListObjectsV2Reques
     Args:
         client (_SyncClientImpl): A agent that sends the request.
         request (ListObjectsV2Request): The request for the ListObjectsV2 operation.
+        compact (bool, optional): Whether to build the entries as ObjectRecord instead of the models.
 
     Returns:
         ListObjectsV2Result: The result for the ListObjectsV2 operation.
@@ -238,11 +243,109 @@ def list_objects_v2(client: _SyncClientImpl, request: models.ListObjectsV2Reques
         result=models.ListObjectsV2Result(),
         op_output=op_output,
         custom_deserializer=[
-            serde.deserialize_output_xmlbody,
+            (serde_utils.deserialize_output_xmlbody_compact if kwargs.get('compact', False)
+             else serde.deserialize_output_xmlbody_stream),
             serde_utils.deserialize_encode_type
         ],
     )
 
+def list_objects_v2_iter(client: _SyncClientImpl, request: models.ListObjectsV2Request, **kwargs
+                         ) -> Generator[models.ObjectProperties, None, models.ListObjectsV2Result]:
+    """
+    list objects synchronously, the objects are yielded one by one while the response body is being parsed.
+    The body is read before the operation returns, so a failed read is retried like in the other operations.
+
+    Args:
+        client (_SyncClientImpl): A agent that sends the request.
+        request (ListObjectsV2Request): The request for the ListObjectsV2 operation.
+        compact (bool, optional): Whether to build the entries as ObjectRecord instead of the models.
+
+    Yields:
+        ObjectProperties: The metadata of the objects in the page.
+
+    Returns:
+        ListObjectsV2Result: The result for the ListObjectsV2 operation without the contents field,
+            it is the value of the StopIteration.
+    """
+
+    op_input = serde.serialize_input(
+        request=request,
+        op_input=OperationInput(
+            op_name='ListObjectsV2',
+            method='GET',
+            headers=CaseInsensitiveDict({
+                'Content-Type': 'application/octet-stream',
+            }),
+            parameters={
+                'encoding-type': 'url',
+                'list-type': 2,
+            },
+            bucket=request.bucket,
+        ),
+        custom_serializer=[
+            serde_utils.add_content_md5
+        ]
+    )
+
+    op_output = client.invoke_operation(op_input, **kwargs)
+
+    result = serde.deserialize_output(
+        result=models.ListObjectsV2Result(),
+        op_output=op_output,
+    )
+
+    converters = serde_utils.compact_converters(result) if kwargs.get('compact', False) else None
+    try:
+        items = (item for _, item in serde.iter_deserialize_xml(
+            serde.iter_output_body(op_output), result, stream_attrs=['contents'], converters=converters))
+        yield from serde_utils.iter_deserialize_encode_type_items(result, items)
+    finally:
+        op_output.http_response.close()
+
+    return serde_utils.deserialize_encode_type(result, op_output)
+
+def list_objects_v2_columnar(client: _SyncClientImpl, request: models.ListObjectsV2Request, **kwargs) -> columnar.ObjectBatch:
+    """
+    list objects synchronously, the objects are decoded into columns without creating ObjectProperties.
+
+    Args:
+        client (_SyncClientImpl): A agent that sends the request.
+        request (ListObjectsV2Request): The request for the ListObjectsV2 operation.
+
+    Returns:
+        ObjectBatch: The objects of the page in columns, its result field holds the result
+            for the ListObjectsV2 operation without the contents field.
+    """
+
+    op_input = serde.serialize_input(
+        request=request,
+        op_input=OperationInput(
+            op_name='ListObjectsV2',
+            method='GET',
+            headers=CaseInsensitiveDict({
+                'Content-Type': 'application/octet-stream',
+            }),
+            parameters={
+                'encoding-type': 'url',
+                'list-type': 2,
+            },
+            bucket=request.bucket,
+        ),
+        custom_serializer=[
+            serde_utils.add_content_md5
+        ]
+    )
+
+    op_output = client.invoke_operation(op_input, **kwargs)
+
+    result = serde.deserialize_output(
+        result=models.ListObjectsV2Result(),
+        op_output=op_output,
+    )
+    batch = columnar.deserialize_output_object_batch(result, op_output)
+    serde_utils.deserialize_encode_type(result, op_output)
+    return batch
+
 def get_bucket_stat(client: _SyncClientImpl, request: models.GetBucketStatRequest, **kwargs) -> models.GetBucketStatResult:
     """
     GetBucketStat Queries the storage capacity of a specified bucket and the number of objects that are stored in the bucket.
@@ -443,6 +546,7 @@ def list_object_versions(client: _SyncClientImpl, request: models.ListObjectVers
     Args:
         client (_SyncClientImpl): A agent that sends the request.
         request (ListObjectVersionsRequest): The request for the ListObjectVersions operation.
+        compact (bool, optional): Whether to build the entries as ObjectVersionRecord instead of the models.
 
     Returns:
         ListObjectVersionsResult: The result for the ListObjectVersions operation.
@@ -473,7 +577,8 @@ def list_object_versions(client: _SyncClientImpl, request: models.ListObjectVers
         result=models.ListObjectVersionsResult(),
         op_output=op_output,
         custom_deserializer=[
-            serde.deserialize_output_xmlbody,
+            (serde_utils.deserialize_output_xmlbody_compact if kwargs.get('compact', False)
+             else serde.deserialize_output_xmlbody_stream),
             serde_utils.deserialize_encode_type
         ],
     )
@@ -645,6 +645,7 @@ def list_multipart_uploads(client: _SyncClientImpl, request: models.ListMultipar
     Args:
         client (_SyncClientImpl): A agent that sends the request.
         request (ListMultipartUploadsRequest): The request for the ListMultipartUploads operation.
+        compact (bool, optional): Whether to build the entries as UploadRecord instead of the models.
 
     Returns:
         ListMultipartUploadsResult: The result for the ListMultipartUploads operation.
@@ -672,7 +673,8 @@ def list_multipart_uploads(client: _SyncClientImpl, request: models.ListMultipar
         result=models.ListMultipartUploadsResult(),
         op_output=op_output,
         custom_deserializer=[
-            serde.deserialize_output_xmlbody,
+            (serde_utils.deserialize_output_xmlbody_compact if kwargs.get('compact', False)
+             else serde.deserialize_output_xmlbody_stream),
             serde_utils.deserialize_encode_type
         ],
     )
@@ -686,6 +688,7 @@ def list_parts(client: _SyncClientImpl, request: models.ListPartsRequest, **kwar
     Args:
         client (_SyncClientImpl): A agent that sends the request.
         request (ListPartsRequest): The request for the ListParts operation.
+        compact (bool, optional): Whether to build the entries as PartRecord instead of the models.
 
     Returns:
         ListPartsResult: The result for the ListParts operation.
@@ -713,7 +716,8 @@ def list_parts(client: _SyncClientImpl, request: models.ListPartsRequest, **kwar
         result=models.ListPartsResult(),
         op_output=op_output,
         custom_deserializer=[
-            serde.deserialize_output_xmlbody,
+            (serde_utils.deserialize_output_xmlbody_compact if kwargs.get('compact', False)
+             else serde.deserialize_output_xmlbody_stream),
             serde_utils.deserialize_encode_type
         ],
     )
@@ -1,10 +1,24 @@
 """Paginator for list operation."""
 import abc
 import copy
-from typing import Iterator, Any
+from typing import Iterator, Generator, Any
 from . import models
 
 
+def _to_records(page: Generator, record: Any) -> Generator:
+    """Yields the items of the page as the records, and returns the return value of the page."""
+    try:
+        while True:
+            try:
+                item = next(page)
+            except StopIteration as stop:
+                return stop.value
+            # the clients which do not build the records return the models
+            yield item if isinstance(item, record) else record.from_model(item)
+    finally:
+        page.close()
+
+
 class ListObjectsAPIClient(abc.ABC):
     """Abstract base class for list_objects client."""
 
@@ -24,9 +38,11 @@ class ListObjectsPaginator:
         """
             client (ListObjectsAPIClient): A agent that sends the request.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as ObjectRecord instead of the models.
         """
         self._client = client
         self._limit = kwargs.get('limit', None)
+        self._compact = kwargs.get('compact', False)
 
     def iter_page(self, request: models.ListObjectsRequest, **kwargs: Any) -> Iterator[models.ListObjectsResult]:
         """Iterates over the objects.
@@ -34,11 +50,15 @@ class ListObjectsPaginator:
         Args:
             request (models.ListObjectsRequest): The request for the ListObjects operation.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as ObjectRecord instead of the models.
 
         Yields:
             Iterator[models.ListObjectsResult]: An iterator of ListObjectsResult from the response
         """
         limit = kwargs.get('limit', self._limit)
+        compact = kwargs.get('compact', self._compact)
+        # the records are built by the deserializer, the models are not created
+        op_kwargs = {'compact': True} if compact else {}
         req = copy.copy(request)
         if limit is not None:
             req.max_keys = limit
@@ -47,7 +67,9 @@ class ListObjectsPaginator:
         is_truncated = False
 
         while first_page or is_truncated:
-            result = self._client.list_objects(req)
+            result = self._client.list_objects(req, **op_kwargs)
+            if compact:
+                result.contents = models.ObjectRecord.as_records(result.contents)
             yield result
 
             first_page = False
@@ -77,9 +99,11 @@ class ListObjectsV2Paginator:
         """
             client (ListObjectsV2APIClient): A agent that sends the request.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as ObjectRecord instead of the models.
         """
         self._client = client
         self._limit = kwargs.get('limit', None)
+        self._compact = kwargs.get('compact', False)
 
     def iter_page(self, request: models.ListObjectsV2Request, **kwargs: Any) -> Iterator[models.ListObjectsV2Result]:
         """Iterates over the objects with v2.
@@ -87,11 +111,15 @@ class ListObjectsV2Paginator:
         Args:
             request (models.ListObjectsV2Request): The request for the ListObjectsV2 operation.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as ObjectRecord instead of the models.
 
         Yields:
             Iterator[models.ListObjectsV2Result]: An iterator of ListObjectsV2Result from the response
         """
         limit = kwargs.get('limit', self._limit)
+        compact = kwargs.get('compact', self._compact)
+        # the records are built by the deserializer, the models are not created
+        op_kwargs = {'compact': True} if compact else {}
         req = copy.copy(request)
         if limit is not None:
             req.max_keys = limit
@@ -100,13 +128,57 @@ class ListObjectsV2Paginator:
         is_truncated = False
 
         while first_page or is_truncated:
-            result = self._client.list_objects_v2(req)
+            result = self._client.list_objects_v2(req, **op_kwargs)
+            if compact:
+                result.contents = models.ObjectRecord.as_records(result.contents)
             yield result
 
             first_page = False
             is_truncated = result.is_truncated
             req.continuation_token = result.next_continuation_token
 
+    def iter_objects(self, request: models.ListObjectsV2Request, **kwargs: Any) -> Iterator[models.ObjectProperties]:
+        """Iterates over the objects with v2 one by one.
+
+        If the client supports list_objects_v2_iter, the objects are yielded
+        while the response body is being parsed, otherwise page by page.
+
+        Args:
+            request (models.ListObjectsV2Request): The request for the ListObjectsV2 operation.
+            limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as ObjectRecord instead of the models.
+
+        Yields:
+            Iterator[models.ObjectProperties]: An iterator of ObjectProperties from the responses
+        """
+        limit = kwargs.get('limit', self._limit)
+        compact = kwargs.get('compact', self._compact)
+        # the records are built by the deserializer, the models are not created
+        op_kwargs = {'compact': True} if compact else {}
+        req = copy.copy(request)
+        if limit is not None:
+            req.max_keys = limit
+
+        list_iter = getattr(self._client, 'list_objects_v2_iter', None)
+        first_page = True
+        is_truncated = False
+
+        while first_page or is_truncated:
+            if list_iter is not None:
+                page = list_iter(req, **op_kwargs)
+                if compact:
+                    page = _to_records(page, models.ObjectRecord)
+                result = yield from page
+            else:
+                result = self._client.list_objects_v2(req, **op_kwargs)
+                if compact:
+                    result.contents = models.ObjectRecord.as_records(result.contents)
+                yield from result.contents or []
+
+            first_page = False
+            is_truncated = result.is_truncated
+            req.continuation_token = result.next_continuation_token
+
     def __repr__(self) -> str:
         return "<ListObjectsV2Paginator>"
 
@@ -129,9 +201,11 @@ class ListObjectVersionsPaginator:
         """
             client (ListObjectVersionsAPIClient): A agent that sends the request.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as ObjectVersionRecord instead of the models.
         """
         self._client = client
         self._limit = kwargs.get('limit', None)
+        self._compact = kwargs.get('compact', False)
 
     def iter_page(self, request: models.ListObjectVersionsRequest, **kwargs: Any) -> Iterator[models.ListObjectVersionsResult]:
         """Iterates over the object versions.
@@ -139,11 +213,15 @@ class ListObjectVersionsPaginator:
         Args:
             request (models.ListObjectVersionsRequest): The request for the ListObjectVersions operation.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as ObjectVersionRecord instead of the models.
 
         Yields:
             Iterator[models.ListObjectVersionsResult]: An iterator of ListObjectVersionsResult from the response
         """
         limit = kwargs.get('limit', self._limit)
+        compact = kwargs.get('compact', self._compact)
+        # the records are built by the deserializer, the models are not created
+        op_kwargs = {'compact': True} if compact else {}
         req = copy.copy(request)
         if limit is not None:
             req.max_keys = limit
@@ -152,7 +230,9 @@ class ListObjectVersionsPaginator:
         is_truncated = False
 
         while first_page or is_truncated:
-            result = self._client.list_object_versions(req)
+            result = self._client.list_object_versions(req, **op_kwargs)
+            if compact:
+                result.version = models.ObjectVersionRecord.as_records(result.version)
             yield result
 
             first_page = False
@@ -234,9 +314,11 @@ class ListPartsPaginator:
         """
             client (_SyncClientImpl): A agent that sends the request.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as PartRecord instead of the models.
         """
         self._client = client
         self._limit = kwargs.get('limit', None)
+        self._compact = kwargs.get('compact', False)
 
     def iter_page(self, request: models.ListPartsRequest, **kwargs: Any) -> Iterator[models.ListPartsResult]:
         """Iterates over the parts.
@@ -244,11 +326,15 @@ class ListPartsPaginator:
         Args:
             request (models.ListPartsRequest): The request for the ListParts operation.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as PartRecord instead of the models.
 
         Yields:
             Iterator[models.ListPartsResult]: An iterator of ListPartsResult from the response
         """
         limit = kwargs.get('limit', self._limit)
+        compact = kwargs.get('compact', self._compact)
+        # the records are built by the deserializer, the models are not created
+        op_kwargs = {'compact': True} if compact else {}
         req = copy.copy(request)
         if limit is not None:
             req.max_parts = limit
@@ -257,7 +343,9 @@ class ListPartsPaginator:
         is_truncated = False
 
         while first_page or is_truncated:
-            result = self._client.list_parts(req)
+            result = self._client.list_parts(req, **op_kwargs)
+            if compact:
+                result.parts = models.PartRecord.as_records(result.parts)
             yield result
 
             first_page = False
@@ -286,9 +374,11 @@ class ListMultipartUploadsPaginator:
         """
             client (ListMultipartUploadsAPIClient): A agent that sends the request.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as UploadRecord instead of the models.
         """
         self._client = client
         self._limit = kwargs.get('limit', None)
+        self._compact = kwargs.get('compact', False)
 
     def iter_page(self, request: models.ListMultipartUploadsRequest, **kwargs: Any) -> Iterator[models.ListMultipartUploadsResult]:
         """Iterates over the objects.
@@ -296,11 +386,15 @@ class ListMultipartUploadsPaginator:
         Args:
             request (models.ListMultipartUploadsRequest): The request for the ListMultipartUploads operation.
             limit (int, optional): The maximum number of items in the response.
+            compact (bool, optional): Whether to return the entries as UploadRecord instead of the models.
 
         Yields:
             Iterator[models.ListMultipartUploadsResult]: An iterator of ListMultipartUploadsResult from the response
         """
         limit = kwargs.get('limit', self._limit)
+        compact = kwargs.get('compact', self._compact)
+        # the records are built by the deserializer, the models are not created
+        op_kwargs = {'compact': True} if compact else {}
         req = copy.copy(request)
         if limit is not None:
             req.max_uploads = limit
@@ -309,7 +403,9 @@ class ListMultipartUploadsPaginator:
         is_truncated = False
 
         while first_page or is_truncated:
-            result = self._client.list_multipart_uploads(req)
+            result = self._client.list_multipart_uploads(req, **op_kwargs)
+            if compact:
+                result.uploads = models.UploadRecord.as_records(result.uploads)
             yield result
 
             first_page = False
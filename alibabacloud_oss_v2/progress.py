@@ -1,5 +1,7 @@
 """Progress for upload, download and copy"""
-from typing import Optional
+import time
+from typing import Optional, Callable, Any
+from . import defaults
 
 
 class Progress:
@@ -10,11 +12,21 @@ class Progress:
         self,
         progress_fn,
         total: Optional[int],
+        flush_size: Optional[int] = None,
     ) -> None:
+        """
+        Args:
+            progress_fn (Callable): The function called with (increment, transferred, total).
+            total (int, optional): The total number of bytes, -1 if it is unknown.
+            flush_size (int, optional): The number of bytes written before the progress is reported,
+                the completion is always reported. By default, every write is reported.
+        """
         self._progress_fn = progress_fn
         self._total = total or -1
         self._written = 0
         self._lwritten = 0
+        self._pending = 0
+        self.flush_size = flush_size or 0
 
     def reset(self):
         """reset
@@ -28,12 +40,172 @@ class Progress:
         n = _len(s)
         self._written = self._written + n
 
-        if self._progress_fn is None or self._written < self._lwritten:
+        if self._progress_fn is None or self._written <= self._lwritten:
+            return
+
+        # the bytes written before the reset have been counted
+        self._pending += min(n, self._written - self._lwritten)
+        if self._pending < self.flush_size and not 0 < self._total <= self._written:
             return
 
+        self.flush()
+
+    def flush(self):
+        """Reports the pending bytes
+        """
+        if self._progress_fn is None or self._pending == 0:
+            return
+
+        n = self._pending
+        self._pending = 0
         self._progress_fn(n, self._written, self._total)
 
 
+class ProgressStats:
+    """The statistics of a transfer, passed to the progress function of ThrottledProgress with_stats
+    """
+
+    def __init__(
+        self,
+        transferred: int,
+        total: int,
+        elapsed: float,
+        rate: float,
+        eta: Optional[float],
+    ) -> None:
+        """
+        Args:
+            transferred (int): The number of bytes transferred.
+            total (int): The total number of bytes, -1 if it is unknown.
+            elapsed (float): The seconds since the first progress event.
+            rate (float): The average throughput in bytes per second.
+            eta (float, optional): The estimated seconds to finish, None if the total or the rate is unknown.
+        """
+        self.transferred = transferred
+        self.total = total
+        self.elapsed = elapsed
+        self.rate = rate
+        self.eta = eta
+
+    def __repr__(self) -> str:
+        return (f'<ProgressStats transferred: {self.transferred}, total: {self.total}, '
+                f'elapsed: {self.elapsed:.3f}, rate: {self.rate:.1f}, eta: {self.eta}>')
+
+
+class ThrottledProgress:
+    """A progress function which coalesces the progress events and calls the wrapped one
+    at most once per interval.
+
+    It can be used as the progress_fn of the requests, the increments between the calls of
+    the wrapped function are summed up, and the completion of the transfer is always reported.
+    The calls must be serialized, as the transfer managers and the operations do.
+    """
+
+    def __init__(
+        self,
+        progress_fn: Callable[..., Any],
+        bytes_interval: Optional[int] = None,
+        time_interval: Optional[float] = None,
+        percent_interval: Optional[float] = None,
+        with_stats: Optional[bool] = False,
+    ) -> None:
+        """
+        Args:
+            progress_fn (Callable): The function called with (increment, transferred, total),
+                and a ProgressStats as the fourth argument if with_stats is true.
+            bytes_interval (int, optional): Reports when so many bytes have been transferred since the last report.
+            time_interval (float, optional): Reports when so many seconds have passed since the last report.
+            percent_interval (float, optional): Reports when the transferred percentage has grown so much
+                since the last report, it is ignored if the total is unknown.
+            with_stats (bool, optional): Whether to pass the ProgressStats to progress_fn.
+            If no interval is set, the time interval is defaults.DEFAULT_PROGRESS_INTERVAL.
+        """
+        if bytes_interval is None and time_interval is None and percent_interval is None:
+            time_interval = defaults.DEFAULT_PROGRESS_INTERVAL
+        self._progress_fn = progress_fn
+        self._bytes_interval = bytes_interval
+        self._time_interval = time_interval
+        self._percent_interval = percent_interval
+        self._with_stats = with_stats
+        self._pending = 0
+        self._transferred = 0
+        self._total = -1
+        self._start_time = None
+        self._start_transferred = 0
+        self._last_time = 0.0
+        self._last_transferred = 0
+
+    def __call__(self, increment: int, transferred: int, total: int) -> None:
+        now = time.monotonic()
+        if self._start_time is None or transferred < self._transferred:
+            # the first event, or the transfer has been restarted
+            self._start_time = now
+            self._start_transferred = transferred - increment
+            self._last_time = now
+            self._last_transferred = transferred - increment
+            self._pending = 0
+
+        self._pending += increment
+        self._transferred = transferred
+        self._total = total
+
+        if self._pending == 0 or not self._should_report(now, transferred, total):
+            return
+
+        self._report(now)
+
+    def flush(self) -> None:
+        """Reports the pending increments"""
+        if self._pending > 0:
+            self._report(time.monotonic())
+
+    @property
+    def stats(self) -> ProgressStats:
+        """The statistics of the transfer"""
+        return self._stats(time.monotonic())
+
+    def _should_report(self, now: float, transferred: int, total: int) -> bool:
+        if 0 < total <= transferred:
+            return True
+
+        if self._bytes_interval is not None and transferred - self._last_transferred >= self._bytes_interval:
+            return True
+
+        if self._time_interval is not None and now - self._last_time >= self._time_interval:
+            return True
+
+        if self._percent_interval is not None and total > 0:
+            if (transferred - self._last_transferred) * 100 >= self._percent_interval * total:
+                return True
+
+        return False
+
+    def _stats(self, now: float) -> ProgressStats:
+        elapsed = now - self._start_time if self._start_time is not None else 0.0
+        done = self._transferred - self._start_transferred
+        rate = done / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if self._total > 0 and rate > 0:
+            eta = max(self._total - self._transferred, 0) / rate
+        return ProgressStats(
+            transferred=self._transferred,
+            total=self._total,
+            elapsed=elapsed,
+            rate=rate,
+            eta=eta,
+        )
+
+    def _report(self, now: float) -> None:
+        increment = self._pending
+        self._pending = 0
+        self._last_time = now
+        self._last_transferred = self._transferred
+        if self._with_stats:
+            self._progress_fn(increment, self._transferred, self._total, self._stats(now))
+        else:
+            self._progress_fn(increment, self._transferred, self._total)
+
+
 def _len(s):
     if isinstance(s, int):
         return 1
@@ -1,6 +1,7 @@
 from .retryer_impl import (
     NopRetryer,
-    StandardRetryer
+    StandardRetryer,
+    AdaptiveRetryer
 )
 
 from .backoff import (
@@ -14,3 +15,8 @@ from .backoff import (
 from .error_retryable import (
     ErrorRetryable,
 )
+
+from .token_bucket import (
+    RetryQuota,
+    ClientRateLimiter
+)
@@ -2,8 +2,10 @@
 from typing import Optional, List
 from ..types import Retryer
 from .. import defaults
+from .. import exceptions
 from . import error_retryable
 from . import backoff
+from . import token_bucket
 
 _default_error_retryables = [
     error_retryable.HTTPStatusCodeRetryable(),
@@ -11,6 +13,11 @@ _default_error_retryables = [
     error_retryable.ClientErrorRetryable()
 ]
 
+# 429(Too Many Requests) 503(Service Unavailable)
+_throttle_status_codes = set([429, 503])
+
+_default_throttle_error_codes = ['SlowDown', 'Throttling', 'QpsLimitExceeded']
+
 
 class NopRetryer(Retryer):
     """nop retryer"""
@@ -65,3 +72,79 @@ class StandardRetryer(Retryer):
 
     def retry_delay(self, attempt: int, error: Exception) -> float:
         return self._backoff_delayer.backoff_delay(attempt, error)
+
+
+class AdaptiveRetryer(StandardRetryer):
+    """adaptive retryer
+
+    It retries like the standard retryer, but the retries take tokens from a retry quota,
+    and the send rate is limited on the client side after the throttling errors (e.g. 503 SlowDown).
+    Its state is shared by all the requests sent with it, so one retryer should be used
+    by all the operations of a client, including the workers of Uploader and Downloader.
+    """
+
+    def __init__(
+        self,
+        max_attempts: Optional[int] = None,
+        max_backoff: Optional[float] = None,
+        base_delay: Optional[float] = None,
+        error_retryables: Optional[List[error_retryable.ErrorRetryable]] = None,
+        backoff_delayer: Optional[backoff.BackoffDelayer] = None,
+        retry_quota: Optional[token_bucket.RetryQuota] = None,
+        rate_limiter: Optional[token_bucket.ClientRateLimiter] = None,
+        throttle_error_codes: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Args:
+            max_attempts (int, optional): max retry attempt
+            max_backoff (float, optional): the max duration in second.
+            base_delay (float, optional): the base delay duration in second.
+            error_retryables ([ErrorRetryable], optional): error retryables list.
+            backoff_delayer ([BackoffDelayer], optional): backoff delayer.
+            retry_quota (RetryQuota, optional): the token bucket for the retries.
+            rate_limiter (ClientRateLimiter, optional): the client side rate limiter.
+            throttle_error_codes ([str], optional): the service error codes of the throttling errors.
+        """
+        super().__init__(
+            max_attempts=max_attempts,
+            max_backoff=max_backoff,
+            base_delay=base_delay,
+            error_retryables=error_retryables,
+            backoff_delayer=backoff_delayer,
+        )
+        self._retry_quota = retry_quota or token_bucket.RetryQuota()
+        self._rate_limiter = rate_limiter or token_bucket.ClientRateLimiter()
+        self._throttle_error_codes = set(throttle_error_codes or _default_throttle_error_codes)
+
+    @property
+    def retry_quota(self) -> token_bucket.RetryQuota:
+        """the token bucket for the retries"""
+        return self._retry_quota
+
+    @property
+    def rate_limiter(self) -> token_bucket.ClientRateLimiter:
+        """the client side rate limiter"""
+        return self._rate_limiter
+
+    def is_throttle_error(self, error: Exception) -> bool:
+        """Check whether the error is a throttling error."""
+        if isinstance(error, exceptions.OperationError):
+            error = error.unwrap()
+        if isinstance(error, exceptions.ServiceError):
+            if error.status_code in _throttle_status_codes:
+                return True
+            if error.code in self._throttle_error_codes:
+                return True
+        return False
+
+    def send_delay(self) -> float:
+        return self._rate_limiter.acquire()
+
+    def acquire_retry(self, error: Exception) -> int:
+        timeout = isinstance(error, (exceptions.RequestError, exceptions.ResponseError))
+        return self._retry_quota.acquire(timeout=timeout)
+
+    def record_attempt(self, attempt: int, error: Optional[Exception], retry_tokens: int = 0) -> None:
+        if error is None:
+            self._retry_quota.release(retry_tokens if attempt > 0 else 0)
+        self._rate_limiter.update(error is not None and self.is_throttle_error(error))
@@ -0,0 +1,192 @@
+"""Modules for retry quota and client side rate limiting """
+
+import math
+import threading
+import time
+from typing import Callable, Optional
+from .. import defaults
+
+
+class RetryQuota:
+    """RetryQuota implements a token bucket for the retries.
+
+    A retry takes some tokens from the bucket, a successful request puts some tokens back.
+    When the bucket is empty, the errors are not retried any more, so the retries stop
+    soon when most of the requests fail.
+    """
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        retry_cost: Optional[int] = None,
+        timeout_cost: Optional[int] = None,
+        no_retry_increment: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            capacity (int, optional): the number of tokens in the bucket.
+            retry_cost (int, optional): the tokens a retry takes.
+            timeout_cost (int, optional): the tokens a retry of a timeout or connection error takes.
+            no_retry_increment (int, optional): the tokens a request which succeeds at the first attempt puts back.
+        """
+        self._capacity = capacity or defaults.DEFAULT_RETRY_QUOTA_CAPACITY
+        self._retry_cost = retry_cost or defaults.DEFAULT_RETRY_QUOTA_RETRY_COST
+        self._timeout_cost = timeout_cost or defaults.DEFAULT_RETRY_QUOTA_TIMEOUT_COST
+        self._no_retry_increment = no_retry_increment or defaults.DEFAULT_RETRY_QUOTA_NO_RETRY_INCREMENT
+        self._available = self._capacity
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> int:
+        """the number of tokens left in the bucket"""
+        return self._available
+
+    def acquire(self, timeout: bool = False) -> int:
+        """Takes the tokens for a retry.
+
+        Args:
+            timeout (bool): whether the error is a timeout or connection error.
+
+        Returns:
+            int: the tokens taken, 0 if there were not enough tokens.
+        """
+        cost = self._timeout_cost if timeout else self._retry_cost
+        with self._lock:
+            if cost > self._available:
+                return 0
+            self._available -= cost
+            return cost
+
+    def release(self, acquired: int = 0) -> None:
+        """Puts the tokens back after a successful request.
+
+        Args:
+            acquired (int): the tokens taken for the retry which succeeded, they are put back as they are.
+                0 if the request succeeded at the first attempt, no_retry_increment tokens are put back then.
+        """
+        amount = acquired if acquired > 0 else self._no_retry_increment
+        with self._lock:
+            self._available = min(self._available + amount, self._capacity)
+
+    def __repr__(self) -> str:
+        return f"<RetryQuota, available: '{self._available}', capacity: '{self._capacity}'>"
+
+
+class ClientRateLimiter:
+    """ClientRateLimiter limits the send rate on the client side with a token bucket.
+
+    The limiter is disabled until a throttling error is met. Then the fill rate is reduced
+    multiplicatively on every throttling error, and grows back along a cubic curve (CUBIC)
+    on the successful responses, so it recovers gradually to the rate at which the
+    throttling happened, and probes beyond it slowly.
+    """
+
+    def __init__(
+        self,
+        beta: Optional[float] = None,
+        scale_constant: Optional[float] = None,
+        min_fill_rate: Optional[float] = None,
+        smoothing: Optional[float] = None,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
+        """
+        Args:
+            beta (float, optional): the factor the send rate is multiplied by on a throttling error.
+            scale_constant (float, optional): the scale constant of the cubic growth.
+            min_fill_rate (float, optional): the minimum send rate in requests per second.
+            smoothing (float, optional): the weight of the newest measured send rate.
+            clock (Callable[[], float], optional): the clock in second, time.monotonic by default.
+        """
+        self._beta = beta or defaults.DEFAULT_RATE_LIMITER_BETA
+        self._scale_constant = scale_constant or defaults.DEFAULT_RATE_LIMITER_SCALE_CONSTANT
+        self._min_fill_rate = min_fill_rate or defaults.DEFAULT_RATE_LIMITER_MIN_FILL_RATE
+        self._smoothing = smoothing or defaults.DEFAULT_RATE_LIMITER_SMOOTHING
+        self._clock = clock or time.monotonic
+        self._lock = threading.Lock()
+
+        now = self._clock()
+        self._enabled = False
+        self._fill_rate = self._min_fill_rate
+        self._max_capacity = 1.0
+        self._current_capacity = 0.0
+        self._last_refill = now
+
+        self._last_max_rate = 0.0
+        self._last_throttle = now
+        self._time_window = 0.0
+
+        self._measured_rate = 0.0
+        self._request_count = 0
+        self._last_rate_bucket = math.floor(now * 2) / 2
+
+    @property
+    def enabled(self) -> bool:
+        """whether the send rate is limited"""
+        return self._enabled
+
+    @property
+    def fill_rate(self) -> float:
+        """the send rate in requests per second"""
+        return self._fill_rate
+
+    @property
+    def measured_rate(self) -> float:
+        """the smoothed rate of the responses in requests per second"""
+        return self._measured_rate
+
+    def acquire(self) -> float:
+        """Reserves a send token.
+
+        Returns:
+            float: the delay in second before the request can be sent.
+        """
+        with self._lock:
+            if not self._enabled:
+                return 0.0
+            self._refill()
+            self._current_capacity -= 1
+            if self._current_capacity >= 0:
+                return 0.0
+            return -self._current_capacity / self._fill_rate
+
+    def update(self, throttled: bool) -> None:
+        """Updates the send rate with a response.
+
+        Args:
+            throttled (bool): whether the response is a throttling error.
+        """
+        with self._lock:
+            now = self._clock()
+            self._update_measured_rate(now)
+            if throttled:
+                rate = self._measured_rate if not self._enabled else min(self._measured_rate, self._fill_rate)
+                self._last_max_rate = rate
+                self._time_window = (self._last_max_rate * (1 - self._beta) / self._scale_constant) ** (1 / 3)
+                self._last_throttle = now
+                new_rate = rate * self._beta
+                self._enabled = True
+            else:
+                new_rate = self._scale_constant * (now - self._last_throttle - self._time_window) ** 3 + self._last_max_rate
+
+            self._refill()
+            self._fill_rate = max(min(new_rate, 2 * self._measured_rate), self._min_fill_rate)
+            self._max_capacity = max(self._fill_rate, 1.0)
+            self._current_capacity = min(self._current_capacity, self._max_capacity)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(now - self._last_refill, 0.0)
+        self._current_capacity = min(self._max_capacity, self._current_capacity + elapsed * self._fill_rate)
+        self._last_refill = now
+
+    def _update_measured_rate(self, now: float) -> None:
+        self._request_count += 1
+        bucket = math.floor(now * 2) / 2
+        if bucket > self._last_rate_bucket:
+            current = self._request_count / (bucket - self._last_rate_bucket)
+            self._measured_rate = current * self._smoothing + self._measured_rate * (1 - self._smoothing)
+            self._request_count = 0
+            self._last_rate_bucket = bucket
+
+    def __repr__(self) -> str:
+        return f"<ClientRateLimiter, enabled: '{self._enabled}', fill rate: '{self._fill_rate}'>"
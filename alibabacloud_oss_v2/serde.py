@@ -1,13 +1,16 @@
 """Serializer & Deserializer for models
 """
 import datetime
+import itertools
 import sys
+import weakref
 from enum import Enum
-from typing import Dict, Any, Optional, List, MutableMapping, Mapping, cast
+from typing import Dict, Any, Optional, List, MutableMapping, Mapping, Iterable, Iterator, Tuple, cast
 from email.utils import format_datetime, parsedate_tz
 import xml.etree.ElementTree as ET
 from . import exceptions
-from .types import OperationInput, OperationOutput, CaseInsensitiveDict
+from . import defaults
+from .types import OperationInput, OperationOutput, CaseInsensitiveDict, HttpResponse
 
 import json
 
@@ -63,7 +66,8 @@ class Model:
             str_models = self.__module__.rsplit(".", 1)[0]
             self.__models = sys.modules[str_models] or {}
 
-        class_obj = self.__models.__dict__.get(name, None)
+        # getattr loads the lazily imported models
+        class_obj = getattr(self.__models, name, None)
         if class_obj is not None:
             return class_obj()
 
@@ -355,71 +359,22 @@ def _serialize_to_str(value: Any, atype: str) -> str:
 def _deserialize_xml_model(root: ET.Element, obj: Any) -> None:
     """deserialize xml model
     """
-    attributes = getattr(obj, '_attribute_map')
-    for attr, attr_desc in attributes.items():
-        if attr_desc.get('tag', '') != 'xml':
-            continue
-        attr_key = attr_desc.get('rename', attr)
-        attr_types = str(attr_desc.get('type', 'str')).split(',')
+    _apply_xml_plan(root, obj, _get_plan(obj, 'xml', _compile_xml_plan))
 
-        if attr_types[0].startswith('[') and attr_types[0].endswith(']'):
-            #attr_types[0] = attr_types[0][1:].removesuffix(']')
-            attr_types[0] = attr_types[0][1:-1]
-            value = _deserialize_xml_iter(
-                obj, root.findall(attr_key), attr_types)
+
+def _apply_xml_plan(root: ET.Element, obj: Any, plan: List[Any]) -> None:
+    for attr, attr_key, is_list, convert in plan:
+        if is_list:
+            elems = root.findall(attr_key)
+            value = [convert(elem) for elem in elems] if elems else None
         else:
-            value = _deserialize_xml_any(obj, root.find(attr_key), attr_types)
+            elem = root.find(attr_key)
+            value = convert(elem) if elem is not None else None
 
         if value is not None:
             setattr(obj, attr, value)
 
 
-def _deserialize_xml_iter(upper_obj: Model, elems: List[ET.Element], attr_types: List[str]) -> Any:
-    if elems is None or len(elems) == 0:
-        return None
-    return [_deserialize_xml_any(upper_obj, elem, attr_types) for elem in elems]
-
-
-def _deserialize_xml_any(upper_obj: Model, elem: ET.Element, attr_types: List[str]) -> Any:
-    # if elem is None or elem.text is None:
-    # print(f'elem.tag={elem.tag}, elem.text={elem.text}, attr_types={attr_types}\n')
-    if elem is None:
-        return None
-
-    attr_type = attr_types[0]
-
-    if not attr_type.islower():
-        obj = upper_obj._Model__create_depend_object( # pylint: disable=protected-access
-            attr_type)  
-        if obj is None:
-            raise exceptions.DeserializationError(
-                error=f'Can not create object with {attr_type} type')
-        _deserialize_xml_model(elem, obj)
-        return obj
-
-    if elem.text is None:
-        return None
-
-    # basic type
-    if attr_type in ('str', ''):
-        return str(elem.text)
-
-    if attr_type == 'bool':
-        return deserialize_boolean(elem.text)
-
-    if elem.text == '':
-        return None
-
-    if attr_type == 'int':
-        return int(elem.text)
-    if attr_type == 'float':
-        return float(elem.text)
-    if 'datetime' in attr_type:
-        return _deserialize_datetime(elem.text, attr_types)
-
-    raise exceptions.DeserializationError(error=f'Unsupport type {attr_type}')
-
-
 def _deserialize_datetime(date_time: str, subtype: List[str]) -> datetime.datetime:
     if 'httptime' in subtype:
         return deserialize_httptime(date_time)
@@ -449,6 +404,153 @@ def _deserialize_to_any(value: Optional[str], atype: str) -> Any:
     raise exceptions.DeserializationError(error=f'Unsupport type {atype}')
 
 
+# compiled (de)serialization plans, keyed by model class then by plan kind
+_PLANS: MutableMapping[type, Dict[str, Any]] = weakref.WeakKeyDictionary()
+
+
+def _get_plan(obj: Any, kind: str, compiler: Any) -> Any:
+    """Returns the plan of the given kind for the object's class,
+    compiling it from the class's attribute map on first use.
+    The plan is rebuilt if the attribute map object has been replaced.
+    """
+    cls = obj.__class__
+    attributes = getattr(obj, '_attribute_map')
+    plans = _PLANS.get(cls)
+    if plans is None:
+        plans = {}
+        _PLANS[cls] = plans
+    entry = plans.get(kind)
+    if entry is None or entry[0] is not attributes:
+        entry = (attributes, compiler(cls, attributes))
+        plans[kind] = entry
+    return entry[1]
+
+
+def _text_converter(attr_types: List[str]) -> Any:
+    """Returns the function to convert a non-None string into the basic type,
+    it keeps the semantics of _deserialize_to_any.
+    """
+    atype = attr_types[0]
+    if atype in ('str', ''):
+        return str
+    if atype == 'bool':
+        return deserialize_boolean
+    if atype == 'int':
+        return int
+    if atype == 'float':
+        return float
+    if 'datetime' in atype:
+        return lambda value: _deserialize_datetime(value, attr_types)
+
+    def _unsupport(value):
+        raise exceptions.DeserializationError(error=f'Unsupport type {atype}')
+    return _unsupport
+
+
+def _resolve_depend_factory(cls: type, name: str) -> Any:
+    """Resolves the callable which creates the dependency object named name,
+    it follows the lookup order of Model.__create_depend_object.
+    """
+    new = getattr(cls, '_dependency_map', {}).get(name, {}).get('new', None)
+    if new is not None:
+        return new
+
+    models = sys.modules.get(cls.__module__.rsplit(".", 1)[0], None)
+    return getattr(models, name, None)
+
+
+def _xml_model_converter(cls: type, name: str) -> Any:
+    factory = _resolve_depend_factory(cls, name)
+    child = [None, None, None]
+
+    def _convert(elem: ET.Element) -> Any:
+        nonlocal factory
+        if factory is None:
+            factory = _resolve_depend_factory(cls, name)
+            if factory is None:
+                raise exceptions.DeserializationError(
+                    error=f'Can not create object with {name} type')
+        obj = factory()
+        if obj is None:
+            raise exceptions.DeserializationError(
+                error=f'Can not create object with {name} type')
+        # the factory makes the same class almost always, keep its plan at hand
+        if obj.__class__ is not child[0] or obj._attribute_map is not child[1]:
+            child[:] = [obj.__class__, obj._attribute_map,
+                        _get_plan(obj, 'xml', _compile_xml_plan)]
+        _apply_xml_plan(elem, obj, child[2])
+        return obj
+    return _convert
+
+
+def _xml_text_converter(attr_types: List[str]) -> Any:
+    to_value = _text_converter(attr_types)
+    empty_is_none = attr_types[0] not in ('str', '', 'bool')
+
+    def _convert(elem: ET.Element) -> Any:
+        text = elem.text
+        if text is None:
+            return None
+        if empty_is_none and text == '':
+            return None
+        return to_value(text)
+    return _convert
+
+
+def _compile_xml_plan(cls: type, attributes: Dict[str, Dict[str, Any]]) -> List[Any]:
+    """Compiles the xml fields into a list of (attr, key, is_list, convert)
+    """
+    plan = []
+    for attr, attr_desc in attributes.items():
+        if attr_desc.get('tag', '') != 'xml':
+            continue
+        attr_key = attr_desc.get('rename', attr)
+        attr_types = str(attr_desc.get('type', 'str')).split(',')
+        is_list = attr_types[0].startswith('[') and attr_types[0].endswith(']')
+        if is_list:
+            attr_types[0] = attr_types[0][1:-1]
+
+        if not attr_types[0].islower():
+            convert = _xml_model_converter(cls, attr_types[0])
+        else:
+            convert = _xml_text_converter(attr_types)
+        plan.append((attr, attr_key, is_list, convert))
+    return plan
+
+
+def _compile_headers_plan(cls: type, attributes: Dict[str, Dict[str, Any]]) -> Any:
+    """Compiles the output fields into (fields, dict_fields),
+    fields is a list of (attr, key, convert), dict_fields is a list of (attr, prefix)
+    """
+    fields = []
+    dict_fields = []
+    for attr, attr_desc in attributes.items():
+        if attr_desc.get('tag', '') != 'output':
+            continue
+        attr_key = attr_desc.get('rename', attr)
+        attr_type = attr_desc.get('type', 'str')
+        if 'dict' in attr_type:
+            dict_fields.append((attr, attr_key))
+            continue
+        fields.append((attr, attr_key, _text_converter(attr_type.split(','))))
+    return fields, dict_fields
+
+
+def _compile_input_plan(cls: type, attributes: Dict[str, Dict[str, Any]]) -> List[Any]:
+    """Compiles the input fields into a list of (attr, required, position, type, name)
+    """
+    plan = []
+    for attr, attr_desc in attributes.items():
+        plan.append((
+            attr,
+            attr_desc.get('required', False) is True,
+            cast(str, attr_desc.get('position', '')),
+            cast(str, attr_desc.get('type', '')),
+            cast(str, attr_desc.get('rename', attr)),
+        ))
+    return plan
+
+
 def serialize_xml(obj, root: Optional[str] = None) -> Any:
     """serialize xml
     """
@@ -471,6 +573,97 @@ def deserialize_xml(xml_data: Any, obj: Any, expect_tag: Optional[str] = None) -
     _deserialize_xml_model(root, obj)
 
 
+def iter_deserialize_xml(xml_chunks: Iterable[bytes], obj: Any, expect_tag: Optional[str] = None,
+                         stream_attrs: Optional[Iterable[str]] = None,
+                         converters: Optional[Mapping[str, Any]] = None) -> Iterator[Tuple[str, Any]]:
+    """Deserialize xml data to the model incrementally.
+
+    The data is fed to a pull parser chunk by chunk, each child of the root element
+    is mapped onto the model as soon as it is complete and then released,
+    so the whole document tree is never held in memory.
+
+    Args:
+        xml_chunks (Iterable[bytes]): The chunks of the xml data.
+        obj (Any): The model to populate.
+        expect_tag (str, optional): The expected tag of the root element.
+        stream_attrs (Iterable[str], optional): The list fields whose items are yielded
+            as (attr, item) instead of being stored on the model.
+        converters (Mapping[str, Any], optional): The functions which convert the elements of the fields
+            instead of the compiled plan, keyed by the field name.
+
+    Yields:
+        Iterator[Tuple[str, Any]]: The items of the stream_attrs fields, in document order.
+    """
+    if not isinstance(obj, Model):
+        return
+
+    stream_attrs = set(stream_attrs or [])
+    converters = converters or {}
+    fields: Dict[str, List[Any]] = {}
+    for attr, attr_key, is_list, convert in _get_plan(obj, 'xml', _compile_xml_plan):
+        convert = converters.get(attr, convert)
+        tag, _, path = attr_key.partition('/')
+        fields.setdefault(tag, []).append((attr, path, is_list, convert))
+
+    lists: Dict[str, List[Any]] = {}
+    found = set()
+    # only the start events are needed, all the children of the root are complete
+    # except the last one until the parser is closed
+    parser = ET.XMLPullParser(events=('start',))
+    root = None
+
+    def _feed():
+        for chunk in xml_chunks:
+            parser.feed(chunk)
+            yield False
+        parser.close()
+        yield True
+
+    for closed in _feed():
+        for _, elem in parser.read_events():
+            if root is None:
+                root = elem
+                if expect_tag is not None and len(expect_tag) > 0 and root.tag != expect_tag:
+                    raise exceptions.DeserializationError(
+                        error=f'Expect root tag is {expect_tag}, gots {root.tag}')
+
+        if root is None:
+            continue
+
+        complete = len(root) if closed else len(root) - 1
+        if complete <= 0:
+            continue
+
+        for elem in root[:complete]:
+            for attr, path, is_list, convert in fields.get(elem.tag, []):
+                if is_list:
+                    for child in (elem.findall(path) if path else [elem]):
+                        item = convert(child)
+                        if attr in stream_attrs:
+                            yield attr, item
+                        else:
+                            lists.setdefault(attr, []).append(item)
+                elif attr not in found:
+                    child = elem.find(path) if path else elem
+                    if child is not None:
+                        found.add(attr)
+                        value = convert(child)
+                        if value is not None:
+                            setattr(obj, attr, value)
+        del root[:complete]
+
+    for attr, value in lists.items():
+        setattr(obj, attr, value)
+
+
+def deserialize_xml_stream(xml_chunks: Iterable[bytes], obj: Any, expect_tag: Optional[str] = None,
+                           converters: Optional[Mapping[str, Any]] = None) -> None:
+    """Deserialize xml data to the model incrementally, see iter_deserialize_xml.
+    """
+    for _ in iter_deserialize_xml(xml_chunks, obj, expect_tag, converters=converters):
+        pass
+
+
 def serialize_input(request: Model, op_input: OperationInput,
                     custom_serializer: Optional[List[Any]] = None) -> OperationInput:
     """Serialize the model request to input parameter
@@ -501,28 +694,23 @@ def serialize_input(request: Model, op_input: OperationInput,
     if hasattr(request, 'payload'):
         op_input.body = request.payload
 
-    attributes = getattr(request, '_attribute_map')
-    for attr, attr_desc in attributes.items():
+    for attr, required, attr_pos, attr_type, attr_name in _get_plan(
+            request, 'input', _compile_input_plan):
         attr_value = getattr(request, attr)
 
         if attr_value is None:
-            if attr_desc.get('required', False) is True:
+            if required:
                 raise exceptions.ParamRequiredError(field=attr)
             continue
 
-        attr_pos = cast(str, attr_desc.get('position', ''))
-        attr_type = cast(str, attr_desc.get('type', ''))
-        attr_name = cast(str, attr_desc.get('rename', attr))
         if attr_pos == 'query':
-            op_input.parameters.update(
-                {attr_name: _serialize_to_str(attr_value, attr_type)})
+            op_input.parameters[attr_name] = _serialize_to_str(attr_value, attr_type)
         elif attr_pos == 'header':
             if 'dict' in attr_type and isinstance(attr_value, dict):
                 op_input.headers.update(
                     {f'{attr_name}{k}': v for k,v in attr_value.items()})
             else:
-                op_input.headers.update(
-                    {attr_name: _serialize_to_str(attr_value, attr_type)})
+                op_input.headers[attr_name] = _serialize_to_str(attr_value, attr_type)
         elif attr_pos == 'body':
             if 'xml' in attr_type:
                 op_input.body = serialize_xml(
@@ -565,25 +753,17 @@ def deserialize_output(result: Model, op_output: OperationOutput,
 def deserialize_output_headers(result: Model, op_output: OperationOutput) -> Model:
     """deserialize output headers
     """
-    attributes = getattr(result, '_attribute_map')
+    fields, dict_fields = _get_plan(result, 'headers', _compile_headers_plan)
     headers = op_output.headers or {}
-    dict_attrs=[]
-    for attr, attr_desc in attributes.items():
-        if attr_desc.get('tag', '') != 'output':
+    for attr, attr_key, convert in fields:
+        value = headers.get(attr_key, None)
+        if value is None:
             continue
-        attr_key = attr_desc.get('rename', attr)
-        attr_type = attr_desc.get('type', 'str')
-        if 'dict' in attr_type:
-            dict_attrs.append(attr)
-            continue
-        value = _deserialize_to_any(
-            value=headers.get(attr_key, None), atype=attr_type)
+        value = convert(value)
         if value is not None:
             setattr(result, attr, value)
 
-    for  attr in  dict_attrs:
-        attr_desc = attributes.get(attr)
-        attr_key = attr_desc.get('rename', attr)
+    for attr, attr_key in dict_fields:
         dict_value = CaseInsensitiveDict()
         for k in headers.keys():
             if k.lower().startswith(attr_key):
@@ -632,6 +812,42 @@ def deserialize_output_xmlbody(result: Model, op_output: OperationOutput) -> Mod
 
     return result
 
+def iter_output_body(op_output: OperationOutput) -> Iterator[bytes]:
+    """iterates over the chunks of the output body,
+    the body is read from the network if it has not been read yet.
+    """
+    response = op_output.http_response
+    block_size = defaults.DEFAULT_XML_CHUNK_SIZE
+    if isinstance(response, HttpResponse) and not response.is_stream_consumed:
+        yield from response.iter_bytes()
+        return
+
+    data = response.content
+    if data is None:
+        return
+    for i in range(0, len(data), block_size):
+        yield data[i:i + block_size]
+
+def deserialize_output_xmlbody_stream(result: Model, op_output: OperationOutput,
+                                      converters: Optional[Mapping[str, Any]] = None) -> Model:
+    """deserialize output xmlbody incrementally,
+    it suits the results which have large lists, such as the listing results.
+    The converters replace the compiled plan for the fields, see iter_deserialize_xml.
+    """
+    xml_map = cast(Dict, getattr(result, '_xml_map', {}))
+    try:
+        chunks = (chunk for chunk in iter_output_body(op_output) if len(chunk) > 0)
+        first = next(chunks, None)
+        if first is None:
+            return result
+        deserialize_xml_stream(itertools.chain([first], chunks), result,
+                               expect_tag=xml_map.get('name', None), converters=converters)
+    finally:
+        if isinstance(op_output.http_response, HttpResponse):
+            op_output.http_response.close()
+
+    return result
+
 def deserialize_output_discardbody(result: Model, op_output: OperationOutput) -> Model:
     """deserialize output discardbody
     """
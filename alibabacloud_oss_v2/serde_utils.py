@@ -4,12 +4,14 @@ import hashlib
 import base64
 import json
 from urllib.parse import unquote, quote
-from typing import List, cast, Union, Dict
+from typing import Any, List, cast, Union, Dict, Iterable, Iterator
 from .types import OperationInput, HttpResponse, OperationOutput
 from . import serde
 from . import utils
 from . import exceptions
 from . import progress
+from . import defaults
+from . import models
 from .models import (
     ListObjectsResult,
     ListObjectsV2Result,
@@ -75,7 +77,8 @@ def add_progress(request: serde.Model, op_input: OperationInput) -> OperationInp
         'opm-request-body-tracker', []))
     p = progress.Progress(
         progress_fn=fn,
-        total=utils.guess_content_length(op_input.body)
+        total=utils.guess_content_length(op_input.body),
+        flush_size=defaults.DEFAULT_PROGRESS_FLUSH_SIZE,
     )
     trackers.append(p)
     op_input.op_metadata['opm-request-body-tracker'] = trackers
@@ -217,6 +220,61 @@ def deserialize_encode_type(result: serde.Model, _: OperationOutput) -> serde.Mo
 
     return result
 
+
+def deserialize_encode_type_item(result: serde.Model, item: serde.Model) -> serde.Model:
+    """
+    do url decode for an item which is streamed out of the result, such as ObjectProperties
+    """
+    if getattr(result, 'encoding_type', None) != 'url':
+        return item
+
+    if getattr(item, 'key', None) is not None:
+        item.key = unquote(item.key)
+
+    return item
+
+def compact_converters(result: serde.Model) -> Dict[str, Any]:
+    """
+    the converters which build the compact records for the entries of the listing result,
+    the models of the entries are not created
+    """
+    # the records are loaded on demand, as the models are
+    if isinstance(result, (ListObjectsResult, ListObjectsV2Result)):
+        return {'contents': models.ObjectRecord.from_xml}
+    if isinstance(result, ListObjectVersionsResult):
+        return {'version': models.ObjectVersionRecord.from_xml}
+    if isinstance(result, ListPartsResult):
+        return {'parts': models.PartRecord.from_xml}
+    if isinstance(result, ListMultipartUploadsResult):
+        return {'uploads': models.UploadRecord.from_xml}
+    return {}
+
+def deserialize_output_xmlbody_compact(result: serde.Model, op_output: OperationOutput) -> serde.Model:
+    """
+    deserialize output xmlbody incrementally, the entries of the listing result are built as the compact records
+    """
+    return serde.deserialize_output_xmlbody_stream(result, op_output, converters=compact_converters(result))
+
+def iter_deserialize_encode_type_items(result: serde.Model, items: Iterable[serde.Model]) -> Iterator[serde.Model]:
+    """
+    do url decode for the items which are streamed out of the result,
+    the items are held until the encoding type of the result is known, because it may follow them in the response.
+    If it follows all of them, the whole page is held before the first item is yielded,
+    so the memory is bounded by the page size (max-keys) rather than by one item.
+    """
+    pending = []
+    for item in items:
+        if getattr(result, 'encoding_type', None) is None:
+            pending.append(item)
+            continue
+        for p in pending:
+            yield deserialize_encode_type_item(result, p)
+        pending.clear()
+        yield deserialize_encode_type_item(result, item)
+
+    for p in pending:
+        yield deserialize_encode_type_item(result, p)
+
 def encode_copy_source(request: Union[CopyObjectRequest, UploadPartCopyRequest]) -> str:
     """
     encode copy source parameter
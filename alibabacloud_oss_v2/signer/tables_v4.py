@@ -10,6 +10,7 @@ import hmac
 
 from .. import exceptions
 from ..types import HttpRequest, SigningContext, Signer
+from .v4 import signing_key_cache, encoded_query_pairs
 
 
 class TablesSignerV4(Signer):
@@ -84,7 +85,8 @@ class TablesSignerV4(Signer):
             date=date_now_iso8601,
             region=region,
             product=product,
-            string_to_sign=string_to_sign)
+            string_to_sign=string_to_sign,
+            access_key_id=cred.access_key_id)
 
         # credential header
         credential_header = f'OSS4-HMAC-SHA256 Credential={cred.access_key_id}/{scope}'
@@ -181,7 +183,8 @@ class TablesSignerV4(Signer):
             date=date_now_iso8601,
             region=region,
             product=product,
-            string_to_sign=string_to_sign)
+            string_to_sign=string_to_sign,
+            access_key_id=cred.access_key_id)
 
         request.url = request.url + f'&x-oss-signature={quote(signature, safe="")}'
 
@@ -244,12 +247,8 @@ class TablesSignerV4(Signer):
 
         # canonical query
         canonical_query = ''
-        parts = urlsplit(request.url)
-        if parts.query:
-            key_val_pairs = []
-            for pair in parts.query.split('&'):
-                key, _, value = pair.partition('=')
-                key_val_pairs.append((key, value))
+        key_val_pairs = encoded_query_pairs(signing_ctx)
+        if key_val_pairs:
             sorted_key_vals = []
             for key, value in sorted(key_val_pairs):
                 if len(value) > 0:
@@ -291,16 +290,10 @@ class TablesSignerV4(Signer):
         values.append(sha256(canonical_request.encode('utf-8')).hexdigest())
         return '\n'.join(values)
 
-    def _calc_signature(self, access_key_secrect: str, date: str, region: str, product: str, string_to_sign: str) -> str:
-        key_secret = ('aliyun_v4' + access_key_secrect).encode('utf-8')
-        signing_date = hmac.new(
-            key_secret, date.encode('utf-8'), sha256).digest()
-        signing_region = hmac.new(
-            signing_date, region.encode('utf-8'), sha256).digest()
-        signing_product = hmac.new(
-            signing_region, product.encode('utf-8'), sha256).digest()
-        signing_key = hmac.new(
-            signing_product, 'aliyun_v4_request'.encode('utf-8'), sha256).digest()
+    def _calc_signature(self, access_key_secrect: str, date: str, region: str, product: str, string_to_sign: str,
+                        access_key_id: str = '') -> str:
+        signing_key = signing_key_cache.get_signing_key(
+            access_key_id, access_key_secrect, date, region, product)
         signature = hmac.new(
             signing_key, string_to_sign.encode(), sha256).hexdigest()
         return signature
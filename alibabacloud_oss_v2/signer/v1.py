@@ -10,6 +10,7 @@ from hashlib import sha1
 import hmac
 from .. import exceptions
 from ..types import SigningContext, Signer
+from .v4 import encoded_query_pairs
 
 class SignerV1(Signer):
     """Signer V1
@@ -158,12 +159,11 @@ class SignerV1(Signer):
 
         # canonical query
         canonical_query = ''
-        parts = urlsplit(request.url)
+        encoded_pairs = encoded_query_pairs(signing_ctx)
 
-        if parts.query:
+        if encoded_pairs:
             key_val_pairs = []
-            for pair in parts.query.split('&'):
-                key, _, value = pair.partition('=')
+            for key, value in encoded_pairs:
                 key = unquote(key)
                 value = unquote(value)
                 if key in self._subresource_key_set:
@@ -2,12 +2,15 @@
 """
 import datetime
 from email.utils import format_datetime
-from typing import Optional, Set
+from typing import Optional, Set, List, Tuple
 from urllib.parse import urlsplit, quote, SplitResult
 from hashlib import sha256
+from collections import OrderedDict
 import hmac
+import threading
 
 from .. import exceptions
+from .. import defaults
 from ..types import HttpRequest, SigningContext, Signer
 
 
@@ -48,16 +51,15 @@ class SignerV4(Signer):
         datetime_now_iso8601 = datetime_now.strftime('%Y%m%dT%H%M%SZ')
         datetime_now_rfc2822 = format_datetime(datetime_now, True)
         date_now_iso8601 = datetime_now_iso8601[:8]
-        request.headers.update({'x-oss-date': datetime_now_iso8601})
-        request.headers.update({'Date': datetime_now_rfc2822})
+        request.headers['x-oss-date'] = datetime_now_iso8601
+        request.headers['Date'] = datetime_now_rfc2822
 
         # Credentials information
         if cred.security_token:
-            request.headers.update(
-                {'x-oss-security-token': cred.security_token})
+            request.headers['x-oss-security-token'] = cred.security_token
 
         # Other Headers
-        request.headers.update({'x-oss-content-sha256': 'UNSIGNED-PAYLOAD'})
+        request.headers['x-oss-content-sha256'] = 'UNSIGNED-PAYLOAD'
 
         # Scope
         region = signing_ctx.region or ''
@@ -86,7 +88,8 @@ class SignerV4(Signer):
             date=date_now_iso8601,
             region=region,
             product=product,
-            string_to_sign=string_to_sign)
+            string_to_sign=string_to_sign,
+            access_key_id=cred.access_key_id)
 
         # credential header
         credential_header = f'OSS4-HMAC-SHA256 Credential={cred.access_key_id}/{scope}'
@@ -94,7 +97,7 @@ class SignerV4(Signer):
             credential_header = f'{credential_header},AdditionalHeaders={";".join(additional_headers)}'
         credential_header = f'{credential_header},Signature={signature}'
 
-        request.headers.update({'Authorization': credential_header})
+        request.headers['Authorization'] = credential_header
 
         signing_ctx.string_to_sign = string_to_sign
         signing_ctx.signing_time = datetime_now
@@ -185,7 +188,8 @@ class SignerV4(Signer):
             date=date_now_iso8601,
             region=region,
             product=product,
-            string_to_sign=string_to_sign)
+            string_to_sign=string_to_sign,
+            access_key_id=cred.access_key_id)
 
         request.url = request.url + f'&x-oss-signature={quote(signature, safe="")}'
 
@@ -240,12 +244,8 @@ class SignerV4(Signer):
 
         # canonical query
         canonical_query = ''
-        parts = urlsplit(request.url)
-        if parts.query:
-            key_val_pairs = []
-            for pair in parts.query.split('&'):
-                key, _, value = pair.partition('=')
-                key_val_pairs.append((key, value))
+        key_val_pairs = encoded_query_pairs(signing_ctx)
+        if key_val_pairs:
             sorted_key_vals = []
             for key, value in sorted(key_val_pairs):
                 if len(value) > 0:
@@ -287,16 +287,10 @@ class SignerV4(Signer):
         values.append(sha256(canonical_request.encode('utf-8')).hexdigest())
         return '\n'.join(values)
 
-    def _calc_signature(self, access_key_secrect: str, date: str, region: str, product: str, string_to_sign: str) -> str:
-        key_secret = ('aliyun_v4' + access_key_secrect).encode('utf-8')
-        signing_date = hmac.new(
-            key_secret, date.encode('utf-8'), sha256).digest()
-        signing_region = hmac.new(
-            signing_date, region.encode('utf-8'), sha256).digest()
-        signing_product = hmac.new(
-            signing_region, product.encode('utf-8'), sha256).digest()
-        signing_key = hmac.new(
-            signing_product, 'aliyun_v4_request'.encode('utf-8'), sha256).digest()
+    def _calc_signature(self, access_key_secrect: str, date: str, region: str, product: str, string_to_sign: str,
+                        access_key_id: str = '') -> str:
+        signing_key = signing_key_cache.get_signing_key(
+            access_key_id, access_key_secrect, date, region, product)
         signature = hmac.new(
             signing_key, string_to_sign.encode(), sha256).hexdigest()
         return signature
@@ -308,6 +302,96 @@ class SignerV4(Signer):
         return _is_default_sign_header(h.lower())
 
 
+def encoded_query_pairs(signing_ctx: SigningContext) -> List[Tuple[str, str]]:
+    """Returns the encoded query pairs of the request's url.
+    The pairs built with the url are used if the url is not changed since then.
+    """
+    request = signing_ctx.request
+    if signing_ctx.encoded_query is not None and signing_ctx.encoded_url == request.url:
+        return signing_ctx.encoded_query
+
+    key_val_pairs = []
+    query = urlsplit(request.url).query
+    if query:
+        for pair in query.split('&'):
+            key, _, value = pair.partition('=')
+            key_val_pairs.append((key, value))
+    return key_val_pairs
+
+
+def _derive_signing_key(access_key_secrect: str, date: str, region: str, product: str) -> bytes:
+    key_secret = ('aliyun_v4' + access_key_secrect).encode('utf-8')
+    signing_date = hmac.new(
+        key_secret, date.encode('utf-8'), sha256).digest()
+    signing_region = hmac.new(
+        signing_date, region.encode('utf-8'), sha256).digest()
+    signing_product = hmac.new(
+        signing_region, product.encode('utf-8'), sha256).digest()
+    return hmac.new(
+        signing_product, 'aliyun_v4_request'.encode('utf-8'), sha256).digest()
+
+
+class SigningKeyCache:
+    """A LRU cache of the derived v4 signing keys.
+
+    The key of an entry is (access key id, hash of access key secret, date, region, product),
+    the entries of an access key id are dropped when its secret is rotated.
+    """
+
+    def __init__(self, capacity: int = defaults.DEFAULT_SIGNING_KEY_CACHE_SIZE) -> None:
+        """
+        Args:
+            capacity (int): The maximum number of the signing keys, 0 disables the cache.
+        """
+        self._capacity = capacity
+        self._keys = OrderedDict()
+        self._secrets = {}
+        self._lock = threading.Lock()
+
+    def get_signing_key(self, access_key_id: str, access_key_secrect: str,
+                        date: str, region: str, product: str) -> bytes:
+        """Returns the signing key, derives it if it is not in the cache."""
+        if self._capacity <= 0:
+            return _derive_signing_key(access_key_secrect, date, region, product)
+
+        secret_hash = sha256(access_key_secrect.encode('utf-8')).digest()
+        cache_key = (access_key_id, secret_hash, date, region, product)
+        with self._lock:
+            signing_key = self._keys.get(cache_key)
+            if signing_key is not None:
+                self._keys.move_to_end(cache_key)
+                return signing_key
+
+        signing_key = _derive_signing_key(access_key_secrect, date, region, product)
+
+        with self._lock:
+            if self._secrets.get(access_key_id, secret_hash) != secret_hash:
+                # the credentials are rotated
+                for k in [k for k in self._keys if k[0] == access_key_id]:
+                    del self._keys[k]
+            self._secrets[access_key_id] = secret_hash
+            self._keys[cache_key] = signing_key
+            while len(self._keys) > self._capacity:
+                k, _ = self._keys.popitem(last=False)
+                if not any(e[0] == k[0] for e in self._keys):
+                    self._secrets.pop(k[0], None)
+
+        return signing_key
+
+    def clear(self) -> None:
+        """Removes all the signing keys."""
+        with self._lock:
+            self._keys.clear()
+            self._secrets.clear()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+# shared by all the v4 signers, the signing key changes once a day for a credentials
+signing_key_cache = SigningKeyCache()
+
+
 def _is_default_sign_header(key: str) -> bool:
     if key.startswith('x-oss-'):
         return True
@@ -1,7 +1,14 @@
 """HttpClient implement based on requests
 """
 from typing import Optional, MutableMapping, Iterator, cast
+import queue
+import socket
+import threading
+import time
+import warnings
+import weakref
 from urllib3.util.retry import Retry
+from urllib3.connection import HTTPConnection
 from urllib3.exceptions import NewConnectionError, ConnectTimeoutError
 import requests
 import requests.adapters
@@ -105,6 +112,108 @@ def convert_proxy_host(proxy_host):
     raise exceptions.RequestError(error="proxy_host must be str or dict")
 
 
+class _PoolHTTPAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter which enables tcp keep-alive on its connections,
+    and drops the pooled connections of an endpoint after they stay idle for idle_connection_timeout.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        self._keep_alive_timeout = kwargs.pop("keep_alive_timeout", None)
+        self._idle_connection_timeout = kwargs.pop("idle_connection_timeout", None)
+        self._last_used = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self._keep_alive_timeout:
+            pool_kwargs.setdefault("socket_options", _keep_alive_socket_options(self._keep_alive_timeout))
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def get_connection_with_tls_context(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        return self._check_idle(super().get_connection_with_tls_context(*args, **kwargs))
+
+    def get_connection(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        return self._check_idle(super().get_connection(*args, **kwargs))
+
+    def grow_pool(self, maxsize: int) -> None:
+        """Enlarges the pools of the direct and the proxied endpoints to maxsize connections,
+        the pools are resized in place, so the requests in flight are not affected.
+        """
+        with self._lock:
+            if maxsize <= self._pool_maxsize:
+                return
+            self._pool_maxsize = maxsize
+            for manager in [self.poolmanager] + list(self.proxy_manager.values()):
+                # the pools created from now on
+                manager.connection_pool_kw["maxsize"] = maxsize
+                # the pools in use
+                for key in manager.pools.keys():
+                    pool = manager.pools.get(key)
+                    if pool is not None:
+                        _grow_pool_queue(pool, maxsize)
+
+    def _check_idle(self, pool):
+        if not self._idle_connection_timeout:
+            return pool
+        now = time.monotonic()
+        with self._lock:
+            last_used = self._last_used.get(pool, now)
+            self._last_used[pool] = now
+        if now - last_used > self._idle_connection_timeout:
+            # the server may have closed them, the connections in flight are not affected
+            _drop_idle_connections(pool)
+        return pool
+
+
+def _grow_pool_queue(pool, maxsize: int) -> None:
+    q = getattr(pool, "pool", None)
+    if q is None:
+        return
+    with q.mutex:
+        grow = maxsize - q.maxsize
+        if grow <= 0:
+            return
+        q.maxsize = maxsize
+    for _ in range(grow):
+        # the free slots of the pool
+        q.put(None, block=False)
+
+
+def _drop_idle_connections(pool) -> None:
+    q = getattr(pool, "pool", None)
+    if q is None:
+        return
+    slots = 0
+    try:
+        while True:
+            conn = q.get(block=False)
+            slots += 1
+            if conn is not None:
+                conn.close()
+    except queue.Empty:
+        pass
+    try:
+        for _ in range(slots):
+            q.put(None, block=False)
+    except queue.Full:
+        # the connections released meanwhile took the slots
+        pass
+
+
+def _keep_alive_socket_options(keep_alive_timeout):
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    idle = max(1, int(keep_alive_timeout))
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+    elif hasattr(socket, "TCP_KEEPALIVE"):
+        # macOS
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, idle))
+    return options
+
+
 class RequestsHttpClient(HttpClient):
     """Implements a basic requests HTTP sender.
 
@@ -122,16 +231,32 @@ class RequestsHttpClient(HttpClient):
                 instead of the default one.
             adapters (requests.adapters, optional): Request adapters to use
                 instead of the default one.
+            max_connections (int, optional): The number of connections kept in the pool of an endpoint,
+                it should be no less than the number of threads which send requests at the same time,
+                or the extra connections are opened and discarded after use. Default value: 20.
+            pool_block (bool, optional): Whether to wait for a free connection when the pool is exhausted
+                instead of opening an extra connection. Default value: False.
+            idle_connection_timeout (int|float, optional): The pooled connections are dropped
+                after the pool stays idle for this time in seconds. Default value: 50.
+            keep_alive_timeout (int|float, optional): The time in seconds a connection stays idle
+                before tcp keep-alive probes are sent. Default value: 30.
         """
 
         self.session_owner = False
         self.session = kwargs.get("session", None)
         self.adapter = kwargs.get("adapter", None)
+        # the pool can be resized only when it is created by this client
+        self._pool_owner = self.session is None and self.adapter is None
+        self._pool_lock = threading.Lock()
 
         # client's configuration
         self._connect_timeout = kwargs.get("connect_timeout", defaults.DEFAULT_CONNECT_TIMEOUT)
         self._read_timeout = kwargs.get("readwrite_timeout", defaults.DEFAULT_READWRITE_TIMEOUT)
         self._max_connections = kwargs.get("max_connections", defaults.DEFAULT_MAX_CONNECTIONS)
+        self._pool_block = kwargs.get("pool_block", False)
+        self._idle_connection_timeout = kwargs.get(
+            "idle_connection_timeout", defaults.DEFAULT_IDLE_CONNECTION_TIMEOUT)
+        self._keep_alive_timeout = kwargs.get("keep_alive_timeout", defaults.DEFAULT_KEEP_ALIVE_TIMEOUT)
         self._verify = True
         if kwargs.get("insecure_skip_verify") is True:
             self._verify = False
@@ -152,14 +277,46 @@ class RequestsHttpClient(HttpClient):
         """
         if self.adapter is None:
             disable_retries = Retry(total=False, redirect=False, raise_on_status=False)
-            self.adapter = requests.adapters.HTTPAdapter(max_retries=disable_retries,
-                                                         pool_maxsize=self._max_connections,
-                                                         pool_connections=self._max_connections)
+            # pool_connections is the number of the endpoints whose pools are cached,
+            # pool_maxsize is the number of the connections kept in each pool
+            self.adapter = _PoolHTTPAdapter(max_retries=disable_retries,
+                                            pool_maxsize=self._max_connections,
+                                            pool_connections=self._max_connections,
+                                            pool_block=self._pool_block,
+                                            idle_connection_timeout=self._idle_connection_timeout,
+                                            keep_alive_timeout=self._keep_alive_timeout)
 
         self.adapter = cast(requests.adapters.HTTPAdapter, self.adapter)
         for p in self._protocols:
             session.mount(p, self.adapter)
 
+    @property
+    def max_connections(self) -> int:
+        """The number of connections kept in the pool of an endpoint."""
+        return self._max_connections
+
+    def reserve_connections(self, num: int) -> None:
+        """Makes sure the pool of an endpoint keeps at least num connections.
+        The pool is enlarged if it is created by this client, otherwise a warning is issued.
+
+        Args:
+            num (int): The number of the threads which send requests at the same time.
+        """
+        if num <= self._max_connections:
+            return
+
+        if not self._pool_owner:
+            warnings.warn(f'{num} threads share a connection pool of {self._max_connections} connections, '
+                          'the extra connections are opened and discarded after use.', RuntimeWarning, stacklevel=3)
+            return
+
+        with self._pool_lock:
+            if num <= self._max_connections:
+                return
+            self._max_connections = num
+            if self.adapter is not None:
+                cast(_PoolHTTPAdapter, self.adapter).grow_pool(num)
+
     def open(self):
         if not self.session:
             self.session = requests.Session()
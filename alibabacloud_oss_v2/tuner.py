@@ -0,0 +1,212 @@
+"""Tuner for adjusting the parallelism and the part size of the transfer managers."""
+import threading
+import time
+from typing import Optional, List
+from . import exceptions
+from . import defaults
+from .types import Retryer
+
+
+class TuneDecision:
+    """A change made by the tuner.
+    """
+
+    def __init__(
+        self,
+        parallel_num: int,
+        part_size: int,
+        throughput: float,
+        latency: float,
+        reason: str,
+    ) -> None:
+        """
+        parallel_num (int): The number of the tasks in parallel after the change.
+        part_size (int): The part size after the change.
+        throughput (float): The observed throughput of the last round, in bytes per second.
+        latency (float): The observed average latency of a part in the last round, in seconds.
+        reason (str): Why the change is made.
+        """
+        self.parallel_num = parallel_num
+        self.part_size = part_size
+        self.throughput = throughput
+        self.latency = latency
+        self.reason = reason
+
+    def __repr__(self) -> str:
+        return (f'<TuneDecision parallel_num={self.parallel_num}, part_size={self.part_size}, '
+                f'throughput={self.throughput:.0f}, latency={self.latency:.3f}, reason={self.reason}>')
+
+
+class TransferTuner:
+    """Adjusts the parallelism and the part size from the observed per-part throughput and latency.
+
+    A round ends after parallel_num parts have finished. After each round, the parallelism is halved
+    if the service throttled any attempt of the requests, even if it was retried successfully,
+    grows by one while the throughput keeps increasing,
+    and shrinks by one when the throughput decreases. The part size doubles when the parts finish quickly
+    and halves when they are slow, but never goes below the initial part size.
+    """
+
+    def __init__(
+        self,
+        parallel_num: int,
+        part_size: int,
+        max_parallel_num: Optional[int] = None,
+        max_part_size: Optional[int] = None,
+        tune_part_size: Optional[bool] = None,
+    ) -> None:
+        """
+        parallel_num (int): The initial number of the tasks in parallel.
+        part_size (int): The initial part size, it is also the minimum part size.
+        max_parallel_num (int, optional): The maximum number of the tasks in parallel. Default value: 16.
+        max_part_size (int, optional): The maximum part size. Default value: 64 MiB.
+        tune_part_size (bool, optional): Whether to tune the part size. Default value: True.
+        """
+        self._lock = threading.Lock()
+        self._parallel_num = max(1, parallel_num)
+        self._part_size = part_size
+        self._min_part_size = part_size
+        self._max_parallel_num = max(self._parallel_num, max_parallel_num or defaults.DEFAULT_AUTO_TUNE_MAX_PARALLEL)
+        self._max_part_size = max(part_size, max_part_size or defaults.DEFAULT_AUTO_TUNE_MAX_PART_SIZE)
+        self._tune_part_size = True if tune_part_size is None else tune_part_size
+
+        self._last_throughput = 0.0
+        self._reset_round()
+        self.decisions: List[TuneDecision] = []
+
+    @property
+    def parallel_num(self) -> int:
+        """The number of the tasks in parallel"""
+        return self._parallel_num
+
+    @property
+    def max_parallel_num(self) -> int:
+        """The maximum number of the tasks in parallel"""
+        return self._max_parallel_num
+
+    @property
+    def part_size(self) -> int:
+        """The part size for the next part"""
+        return self._part_size
+
+    def record(self, size: int, elapsed: float, error: Optional[Exception] = None) -> None:
+        """Records a finished part.
+
+        Args:
+            size (int): The number of bytes transferred by the part.
+            elapsed (float): The time spent by the part, in seconds.
+            error (Exception, optional): The error the part meets.
+        """
+        with self._lock:
+            if error is not None and is_throttling_error(error):
+                self._round_throttled = True
+            self._round_parts += 1
+            self._round_bytes += size
+            self._round_elapsed += elapsed
+            if self._round_parts >= self._parallel_num:
+                self._tune()
+                self._reset_round()
+
+    def record_throttled(self) -> None:
+        """Records an attempt which the service throttled, the parallelism is halved after the round."""
+        with self._lock:
+            self._round_throttled = True
+
+    def wrap_retryer(self, retryer: Retryer) -> Retryer:
+        """Wraps the retryer of the client, so the throttled attempts of the parts are recorded.
+
+        Args:
+            retryer (Retryer): The retryer the parts are sent with.
+
+        Returns:
+            Retryer: The retryer to send the parts with.
+        """
+        return _TunerRetryer(retryer, self)
+
+    def _reset_round(self) -> None:
+        self._round_start = time.monotonic()
+        self._round_parts = 0
+        self._round_bytes = 0
+        self._round_elapsed = 0.0
+        self._round_throttled = False
+
+    def _tune(self) -> None:
+        wall = max(time.monotonic() - self._round_start, 1e-6)
+        throughput = self._round_bytes / wall
+        latency = self._round_elapsed / self._round_parts
+
+        parallel_num = self._parallel_num
+        part_size = self._part_size
+        reasons = []
+
+        if self._round_throttled:
+            parallel_num = max(1, parallel_num // 2)
+            reasons.append('throttled')
+        elif throughput > self._last_throughput * 1.05:
+            parallel_num = min(self._max_parallel_num, parallel_num + 1)
+            reasons.append('throughput increased')
+        elif throughput < self._last_throughput * 0.95:
+            parallel_num = max(1, parallel_num - 1)
+            reasons.append('throughput decreased')
+
+        if self._tune_part_size:
+            if latency < defaults.DEFAULT_AUTO_TUNE_MIN_PART_LATENCY:
+                part_size = min(self._max_part_size, part_size * 2)
+                reasons.append('fast part')
+            elif latency > defaults.DEFAULT_AUTO_TUNE_MAX_PART_LATENCY:
+                part_size = max(self._min_part_size, part_size // 2)
+                reasons.append('slow part')
+
+        self._last_throughput = throughput
+
+        if parallel_num == self._parallel_num and part_size == self._part_size:
+            return
+
+        self._parallel_num = parallel_num
+        self._part_size = part_size
+        self.decisions.append(TuneDecision(
+            parallel_num=parallel_num,
+            part_size=part_size,
+            throughput=throughput,
+            latency=latency,
+            reason=', '.join(reasons),
+        ))
+
+
+def is_throttling_error(error: Exception) -> bool:
+    """Checks whether the error means that the service throttles the requests.
+    """
+    if isinstance(error, exceptions.OperationError):
+        error = error.unwrap()
+    if isinstance(error, exceptions.ServiceError):
+        return error.status_code in (429, 503) or error.code in ('SlowDown', 'QpsLimitExceeded')
+    return False
+
+
+class _TunerRetryer(Retryer):
+    """Retries like the wrapped retryer, and records the throttled attempts to the tuner"""
+
+    def __init__(self, retryer: Retryer, tuner: TransferTuner) -> None:
+        super().__init__()
+        self._retryer = retryer
+        self._tuner = tuner
+
+    def is_error_retryable(self, error: Exception) -> bool:
+        return self._retryer.is_error_retryable(error)
+
+    def max_attempts(self) -> int:
+        return self._retryer.max_attempts()
+
+    def retry_delay(self, attempt: int, error: Exception) -> float:
+        return self._retryer.retry_delay(attempt, error)
+
+    def send_delay(self) -> float:
+        return self._retryer.send_delay()
+
+    def acquire_retry(self, error: Exception) -> int:
+        return self._retryer.acquire_retry(error)
+
+    def record_attempt(self, attempt: int, error: Optional[Exception], retry_tokens: int = 0) -> None:
+        if error is not None and is_throttling_error(error):
+            self._tuner.record_throttled()
+        self._retryer.record_attempt(attempt, error, retry_tokens)
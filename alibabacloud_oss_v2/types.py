@@ -13,10 +13,11 @@ from typing import (
     Mapping,
     Set,
     Dict,
+    List,
+    Tuple,
     AsyncIterator,
     AsyncContextManager,
 )
-from requests.structures import CaseInsensitiveDict
 
 BodyType = Union[str, bytes, Iterable[bytes], IO[str], IO[bytes]]
 
@@ -126,6 +127,40 @@ class Retryer(abc.ABC):
         :return: delay duration in second.
         """
 
+    def send_delay(self) -> float:
+        """Returns the delay that should be used before sending a request,
+        the retryer which limits the send rate on the client side reserves a send token here.
+
+        :rtype: float
+        :return: delay duration in second.
+        """
+        return 0.0
+
+    def acquire_retry(self, error: Exception) -> int:
+        """Takes the retry quota for retrying the retryable error.
+
+        :type error: Exception
+        :param error: the error meets
+
+        :rtype: int
+        :return: the tokens taken, they are passed to record_attempt of the retry.
+            0 if the request can not be retried, the retryers without a quota return 1.
+        """
+        return 1
+
+    def record_attempt(self, attempt: int, error: Optional[Exception], retry_tokens: int = 0) -> None:
+        """Records the result of an attempt.
+
+        :type attempt: int
+        :param attempt: current attempt, 0 for the first one
+
+        :type error: Exception
+        :param error: the error meets, None if the attempt succeeds
+
+        :type retry_tokens: int
+        :param retry_tokens: the tokens acquire_retry took for this attempt, 0 for the first one
+        """
+
 class HttpRequest:
     """A HttpRequest represents an HTTP request received by a server or to be sent by a client.
 
@@ -170,7 +205,7 @@ class HttpRequest:
 
         # header
         default_headers: MutableMapping[str, str] = {}
-        self.headers = CaseInsensitiveDict(default_headers)
+        self.headers = _case_insensitive_dict()(default_headers)
         self.headers.update(headers or {})
 
     def __repr__(self) -> str:
@@ -330,6 +365,10 @@ class SigningContext(object):
         self.additional_headers = additional_headers
         self.expiration_time: Optional[datetime.datetime] = None
         self.sub_resource: Optional[str] = []
+        # the encoded query pairs of encoded_url, the signers use them instead of
+        # parsing the request's url as long as the url is not changed.
+        self.encoded_url: Optional[str] = None
+        self.encoded_query: Optional[List[Tuple[str, str]]] = None
 
 
 class Signer(abc.ABC):
@@ -572,3 +611,18 @@ class AsyncHttpClient(abc.ABC):
     @abc.abstractmethod
     async def close(self) -> None:
         """Close the session if it is not externally owned."""
+
+
+def _case_insensitive_dict() -> type:
+    # requests is loaded on the first use of CaseInsensitiveDict, not by importing the package
+    cls = globals().get('CaseInsensitiveDict')
+    if cls is None:
+        from requests.structures import CaseInsensitiveDict  # pylint: disable=import-outside-toplevel
+        cls = globals()['CaseInsensitiveDict'] = CaseInsensitiveDict
+    return cls
+
+
+def __getattr__(name: str) -> Any:
+    if name == 'CaseInsensitiveDict':
+        return _case_insensitive_dict()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -5,6 +5,7 @@ import copy
 import os
 import concurrent.futures
 import threading
+import time
 from typing import Any, Optional, IO, MutableMapping, List
 from . import exceptions
 from . import models
@@ -14,8 +15,13 @@ from . import io_utils
 from . import defaults
 from .serde import copy_request
 from .checkpoint import UploadCheckpoint
+from .tuner import TransferTuner, TuneDecision
 from .paginator import ListPartsPaginator
 
+# the block size of the cipher the client side encryption uses
+_CSE_BLOCK_SIZE = 16
+
+
 class UploadAPIClient(abc.ABC):
     """Abstract base class for uploader client."""
 
@@ -76,6 +82,7 @@ class UploaderOptions:
         leave_parts_on_error: Optional[bool] = None,
         enable_checkpoint: Optional[bool] = None,
         checkpoint_dir: Optional[str] = None,
+        auto_tune: Optional[bool] = None,
     ) -> None:
         """
         part_size (int, optional): The part size. Default value: 6 MiB.
@@ -86,12 +93,16 @@ class UploaderOptions:
             By default, no resumable upload progress is recorded.
         checkpoint_dir (str, optional): The path in which the checkpoint file is stored. Example: /local/dir/.
             This parameter is valid only if EnableCheckpoint is set to true.
+        auto_tune (bool, optional): Specifies whether to tune the parallel number and the part size
+            from the observed throughput and latency of the parts during the multipart upload.
+            The part size is not tuned when the checkpoint is enabled. By default, no tuning is made.
         """
         self.part_size = part_size
         self.parallel_num = parallel_num
         self.leave_parts_on_error = leave_parts_on_error or False
         self.enable_checkpoint = enable_checkpoint or False
         self.checkpoint_dir = checkpoint_dir
+        self.auto_tune = auto_tune or False
 
 
 class UploadResult:
@@ -122,6 +133,7 @@ class UploadResult:
         self.status_code = 0
         self.request_id = ''
         self.headers: MutableMapping[str, str] = {}
+        self.tune_decisions: List[TuneDecision] = []
 
 class UploadError(exceptions.BaseError):
     """
@@ -155,7 +167,8 @@ class Uploader:
                 - parallel_num (int): The number of the upload tasks in parallel. Default value: 3.
                 - leave_parts_on_error (bool): Whether to retain the uploaded parts when an upload task fails. By default, the uploaded parts are not retained.
                 - enable_checkpoint (bool): Whether to enable checkpoint. Defaults to False.
-                - checkpoint_dir (str): The directory to store checkpoint.            
+                - checkpoint_dir (str): The directory to store checkpoint.
+                - auto_tune (bool): Whether to tune the parallel number and the part size automatically. Defaults to False.
         """
         part_size = kwargs.get('part_size', defaults.DEFAULT_UPLOAD_PART_SIZE)
         parallel_num = kwargs.get('parallel_num', defaults.DEFAULT_UPLOAD_PARALLEL)
@@ -167,17 +180,26 @@ class Uploader:
             leave_parts_on_error=leave_parts_on_error,
             enable_checkpoint=kwargs.get('enable_checkpoint', None),
             checkpoint_dir=kwargs.get('checkpoint_dir', None),
+            auto_tune=kwargs.get('auto_tune', None),
         )
 
         feature_flags = 0
+        http_client = None
+        retryer = None
         is_eclient = False
         cstr = str(client)
         if cstr == '<OssClient>':
             feature_flags = client._client._options.feature_flags
+            http_client = client._client._options.http_client
+            retryer = client._client._options.retryer
         elif cstr == '<OssEncryptionClient>':
             feature_flags = client.unwrap()._client._options.feature_flags
+            http_client = client.unwrap()._client._options.http_client
+            retryer = client.unwrap()._client._options.retryer
             is_eclient = True
         self._feature_flags = feature_flags
+        self._http_client = http_client
+        self._retryer = retryer
         self._is_eclient = is_eclient
 
 
@@ -197,7 +219,8 @@ class Uploader:
                 - parallel_num (int): The number of the upload tasks in parallel.
                 - leave_parts_on_error (bool): Whether to retain the uploaded parts when an upload task fails.
                 - enable_checkpoint (bool): Whether to enable checkpoint.
-                - checkpoint_dir (str): The directory to store checkpoint.            
+                - checkpoint_dir (str): The directory to store checkpoint.
+                - auto_tune (bool): Whether to tune the parallel number and the part size automatically.
 
         Returns:
             UploadResult: The result for the upload operation.
@@ -237,6 +260,7 @@ class Uploader:
                 - part_size (int): The part size.
                 - parallel_num (int): The number of the upload tasks in parallel.
                 - leave_parts_on_error (bool): Whether to retain the uploaded parts when an upload task fails.
+                - auto_tune (bool): Whether to tune the parallel number and the part size automatically.
         Returns:
             UploadResult: The result for the upload operation.
         """
@@ -266,6 +290,7 @@ class Uploader:
         options.leave_parts_on_error = kwargs.get('leave_parts_on_error', self._options.leave_parts_on_error)
         options.enable_checkpoint = kwargs.get('enable_checkpoint', self._options.enable_checkpoint)
         options.checkpoint_dir = kwargs.get('checkpoint_dir', self._options.checkpoint_dir)
+        options.auto_tune = kwargs.get('auto_tune', self._options.auto_tune)
 
         if options.part_size <= 0:
             options.part_size = defaults.DEFAULT_UPLOAD_PART_SIZE
@@ -273,6 +298,13 @@ class Uploader:
         if options.parallel_num <= 0:
             options.parallel_num = defaults.DEFAULT_UPLOAD_PARALLEL
 
+        # each worker holds a connection
+        if hasattr(self._http_client, 'reserve_connections'):
+            parallel_num = options.parallel_num
+            if options.auto_tune:
+                parallel_num = max(parallel_num, defaults.DEFAULT_AUTO_TUNE_MAX_PARALLEL)
+            self._http_client.reserve_connections(parallel_num)
+
         delegate = _UploaderDelegate(
             base=self,
             client=self._client,
@@ -288,9 +320,11 @@ class _UploadContext:
         self,
         upload_id: str = None,
         start_num: int = None,
+        cse_context: Any = None,
     ) -> None:
         self.upload_id = upload_id
         self.start_num = start_num
+        self.cse_context = cse_context
 
 
 class _UploaderDelegate:
@@ -337,6 +371,14 @@ class _UploaderDelegate:
         self._upload_id = None
         self._part_number = None
 
+        # client side encryption
+        self._cse_context = None
+
+        # auto tune
+        self._tuner: TransferTuner = None
+        # the extra options of the part requests
+        self._part_kwargs = {}
+
 
     @property
     def reader_filepath(self) -> str:
@@ -375,6 +417,10 @@ class _UploaderDelegate:
             while total_size / part_size >= defaults.MAX_UPLOAD_PARTS:
                 part_size += self._options.part_size
 
+        # the parts of the client side encryption must be aligned to the cipher block
+        if self._base._is_eclient:
+            part_size = (part_size + _CSE_BLOCK_SIZE - 1) // _CSE_BLOCK_SIZE * _CSE_BLOCK_SIZE
+
         self._reader = reader
         self._options.part_size = part_size
         self._total_size = total_size
@@ -399,6 +445,8 @@ class _UploaderDelegate:
         checkpoint.load()
         if checkpoint.loaded:
             self._upload_id = checkpoint.upload_id
+            if self._base._is_eclient:
+                self._load_cse_context(checkpoint.cse_context)
 
         self._options.leave_parts_on_error = True
         self._checkpoint = checkpoint
@@ -501,17 +549,34 @@ class _UploaderDelegate:
         except Exception as err:
             raise self._wrap_error('', err)
 
+        self._cse_context = upload_ctx.cse_context
+
         # update checkpoint
         if self._checkpoint:
             self._checkpoint.upload_id = upload_ctx.upload_id
+            if self._cse_context is not None:
+                self._checkpoint.cse_context = self._cse_context.to_dict()
             self._checkpoint.dump()
 
+        # the part size must stay the same when resuming from the uploaded parts,
+        # and the offsets of the encrypted parts are derived from it
+        if self._options.auto_tune:
+            self._tuner = TransferTuner(
+                parallel_num=self._options.parallel_num,
+                part_size=self._options.part_size,
+                tune_part_size=self._checkpoint is None and not self._base._is_eclient,
+            )
+            # the throttled attempts are seen by the tuner, even if they are retried successfully
+            if self._base._retryer is not None:
+                self._part_kwargs['retryer'] = self._tuner.wrap_retryer(self._base._retryer)
+
         # upload part
-        parallel = self._options.parallel_num > 1
+        parallel = self._options.parallel_num > 1 or self._tuner is not None
         if parallel:
             self._upload_part_lock = threading.Lock()
-            with concurrent.futures.ThreadPoolExecutor(self._options.parallel_num) as executor:
-                for result in executor.map(self._upload_part, self._iter_part(upload_ctx)):
+            max_workers = self._tuner.max_parallel_num if self._tuner else self._options.parallel_num
+            with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+                for result in self._iter_upload_result(executor, upload_ctx):
                     self._update_upload_result(result)
         else:
             for part in self._iter_part(upload_ctx):
@@ -557,6 +622,8 @@ class _UploaderDelegate:
         ret.status_code = cmresult.status_code
         ret.request_id = cmresult.request_id
         ret.headers = cmresult.headers
+        if self._tuner:
+            ret.tune_decisions = self._tuner.decisions
 
         return ret
 
@@ -566,6 +633,7 @@ class _UploaderDelegate:
             return _UploadContext(
                 upload_id=self._upload_id,
                 start_num=self._part_number - 1,
+                cse_context=self._cse_context,
             )
 
         #if not exist or fail, create a new upload id
@@ -574,11 +642,17 @@ class _UploaderDelegate:
         if request.content_type is None:
             request.content_type = self._get_content_type()
 
+        if self._base._is_eclient:
+            request.cse_part_size = self._options.part_size
+            if self._total_size > 0:
+                request.cse_data_size = self._total_size
+
         result = self._client.initiate_multipart_upload(request)
 
         return _UploadContext(
             upload_id=result.upload_id,
             start_num=0,
+            cse_context=result.cse_multipart_context,
         )
 
     def _iter_part(self, upload_ctx: _UploadContext):
@@ -588,7 +662,7 @@ class _UploaderDelegate:
             reader = io_utils.ReadAtReader(reader)
 
         def next_body():
-            n = self._options.part_size
+            n = self._tuner.part_size if self._tuner else self._options.part_size
             if self._reader_seekable:
                 bytes_left = self._total_size - self._reader_pos
                 if bytes_left < n:
@@ -613,6 +687,41 @@ class _UploaderDelegate:
             yield upload_ctx.upload_id, start_part_num, body
 
 
+    def _iter_upload_result(self, executor: concurrent.futures.Executor, upload_ctx: _UploadContext):
+        """Submits at most parallel_num parts to the executor at a time and yields the results in part order.
+        The next part's body is read only when a slot is free, and no more parts are scheduled after a part fails.
+        """
+        parts = self._iter_part(upload_ctx)
+        running = {}
+        finished = {}
+        next_part_number = upload_ctx.start_num + 1
+        eof = False
+        while True:
+            window = self._tuner.parallel_num if self._tuner else self._options.parallel_num
+            while not eof and len(running) < window and len(self._upload_errors) == 0:
+                part = next(parts, None)
+                if part is None:
+                    eof = True
+                    break
+                running[executor.submit(self._upload_part, part)] = part[1]
+
+            if len(running) == 0:
+                break
+
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                part_number = running.pop(future)
+                result = future.result()
+                if result is not None and result[2] is not None:
+                    # early abort, the running parts are skipped
+                    yield result
+                    return
+                finished[part_number] = result
+
+            while next_part_number in finished:
+                yield finished.pop(next_part_number)
+                next_part_number += 1
+
     def _upload_part(self, part):
         # When an error occurs, ignore other upload requests
         if len(self._upload_errors) > 0:
@@ -625,6 +734,7 @@ class _UploaderDelegate:
         etag = None
         size = len(body)
         hash_crc64 = None
+        start = time.monotonic()
         try:
             result = self._client.upload_part(models.UploadPartRequest(
                 bucket=self._request.bucket,
@@ -632,16 +742,33 @@ class _UploaderDelegate:
                 upload_id=upload_id,
                 part_number=part_number,
                 body=body,
-                request_payer=self._request.request_payer
-            ))
+                request_payer=self._request.request_payer,
+                cse_multipart_context=self._cse_context,
+            ), **self._part_kwargs)
             etag = result.etag
             hash_crc64 = result.hash_crc64
         except Exception as err:
             error = err
 
+        if self._tuner:
+            self._tuner.record(size, time.monotonic() - start, error)
+
         return part_number, etag, error, hash_crc64, size
 
 
+    def _load_cse_context(self, value) -> None:
+        # the uploaded parts can not be resumed without the envelope they were encrypted with
+        try:
+            if value is None:
+                raise ValueError('no envelope in the checkpoint')
+            context = self._client.load_multipart_context(value)
+            if context.part_size != self._options.part_size:
+                raise ValueError('the part size of the envelope is changed')
+            self._cse_context = context
+        except Exception:
+            self._upload_id = None
+            self._cse_context = None
+
     def _save_error(self, error) -> None:
         if self._upload_part_lock:
             with self._upload_part_lock:
@@ -0,0 +1,60 @@
+import argparse
+import os
+import time
+from alibabacloud_oss_v2 import crc
+
+parser = argparse.ArgumentParser(description="crc64 engines benchmark")
+parser.add_argument('--size', help='The size of the data in MiB. Default value: 64.', default=64)
+parser.add_argument('--chunk_size', help='The size of each update in KiB. Default value: 4096.', default=4096)
+parser.add_argument('--repeat', help='The number of rounds of each engine. Default value: 3.', default=3)
+
+def _crcmod_py():
+    try:
+        import crcmod
+        from crcmod import _crcfunpy
+    except ImportError:
+        return None
+    c = crcmod.Crc(0x142F0E1EBA9EA3693, initCrc=0, rev=True, xorOut=0XFFFFFFFFFFFFFFFF)
+    # crcmod's pure python fallback, used when its C extension is missing
+    def update(crc, data):
+        return _crcfunpy._crc64r(data, crc ^ 0XFFFFFFFFFFFFFFFF, c.table) ^ 0XFFFFFFFFFFFFFFFF
+    return update
+
+def main():
+
+    args = parser.parse_args()
+    size = int(args.size) * 1024 * 1024
+    chunk_size = int(args.chunk_size) * 1024
+    data = memoryview(os.urandom(size))
+
+    engines = {
+        'crcmod': crc._crc64_update_crcmod,
+        'crcmod-py': _crcmod_py(),
+        'numpy': crc._make_numpy_engine(),
+        'table': crc._crc64_update_table,
+    }
+
+    print(f'crc64 engine in use: {crc.CRC64_ENGINE}, data size: {size}, chunk size: {chunk_size}')
+
+    expected = None
+    for name, update in engines.items():
+        if update is None:
+            print(f'{name:<10}: not available')
+            continue
+
+        best = None
+        for _ in range(int(args.repeat)):
+            value = 0
+            stime = time.time()
+            for i in range(0, size, chunk_size):
+                value = update(value, data[i:i + chunk_size])
+            cost = time.time() - stime
+            best = cost if best is None else min(best, cost)
+
+        if expected is None:
+            expected = value
+        speed = size / best / 1024 / 1024 / 1024
+        print(f'{name:<10}: {speed:.4f} GiB/s, crc64: {value}, same: {value == expected}')
+
+if __name__ == "__main__":
+    main()
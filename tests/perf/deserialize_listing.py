@@ -0,0 +1,67 @@
+import argparse
+import time
+import xml.etree.ElementTree as ET
+from alibabacloud_oss_v2 import serde
+from alibabacloud_oss_v2.models import ListObjectsV2Result
+
+parser = argparse.ArgumentParser(description="listing decode benchmark")
+parser.add_argument('--keys', help='The number of the objects in a page. Default value: 1000.', default=1000)
+parser.add_argument('--pages', help='The number of the pages decoded by each case. Default value: 50.', default=50)
+
+def _page(keys):
+    contents = ''.join(
+        '<Contents>'
+        f'<Key>dir/sub/object-{i:08d}.txt</Key>'
+        '<LastModified>2024-01-01T12:00:00.000Z</LastModified>'
+        '<ETag>"5B3C1A2E053D763E1B002CC607C5A0FE"</ETag>'
+        '<Type>Normal</Type>'
+        f'<Size>{i * 10}</Size>'
+        '<StorageClass>Standard</StorageClass>'
+        '<Owner><ID>0022012****</ID><DisplayName>user-example</DisplayName></Owner>'
+        '</Contents>' for i in range(keys))
+    return ('<?xml version="1.0" encoding="UTF-8"?>'
+            '<ListBucketResult>'
+            '<Name>bucket</Name><Prefix>dir/</Prefix><MaxKeys>1000</MaxKeys>'
+            '<IsTruncated>true</IsTruncated><NextContinuationToken>token</NextContinuationToken>'
+            f'{contents}<KeyCount>{keys}</KeyCount>'
+            '</ListBucketResult>').encode()
+
+def _decode(data, pages, warm):
+    stime = time.time()
+    for _ in range(pages):
+        if not warm:
+            serde._PLANS.clear()
+        serde.deserialize_xml(data, ListObjectsV2Result(), expect_tag='ListBucketResult')
+    return (time.time() - stime) / pages
+
+def _decode_stream(data, pages):
+    stime = time.time()
+    for _ in range(pages):
+        chunks = (data[i:i + 64 * 1024] for i in range(0, len(data), 64 * 1024))
+        serde.deserialize_xml_stream(chunks, ListObjectsV2Result(), expect_tag='ListBucketResult')
+    return (time.time() - stime) / pages
+
+def main():
+
+    args = parser.parse_args()
+    keys = int(args.keys)
+    pages = int(args.pages)
+    data = _page(keys)
+
+    stime = time.time()
+    for _ in range(pages):
+        ET.fromstring(data)
+    parse = (time.time() - stime) / pages
+
+    cold = _decode(data, pages, False)
+    warm = _decode(data, pages, True)
+    stream = _decode_stream(data, pages)
+
+    print(f'page: {keys} keys, {len(data)} bytes')
+    print(f'{"xml parse only":<24}: {parse * 1000:.2f} ms/page')
+    print(f'{"decode, cold plans":<24}: {cold * 1000:.2f} ms/page, {keys / cold:.0f} keys/s')
+    print(f'{"decode, cached plans":<24}: {warm * 1000:.2f} ms/page, {keys / warm:.0f} keys/s')
+    print(f'{"stream decode":<24}: {stream * 1000:.2f} ms/page, {keys / stream:.0f} keys/s')
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import argparse
+import time
+from Crypto.PublicKey import RSA
+import alibabacloud_oss_v2 as oss
+from alibabacloud_oss_v2.types import HttpClient, HttpResponse
+
+parser = argparse.ArgumentParser(description="encryption put object with iterator body benchmark")
+parser.add_argument('--size', help='The size of the object in MiB. Default value: 64.', default=64)
+parser.add_argument('--piece_size', help='The size of the pieces the iterator yields. Default value: 100.', default=100)
+parser.add_argument('--chunk_size', help='The size of the chunks the body is encrypted in.')
+
+
+class _DrainHttpResponse(HttpResponse):
+    def __init__(self, request) -> None:
+        self._request = request
+
+    @property
+    def request(self):
+        return self._request
+
+    @property
+    def is_closed(self) -> bool:
+        return True
+
+    @property
+    def is_stream_consumed(self) -> bool:
+        return True
+
+    @property
+    def status_code(self) -> int:
+        return 200
+
+    @property
+    def headers(self):
+        return {'x-oss-request-id': 'id-1234'}
+
+    @property
+    def reason(self) -> str:
+        return 'OK'
+
+    @property
+    def content(self) -> bytes:
+        return b''
+
+    def __repr__(self) -> str:
+        return '_DrainHttpResponse'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def read(self) -> bytes:
+        return b''
+
+    def iter_bytes(self, **kwargs):
+        return iter([])
+
+
+class _DrainHttpClient(HttpClient):
+    """consumes the request body like a transport, without sending it"""
+
+    def __init__(self) -> None:
+        self.sent = 0
+        self.chunks = 0
+
+    def send(self, request, **kwargs):
+        for d in request.body:
+            self.sent += len(d)
+            self.chunks += 1
+        return _DrainHttpResponse(request)
+
+    def open(self) -> None:
+        return
+
+    def close(self) -> None:
+        return
+
+
+def main():
+
+    args = parser.parse_args()
+    size = int(args.size) * 1024 * 1024
+    piece_size = int(args.piece_size)
+    chunk_size = int(args.chunk_size) if args.chunk_size is not None else None
+
+    key = RSA.generate(2048)
+    mc = oss.crypto.MasterRsaCipher(
+        mat_desc={'desc': 'benchmark'},
+        public_key=key.publickey().export_key().decode(),
+        private_key=key.export_key().decode(),
+    )
+
+    http_client = _DrainHttpClient()
+    cfg = oss.config.load_default()
+    cfg.region = 'cn-hangzhou'
+    cfg.credentials_provider = oss.credentials.AnonymousCredentialsProvider()
+    cfg.http_client = http_client
+    eclient = oss.EncryptionClient(oss.Client(cfg), mc, chunk_size=chunk_size)
+
+    piece = b'x' * piece_size
+    def _body():
+        for _ in range(size // piece_size):
+            yield piece
+
+    stime = time.time()
+    eclient.put_object(oss.PutObjectRequest(bucket='bucket', key='key', body=_body()))
+    etime = time.time()
+
+    avg = http_client.sent/(etime - stime)
+    print(f'put {http_client.sent} bytes in {http_client.chunks} chunks with pieces of {piece_size} bytes,' \
+          f' cost: {etime - stime:.2f} s, avg: {avg/1024/1024:.2f} MiB/s')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import argparse
+import statistics
+import subprocess
+import sys
+
+parser = argparse.ArgumentParser(description="import time benchmark")
+parser.add_argument('--runs', help='The number of the interpreters started for each case. Default value: 10.', default=10)
+
+_CASES = [
+    ('import package', 'import alibabacloud_oss_v2'),
+    ('client + object models', 'import alibabacloud_oss_v2 as oss; oss.Client; oss.PutObjectRequest; oss.GetObjectRequest'),
+    ('all models', 'import alibabacloud_oss_v2 as oss; [getattr(oss.models, n) for n in dir(oss.models)]'),
+    ('encryption client', 'import alibabacloud_oss_v2 as oss; oss.EncryptionClient'),
+]
+
+def _measure(stmt, runs):
+    code = f'import time; t = time.perf_counter(); {stmt}; print(time.perf_counter() - t)'
+    times = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        times.append(float(out.stdout))
+    return min(times), statistics.median(times)
+
+def main():
+
+    args = parser.parse_args()
+    runs = int(args.runs)
+
+    for name, stmt in _CASES:
+        best, median = _measure(stmt, runs)
+        print(f'{name:<24}: best {best * 1000:.1f} ms, median {median * 1000:.1f} ms')
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import argparse
+import time
+from urllib.parse import urlencode, quote
+from alibabacloud_oss_v2.signer import SignerV1, SignerV4
+from alibabacloud_oss_v2.signer.v4 import signing_key_cache
+from alibabacloud_oss_v2.credentials import StaticCredentialsProvider
+from alibabacloud_oss_v2.types import HttpRequest, SigningContext
+from alibabacloud_oss_v2._client import _encode_query
+
+parser = argparse.ArgumentParser(description="signing benchmark")
+parser.add_argument('--count', help='The number of the requests signed by each case. Default value: 20000.', default=20000)
+
+def _sign(signer, count, fast_query, cache_key):
+    cred = StaticCredentialsProvider('ak', 'sk').get_credentials()
+    parameters = {'uploadId': '0004B9895DBBB6EC98E', 'partNumber': '1', 'response-content-type': 'text/plain'}
+    encoded_query = _encode_query(parameters)
+    url = 'https://bucket.oss-cn-hangzhou.aliyuncs.com/dir/key.txt?' + urlencode(parameters, quote_via=quote)
+    if not cache_key:
+        signing_key_cache.clear()
+        signing_key_cache._capacity = 0
+
+    stime = time.time()
+    for _ in range(count):
+        request = HttpRequest('GET', url)
+        request.headers.update({'User-Agent': 'bench', 'Content-Type': 'text/plain'})
+        context = SigningContext(
+            product='oss',
+            region='cn-hangzhou',
+            bucket='bucket',
+            key='dir/key.txt',
+            request=request,
+            credentials=cred,
+        )
+        if fast_query:
+            context.encoded_url = url
+            context.encoded_query = encoded_query
+        signer.sign(context)
+    cost = time.time() - stime
+
+    signing_key_cache._capacity = 64
+    return count / cost
+
+def main():
+
+    args = parser.parse_args()
+    count = int(args.count)
+
+    cases = [
+        ('v1, parse url', SignerV1(), False, True),
+        ('v1, encoded query', SignerV1(), True, True),
+        ('v4, parse url, no key cache', SignerV4(), False, False),
+        ('v4, parse url', SignerV4(), False, True),
+        ('v4, encoded query', SignerV4(), True, True),
+    ]
+    for name, signer, fast_query, cache_key in cases:
+        speed = _sign(signer, count, fast_query, cache_key)
+        print(f'{name:<30}: {speed:.0f} requests/s')
+
+if __name__ == "__main__":
+    main()
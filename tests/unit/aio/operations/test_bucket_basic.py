@@ -470,3 +470,56 @@ class TestBucketBasic(TestOperations):
         self.assertEqual('demo/README-CN.md', result.version[0].key)
         self.assertEqual('demo/LICENSE', result.delete_marker[0].key)
         self.assertEqual('demo/.git/', result.common_prefixes[0].prefix)
+
+    async def test_list_objects_v2_columnar(self):
+        def response_list_objects_v2():
+            body = ('<?xml version="1.0" encoding="UTF-8"?>'
+                    '<ListBucketResult>'
+                    '<Name>example-bucket</Name><Prefix>a%2F</Prefix><MaxKeys>2</MaxKeys>'
+                    '<EncodingType>url</EncodingType><IsTruncated>false</IsTruncated>'
+                    '<Contents><Key>a%2Fkey%201</Key><Size>1</Size><LastModified>2024-01-02T03:04:05.000Z</LastModified></Contents>'
+                    '<Contents><Key>a%2Fkey%202</Key><Size>2</Size></Contents>'
+                    '<CommonPrefixes><Prefix>a%2Fdir%2F</Prefix></CommonPrefixes>'
+                    '</ListBucketResult>')
+            return MockAsyncHttpResponse(
+                status_code=200,
+                reason='OK',
+                headers={'x-oss-request-id': 'id-1234'},
+                body=body,
+            )
+
+        self.set_responseFunc(response_list_objects_v2)
+        request = model.ListObjectsV2Request(
+            bucket='example-bucket',
+            prefix='a/',
+            max_keys=2,
+        )
+
+        batch = await operations.list_objects_v2_columnar(self.client, request)
+        self.assertEqual('https://example-bucket.oss-cn-hangzhou.aliyuncs.com/?encoding-type=url&list-type=2&max-keys=2&prefix=a%2F', self.request_dump.url)
+        self.assertEqual('GET', self.request_dump.method)
+
+        self.assertEqual(['a/key 1', 'a/key 2'], batch.keys)
+        self.assertEqual([1, 2], batch.sizes.tolist())
+        self.assertEqual([1704164645000, -1], batch.last_modified.tolist())
+        self.assertEqual(200, batch.result.status_code)
+        self.assertEqual('id-1234', batch.result.request_id)
+        self.assertEqual('a/', batch.result.prefix)
+        self.assertFalse(batch.result.is_truncated)
+        self.assertIsNone(batch.result.contents)
+        self.assertEqual('a/dir/', batch.result.common_prefixes[0].prefix)
+
+    async def test_list_objects_v2_columnar_fail(self):
+        self.set_responseFunc(self.response_403_InvalidAccessKeyId)
+        request = model.ListObjectsV2Request(
+            bucket='example-bucket',
+        )
+
+        try:
+            await operations.list_objects_v2_columnar(self.client, request)
+            self.fail('should not here')
+        except exceptions.OperationError as ope:
+            self.assertIsInstance(ope.unwrap(), exceptions.ServiceError)
+            serr = cast(exceptions.ServiceError, ope.unwrap())
+            self.assertEqual(403, serr.status_code)
+            self.assertEqual('InvalidAccessKeyId', serr.code)
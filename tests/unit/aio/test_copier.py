@@ -0,0 +1,110 @@
+# pylint: skip-file
+"""Unit tests for alibabacloud_oss_v2.aio.copier."""
+import asyncio
+import unittest
+
+from alibabacloud_oss_v2 import models
+from alibabacloud_oss_v2.copier import CopyError
+from alibabacloud_oss_v2.aio.copier import AsyncCopier, AsyncCopyAPIClient
+
+
+def _make_result(cls, **kwargs):
+    obj = cls(**kwargs)
+    obj.status = 'OK'
+    obj.status_code = 200
+    obj.request_id = 'mock-request-id'
+    obj.headers = kwargs.get('headers', {})
+    return obj
+
+
+class _MockAsyncCopyClient(AsyncCopyAPIClient):
+    def __init__(self, source_size, fail_part_number=None):
+        self._source_size = source_size
+        self._fail_part_number = fail_part_number
+        self.copy_calls = 0
+        self.part_ranges = {}
+        self.complete_calls = 0
+        self.abort_calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def copy_object(self, request, **kwargs):
+        self.copy_calls += 1
+        return _make_result(models.CopyObjectResult, etag='"copy-etag"')
+
+    async def head_object(self, request, **kwargs):
+        return _make_result(
+            models.HeadObjectResult,
+            content_length=self._source_size,
+            hash_crc64='12345',
+            headers={'Content-Length': str(self._source_size)},
+        )
+
+    async def initiate_multipart_upload(self, request, **kwargs):
+        return _make_result(models.InitiateMultipartUploadResult, upload_id='mock-copy-upload-id')
+
+    async def upload_part_copy(self, request, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        if request.part_number == self._fail_part_number:
+            raise RuntimeError('mock copy part failure')
+        self.part_ranges[request.part_number] = request.source_range
+        return _make_result(models.UploadPartCopyResult, etag=f'"part-{request.part_number}"')
+
+    async def complete_multipart_upload(self, request, **kwargs):
+        self.complete_calls += 1
+        return _make_result(
+            models.CompleteMultipartUploadResult,
+            etag='"final-copy-etag"',
+            headers={'x-oss-hash-crc64ecma': '12345'},
+        )
+
+    async def abort_multipart_upload(self, request, **kwargs):
+        self.abort_calls += 1
+        return _make_result(models.AbortMultipartUploadResult)
+
+    async def list_parts(self, request, **kwargs):
+        raise NotImplementedError
+
+    async def get_object_tagging(self, request, **kwargs):
+        raise NotImplementedError
+
+
+class TestAsyncCopier(unittest.IsolatedAsyncioTestCase):
+
+    def _request(self):
+        return models.CopyObjectRequest(bucket='bucket', key='dst-key', source_key='src-key')
+
+    async def test_single_copy(self):
+        client = _MockAsyncCopyClient(source_size=1024)
+        result = await AsyncCopier(client).copy(self._request())
+        self.assertEqual('"copy-etag"', result.etag)
+        self.assertEqual(1, client.copy_calls)
+
+    async def test_multipart_copy(self):
+        part_size = 100 * 1024
+        client = _MockAsyncCopyClient(source_size=part_size * 5 + 1)
+        copier = AsyncCopier(client, part_size=part_size, parallel_num=3,
+                             multipart_copy_threshold=part_size, disable_shallow_copy=True)
+        result = await copier.copy(self._request())
+
+        self.assertEqual('mock-copy-upload-id', result.upload_id)
+        self.assertEqual('"final-copy-etag"', result.etag)
+        self.assertEqual(6, len(client.part_ranges))
+        self.assertEqual(f'bytes={part_size * 5}-{part_size * 5}', client.part_ranges[6])
+        self.assertEqual(3, client.max_in_flight)
+
+    async def test_multipart_copy_fail(self):
+        part_size = 100 * 1024
+        client = _MockAsyncCopyClient(source_size=part_size * 5, fail_part_number=2)
+        copier = AsyncCopier(client, part_size=part_size, parallel_num=2,
+                             multipart_copy_threshold=part_size, disable_shallow_copy=True)
+        with self.assertRaises(CopyError) as cm:
+            await copier.copy(self._request())
+        self.assertEqual('mock copy part failure', str(cm.exception.unwrap()))
+        self.assertEqual(0, client.complete_calls)
+        self.assertEqual(1, client.abort_calls)
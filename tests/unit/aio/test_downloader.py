@@ -0,0 +1,124 @@
+# pylint: skip-file
+"""Unit tests for alibabacloud_oss_v2.aio.downloader."""
+import asyncio
+import io
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from alibabacloud_oss_v2 import models
+from alibabacloud_oss_v2.crc import Crc64
+from alibabacloud_oss_v2.downloader import DownloadError
+from alibabacloud_oss_v2.aio.downloader import AsyncDownloader, AsyncDownloadAPIClient
+
+
+def _make_result(cls, **kwargs):
+    obj = cls(**kwargs)
+    obj.status = 'OK'
+    obj.status_code = 200
+    obj.request_id = 'mock-request-id'
+    obj.headers = kwargs.get('headers', {})
+    return obj
+
+
+class _MockAsyncStreamBody:
+    def __init__(self, data):
+        self._data = data
+        self.is_closed = False
+
+    async def iter_bytes(self, **kwargs):
+        return self._aiter(kwargs.get('block_size', 8192))
+
+    async def _aiter(self, block_size):
+        for i in range(0, len(self._data), block_size):
+            await asyncio.sleep(0)
+            yield self._data[i:i + block_size]
+
+    async def close(self):
+        self.is_closed = True
+
+
+class _MockAsyncDownloadClient(AsyncDownloadAPIClient):
+    def __init__(self, data, fail_start=None):
+        self._data = data
+        self._fail_start = fail_start
+        self.get_calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def head_object(self, request, **kwargs):
+        crc = Crc64(0)
+        crc.update(self._data)
+        return _make_result(
+            models.HeadObjectResult,
+            content_length=len(self._data),
+            etag='"etag"',
+            headers={'Content-Length': str(len(self._data)), 'x-oss-hash-crc64ecma': str(crc.sum64())},
+        )
+
+    async def get_object(self, request, **kwargs):
+        self.get_calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # finish the parts out of order
+            await asyncio.sleep(random.random() * 0.01)
+        finally:
+            self.in_flight -= 1
+        start, end = request.range_header.replace('bytes=', '').split('-')
+        start, end = int(start), int(end)
+        if start == self._fail_start:
+            raise RuntimeError('mock get object failure')
+        chunk = self._data[start:end + 1]
+        result = _make_result(models.GetObjectResult, content_length=len(chunk))
+        result.body = _MockAsyncStreamBody(chunk)
+        return result
+
+
+class TestAsyncDownloader(unittest.IsolatedAsyncioTestCase):
+    PART_SIZE = 100 * 1024
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp(prefix='oss-async-downloader-test-')
+        self.data = os.urandom(self.PART_SIZE * 7 + 321)
+        self.request = models.GetObjectRequest(bucket='bucket', key='key')
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    async def test_download_to(self):
+        client = _MockAsyncDownloadClient(self.data)
+        downloader = AsyncDownloader(client, part_size=self.PART_SIZE, parallel_num=1)
+        buf = io.BytesIO()
+        result = await downloader.download_to(self.request, buf)
+        self.assertEqual(len(self.data), result.written)
+        self.assertEqual(self.data, buf.getvalue())
+        self.assertEqual(8, client.get_calls)
+
+    async def test_download_file_in_parallel(self):
+        client = _MockAsyncDownloadClient(self.data)
+        downloader = AsyncDownloader(client, part_size=self.PART_SIZE, parallel_num=4)
+        downloader._feature_flags = 0x00000010
+
+        progress = []
+        self.request.progress_fn = lambda n, written, total: progress.append(written)
+        filepath = os.path.join(self.workdir, 'data.bin')
+        result = await downloader.download_file(self.request, filepath)
+
+        self.assertEqual(len(self.data), result.written)
+        with open(filepath, 'rb') as f:
+            self.assertEqual(self.data, f.read())
+        self.assertEqual(4, client.max_in_flight)
+        self.assertEqual(len(self.data), progress[-1])
+
+    async def test_download_file_fail(self):
+        client = _MockAsyncDownloadClient(self.data, fail_start=self.PART_SIZE * 2)
+        downloader = AsyncDownloader(client, part_size=self.PART_SIZE, parallel_num=2)
+        filepath = os.path.join(self.workdir, 'data.bin')
+
+        with self.assertRaises(DownloadError) as cm:
+            await downloader.download_file(self.request, filepath)
+        self.assertEqual('mock get object failure', str(cm.exception.unwrap()))
+        self.assertLess(client.get_calls, 8)
@@ -0,0 +1,209 @@
+# pylint: skip-file
+"""Unit tests for alibabacloud_oss_v2.aio.uploader."""
+import asyncio
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from alibabacloud_oss_v2 import models
+from alibabacloud_oss_v2.crc import Crc64
+from alibabacloud_oss_v2.uploader import UploadError
+from alibabacloud_oss_v2.aio.uploader import AsyncUploader, AsyncUploadAPIClient
+
+
+def _make_result(cls, **kwargs):
+    obj = cls(**kwargs)
+    obj.status = 'OK'
+    obj.status_code = 200
+    obj.request_id = 'mock-request-id'
+    obj.headers = kwargs.get('headers', {})
+    return obj
+
+
+class _MockAsyncUploadClient(AsyncUploadAPIClient):
+    """Mock async client that records the uploaded parts."""
+
+    def __init__(self, fail_part_number=None, list_parts_pages=None, delays=None):
+        self.fail_part_number = fail_part_number
+        self.delays = delays or {}
+        self.list_parts_pages = list_parts_pages if list_parts_pages is not None else [[]]
+        self.parts = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.put_calls = 0
+        self.initiate_calls = 0
+        self.complete_calls = 0
+        self.abort_calls = 0
+        self.list_parts_calls = 0
+
+    async def put_object(self, request, **kwargs):
+        self.put_calls += 1
+        return _make_result(models.PutObjectResult, etag='"put-etag"')
+
+    async def head_object(self, request, **kwargs):
+        raise NotImplementedError
+
+    async def initiate_multipart_upload(self, request, **kwargs):
+        self.initiate_calls += 1
+        return _make_result(models.InitiateMultipartUploadResult, upload_id='mock-upload-id')
+
+    async def upload_part(self, request, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(request.part_number, 0.01))
+            if request.part_number == self.fail_part_number:
+                raise RuntimeError('mock upload part failure')
+            self.parts[request.part_number] = request.body
+            crc = Crc64(0)
+            crc.update(request.body)
+            return _make_result(
+                models.UploadPartResult,
+                etag=f'"etag-{request.part_number}"',
+                hash_crc64=str(crc.sum64()),
+            )
+        finally:
+            self.in_flight -= 1
+
+    async def complete_multipart_upload(self, request, **kwargs):
+        self.complete_calls += 1
+        data = b''.join(self.parts[p.part_number] for p in request.complete_multipart_upload.parts)
+        crc = Crc64(0)
+        crc.update(data)
+        return _make_result(
+            models.CompleteMultipartUploadResult,
+            etag='"final-etag"',
+            hash_crc64=str(crc.sum64()),
+            headers={'x-oss-hash-crc64ecma': str(crc.sum64())},
+        )
+
+    async def abort_multipart_upload(self, request, **kwargs):
+        self.abort_calls += 1
+        return _make_result(models.AbortMultipartUploadResult)
+
+    async def list_parts(self, request, **kwargs):
+        self.list_parts_calls += 1
+        idx = self.list_parts_calls - 1
+        parts = list(self.list_parts_pages[idx]) if idx < len(self.list_parts_pages) else []
+        return _make_result(
+            models.ListPartsResult,
+            upload_id=request.upload_id,
+            is_truncated=idx + 1 < len(self.list_parts_pages),
+            next_part_number_marker=parts[-1].part_number if parts else 0,
+            parts=parts,
+        )
+
+
+class TestAsyncUploader(unittest.IsolatedAsyncioTestCase):
+    PART_SIZE = 100 * 1024
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp(prefix='oss-async-uploader-test-')
+        self.data = os.urandom(self.PART_SIZE * 5 + 123)
+        self.filepath = os.path.join(self.workdir, 'data.bin')
+        with open(self.filepath, 'wb') as f:
+            f.write(self.data)
+        self.request = models.PutObjectRequest(bucket='bucket', key='key')
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    async def test_single_part(self):
+        client = _MockAsyncUploadClient()
+        uploader = AsyncUploader(client)
+        result = await uploader.upload_from(self.request, io.BytesIO(b'hello world'))
+        self.assertEqual('"put-etag"', result.etag)
+        self.assertEqual(1, client.put_calls)
+        self.assertEqual(0, client.initiate_calls)
+
+    async def test_upload_file_in_parallel(self):
+        client = _MockAsyncUploadClient()
+        uploader = AsyncUploader(client, part_size=self.PART_SIZE, parallel_num=3)
+        uploader._feature_flags = 0x00000008
+
+        progress = []
+        self.request.progress_fn = lambda n, written, total: progress.append((n, written, total))
+        result = await uploader.upload_file(self.request, self.filepath)
+
+        self.assertEqual('mock-upload-id', result.upload_id)
+        self.assertEqual('"final-etag"', result.etag)
+        self.assertEqual(6, len(client.parts))
+        self.assertEqual(self.data, b''.join(client.parts[i] for i in sorted(client.parts)))
+        self.assertEqual(3, client.max_in_flight)
+        self.assertEqual(len(self.data), progress[-1][1])
+
+    async def test_upload_parts_finish_out_of_order(self):
+        client = _MockAsyncUploadClient(delays={1: 0.1, 2: 0.05})
+        uploader = AsyncUploader(client, part_size=self.PART_SIZE, parallel_num=3)
+        uploader._feature_flags = 0x00000008
+
+        progress = []
+        self.request.progress_fn = lambda n, written, total: progress.append((n, written, total))
+        result = await uploader.upload_file(self.request, self.filepath)
+
+        self.assertEqual('"final-etag"', result.etag)
+        self.assertEqual(_crc_of(self.data), result.hash_crc64)
+        self.assertEqual(self.data, b''.join(client.parts[i] for i in sorted(client.parts)))
+        self.assertEqual(len(self.data), progress[-1][1])
+
+    async def test_upload_from_non_seekable_stream(self):
+        class _Stream:
+            def __init__(self, data):
+                self._r = io.BytesIO(data)
+
+            def read(self, n=-1):
+                return self._r.read(n)
+
+        client = _MockAsyncUploadClient()
+        uploader = AsyncUploader(client, part_size=self.PART_SIZE, parallel_num=2)
+        result = await uploader.upload_from(self.request, _Stream(self.data))
+
+        self.assertEqual('"final-etag"', result.etag)
+        self.assertEqual(self.data, b''.join(client.parts[i] for i in sorted(client.parts)))
+        self.assertLessEqual(client.max_in_flight, 2)
+
+    async def test_upload_part_fail_aborts(self):
+        client = _MockAsyncUploadClient(fail_part_number=2)
+        uploader = AsyncUploader(client, part_size=self.PART_SIZE, parallel_num=2)
+
+        with self.assertRaises(UploadError) as cm:
+            await uploader.upload_file(self.request, self.filepath)
+
+        self.assertEqual('mock upload part failure', str(cm.exception.unwrap()))
+        self.assertEqual(0, client.complete_calls)
+        self.assertEqual(1, client.abort_calls)
+        self.assertLess(len(client.parts), 6)
+
+    async def test_resume_from_checkpoint(self):
+        cp_arg = os.path.join(self.workdir, '_placeholder')
+
+        client = _MockAsyncUploadClient(fail_part_number=3)
+        uploader = AsyncUploader(client, part_size=self.PART_SIZE, parallel_num=1,
+                                 enable_checkpoint=True, checkpoint_dir=cp_arg)
+        with self.assertRaises(UploadError):
+            await uploader.upload_file(self.request, self.filepath)
+        self.assertEqual(0, client.abort_calls)
+
+        uploaded = [
+            models.Part(part_number=i, etag=f'"etag-{i}"', size=self.PART_SIZE,
+                        hash_crc64=_crc_of(self.data[(i - 1) * self.PART_SIZE:i * self.PART_SIZE]))
+            for i in (1, 2)
+        ]
+        client2 = _MockAsyncUploadClient(list_parts_pages=[uploaded])
+        client2.parts = {i: self.data[(i - 1) * self.PART_SIZE:i * self.PART_SIZE] for i in (1, 2)}
+        uploader2 = AsyncUploader(client2, part_size=self.PART_SIZE, parallel_num=2,
+                                  enable_checkpoint=True, checkpoint_dir=cp_arg)
+        uploader2._feature_flags = 0x00000008
+        result = await uploader2.upload_file(self.request, self.filepath)
+
+        self.assertEqual('mock-upload-id', result.upload_id)
+        self.assertEqual(0, client2.initiate_calls)
+        self.assertEqual(self.data, b''.join(client2.parts[i] for i in sorted(client2.parts)))
+
+
+def _crc_of(data):
+    crc = Crc64(0)
+    crc.update(data)
+    return str(crc.sum64())
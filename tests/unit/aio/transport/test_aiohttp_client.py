@@ -0,0 +1,101 @@
+# pylint: skip-file
+import asyncio
+import unittest
+import aiohttp
+from aiohttp import web
+from alibabacloud_oss_v2.types import HttpRequest
+from alibabacloud_oss_v2.aio.transport import AioHttpClient
+
+
+class TestAioHttpClient(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        async def _handler(request):
+            # the body is sent in two chunks, the connection is in use until it is read
+            resp = web.StreamResponse()
+            resp.content_length = 5
+            await resp.prepare(request)
+            await resp.write(b'hel')
+            await asyncio.sleep(float(request.query.get('delay', '0')))
+            await resp.write(b'lo')
+            await resp.write_eof()
+            return resp
+
+        app = web.Application()
+        app.router.add_get('/', _handler)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        self.port = self.runner.addresses[0][1]
+        self.url = f'http://127.0.0.1:{self.port}/'
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def test_connector_settings(self):
+        client = AioHttpClient(
+            max_connections=5,
+            max_connections_per_host=2,
+            idle_connection_timeout=12,
+            dns_cache_ttl=30,
+        )
+        await client.open()
+        connector = client.session.connector
+        self.assertIsInstance(connector, aiohttp.TCPConnector)
+        self.assertEqual(5, connector.limit)
+        self.assertEqual(2, connector.limit_per_host)
+        self.assertEqual(12, connector._keepalive_timeout)
+        await client.close()
+        self.assertTrue(connector.closed)
+
+        client = AioHttpClient()
+        await client.open()
+        self.assertEqual(20, client.session.connector.limit)
+        self.assertEqual(0, client.session.connector.limit_per_host)
+        await client.close()
+
+    async def test_shared_connector(self):
+        connector = aiohttp.TCPConnector(limit=3)
+        client1 = AioHttpClient(connector=connector)
+        client2 = AioHttpClient(connector=connector)
+
+        resp = await client1.send(HttpRequest('GET', self.url))
+        self.assertEqual(b'hello', resp.content)
+        resp = await client2.send(HttpRequest('GET', self.url))
+        self.assertEqual(b'hello', resp.content)
+        self.assertEqual(1, client1.pool_stats()['idle'])
+
+        await client1.close()
+        self.assertFalse(connector.closed)
+        await client2.close()
+        await connector.close()
+
+    async def test_pool_stats(self):
+        client = AioHttpClient(max_connections=4, max_connections_per_host=3)
+        stats = client.pool_stats()
+        self.assertEqual(4, stats['limit'])
+        self.assertEqual(0, stats['acquired'])
+        self.assertEqual({}, stats['hosts'])
+
+        host = f'127.0.0.1:{self.port}'
+        resps = await asyncio.gather(*[
+            client.send(HttpRequest('GET', self.url + '?delay=0.05'), stream=True) for _ in range(3)
+        ])
+        stats = client.pool_stats()
+        self.assertEqual(3, stats['limit_per_host'])
+        self.assertEqual(3, stats['acquired'])
+        self.assertEqual(3, stats['hosts'][host]['acquired'])
+
+        for resp in resps:
+            self.assertEqual(b'hello', await resp.read())
+        stats = client.pool_stats()
+        self.assertEqual(0, stats['acquired'])
+        self.assertEqual(3, stats['idle'])
+        self.assertEqual({'acquired': 0, 'idle': 3}, stats['hosts'][host])
+
+        await client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,10 @@
 # pylint: skip-file
 import unittest
 import datetime
+import threading
+import time
 
-from alibabacloud_oss_v2 import credentials
+from alibabacloud_oss_v2 import credentials, exceptions
 from alibabacloud_oss_v2.types import Credentials
 
 class TestCredentials(unittest.TestCase):
@@ -89,3 +91,120 @@ class TestCredentials(unittest.TestCase):
         self.assertEqual(False, cred.is_expired())
 
 
+
+
+class TestRefreshingCredentialsProvider(unittest.TestCase):
+
+    def _fetcher(self, lifetime, delay=0.0, fail=None):
+        state = {'calls': 0}
+        lock = threading.Lock()
+
+        def _fetch():
+            with lock:
+                state['calls'] += 1
+                n = state['calls']
+            if delay:
+                time.sleep(delay)
+            if fail is not None and fail(n):
+                raise ValueError(f'fetch error {n}')
+            expiration = None
+            if lifetime is not None:
+                expiration = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=lifetime)
+            return Credentials(f'ak-{n}', f'sk-{n}', f'token-{n}', expiration)
+
+        return _fetch, state
+
+    def test_cache(self):
+        fetch, state = self._fetcher(lifetime=3600)
+        provider = credentials.RefreshingCredentialsProvider(fetch)
+        for _ in range(100):
+            cred = provider.get_credentials()
+        self.assertEqual('ak-1', cred.access_key_id)
+        self.assertEqual(1, state['calls'])
+
+        fetch, state = self._fetcher(lifetime=None)
+        provider = credentials.RefreshingCredentialsProvider(credentials.CredentialsProviderFunc(fetch))
+        provider.get_credentials()
+        provider.get_credentials()
+        self.assertEqual(1, state['calls'])
+
+    def test_refresh_in_background(self):
+        fetch, state = self._fetcher(lifetime=1.0, delay=0.1)
+        provider = credentials.RefreshingCredentialsProvider(fetch, refresh_ahead=120)
+        self.assertEqual('ak-1', provider.get_credentials().access_key_id)
+        for _ in range(50):
+            self.assertEqual('ak-1', provider.get_credentials().access_key_id)
+        self.assertEqual(1, state['calls'])
+
+        # within the refresh window, the cached credentials are returned at once
+        time.sleep(0.55)
+        start = time.monotonic()
+        for _ in range(50):
+            self.assertEqual('ak-1', provider.get_credentials().access_key_id)
+        self.assertLess(time.monotonic() - start, 0.1)
+
+        time.sleep(0.2)
+        self.assertEqual(2, state['calls'])
+        self.assertEqual('ak-2', provider.get_credentials().access_key_id)
+
+    def test_lifetime_shorter_than_refresh_ahead(self):
+        fetch, state = self._fetcher(lifetime=200)
+        provider = credentials.RefreshingCredentialsProvider(fetch, refresh_ahead=300)
+        for _ in range(2000):
+            self.assertEqual('ak-1', provider.get_credentials().access_key_id)
+        time.sleep(0.05)
+        self.assertEqual(1, state['calls'])
+
+    def test_single_flight(self):
+        fetch, state = self._fetcher(lifetime=3600, delay=0.1)
+        provider = credentials.RefreshingCredentialsProvider(fetch)
+        results = []
+
+        def _get():
+            results.append(provider.get_credentials().access_key_id)
+
+        threads = [threading.Thread(target=_get) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(['ak-1'] * 10, results)
+        self.assertEqual(1, state['calls'])
+
+    def test_expired(self):
+        fetch, state = self._fetcher(lifetime=-1)
+        provider = credentials.RefreshingCredentialsProvider(fetch)
+        self.assertEqual('ak-1', provider.get_credentials().access_key_id)
+        # the expired credentials are refreshed in the calling thread
+        self.assertEqual('ak-2', provider.get_credentials().access_key_id)
+        self.assertEqual(2, state['calls'])
+
+    def test_background_error(self):
+        fetch, state = self._fetcher(lifetime=1.0, fail=lambda n: n == 2)
+        provider = credentials.RefreshingCredentialsProvider(fetch, refresh_ahead=120, retry_interval=0.2)
+        self.assertEqual('ak-1', provider.get_credentials().access_key_id)
+        time.sleep(0.55)
+        self.assertEqual('ak-1', provider.get_credentials().access_key_id)
+        time.sleep(0.05)
+        self.assertIsInstance(provider.last_error, ValueError)
+
+        # no refresh until the retry interval passes
+        self.assertEqual('ak-1', provider.get_credentials().access_key_id)
+        self.assertEqual(2, state['calls'])
+
+        time.sleep(0.2)
+        provider.get_credentials()
+        time.sleep(0.05)
+        self.assertEqual(3, state['calls'])
+        self.assertIsNone(provider.last_error)
+        self.assertEqual('ak-3', provider.get_credentials().access_key_id)
+
+    def test_fetch_error(self):
+        provider = credentials.RefreshingCredentialsProvider(lambda: Credentials('', ''))
+        with self.assertRaises(exceptions.CredentialsEmptyError):
+            provider.get_credentials()
+
+        fetch, _ = self._fetcher(lifetime=60, fail=lambda n: True)
+        provider = credentials.RefreshingCredentialsProvider(fetch)
+        with self.assertRaises(ValueError):
+            provider.get_credentials()
@@ -340,3 +340,75 @@ class TestAesCtr(unittest.TestCase):
             data += d
         self.assertEqual(example_data, dataf.read())
 
+
+    def test_iterator_encryptor_chunks(self):
+        cipher_data = CipherData(
+            iv=aes_ctr._AesCtr.random_iv(),
+            key=aes_ctr._AesCtr.random_key(),
+            encrypted_iv=b'',
+            encrypted_key=b'',
+            mat_desc='',
+            wrap_algorithm='RSA/NONE/PKCS1Padding',
+            cek_algorithm='AES/CTR/NoPadding'
+        )
+        data = bytes(range(256)) * 40
+        expected = aes_ctr._AesCtr(cipher_data, 0).encrypt(data)
+
+        def pieces(sizes):
+            pos = 0
+            i = 0
+            while pos < len(data):
+                n = sizes[i % len(sizes)]
+                yield data[pos:pos + n]
+                pos += n
+                i += 1
+
+        for chunk_size in [16, 100, 1024, 64 * 1024]:
+            for sizes in [[1], [3, 0, 17], [1000], [5, 2000, 7, 1024], [len(data)]]:
+                cipher = aes_ctr._AesCtr(cipher_data, 0, chunk_size=chunk_size)
+                eiter = cipher.encrypt(pieces(sizes))
+                self.assertIsInstance(eiter, aes_ctr.IteratorEncryptor)
+                chunks = list(eiter)
+                self.assertEqual(expected, b''.join(chunks))
+                # the chunks are independent of each other
+                self.assertTrue(all(isinstance(c, bytes) for c in chunks))
+                # the small pieces are coalesced
+                for c in chunks[:-1]:
+                    self.assertGreaterEqual(len(c), min(chunk_size, min(s for s in sizes if s > 0)))
+                if max(sizes) < chunk_size:
+                    self.assertTrue(all(len(c) == chunk_size for c in chunks[:-1]))
+
+        # bytearray and memoryview pieces
+        cipher = aes_ctr._AesCtr(cipher_data, 0, chunk_size=100)
+        eiter = cipher.encrypt(iter([bytearray(data[:10]), memoryview(data)[10:300], data[300:]]))
+        self.assertEqual(expected, b''.join(eiter))
+
+        # empty
+        cipher = aes_ctr._AesCtr(cipher_data, 0, chunk_size=100)
+        self.assertEqual([], list(cipher.encrypt(iter([]))))
+        self.assertEqual([], list(cipher.encrypt(iter([b'', b'']))))
+
+    def test_stream_body_decryptor_in_place(self):
+        cipher_data = CipherData(
+            iv=aes_ctr._AesCtr.random_iv(),
+            key=aes_ctr._AesCtr.random_key(),
+            encrypted_iv=b'',
+            encrypted_key=b'',
+            mat_desc='',
+            wrap_algorithm='RSA/NONE/PKCS1Padding',
+            cek_algorithm='AES/CTR/NoPadding'
+        )
+        data = bytes(range(256)) * 40
+        cipher = aes_ctr._AesCtr(cipher_data, 0)
+        edata = cipher.encrypt(data)
+
+        class _BytearrayStreamBody(StubStreamBody):
+            def iter_bytes(self, **kwargs):
+                for d in super().iter_bytes(**kwargs):
+                    yield bytearray(d)
+
+        chunks = []
+        for d in cipher.decrypt(_BytearrayStreamBody(edata)).iter_bytes(block_size=1000):
+            self.assertIsInstance(d, bytearray)
+            chunks.append(bytes(d))
+        self.assertEqual(data, b''.join(chunks))
@@ -0,0 +1,168 @@
+# pylint: skip-file
+import threading
+import unittest
+from alibabacloud_oss_v2 import client, config, credentials
+from alibabacloud_oss_v2.crypto import MasterCipher, Envelope, ContentKeyCache
+from alibabacloud_oss_v2.crypto.aes_ctr_cipher import AESCtrCipherBuilder
+from alibabacloud_oss_v2.encryption_client import EncryptionClient
+
+
+class _CountingMasterCipher(MasterCipher):
+    """reverses the data, and counts the decryptions"""
+
+    def __init__(self, mat_desc=''):
+        self._mat_desc = mat_desc
+        self._lock = threading.Lock()
+        self.decrypts = 0
+
+    def encrypt(self, data: bytes) -> bytes:
+        return data[::-1]
+
+    def decrypt(self, data: bytes) -> bytes:
+        with self._lock:
+            self.decrypts += 1
+        return data[::-1]
+
+    def get_wrap_algorithm(self) -> str:
+        return 'RSA/NONE/PKCS1Padding'
+
+    def get_mat_desc(self) -> str:
+        return self._mat_desc
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _unwrap(key, iv):
+    calls = []
+    def fn():
+        calls.append(1)
+        return key, iv
+    return fn, calls
+
+
+class TestContentKeyCache(unittest.TestCase):
+
+    def test_hit_and_miss(self):
+        cache = ContentKeyCache()
+        fn, calls = _unwrap(b'k' * 32, b'i' * 16)
+        self.assertEqual((b'k' * 32, b'i' * 16), cache.get_or_unwrap('a', fn))
+        self.assertEqual((b'k' * 32, b'i' * 16), cache.get_or_unwrap('a', fn))
+        key, iv = cache.get_or_unwrap('a', fn)
+        self.assertIsInstance(key, bytes)
+        self.assertIsInstance(iv, bytes)
+        self.assertEqual(1, len(calls))
+        self.assertEqual(2, cache.hits)
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(1, len(cache))
+
+    def test_lru(self):
+        cache = ContentKeyCache(max_entries=2)
+        fn, calls = _unwrap(b'k', b'i')
+        cache.get_or_unwrap('a', fn)
+        cache.get_or_unwrap('b', fn)
+        cache.get_or_unwrap('a', fn)
+        cache.get_or_unwrap('c', fn)
+        self.assertEqual(2, len(cache))
+        self.assertEqual(3, len(calls))
+        cache.get_or_unwrap('a', fn)
+        self.assertEqual(3, len(calls))
+        cache.get_or_unwrap('b', fn)
+        self.assertEqual(4, len(calls))
+
+    def test_ttl(self):
+        clock = _Clock()
+        cache = ContentKeyCache(ttl=10, clock=clock)
+        fn, calls = _unwrap(b'k', b'i')
+        cache.get_or_unwrap('a', fn)
+        clock.now = 9.9
+        cache.get_or_unwrap('a', fn)
+        self.assertEqual(1, len(calls))
+        clock.now = 10.0
+        cache.get_or_unwrap('a', fn)
+        self.assertEqual(2, len(calls))
+
+    def test_zero_on_evict(self):
+        cache = ContentKeyCache(max_entries=1)
+        fn, _ = _unwrap(b'k' * 4, b'i' * 4)
+        key, _ = cache.get_or_unwrap('a', fn)
+        cached = cache._entries['a']
+        cache.get_or_unwrap('b', fn)
+        self.assertEqual(bytearray(4), cached[0])
+        self.assertEqual(bytearray(4), cached[1])
+        # the keys handed out are not affected
+        self.assertEqual(b'k' * 4, key)
+
+        cached = cache._entries['b']
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(bytearray(4), cached[0])
+
+        cache = ContentKeyCache(max_entries=1, zero_on_evict=False)
+        cache.get_or_unwrap('a', fn)
+        cached = cache._entries['a']
+        cache.clear()
+        self.assertEqual(bytearray(b'k' * 4), cached[0])
+
+    def test_disabled(self):
+        cache = ContentKeyCache(max_entries=0)
+        fn, calls = _unwrap(b'k', b'i')
+        cache.get_or_unwrap('a', fn)
+        cache.get_or_unwrap('a', fn)
+        self.assertEqual(2, len(calls))
+        self.assertEqual(0, len(cache))
+
+    def test_builder(self):
+        mc = _CountingMasterCipher()
+        builder = AESCtrCipherBuilder(mc, key_cache=ContentKeyCache())
+        cd = builder.content_cipher().get_cipher_data()
+        env = Envelope(
+            iv=cd.encrypted_iv,
+            cipher_key=cd.encrypted_key,
+            wrap_algorithm=cd.wrap_algorithm,
+            cek_algorithm=cd.cek_algorithm,
+        )
+
+        for offset in [0, 16, 32, 0]:
+            cc = builder.content_cipher_from_env(env, offset=offset)
+            self.assertEqual(cd.key, cc.get_cipher_data().key)
+            self.assertEqual(cd.iv, cc.get_cipher_data().iv)
+        self.assertEqual(2, mc.decrypts)
+
+        # the data are decrypted the same
+        data = b'hello world' * 10
+        encrypted = builder.content_cipher_from_env(env).encrypt_content(data)
+        self.assertEqual(data, builder.content_cipher_from_env(env).decrypt_content(encrypted))
+
+        # another master cipher does not share the cached keys
+        mc2 = _CountingMasterCipher()
+        builder2 = AESCtrCipherBuilder(mc2, key_cache=builder.key_cache)
+        builder2.content_cipher_from_env(env)
+        self.assertEqual(2, mc2.decrypts)
+
+        # without the cache
+        mc3 = _CountingMasterCipher()
+        builder3 = AESCtrCipherBuilder(mc3)
+        builder3.content_cipher_from_env(env)
+        builder3.content_cipher_from_env(env)
+        self.assertEqual(4, mc3.decrypts)
+
+    def test_encryption_client(self):
+        cfg = config.load_default()
+        cfg.region = 'cn-hangzhou'
+        cfg.credentials_provider = credentials.AnonymousCredentialsProvider()
+        mc = _CountingMasterCipher()
+        mc2 = _CountingMasterCipher(mat_desc='{"key": "value"}')
+        eclient = EncryptionClient(client.Client(cfg), mc, decrypt_master_ciphers=[mc2])
+        self.assertIsInstance(eclient.key_cache, ContentKeyCache)
+        self.assertIs(eclient.key_cache, eclient._defualt_ccbuilder.key_cache)
+        self.assertIs(eclient.key_cache, eclient._ccbuilders['{"key": "value"}'].key_cache)
+
+        cache = ContentKeyCache(max_entries=0)
+        eclient = EncryptionClient(client.Client(cfg), mc, key_cache=cache)
+        self.assertIs(cache, eclient.key_cache)
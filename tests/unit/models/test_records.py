@@ -0,0 +1,152 @@
+# pylint: skip-file
+import datetime
+import unittest
+from xml.etree import ElementTree as ET
+from alibabacloud_oss_v2 import models, serde
+from alibabacloud_oss_v2.models import records as model
+
+
+class TestObjectRecord(unittest.TestCase):
+    def test_from_model(self):
+        obj = models.ObjectProperties(
+            key='key-1',
+            object_type='Normal',
+            size=1024,
+            etag='"5B3C1A2E053D763E1B002CC607C5A0FE"',
+            last_modified=datetime.datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.timezone.utc),
+            storage_class='Standard',
+            owner=models.Owner(id='0022012****', display_name='user-example'),
+            restore_info='ongoing-request="false"',
+        )
+        record = model.ObjectRecord.from_model(obj)
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertEqual('key-1', record.key)
+        self.assertEqual('Normal', record.object_type)
+        self.assertEqual(1024, record.size)
+        self.assertEqual('"5B3C1A2E053D763E1B002CC607C5A0FE"', record.etag)
+        self.assertEqual(obj.last_modified, record.last_modified)
+        self.assertEqual(1704164645123456, record._last_modified)
+        self.assertEqual('Standard', record.storage_class)
+        self.assertEqual('0022012****', record.owner.id)
+        self.assertEqual('user-example', record.owner.display_name)
+        self.assertEqual('ongoing-request="false"', record.restore_info)
+        self.assertIsNone(record.transition_time)
+
+        again = record.to_model()
+        self.assertIsInstance(again, models.ObjectProperties)
+        self.assertEqual(obj.__dict__.keys(), again.__dict__.keys())
+        for name in ['key', 'object_type', 'size', 'etag', 'last_modified', 'storage_class', 'restore_info']:
+            self.assertEqual(getattr(obj, name), getattr(again, name))
+        self.assertEqual(obj.owner.id, again.owner.id)
+
+        self.assertEqual(record, model.ObjectRecord.from_model(obj))
+        self.assertNotEqual(record, model.ObjectRecord.from_model(models.ObjectProperties(key='key-2')))
+
+    def test_from_xml(self):
+        elem = ET.fromstring(
+            '<Contents><Key>key-1</Key><LastModified>2024-01-02T03:04:05.123Z</LastModified>'
+            '<ETag>"5B3C1A2E053D763E1B002CC607C5A0FE"</ETag><Type>Normal</Type><Size>1024</Size>'
+            '<StorageClass>Standard</StorageClass>'
+            '<Owner><ID>0022012****</ID><DisplayName>user-example</DisplayName></Owner></Contents>')
+        record = model.ObjectRecord.from_xml(elem)
+        obj = models.ObjectProperties()
+        serde._deserialize_xml_model(elem, obj)
+        self.assertEqual(model.ObjectRecord.from_model(obj), record)
+        self.assertEqual(1024, record.size)
+        self.assertEqual(1704164645123000, record._last_modified)
+        self.assertIs(record.storage_class, model.ObjectRecord.from_xml(elem).storage_class)
+        self.assertIs(record._owner_id, model.ObjectRecord.from_xml(elem)._owner_id)
+
+        record = model.ObjectRecord.from_xml(ET.fromstring('<Contents><Key>key-2</Key></Contents>'))
+        self.assertEqual('key-2', record.key)
+        self.assertIsNone(record.last_modified)
+        self.assertIsNone(record.owner)
+        self.assertIsNone(record.size)
+
+    def test_as_records(self):
+        record = model.ObjectRecord(key='key-1')
+        records = [record]
+        self.assertIs(records, model.ObjectRecord.as_records(records))
+        self.assertEqual([record], model.ObjectRecord.as_records([models.ObjectProperties(key='key-1')]))
+        self.assertIsNone(model.ObjectRecord.as_records(None))
+
+    def test_interned(self):
+        a = model.ObjectRecord.from_model(models.ObjectProperties(storage_class=''.join(['Stand', 'ard'])))
+        b = model.ObjectRecord.from_model(models.ObjectProperties(storage_class=''.join(['Stan', 'dard'])))
+        self.assertIs(a.storage_class, b.storage_class)
+
+    def test_empty(self):
+        record = model.ObjectRecord.from_model(models.ObjectProperties())
+        self.assertIsNone(record.key)
+        self.assertIsNone(record.last_modified)
+        self.assertIsNone(record.owner)
+        self.assertIsNone(model.ObjectRecord.from_models(None))
+        self.assertEqual([], model.ObjectRecord.from_models([]))
+
+    def test_constructor(self):
+        record = model.ObjectRecord(
+            key='key-1',
+            last_modified=datetime.datetime(2024, 1, 2, 3, 4, 5),
+        )
+        self.assertEqual('key-1', record.key)
+        self.assertEqual(datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc), record.last_modified)
+        self.assertIsNone(record.size)
+
+        record.owner = models.Owner(id='id')
+        self.assertEqual('id', record.owner.id)
+        record.owner = None
+        self.assertIsNone(record.owner)
+
+
+class TestObjectVersionRecord(unittest.TestCase):
+    def test_from_model(self):
+        obj = models.ObjectVersionProperties(
+            key='key-1',
+            version_id='CAEQNhiBgMDJgZCA0BYiIDc4MGZjZGI2OTBjOTRmNTE5NmU5NmFhZjhjYmY0****',
+            is_latest=True,
+            size=1,
+            last_modified=datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc),
+        )
+        record = model.ObjectVersionRecord.from_model(obj)
+        self.assertEqual(obj.version_id, record.version_id)
+        self.assertTrue(record.is_latest)
+        self.assertEqual(obj.last_modified, record.last_modified)
+        self.assertIsInstance(record.to_model(), models.ObjectVersionProperties)
+        self.assertEqual(obj.version_id, record.to_model().version_id)
+
+
+class TestPartRecord(unittest.TestCase):
+    def test_from_xml(self):
+        elem = ET.fromstring(
+            '<Part><PartNumber>1</PartNumber><LastModified>2024-01-02T03:04:05.000Z</LastModified>'
+            '<ETag>"etag-1"</ETag><Size>6291456</Size><HashCrc64ecma>123</HashCrc64ecma></Part>')
+        record = model.PartRecord.from_xml(elem)
+        self.assertEqual(model.PartRecord(part_number=1, etag='"etag-1"', size=6291456, hash_crc64='123',
+                                          last_modified=datetime.datetime(2024, 1, 2, 3, 4, 5)), record)
+
+    def test_from_model(self):
+        obj = models.Part(
+            part_number=3,
+            etag='"etag"',
+            last_modified=datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc),
+            size=100,
+            hash_crc64='1234',
+        )
+        record = model.PartRecord.from_model(obj)
+        self.assertEqual(3, record.part_number)
+        self.assertEqual('1234', record.hash_crc64)
+        self.assertEqual(obj.last_modified, record.last_modified)
+        self.assertEqual(obj.__dict__, record.to_model().__dict__)
+
+
+class TestUploadRecord(unittest.TestCase):
+    def test_from_model(self):
+        obj = models.Upload(
+            key='key-1',
+            upload_id='upload-id',
+            initiated=datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc),
+        )
+        record = model.UploadRecord.from_model(obj)
+        self.assertEqual('upload-id', record.upload_id)
+        self.assertEqual(obj.initiated, record.initiated)
+        self.assertEqual(obj.__dict__, record.to_model().__dict__)
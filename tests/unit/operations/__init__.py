@@ -1,8 +1,68 @@
 # pylint: skip-file
 import unittest
+from typing import Any
+from alibabacloud_oss_v2 import config, credentials, exceptions
+from alibabacloud_oss_v2 import _client
 from alibabacloud_oss_v2.types import HttpRequest, HttpResponse, HttpClient
 from .. import MockHttpResponse, mock_client
 
+
+class ResetOnceHttpClient(HttpClient):
+    """Resets the connection once while the body of the first response is being read.
+    The body is read in send unless a streamed response is asked for, as RequestsHttpClient does.
+    """
+
+    def __init__(self, body: str) -> None:
+        super().__init__()
+        self.body = body
+        self.sends = 0
+
+    def send(self, request: HttpRequest, **kwargs: Any) -> HttpResponse:
+        self.sends += 1
+        reset = self.sends == 1
+        body = self.body
+
+        class _Response(MockHttpResponse):
+            def iter_bytes(self, **kwargs):
+                data = body.encode()
+                for i in range(0, len(data), 16):
+                    if reset and i >= 32:
+                        raise ConnectionResetError('connection reset by peer')
+                    yield data[i:i + 16]
+
+            def read(self):
+                self._body = b''.join(self.iter_bytes())
+                self._is_stream_consumed = True
+                return self._body
+
+        response = _Response(
+            status_code=200,
+            reason='OK',
+            headers={'x-oss-request-id': 'id-1234'},
+            body=None,
+        )
+        response._request = request
+        if not kwargs.get('stream', False):
+            try:
+                response.read()
+            except ConnectionResetError as err:
+                raise exceptions.ResponseError(error=err)
+        return response
+
+    def open(self) -> None:
+        return
+
+    def close(self) -> None:
+        return
+
+
+def mock_client_with(http_client: HttpClient) -> _client._SyncClientImpl:
+    cfg = config.load_default()
+    cfg.region = 'cn-hangzhou'
+    cfg.credentials_provider = credentials.AnonymousCredentialsProvider()
+    cfg.http_client = http_client
+    return _client._SyncClientImpl(cfg)
+
 class TestOperations(unittest.TestCase):
     def setUp(self):
         self.set_requestFunc(None)
@@ -5,7 +5,7 @@ from alibabacloud_oss_v2 import exceptions
 from alibabacloud_oss_v2.models import bucket_basic as model
 from alibabacloud_oss_v2.operations import bucket_basic as operations
 from .. import MockHttpResponse
-from . import TestOperations
+from . import TestOperations, ResetOnceHttpClient, mock_client_with
 
 class TestBucketBasic(TestOperations):
 
@@ -470,3 +470,168 @@ class TestBucketBasic(TestOperations):
         self.assertEqual('demo/README-CN.md', result.version[0].key)
         self.assertEqual('demo/LICENSE', result.delete_marker[0].key)
         self.assertEqual('demo/.git/', result.common_prefixes[0].prefix)
+
+    def test_list_objects_v2_iter(self):
+        def response_list_objects_v2():
+            body = ('<?xml version="1.0" encoding="UTF-8"?>'
+                    '<ListBucketResult>'
+                    '<Name>example-bucket</Name><Prefix>a%2F</Prefix><MaxKeys>2</MaxKeys>'
+                    '<EncodingType>url</EncodingType><IsTruncated>true</IsTruncated>'
+                    '<NextContinuationToken>token-2</NextContinuationToken>'
+                    '<Contents><Key>a%2Fkey%201</Key><Size>1</Size></Contents>'
+                    '<Contents><Key>a%2Fkey%202</Key><Size>2</Size></Contents>'
+                    '<CommonPrefixes><Prefix>a%2Fdir%2F</Prefix></CommonPrefixes>'
+                    '<KeyCount>3</KeyCount>'
+                    '</ListBucketResult>')
+            return MockHttpResponse(
+                status_code=200,
+                reason='OK',
+                headers={'x-oss-request-id': 'id-1234'},
+                body=body,
+            )
+
+        self.set_responseFunc(response_list_objects_v2)
+        request = model.ListObjectsV2Request(
+            bucket='example-bucket',
+            prefix='a/',
+            max_keys=2,
+        )
+
+        self.__class__.request_dump = None
+        gen = operations.list_objects_v2_iter(self.client, request)
+        self.assertIsNone(self.request_dump)
+
+        item = next(gen)
+        self.assertEqual('https://example-bucket.oss-cn-hangzhou.aliyuncs.com/?encoding-type=url&list-type=2&max-keys=2&prefix=a%2F', self.request_dump.url)
+        self.assertEqual('a/key 1', item.key)
+        self.assertEqual(1, item.size)
+
+        items = [item]
+        try:
+            while True:
+                items.append(next(gen))
+        except StopIteration as stop:
+            result = stop.value
+
+        self.assertEqual(['a/key 1', 'a/key 2'], [o.key for o in items])
+        self.assertEqual(200, result.status_code)
+        self.assertEqual('id-1234', result.request_id)
+        self.assertEqual('a/', result.prefix)
+        self.assertTrue(result.is_truncated)
+        self.assertEqual('token-2', result.next_continuation_token)
+        self.assertEqual(3, result.key_count)
+        self.assertIsNone(result.contents)
+        self.assertEqual(['a/dir/'], [p.prefix for p in result.common_prefixes])
+
+    def test_list_objects_v2_iter_encoding_type_last(self):
+        def response_list_objects_v2():
+            body = ('<?xml version="1.0" encoding="UTF-8"?>'
+                    '<ListBucketResult>'
+                    '<Name>example-bucket</Name><Prefix>a%2F</Prefix><MaxKeys>2</MaxKeys>'
+                    '<Contents><Key>a%2Fkey%201</Key><Size>1</Size></Contents>'
+                    '<Contents><Key>a%2Fkey%202</Key><Size>2</Size></Contents>'
+                    '<IsTruncated>false</IsTruncated>'
+                    '<EncodingType>url</EncodingType>'
+                    '</ListBucketResult>')
+            return MockHttpResponse(
+                status_code=200,
+                reason='OK',
+                headers={'x-oss-request-id': 'id-1234'},
+                body=body,
+            )
+
+        self.set_responseFunc(response_list_objects_v2)
+        request = model.ListObjectsV2Request(bucket='example-bucket')
+        items = list(operations.list_objects_v2_iter(self.client, request))
+        self.assertEqual(['a/key 1', 'a/key 2'], [o.key for o in items])
+
+    def test_list_objects_v2_retry_body_read(self):
+        body = ('<?xml version="1.0" encoding="UTF-8"?>'
+                '<ListBucketResult>'
+                '<Name>example-bucket</Name>'
+                '<Contents><Key>a%2Fkey%201</Key><Size>1</Size></Contents>'
+                '<IsTruncated>false</IsTruncated>'
+                '<EncodingType>url</EncodingType>'
+                '</ListBucketResult>')
+
+        for name in ['list_objects_v2', 'list_objects_v2_iter', 'list_objects_v2_columnar']:
+            with self.subTest(name=name):
+                http_client = ResetOnceHttpClient(body)
+                client = mock_client_with(http_client)
+                request = model.ListObjectsV2Request(bucket='example-bucket')
+                if name == 'list_objects_v2':
+                    keys = [o.key for o in operations.list_objects_v2(client, request).contents]
+                elif name == 'list_objects_v2_iter':
+                    keys = [o.key for o in operations.list_objects_v2_iter(client, request)]
+                else:
+                    keys = operations.list_objects_v2_columnar(client, request).keys
+                self.assertEqual(['a/key 1'], keys)
+                self.assertEqual(2, http_client.sends)
+
+    def test_list_objects_v2_iter_fail(self):
+        self.set_responseFunc(self.response_403_InvalidAccessKeyId)
+        request = model.ListObjectsV2Request(
+            bucket='example-bucket',
+        )
+
+        try:
+            list(operations.list_objects_v2_iter(self.client, request))
+            self.fail('should not here')
+        except exceptions.OperationError as ope:
+            self.assertIsInstance(ope.unwrap(), exceptions.ServiceError)
+            serr = cast(exceptions.ServiceError, ope.unwrap())
+            self.assertEqual(403, serr.status_code)
+            self.assertEqual('InvalidAccessKeyId', serr.code)
+
+    def test_list_objects_v2_columnar(self):
+        def response_list_objects_v2():
+            body = ('<?xml version="1.0" encoding="UTF-8"?>'
+                    '<ListBucketResult>'
+                    '<Name>example-bucket</Name><Prefix>a%2F</Prefix><MaxKeys>2</MaxKeys>'
+                    '<EncodingType>url</EncodingType><IsTruncated>false</IsTruncated>'
+                    '<Contents><Key>a%2Fkey%201</Key><Size>1</Size><LastModified>2024-01-02T03:04:05.000Z</LastModified></Contents>'
+                    '<Contents><Key>a%2Fkey%202</Key><Size>2</Size></Contents>'
+                    '<CommonPrefixes><Prefix>a%2Fdir%2F</Prefix></CommonPrefixes>'
+                    '</ListBucketResult>')
+            return MockHttpResponse(
+                status_code=200,
+                reason='OK',
+                headers={'x-oss-request-id': 'id-1234'},
+                body=body,
+            )
+
+        self.set_responseFunc(response_list_objects_v2)
+        request = model.ListObjectsV2Request(
+            bucket='example-bucket',
+            prefix='a/',
+            max_keys=2,
+        )
+
+        batch = operations.list_objects_v2_columnar(self.client, request)
+        self.assertEqual('https://example-bucket.oss-cn-hangzhou.aliyuncs.com/?encoding-type=url&list-type=2&max-keys=2&prefix=a%2F', self.request_dump.url)
+        self.assertEqual('GET', self.request_dump.method)
+
+        self.assertEqual(['a/key 1', 'a/key 2'], batch.keys)
+        self.assertEqual([1, 2], batch.sizes.tolist())
+        self.assertEqual([1704164645000, -1], batch.last_modified.tolist())
+        self.assertEqual(200, batch.result.status_code)
+        self.assertEqual('id-1234', batch.result.request_id)
+        self.assertEqual('a/', batch.result.prefix)
+        self.assertFalse(batch.result.is_truncated)
+        self.assertIsNone(batch.result.contents)
+        self.assertEqual('a/dir/', batch.result.common_prefixes[0].prefix)
+
+    def test_list_objects_v2_columnar_fail(self):
+        self.set_responseFunc(self.response_403_InvalidAccessKeyId)
+        request = model.ListObjectsV2Request(
+            bucket='example-bucket',
+        )
+
+        try:
+            operations.list_objects_v2_columnar(self.client, request)
+            self.fail('should not here')
+        except exceptions.OperationError as ope:
+            self.assertIsInstance(ope.unwrap(), exceptions.ServiceError)
+            serr = cast(exceptions.ServiceError, ope.unwrap())
+            self.assertEqual(403, serr.status_code)
+            self.assertEqual('InvalidAccessKeyId', serr.code)
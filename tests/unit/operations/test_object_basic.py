@@ -4,7 +4,7 @@ import xml.etree.ElementTree as ET
 from alibabacloud_oss_v2 import exceptions
 from alibabacloud_oss_v2.models import object_basic as model
 from alibabacloud_oss_v2.operations import object_basic as operations
-from . import TestOperations
+from . import TestOperations, ResetOnceHttpClient, mock_client_with
 
 class TestObjectBasic(TestOperations):
 
@@ -932,6 +932,20 @@ class TestObjectBasic(TestOperations):
         self.assertEqual('requester', self.request_dump.headers.get('x-oss-request-payer'))
 
 
+    def test_list_parts_retry_body_read(self):
+        body = ('<?xml version="1.0" encoding="UTF-8"?>'
+                '<ListPartsResult>'
+                '<Bucket>bucket</Bucket><Key>key</Key><UploadId>0004B9895DBBB6EC9</UploadId>'
+                '<Part><PartNumber>1</PartNumber><Size>6291456</Size></Part>'
+                '<Part><PartNumber>2</PartNumber><Size>3410</Size></Part>'
+                '<IsTruncated>false</IsTruncated>'
+                '</ListPartsResult>')
+        http_client = ResetOnceHttpClient(body)
+        request = model.ListPartsRequest(bucket='bucket', key='key', upload_id='0004B9895DBBB6EC9')
+        result = operations.list_parts(mock_client_with(http_client), request)
+        self.assertEqual([1, 2], [p.part_number for p in result.parts])
+        self.assertEqual(2, http_client.sends)
+
     def test_list_parts_fail(self):
         self.set_responseFunc(self.response_403_InvalidAccessKeyId)
         request = model.ListPartsRequest(
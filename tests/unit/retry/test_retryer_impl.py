@@ -1,8 +1,8 @@
 # pylint: skip-file
 from typing import List
 import unittest
-from alibabacloud_oss_v2.retry import retryer_impl, error_retryable
-from alibabacloud_oss_v2.exceptions import ServiceError
+from alibabacloud_oss_v2.retry import retryer_impl, error_retryable, token_bucket
+from alibabacloud_oss_v2.exceptions import ServiceError, OperationError, RequestError
 from alibabacloud_oss_v2.defaults import DEFAULT_BASE_DELAY_S, DEFAULT_MAX_ATTEMPTS, DEFAULT_MAX_BACKOFF_S
 
 def gen_status_code_error(status_code: int):
@@ -97,3 +97,54 @@ class TestRetryerImpl(unittest.TestCase):
 
         self.assertGreater(len(values), 0)
 
+
+    def test_adaptive_retryer(self):
+        quota = token_bucket.RetryQuota(capacity=12, retry_cost=5, timeout_cost=10)
+        r = retryer_impl.AdaptiveRetryer(max_attempts=4, retry_quota=quota)
+        self.assertEqual(4, r.max_attempts())
+        self.assertIs(quota, r.retry_quota)
+        self.assertTrue(r.is_error_retryable(gen_status_code_error(503)))
+
+        self.assertTrue(r.is_throttle_error(gen_status_code_error(503)))
+        self.assertTrue(r.is_throttle_error(gen_status_code_error(429)))
+        self.assertTrue(r.is_throttle_error(gen_service_code_error('SlowDown')))
+        self.assertTrue(r.is_throttle_error(OperationError(name='test', error=gen_status_code_error(503))))
+        self.assertFalse(r.is_throttle_error(gen_status_code_error(500)))
+        self.assertFalse(r.is_throttle_error(Exception()))
+
+        # retry quota
+        self.assertEqual(5, r.acquire_retry(gen_status_code_error(500)))
+        self.assertEqual(7, quota.available)
+        self.assertEqual(0, r.acquire_retry(RequestError(error=Exception('timeout'))))
+        self.assertEqual(5, r.acquire_retry(gen_status_code_error(500)))
+        self.assertEqual(0, r.acquire_retry(gen_status_code_error(500)))
+        r.record_attempt(1, None, 5)
+        self.assertEqual(7, quota.available)
+        r.record_attempt(0, None)
+        self.assertEqual(8, quota.available)
+        r.record_attempt(0, gen_status_code_error(500))
+        self.assertEqual(8, quota.available)
+
+        # the tokens taken for a timeout retry are put back as they are
+        for _ in range(4):
+            r.record_attempt(0, None)
+        self.assertEqual(12, quota.available)
+        tokens = r.acquire_retry(RequestError(error=Exception('timeout')))
+        self.assertEqual(10, tokens)
+        self.assertEqual(2, quota.available)
+        r.record_attempt(2, gen_status_code_error(500), tokens)
+        self.assertEqual(2, quota.available)
+        r.record_attempt(1, None, tokens)
+        self.assertEqual(12, quota.available)
+
+        # rate limiting is enabled by the throttling errors
+        self.assertFalse(r.rate_limiter.enabled)
+        self.assertEqual(0.0, r.send_delay())
+        r.record_attempt(0, gen_service_code_error('SlowDown'))
+        self.assertTrue(r.rate_limiter.enabled)
+
+    def test_nop_retryer_hooks(self):
+        r = retryer_impl.StandardRetryer()
+        self.assertEqual(0.0, r.send_delay())
+        self.assertEqual(1, r.acquire_retry(gen_status_code_error(503)))
+        self.assertIsNone(r.record_attempt(0, None))
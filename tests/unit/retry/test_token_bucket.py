@@ -0,0 +1,115 @@
+# pylint: skip-file
+import threading
+import unittest
+from alibabacloud_oss_v2.retry import token_bucket
+from alibabacloud_oss_v2.defaults import DEFAULT_RETRY_QUOTA_CAPACITY
+
+
+class _Clock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestRetryQuota(unittest.TestCase):
+
+    def test_default(self):
+        q = token_bucket.RetryQuota()
+        self.assertEqual(DEFAULT_RETRY_QUOTA_CAPACITY, q.available)
+
+    def test_acquire_release(self):
+        q = token_bucket.RetryQuota(capacity=20, retry_cost=5, timeout_cost=10, no_retry_increment=1)
+        self.assertEqual(5, q.acquire())
+        self.assertEqual(10, q.acquire(timeout=True))
+        self.assertEqual(5, q.available)
+        self.assertEqual(0, q.acquire(timeout=True))
+        self.assertEqual(5, q.acquire())
+        self.assertEqual(0, q.acquire())
+        self.assertEqual(0, q.available)
+
+        q.release()
+        self.assertEqual(1, q.available)
+        q.release(5)
+        self.assertEqual(6, q.available)
+        # the tokens taken for a timeout retry are put back as they are
+        q.release(10)
+        self.assertEqual(16, q.available)
+        for _ in range(10):
+            q.release(5)
+        self.assertEqual(20, q.available)
+
+    def test_concurrent(self):
+        q = token_bucket.RetryQuota(capacity=500, retry_cost=5)
+        acquired = []
+
+        def run():
+            for _ in range(100):
+                if q.acquire():
+                    acquired.append(1)
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(100, len(acquired))
+        self.assertEqual(0, q.available)
+
+
+class TestClientRateLimiter(unittest.TestCase):
+
+    def test_disabled(self):
+        clock = _Clock()
+        r = token_bucket.ClientRateLimiter(clock=clock)
+        self.assertFalse(r.enabled)
+        for _ in range(100):
+            self.assertEqual(0.0, r.acquire())
+            r.update(False)
+        self.assertFalse(r.enabled)
+
+    def test_throttle_and_recover(self):
+        clock = _Clock()
+        r = token_bucket.ClientRateLimiter(clock=clock, beta=0.7, scale_constant=0.4, min_fill_rate=0.5)
+
+        # 20 requests per second
+        for _ in range(40):
+            clock.now += 0.05
+            r.update(False)
+        self.assertAlmostEqual(20.0, r.measured_rate, delta=2.0)
+
+        clock.now += 0.05
+        r.update(True)
+        self.assertTrue(r.enabled)
+        throttled_rate = r.fill_rate
+        self.assertLess(throttled_rate, r.measured_rate)
+        self.assertGreaterEqual(throttled_rate, 0.5)
+
+        # the capacity is used up, the requests are delayed
+        delays = [r.acquire() for _ in range(5)]
+        self.assertEqual(sorted(delays), delays)
+        self.assertGreater(delays[-1], 0.0)
+
+        # the rate grows back gradually
+        rates = []
+        for _ in range(20):
+            for _ in range(10):
+                clock.now += 0.05
+                r.update(False)
+            rates.append(r.fill_rate)
+        self.assertGreater(rates[-1], throttled_rate)
+        self.assertEqual(sorted(rates), rates)
+
+        # and backs off again on throttling
+        before = r.fill_rate
+        clock.now += 0.5
+        r.update(True)
+        self.assertLess(r.fill_rate, before)
+
+    def test_min_fill_rate(self):
+        clock = _Clock()
+        r = token_bucket.ClientRateLimiter(clock=clock, min_fill_rate=2.0)
+        for _ in range(10):
+            r.update(True)
+        self.assertEqual(2.0, r.fill_rate)
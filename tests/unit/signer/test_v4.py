@@ -3,6 +3,7 @@ import unittest
 import datetime
 from urllib.parse import urlencode, quote, urlsplit
 from alibabacloud_oss_v2.signer import SignerV4
+from alibabacloud_oss_v2.signer.v4 import SigningKeyCache, signing_key_cache, _derive_signing_key
 from alibabacloud_oss_v2.credentials import StaticCredentialsProvider
 from alibabacloud_oss_v2.types import HttpRequest, SigningContext
 
@@ -715,6 +716,113 @@ class TestSignerV4(unittest.TestCase):
         self.assertEqual('abc%3Bzabc', queries.get('x-oss-additional-headers', ''))
 
 
+
+class TestSignerV4EncodedQuery(unittest.TestCase):
+    def _context(self, url, encoded_query=None):
+        cred = StaticCredentialsProvider('ak', 'sk').get_credentials()
+        context = SigningContext(
+            bucket='bucket',
+            key='1234+-/123/1.txt',
+            request=HttpRequest('PUT', url),
+            credentials=cred,
+            product='oss',
+            region='cn-hangzhou',
+            signing_time=datetime.datetime.fromtimestamp(1702743657),
+        )
+        context.request.headers.update({'content-type': 'text/plain'})
+        if encoded_query is not None:
+            context.encoded_url = url
+            context.encoded_query = encoded_query
+        return context
+
+    def test_encoded_query(self) -> None:
+        from alibabacloud_oss_v2._client import _encode_query
+        parameters = {
+            'param1': 'value1',
+            '+param1': 'value3',
+            '|param1': 'value4',
+            '+param2': '',
+            'param2': '',
+            'list-type': '2',
+            'prefix': 'a b/c',
+        }
+        encoded_query = _encode_query(parameters)
+        query = urlencode(parameters, quote_via=quote)
+        self.assertEqual(query, '&'.join(f'{k}={v}' for k, v in encoded_query))
+
+        url = 'http://bucket.oss-cn-hangzhou.aliyuncs.com/1234%2B-/123/1.txt?' + query
+        signer = SignerV4()
+        parsed = self._context(url)
+        signer.sign(parsed)
+        fast = self._context(url, encoded_query)
+        signer.sign(fast)
+        self.assertEqual(parsed.string_to_sign, fast.string_to_sign)
+        self.assertEqual(parsed.request.headers['Authorization'], fast.request.headers['Authorization'])
+
+        # the url is changed, the encoded query is ignored
+        fast = self._context(url, [('param1', 'value1')])
+        fast.request.url = url + '&param3=v'
+        parsed = self._context(url + '&param3=v')
+        signer.sign(fast)
+        signer.sign(parsed)
+        self.assertEqual(parsed.string_to_sign, fast.string_to_sign)
+
+
+class TestSigningKeyCache(unittest.TestCase):
+    def test_get_signing_key(self) -> None:
+        cache = SigningKeyCache(capacity=2)
+        key = cache.get_signing_key('ak', 'sk', '20231216', 'cn-hangzhou', 'oss')
+        self.assertEqual(_derive_signing_key('sk', '20231216', 'cn-hangzhou', 'oss'), key)
+        self.assertIs(key, cache.get_signing_key('ak', 'sk', '20231216', 'cn-hangzhou', 'oss'))
+        self.assertEqual(1, len(cache))
+
+        # lru eviction
+        cache.get_signing_key('ak', 'sk', '20231217', 'cn-hangzhou', 'oss')
+        cache.get_signing_key('ak', 'sk', '20231216', 'cn-hangzhou', 'oss')
+        cache.get_signing_key('ak', 'sk', '20231216', 'cn-shanghai', 'oss')
+        self.assertEqual(2, len(cache))
+        self.assertIn(('20231216', 'cn-hangzhou'), [(k[2], k[3]) for k in cache._keys])
+        self.assertIn(('20231216', 'cn-shanghai'), [(k[2], k[3]) for k in cache._keys])
+
+        cache.clear()
+        self.assertEqual(0, len(cache))
+
+    def test_credentials_rotation(self) -> None:
+        cache = SigningKeyCache()
+        cache.get_signing_key('ak', 'sk', '20231216', 'cn-hangzhou', 'oss')
+        cache.get_signing_key('ak', 'sk', '20231216', 'cn-shanghai', 'oss')
+        cache.get_signing_key('ak2', 'sk', '20231216', 'cn-hangzhou', 'oss')
+        self.assertEqual(3, len(cache))
+
+        key = cache.get_signing_key('ak', 'sk-new', '20231216', 'cn-hangzhou', 'oss')
+        self.assertEqual(_derive_signing_key('sk-new', '20231216', 'cn-hangzhou', 'oss'), key)
+        self.assertEqual(2, len(cache))
+
+    def test_disabled(self) -> None:
+        cache = SigningKeyCache(capacity=0)
+        key = cache.get_signing_key('ak', 'sk', '20231216', 'cn-hangzhou', 'oss')
+        self.assertEqual(_derive_signing_key('sk', '20231216', 'cn-hangzhou', 'oss'), key)
+        self.assertEqual(0, len(cache))
+
+    def test_signer_uses_cache(self) -> None:
+        signing_key_cache.clear()
+        signer = SignerV4()
+        for secret in ['sk', 'sk', 'sk2']:
+            cred = StaticCredentialsProvider('ak-cache', secret).get_credentials()
+            request = HttpRequest("GET", "http://bucket.oss-cn-hangzhou.aliyuncs.com/key")
+            context = SigningContext(
+                bucket='bucket',
+                key='key',
+                request=request,
+                credentials=cred,
+                product='oss',
+                region='cn-hangzhou',
+                signing_time=datetime.datetime.fromtimestamp(1702743657),
+            )
+            signer.sign(context)
+        # the entry of the rotated secret is dropped
+        self.assertEqual(1, len(signing_key_cache))
+
 def _get_url_query(url: str):
     encoded_pairs = {}
     parts = urlsplit(url)
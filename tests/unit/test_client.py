@@ -765,6 +765,63 @@ class TestSyncClient(unittest.TestCase):
             self.assertEqual(4, len(self.save_op_context))
             self.assertEqual(4, len(self.save_options))
 
+    def test_invoke_operation_adaptive_retry(self):
+        quota = retry.RetryQuota(capacity=10, retry_cost=5)
+        retryer = retry.AdaptiveRetryer(max_attempts=3, base_delay=0.001, max_backoff=0.001, retry_quota=quota,
+                                        rate_limiter=retry.ClientRateLimiter(min_fill_rate=1000))
+        cfg = config.Config(
+            region='cn-hangzhou',
+            credentials_provider=credentials.AnonymousCredentialsProvider(),
+            retryer=retryer,
+        )
+        clinet = client.Client(cfg)
+
+        self.save_status_codes = [503, 200]
+        def _sent_http_request_once(context: SigningContext, options: Any) -> HttpResponse:
+            status_code = self.save_status_codes.pop(0)
+            if status_code != 200:
+                raise exceptions.ServiceError(
+                    status_code=status_code,
+                    code='SlowDown',
+                    request_id='id-1234',
+                    message='Please reduce your request rate.',
+                    ec='',
+                    timestamp='',
+                    request_target=''
+                )
+            return MockHttpResponse(
+                status_code=200,
+                reason='OK',
+                headers={'x-oss-request-id': 'id-1234'},
+                body=''
+            )
+
+        # throttled, retried and succeeds
+        with mock.patch.object(clinet._client, '_sent_http_request_once', new= _sent_http_request_once) as _:
+            clinet.invoke_operation(
+                OperationInput(
+                    op_name='InvokeOperation',
+                    method='GET',
+                    bucket='bucket',
+            ))
+        self.assertEqual(0, len(self.save_status_codes))
+        self.assertTrue(retryer.rate_limiter.enabled)
+        self.assertEqual(10, quota.available)
+
+        # the retry quota is exhausted, the error is not retried any more
+        self.save_status_codes = [503, 503, 503, 503, 503, 503]
+        with mock.patch.object(clinet._client, '_sent_http_request_once', new= _sent_http_request_once) as _:
+            for _ in range(2):
+                with self.assertRaises(exceptions.OperationError):
+                    clinet.invoke_operation(
+                        OperationInput(
+                            op_name='InvokeOperation',
+                            method='GET',
+                            bucket='bucket',
+                    ))
+        self.assertEqual(0, quota.available)
+        self.assertEqual(2, len(self.save_status_codes))
+
     def test_invoke_operation_retryable_body(self):
         self.save_op_context: List[SigningContext] = None
         self.save_options: List[Any] = None
@@ -2090,6 +2147,81 @@ class TestClientReturnsJsonV2(unittest.TestCase):
 
 
 class TestClientExtension(TestClientBase):
+    def test_list_objects_v2_columnar(self):
+        pages = {
+            'token-1': ('<IsTruncated>true</IsTruncated><NextContinuationToken>token-2</NextContinuationToken>'
+                        '<Contents><Key>key-1</Key><Size>1</Size></Contents><Contents><Key>key-2</Key><Size>2</Size></Contents>'),
+            'token-2': ('<IsTruncated>false</IsTruncated>'
+                        '<Contents><Key>key-3</Key><Size>3</Size></Contents>'),
+        }
+
+        def response_200() -> MockHttpResponse:
+            token = 'token-2' if 'continuation-token=token-2' in self.request_dump.url else 'token-1'
+            return MockHttpResponse(
+                status_code=200,
+                reason='OK',
+                headers={'x-oss-request-id': 'id-1234'},
+                body=f'<ListBucketResult><Name>bucket</Name>{pages[token]}</ListBucketResult>'
+            )
+
+        self.set_responseFunc(response_200)
+        batches = list(self.client.list_objects_v2_columnar(models.ListObjectsV2Request(bucket='bucket', max_keys=2)))
+        self.assertEqual(2, len(batches))
+        self.assertEqual(['key-1', 'key-2'], batches[0].keys)
+        self.assertEqual([3], batches[1].sizes.tolist())
+        self.assertEqual('token-2', batches[0].result.next_continuation_token)
+        self.assertIn('continuation-token=token-2', self.request_dump.url)
+        self.assertIn('max-keys=2', self.request_dump.url)
+
+    def test_list_objects_v2_paginator_iter_objects(self):
+        pages = {
+            'token-1': ('<IsTruncated>true</IsTruncated><NextContinuationToken>token-2</NextContinuationToken>'
+                        '<Contents><Key>key-1</Key></Contents><Contents><Key>key-2</Key></Contents>'),
+            'token-2': ('<IsTruncated>false</IsTruncated>'
+                        '<Contents><Key>key-3</Key></Contents>'),
+        }
+        responses = []
+
+        def response_200() -> MockHttpResponse:
+            token = 'token-2' if 'continuation-token=token-2' in self.request_dump.url else 'token-1'
+            response = MockHttpResponse(
+                status_code=200,
+                reason='OK',
+                headers={'x-oss-request-id': 'id-1234'},
+                body=f'<ListBucketResult><Name>bucket</Name>{pages[token]}</ListBucketResult>'
+            )
+            responses.append(response)
+            return response
+
+        self.set_responseFunc(response_200)
+        paginator = self.client.list_objects_v2_paginator(limit=2)
+        keys = [obj.key for obj in paginator.iter_objects(models.ListObjectsV2Request(bucket='bucket'))]
+        self.assertEqual(['key-1', 'key-2', 'key-3'], keys)
+        self.assertEqual(2, len(responses))
+        self.assertTrue(all(r.is_closed for r in responses))
+        self.assertIn('max-keys=2', self.request_dump.url)
+
+        # compact records, the models are not created
+        responses.clear()
+        with mock.patch.object(models.ObjectProperties, '__init__', side_effect=AssertionError('model created')):
+            objs = list(paginator.iter_objects(models.ListObjectsV2Request(bucket='bucket'), compact=True))
+            results = list(self.client.list_objects_v2_paginator(compact=True).iter_page(models.ListObjectsV2Request(bucket='bucket')))
+        self.assertEqual(['key-1', 'key-2', 'key-3'], [obj.key for obj in objs])
+        self.assertTrue(all(isinstance(obj, models.ObjectRecord) for obj in objs))
+        self.assertTrue(all(r.is_closed for r in responses))
+
+        self.assertEqual(2, len(results))
+        self.assertIsInstance(results[0].contents[0], models.ObjectRecord)
+        self.assertEqual('key-1', results[0].contents[0].to_model().key)
+
+        # stop in the middle of a page
+        responses.clear()
+        objs = paginator.iter_objects(models.ListObjectsV2Request(bucket='bucket'))
+        self.assertEqual('key-1', next(objs).key)
+        objs.close()
+        self.assertEqual(1, len(responses))
+        self.assertTrue(responses[0].is_closed)
+
     def test_get_object_to_file(self):
         def response_200() -> MockHttpResponse:
             return MockHttpResponse(
@@ -2138,6 +2270,29 @@ class TestClientExtension(TestClientBase):
         self.assertEqual('5981764153023615706', result.hash_crc64)
         self.assertEqual(11, progress_save_n)
 
+    def test_put_object_progress_flush_size(self):
+        bodies = []
+        self.set_requestFunc(lambda r: bodies.append(b''.join(r.body)))
+        self.set_responseFunc(lambda: MockHttpResponse(
+            status_code=200, reason='OK', headers={'x-oss-request-id': 'id-1234'}, body=b''))
+
+        events = []
+        request = models.PutObjectRequest(
+            bucket='bucket',
+            key='key',
+            body=b'x' * (600 * 1024),
+            progress_fn=lambda *args: events.append(args),
+        )
+        self.client.put_object(request)
+        self.assertEqual(600 * 1024, len(bodies[0]))
+        self.assertEqual([256 * 1024, 512 * 1024, 600 * 1024], [e[1] for e in events])
+
+        # every block is reported
+        events.clear()
+        self.client.put_object(request, progress_flush_size=0)
+        self.assertEqual(len(bodies[1]) // (32 * 1024) + 1, len(events))
+        self.assertEqual(600 * 1024, sum(e[0] for e in events))
+
     def test_get_object_to_file_crc_fail(self):
         def response_200() -> MockHttpResponse:
             return MockHttpResponse(
@@ -2166,6 +2321,75 @@ class TestClientExtension(TestClientBase):
         except exceptions.InconsistentError as err:
             self.assertIn('crc is inconsistent, client 5981764153023615706, server 5981764153023615707', str(err))
 
+    def test_get_object_to_file_resume(self):
+        class _BrokenHttpResponse(MockHttpResponse):
+            def iter_bytes(self, **kwargs):
+                yield self._body[:6]
+                raise IOError('connection reset')
+
+        headers = {
+            'Server': 'AliyunOSS',
+            'Date': 'Tue, 03 Sep 2024 06:33:10 GMT',
+            'ETag': '"D41D8CD98F00B204E9800998ECF8427E"',
+            'x-oss-request-id': 'id-1234',
+            'x-oss-hash-crc64ecma': '5981764153023615706',
+        }
+        requests = []
+        responses = [
+            _BrokenHttpResponse(status_code=200, reason='OK', body=b'hello world',
+                                headers=dict(headers, **{'Content-Length': '11'})),
+            MockHttpResponse(status_code=206, reason='Partial Content', body=b'world',
+                             headers=dict(headers, **{'Content-Length': '5', 'Content-Range': 'bytes 6-10/11'})),
+        ]
+        self.set_requestFunc(requests.append)
+        self.set_responseFunc(lambda: responses.pop(0))
+
+        global progress_save_n
+        progress_save_n = 0
+        request = models.GetObjectRequest(bucket='bucket', key='key', progress_fn=_progress_fn)
+        filepath = _get_tempfile()
+        result = self.client.get_object_to_file(request, filepath)
+        self.assertEqual(206, result.status_code)
+        self.assertEqual(11, progress_save_n)
+        with open(filepath, 'rb') as f:
+            self.assertEqual(b'hello world', f.read())
+
+        self.assertEqual(2, len(requests))
+        self.assertIsNone(requests[0].headers.get('Range'))
+        self.assertEqual('bytes=6-', requests[1].headers.get('Range'))
+        self.assertEqual('standard', requests[1].headers.get('x-oss-range-behavior'))
+        self.assertEqual('"D41D8CD98F00B204E9800998ECF8427E"', requests[1].headers.get('If-Match'))
+        self.assertIsNone(request.range_header)
+
+        # the range is ignored, the whole object is written again
+        responses = [
+            _BrokenHttpResponse(status_code=200, reason='OK', body=b'hello world',
+                                headers=dict(headers, **{'Content-Length': '11'})),
+            MockHttpResponse(status_code=200, reason='OK', body=b'hello world',
+                             headers=dict(headers, **{'Content-Length': '11'})),
+        ]
+        requests.clear()
+        filepath = _get_tempfile()
+        result = self.client.get_object_to_file(models.GetObjectRequest(bucket='bucket', key='key'), filepath)
+        self.assertEqual('5981764153023615706', result.hash_crc64)
+        with open(filepath, 'rb') as f:
+            self.assertEqual(b'hello world', f.read())
+        self.assertEqual(2, len(requests))
+
+        # the user range is resumed from its start
+        responses = [
+            _BrokenHttpResponse(status_code=206, reason='Partial Content', body=b'0123456789',
+                                headers={'ETag': '"etag"', 'Content-Length': '10', 'Content-Range': 'bytes 10-19/100'}),
+            MockHttpResponse(status_code=206, reason='Partial Content', body=b'6789',
+                             headers={'ETag': '"etag"', 'Content-Length': '4', 'Content-Range': 'bytes 16-19/100'}),
+        ]
+        requests.clear()
+        filepath = _get_tempfile()
+        self.client.get_object_to_file(models.GetObjectRequest(bucket='bucket', key='key', range_header='bytes=10-19'), filepath)
+        with open(filepath, 'rb') as f:
+            self.assertEqual(b'0123456789', f.read())
+        self.assertEqual('bytes=16-19', requests[1].headers.get('Range'))
+
 
 class TestClientCRC(unittest.TestCase):
 
@@ -0,0 +1,102 @@
+# pylint: skip-file
+import datetime
+import unittest
+from alibabacloud_oss_v2 import columnar
+from alibabacloud_oss_v2.models import ListObjectsV2Result
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+_PAGE = ('<?xml version="1.0" encoding="UTF-8"?>'
+         '<ListBucketResult>'
+         '<Name>bucket</Name><Prefix>dir%2F</Prefix><MaxKeys>3</MaxKeys>'
+         '<EncodingType>url</EncodingType><IsTruncated>true</IsTruncated>'
+         '<NextContinuationToken>token</NextContinuationToken>'
+         '<Contents><Key>dir%2Fkey%201</Key><LastModified>2024-01-02T03:04:05.678Z</LastModified>'
+         '<ETag>"etag-1"</ETag><Type>Normal</Type><Size>100</Size><StorageClass>Standard</StorageClass>'
+         '<Owner><ID>1</ID><DisplayName>1</DisplayName></Owner></Contents>'
+         '<Contents><Key>dir%2Fkey%202</Key><LastModified>2024-01-02T03:04:05Z</LastModified>'
+         '<ETag>"etag-2"</ETag><Size>0</Size><StorageClass>IA</StorageClass></Contents>'
+         '<Contents><Key>dir%2Fkey%203</Key></Contents>'
+         '<CommonPrefixes><Prefix>dir%2Fsub%2F</Prefix></CommonPrefixes>'
+         '<KeyCount>4</KeyCount>'
+         '</ListBucketResult>').encode()
+
+
+class TestObjectBatch(unittest.TestCase):
+    def _decode(self, size=16):
+        result = ListObjectsV2Result()
+        chunks = [_PAGE[i:i + size] for i in range(0, len(_PAGE), size)]
+        return columnar.decode_object_batch(chunks, result)
+
+    def test_decode_encoding_type_last(self):
+        page = ('<?xml version="1.0" encoding="UTF-8"?>'
+                '<ListBucketResult>'
+                '<Name>bucket</Name>'
+                '<Contents><Key>dir%2Fkey%201</Key><Size>1</Size></Contents>'
+                '<Contents><Key>dir%2Fkey%25202</Key><Size>2</Size></Contents>'
+                '<IsTruncated>false</IsTruncated>'
+                '<EncodingType>url</EncodingType>'
+                '</ListBucketResult>').encode()
+        batch = columnar.decode_object_batch([page[i:i + 16] for i in range(0, len(page), 16)], ListObjectsV2Result())
+        self.assertEqual('url', batch.result.encoding_type)
+        self.assertEqual(['dir/key 1', 'dir/key%202'], batch.keys)
+
+    def test_decode(self):
+        batch = self._decode()
+        self.assertEqual(3, batch.num_rows)
+        self.assertEqual(3, len(batch))
+        self.assertEqual(['dir/key 1', 'dir/key 2', 'dir/key 3'], batch.keys)
+        self.assertEqual([100, 0, -1], batch.sizes.tolist())
+        self.assertEqual([1704164645678, 1704164645000, -1], batch.last_modified.tolist())
+        self.assertEqual(['"etag-1"', '"etag-2"', None], batch.etags)
+        self.assertEqual(['Standard', 'IA', None], batch.storage_classes)
+
+        result = batch.result
+        self.assertIsNone(result.contents)
+        self.assertTrue(result.is_truncated)
+        self.assertEqual('token', result.next_continuation_token)
+        self.assertEqual(4, result.key_count)
+        self.assertEqual(1, len(result.common_prefixes))
+
+        self.assertEqual({
+            'key': ['dir/key 1', 'dir/key 2', 'dir/key 3'],
+            'size': [100, 0, -1],
+            'last_modified': [1704164645678, 1704164645000, -1],
+            'etag': ['"etag-1"', '"etag-2"', None],
+            'storage_class': ['Standard', 'IA', None],
+        }, batch.to_pydict())
+
+    def test_empty(self):
+        batch = columnar.ObjectBatch()
+        self.assertEqual(0, batch.num_rows)
+        self.assertIsNone(batch.result)
+        self.assertEqual([], batch.to_pydict()['key'])
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_to_numpy(self):
+        cols = self._decode().to_numpy()
+        self.assertEqual(numpy.int64, cols['size'].dtype)
+        self.assertEqual([100, 0, -1], cols['size'].tolist())
+        self.assertEqual(numpy.datetime64('2024-01-02T03:04:05.678'), cols['last_modified'][0])
+        self.assertEqual('dir/key 2', cols['key'][1])
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_to_arrow(self):
+        batch = self._decode().to_arrow()
+        self.assertEqual(3, batch.num_rows)
+        self.assertEqual(['key', 'size', 'last_modified', 'etag', 'storage_class'], batch.schema.names)
+        self.assertEqual(pyarrow.int64(), batch.schema.field('size').type)
+        self.assertEqual(pyarrow.timestamp('ms', tz='UTC'), batch.schema.field('last_modified').type)
+        data = batch.to_pydict()
+        self.assertEqual([100, 0, -1], data['size'])
+        self.assertEqual(datetime.datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=datetime.timezone.utc),
+                         data['last_modified'][0])
+        self.assertEqual([None], data['etag'][2:])
@@ -1,4 +1,5 @@
 # pylint: skip-file
+import os
 import unittest
 from alibabacloud_oss_v2 import crc
 
@@ -26,5 +27,64 @@ class TestCrc(unittest.TestCase):
 
         self.assertEqual(crc_combine, crc_raw)
 
- 
+    def test_crc64_engines(self):
+        engines = [crc._crc64_update_table]
+        if crc._crc64_update_crcmod is not None:
+            engines.append(crc._crc64_update_crcmod)
+        numpy_engine = crc._make_numpy_engine()
+        if numpy_engine is not None:
+            engines.append(numpy_engine)
 
+        for update in engines:
+            self.assertEqual(11051210869376104954, update(0, b'123456789'))
+            self.assertEqual(0, update(0, b''))
+
+        lane_data = crc._NUMPY_LANE_SIZE * crc._NUMPY_MIN_LANES
+        for size in [1, 7, 8, 1000, lane_data - 1, lane_data, lane_data * 3 + 5]:
+            data = os.urandom(size)
+            expect = crc._crc64_update_table(0, data)
+            for update in engines:
+                self.assertEqual(expect, update(0, data))
+                # continue from a previous value
+                value = update(update(0, data[:size // 2]), data[size // 2:])
+                self.assertEqual(expect, value)
+
+    def test_crc64_hash(self):
+        self.assertIn(crc.CRC64_ENGINE, ['crcmod', 'numpy', 'table'])
+
+        c = crc.Crc64(0)
+        c.update(b'12345')
+        c.write(memoryview(b'6789'))
+        self.assertEqual(11051210869376104954, c.sum64())
+        self.assertEqual(b'\x99\x5d\xc9\xbb\xdf\x19\x39\xfa', c.digest())
+        self.assertEqual('995DC9BBDF1939FA', c.hexdigest())
+
+        c.reset()
+        self.assertEqual(0, c.sum64())
+        c.update(b'123456789')
+        self.assertEqual(11051210869376104954, c.sum64())
+
+        c = crc.Crc64(11051210869376104954)
+        c.update(b'')
+        self.assertEqual(11051210869376104954, c.sum64())
+
+    def test_crc64_combine_parts(self):
+        data = os.urandom(100 * 1024 + 3)
+        for part_size in [1, 100, 1024, 7 * 1024, 64 * 1024]:
+            ccrc = 0
+            for i in range(0, len(data), part_size):
+                part = data[i:i + part_size]
+                c = crc.Crc64(0)
+                c.update(part)
+                ccrc = crc.Crc64.combine(ccrc, c.sum64(), len(part))
+
+            c = crc.Crc64(0)
+            c.update(data)
+            self.assertEqual(c.sum64(), ccrc)
+
+        self.assertEqual(123, crc.Crc64.combine(123, 456, 0))
+
+        # the operators are computed once and shared
+        ops = crc._gf2_zeros_operators(crc._CRC64_POLY_REV, True, 20)
+        self.assertGreaterEqual(len(ops), 20)
+        self.assertIs(ops, crc._gf2_zeros_operators(crc._CRC64_POLY_REV, True, 10))
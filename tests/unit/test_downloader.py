@@ -3,10 +3,13 @@
 import io
 import os
 import tempfile
+import threading
 import unittest
 
-from alibabacloud_oss_v2 import models, defaults
+from alibabacloud_oss_v2 import models, defaults, config, credentials, client, retry
 from alibabacloud_oss_v2.downloader import Downloader, DownloadAPIClient, DownloadError
+from alibabacloud_oss_v2.types import HttpClient
+from . import MockHttpResponse
 
 
 def _make_result(cls, **kwargs):
@@ -182,3 +185,186 @@ class TestDownloaderNoProgressRetry(unittest.TestCase):
         self.assertGreater(len(progress_data), 0)
         # Last entry should have written == total
         self.assertEqual(progress_data[-1][1], len(data))
+
+    def test_progress_coalesced_per_task(self):
+        """The download tasks report the progress every DEFAULT_PROGRESS_FLUSH_SIZE bytes."""
+        part_size = defaults.DEFAULT_PROGRESS_FLUSH_SIZE * 2 + 100
+        data = b'\xab' * (part_size * 3)
+        client = _MockDownloadClient(data)
+        downloader = Downloader(client, part_size=part_size, parallel_num=3, block_size=16 * 1024)
+
+        progress_data = []
+
+        def _progress(increment, written, total):
+            progress_data.append((increment, written, total))
+
+        buf = io.BytesIO()
+        request = models.GetObjectRequest(bucket='test-bucket', key='test-key', progress_fn=_progress)
+        result = downloader.download_to(request, buf)
+
+        self.assertEqual(len(data), result.written)
+        self.assertEqual(data, buf.getvalue())
+        # 2 full flushes and the tail of each part
+        self.assertEqual(9, len(progress_data))
+        self.assertEqual(len(data), sum(p[0] for p in progress_data))
+        self.assertEqual(len(data), progress_data[-1][1])
+
+    def test_progress_flush_size(self):
+        data = b'\xab' * (64 * 1024)
+        client = _MockDownloadClient(data)
+        downloader = Downloader(client, part_size=len(data), parallel_num=1, block_size=16 * 1024)
+        self.assertIsNone(downloader._options.progress_flush_size)
+
+        progress_data = []
+
+        def _progress(increment, written, total):
+            progress_data.append((increment, written, total))
+
+        # every block is reported
+        request = models.GetObjectRequest(bucket='test-bucket', key='test-key', progress_fn=_progress)
+        downloader.download_to(request, io.BytesIO(), progress_flush_size=0)
+        self.assertEqual([16 * 1024] * 4, [p[0] for p in progress_data])
+
+        progress_data.clear()
+        downloader = Downloader(client, part_size=len(data), parallel_num=1, block_size=16 * 1024,
+                                progress_flush_size=32 * 1024)
+        downloader.download_to(request, io.BytesIO())
+        self.assertEqual([32 * 1024, 64 * 1024], [p[1] for p in progress_data])
+
+
+@unittest.skipUnless(hasattr(os, 'pwrite'), 'os.pwrite is not supported')
+class TestDownloaderPwrite(unittest.TestCase):
+    """Tests the positional write mode of download_file."""
+
+    def test_download_file_with_pwrite(self):
+        part_size = 1024
+        data = os.urandom(part_size * 9 + 100)
+        client = _MockDownloadClient(data)
+        downloader = Downloader(client, part_size=part_size, parallel_num=4, use_pwrite=True)
+
+        filepath = os.path.join(tempfile.gettempdir(), 'test_dl_pwrite.bin')
+        request = models.GetObjectRequest(bucket='test-bucket', key='test-key')
+        try:
+            delegate = downloader._delegate(request)
+            self.assertTrue(delegate._options.use_pwrite)
+            result = downloader.download_file(request, filepath)
+            self.assertEqual(len(data), result.written)
+            with open(filepath, 'rb') as f:
+                self.assertEqual(data, f.read())
+        finally:
+            if os.path.exists(filepath):
+                os.remove(filepath)
+
+    def test_apply_pwrite_preallocates_file(self):
+        data = b'\x01' * 4096
+        client = _MockDownloadClient(data)
+        downloader = Downloader(client, part_size=1024, parallel_num=2, use_pwrite=True)
+
+        filepath = os.path.join(tempfile.gettempdir(), 'test_dl_prealloc.bin')
+        request = models.GetObjectRequest(bucket='test-bucket', key='test-key')
+        try:
+            delegate = downloader._delegate(request)
+            delegate.check_source()
+            delegate.check_destination(filepath)
+            delegate.adjust_range()
+            with open(filepath, 'wb+') as writer:
+                delegate.adjust_writer(writer)
+                delegate.apply_pwrite(writer)
+                self.assertIsNotNone(delegate._writer_fd)
+                self.assertIsNone(delegate._writer_lock)
+                self.assertEqual(len(data), os.fstat(writer.fileno()).st_size)
+        finally:
+            if os.path.exists(filepath):
+                os.remove(filepath)
+
+
+class _ThrottlingHttpClient(HttpClient):
+    """Serves the ranges of an object, the first attempt of the first parts is throttled with 503 SlowDown."""
+
+    def __init__(self, data, part_size, throttled_parts):
+        super().__init__()
+        self._data = data
+        self._part_size = part_size
+        self._throttled_parts = throttled_parts
+        self._lock = threading.Lock()
+        self._seen = set()
+        self.throttled = 0
+
+    def send(self, request, **kwargs):
+        headers = {
+            'x-oss-request-id': 'id-1234',
+            'Date': 'Fri, 24 Feb 2017 03:15:40 GMT',
+            'ETag': '"etag"',
+            'Last-Modified': 'Fri, 24 Feb 2017 03:15:40 GMT',
+        }
+        if request.method == 'HEAD':
+            headers['Content-Length'] = str(len(self._data))
+            response = MockHttpResponse(status_code=200, reason='OK', headers=headers, body=b'')
+            response._request = request
+            return response
+
+        start, end = request.headers['Range'][len('bytes='):].split('-')
+        start, end = int(start), int(end)
+        with self._lock:
+            throttle = start < self._part_size * self._throttled_parts and start not in self._seen
+            self._seen.add(start)
+            if throttle:
+                self.throttled += 1
+        if throttle:
+            headers['Content-Type'] = 'application/xml'
+            body = b'<Error><Code>SlowDown</Code><Message>Please reduce your request rate.</Message></Error>'
+            response = MockHttpResponse(status_code=503, reason='Service Unavailable', headers=headers, body=body)
+        else:
+            body = self._data[start:end + 1]
+            headers['Content-Length'] = str(len(body))
+            headers['Content-Range'] = f'bytes {start}-{end}/{len(self._data)}'
+            response = MockHttpResponse(status_code=206, reason='Partial Content', headers=headers, body=body)
+        response._request = request
+        return response
+
+    def open(self):
+        return
+
+    def close(self):
+        return
+
+
+class TestDownloaderAutoTune(unittest.TestCase):
+    """Tests the download with auto tuning."""
+
+    def test_download_with_auto_tune(self):
+        part_size = 1024
+        data = os.urandom(part_size * 40 + 7)
+        client = _MockDownloadClient(data)
+        downloader = Downloader(client, part_size=part_size, parallel_num=2, auto_tune=True)
+
+        buf = io.BytesIO()
+        request = models.GetObjectRequest(bucket='test-bucket', key='test-key')
+        result = downloader.download_to(request, buf)
+
+        self.assertEqual(len(data), result.written)
+        self.assertEqual(data, buf.getvalue())
+        self.assertGreater(len(result.tune_decisions), 0)
+        self.assertLess(client.get_calls, 41)
+
+    def test_download_throttled_attempts(self):
+        # the first attempt of the first parts is throttled, the retries succeed
+        part_size = 1024
+        data = os.urandom(part_size * 16)
+        http_client = _ThrottlingHttpClient(data, part_size, throttled_parts=4)
+        cfg = config.load_default()
+        cfg.region = 'cn-hangzhou'
+        cfg.credentials_provider = credentials.AnonymousCredentialsProvider()
+        cfg.http_client = http_client
+        cfg.retryer = retry.StandardRetryer(backoff_delayer=retry.FixedDelayBackoff(0.001))
+        c = client.Client(cfg)
+
+        downloader = Downloader(c, part_size=part_size, parallel_num=4, auto_tune=True)
+        buf = io.BytesIO()
+        request = models.GetObjectRequest(bucket='test-bucket', key='test-key')
+        result = downloader.download_to(request, buf)
+
+        self.assertEqual(data, buf.getvalue())
+        self.assertEqual(4, http_client.throttled)
+        self.assertEqual('throttled', result.tune_decisions[0].reason.split(', ')[0])
+        self.assertEqual(2, result.tune_decisions[0].parallel_num)
@@ -1,5 +1,7 @@
 # pylint: skip-file
 """Unit tests for alibabacloud_oss_v2.filelike (AppendOnlyFile, ReadOnlyFile)."""
+import threading
+import time
 import unittest
 
 from alibabacloud_oss_v2 import models, exceptions
@@ -34,6 +36,11 @@ class _MockAppendClient(AppendFileAPIClient):
 
         self.head_calls = 0
         self.append_calls = 0
+        self.bodies = []
+        self.positions = []
+        self.threads = set()
+        self.append_delay = 0
+        self.fail_next = False
 
     def head_object(self, request, **kwargs):
         self.head_calls += 1
@@ -59,7 +66,15 @@ class _MockAppendClient(AppendFileAPIClient):
 
     def append_object(self, request, **kwargs):
         self.append_calls += 1
+        self.threads.add(threading.current_thread().name)
+        if self.append_delay:
+            time.sleep(self.append_delay)
+        if self.fail_next:
+            self.fail_next = False
+            raise exceptions.OperationError(name='AppendObject', error=ValueError('connection reset'))
         body = request.body
+        self.bodies.append(body)
+        self.positions.append(request.position)
         size = len(body) if isinstance(body, bytes) else 0
         self._current_size += size
         return _make_result(
@@ -223,6 +238,132 @@ class TestAppendOnlyFileExisting(unittest.TestCase):
         self.assertTrue(f.closed)
 
 
+class TestAppendOnlyFileBuffered(unittest.TestCase):
+    """Tests AppendOnlyFile with the write-behind buffer."""
+
+    def test_size_threshold(self):
+        client = _MockAppendClient(object_exists=True, object_size=10)
+        f = AppendOnlyFile(client, bucket='b', key='k', enable_buffering=True, buffer_size=10, flush_interval=None)
+
+        self.assertEqual(4, f.write(b'line'))
+        self.assertEqual(4, f.write(b'line'))
+        self.assertEqual(0, client.append_calls)
+        self.assertEqual(18, f.tell())
+
+        f.write(b'line')
+        self.assertEqual(1, client.append_calls)
+        self.assertEqual([b'lineline' b'line'], client.bodies)
+        self.assertEqual([10], client.positions)
+
+        f.write(b'tail')
+        f.flush()
+        self.assertEqual(2, client.append_calls)
+        self.assertEqual([10, 22], client.positions)
+        self.assertEqual(26, f.tell())
+
+        # nothing is buffered
+        f.flush()
+        f.close()
+        self.assertEqual(2, client.append_calls)
+
+    def test_time_threshold(self):
+        client = _MockAppendClient(object_exists=False)
+        f = AppendOnlyFile(client, bucket='b', key='k', enable_buffering=True, flush_interval=0.05)
+        f.write(b'a')
+        self.assertEqual(0, client.append_calls)
+        time.sleep(0.06)
+        f.write(b'b')
+        self.assertEqual([b'ab'], client.bodies)
+        f.close()
+
+    def test_close_flushes(self):
+        client = _MockAppendClient(object_exists=False)
+        with AppendOnlyFile(client, bucket='b', key='k', enable_buffering=True) as f:
+            for i in range(100):
+                f.write(b'record %d\n' % i)
+            self.assertEqual(0, client.append_calls)
+        self.assertEqual(1, client.append_calls)
+        self.assertEqual(b''.join(b'record %d\n' % i for i in range(100)), client.bodies[0])
+
+    def test_write_from_keeps_order(self):
+        client = _MockAppendClient(object_exists=False)
+        f = AppendOnlyFile(client, bucket='b', key='k', enable_buffering=True)
+        f.write(b'abc')
+        f.write_from(b'def')
+        self.assertEqual([b'abc', b'def'], client.bodies)
+        self.assertEqual([0, 3], client.positions)
+        f.close()
+
+    def test_error_keeps_data(self):
+        client = _MockAppendClient(object_exists=False)
+        f = AppendOnlyFile(client, bucket='b', key='k', enable_buffering=True)
+        f.write(b'abc')
+        client.fail_next = True
+        with self.assertRaises(PathError):
+            f.flush()
+        self.assertEqual(3, f.tell())
+        f.flush()
+        self.assertEqual([b'abc'], client.bodies)
+        f.close()
+
+    def test_async_flush(self):
+        client = _MockAppendClient(object_exists=False)
+        client.append_delay = 0.05
+        f = AppendOnlyFile(client, bucket='b', key='k', enable_async_flush=True, buffer_size=4, flush_interval=None)
+
+        stime = time.monotonic()
+        for i in range(10):
+            f.write(b'%d' % i)
+        # the writes do not wait for every append
+        self.assertLess(time.monotonic() - stime, 0.4)
+        self.assertEqual(10, f.tell())
+        f.flush()
+        self.assertEqual(10, f.tell())
+        self.assertEqual(b'0123456789', b''.join(client.bodies))
+        self.assertLess(client.append_calls, 10)
+        positions = [0]
+        for body in client.bodies[:-1]:
+            positions.append(positions[-1] + len(body))
+        self.assertEqual(positions, client.positions)
+        self.assertEqual({'oss-append-flusher'}, client.threads)
+
+        f.close()
+        self.assertTrue(f.closed)
+        self.assertIsNone(f._flusher)
+
+    def test_async_flush_interval(self):
+        client = _MockAppendClient(object_exists=False)
+        f = AppendOnlyFile(client, bucket='b', key='k', enable_async_flush=True, flush_interval=0.02)
+        f.write(b'abc')
+        for _ in range(50):
+            if client.append_calls > 0:
+                break
+            time.sleep(0.01)
+        self.assertEqual([b'abc'], client.bodies)
+        f.close()
+
+    def test_async_flush_error(self):
+        client = _MockAppendClient(object_exists=False)
+        client.fail_next = True
+        f = AppendOnlyFile(client, bucket='b', key='k', enable_async_flush=True, flush_interval=None)
+        f.write(b'abc')
+        with self.assertRaises(PathError):
+            f.flush()
+        self.assertEqual(3, f.tell())
+        f.write(b'def')
+        f.close()
+        self.assertEqual([b'abcdef'], client.bodies)
+
+        client = _MockAppendClient(object_exists=False)
+        client.fail_next = True
+        f = AppendOnlyFile(client, bucket='b', key='k', enable_async_flush=True, flush_interval=None)
+        f.write(b'abc')
+        with self.assertRaises(PathError):
+            f.close()
+        self.assertTrue(f.closed)
+        self.assertEqual(1, client.append_calls)
+
+
 # ==============================================================================
 # ReadOnlyFile tests
 # ==============================================================================
@@ -0,0 +1,241 @@
+# pylint: skip-file
+"""Unit tests for alibabacloud_oss_v2.hedge."""
+import threading
+import time
+import unittest
+
+from alibabacloud_oss_v2 import config, client, credentials, models, exceptions
+from alibabacloud_oss_v2.hedge import HedgePolicy
+from alibabacloud_oss_v2.types import HttpClient, OperationInput
+from . import MockHttpResponse
+
+
+class _SlowFirstHttpClient(HttpClient):
+    """The first request is slow, the others return at once."""
+
+    def __init__(self, slow=0.3, status_codes=None):
+        super().__init__()
+        self._slow = slow
+        self._status_codes = status_codes or []
+        self._lock = threading.Lock()
+        self.requests = []
+        self.responses = []
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            index = len(self.requests)
+            self.requests.append(request)
+        if index == 0:
+            time.sleep(self._slow)
+        status_code = self._status_codes[index] if index < len(self._status_codes) else 200
+        body = b'data'
+        if status_code != 200:
+            body = b'<?xml version="1.0" encoding="UTF-8"?><Error><Code>NoSuchKey</Code></Error>'
+        response = MockHttpResponse(
+            status_code=status_code,
+            reason='OK',
+            headers={'x-oss-request-id': f'id-{index}', 'Content-Length': str(len(body)),
+                     'Date': 'Fri, 24 Feb 2017 03:15:40 GMT'},
+            body=body,
+        )
+        response._request = request
+        with self._lock:
+            self.responses.append(response)
+        return response
+
+    def open(self):
+        return
+
+    def close(self):
+        return
+
+
+def _client(http_client, **kwargs):
+    cfg = config.load_default()
+    cfg.region = 'cn-hangzhou'
+    cfg.credentials_provider = credentials.StaticCredentialsProvider('ak', 'sk')
+    cfg.http_client = http_client
+    return client.Client(cfg, **kwargs)
+
+
+class TestHedgePolicy(unittest.TestCase):
+
+    def test_is_hedgeable(self):
+        policy = HedgePolicy()
+        self.assertTrue(policy.is_hedgeable(OperationInput(op_name='GetObject', method='GET')))
+        self.assertTrue(policy.is_hedgeable(OperationInput(op_name='HeadObject', method='HEAD')))
+        self.assertFalse(policy.is_hedgeable(OperationInput(op_name='PutObject', method='PUT')))
+        self.assertFalse(policy.is_hedgeable(OperationInput(op_name='GetObject', method='GET', body=b'123')))
+
+        policy = HedgePolicy(operations=['GetObject'])
+        self.assertTrue(policy.is_hedgeable(OperationInput(op_name='GetObject', method='GET')))
+        self.assertFalse(policy.is_hedgeable(OperationInput(op_name='HeadObject', method='HEAD')))
+
+    def test_hedge_delay(self):
+        policy = HedgePolicy(delay=0.2)
+        self.assertEqual(0.2, policy.hedge_delay())
+
+        policy = HedgePolicy(delay=0.2, percentile=90, min_delay=0.01, window=10)
+        self.assertEqual(0.2, policy.hedge_delay())
+        for i in range(10):
+            policy._record(0.001 * (i + 1) * 10)
+        self.assertAlmostEqual(0.1, policy.hedge_delay())
+        for i in range(10):
+            policy._record(0.001)
+        self.assertEqual(0.01, policy.hedge_delay())
+
+    def test_send_fast(self):
+        policy = HedgePolicy(delay=0.5)
+        calls = []
+        result = policy.send(lambda i: calls.append(i) or f'r{i}', lambda r: None)
+        self.assertEqual('r0', result)
+        self.assertEqual([0], calls)
+        self.assertEqual(1, policy.requests)
+        self.assertEqual(0, policy.hedges_issued)
+        policy.close()
+
+    def test_send_hedge_wins(self):
+        policy = HedgePolicy(delay=0.02)
+        closed = []
+        primary_done = threading.Event()
+
+        def attempt(i):
+            if i == 0:
+                time.sleep(0.2)
+                primary_done.set()
+            return f'r{i}'
+
+        result = policy.send(attempt, closed.append)
+        self.assertEqual('r1', result)
+        self.assertEqual(1, policy.hedges_issued)
+        self.assertEqual(1, policy.hedges_won)
+        primary_done.wait(1)
+        time.sleep(0.05)
+        self.assertEqual(['r0'], closed)
+        policy.close()
+
+    def test_send_errors(self):
+        policy = HedgePolicy(delay=0.01)
+
+        def attempt(i):
+            if i == 0:
+                time.sleep(0.1)
+                raise ValueError('primary')
+            raise KeyError('hedge')
+
+        with self.assertRaisesRegex(ValueError, 'primary'):
+            policy.send(attempt, lambda r: None)
+
+        # the primary fails, the hedge is used
+        def attempt(i):
+            if i == 0:
+                time.sleep(0.05)
+                raise ValueError('primary')
+            time.sleep(0.1)
+            return 'r1'
+
+        self.assertEqual('r1', policy.send(attempt, lambda r: None))
+        self.assertEqual(2, policy.hedges_issued)
+        self.assertEqual(1, policy.hedges_won)
+        policy.close()
+
+    def test_send_saturated(self):
+        # the requests faster than the delay are not hedged however many callers share the policy
+        policy = HedgePolicy(delay=0.1, max_workers=4)
+        threads = []
+        for _ in range(16):
+            t = threading.Thread(target=policy.send, args=(lambda i: time.sleep(0.04) or f'r{i}', lambda r: None))
+            threads.append(t)
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(16, policy.requests)
+        self.assertEqual(0, policy.hedges_issued)
+        policy.close()
+
+    def test_send_no_free_worker(self):
+        policy = HedgePolicy(delay=0.01, max_workers=1)
+        calls = []
+        lock = threading.Lock()
+        started = threading.Event()
+
+        def attempt(i):
+            with lock:
+                calls.append(i)
+            started.set()
+            time.sleep(0.1)
+            return f'r{i}'
+
+        t = threading.Thread(target=policy.send, args=(attempt, lambda r: None))
+        t.start()
+        started.wait(1)
+        # the only worker waits for the first request, the second one is sent without a hedge
+        self.assertEqual('r0', policy.send(lambda i: calls.append(i) or f'r{i}', lambda r: None))
+        t.join()
+        self.assertEqual(2, policy.requests)
+        self.assertEqual(1, policy.hedges_issued)
+        self.assertEqual([0, 0, 1], sorted(calls))
+        policy.close()
+
+    def test_send_max_hedge_percent(self):
+        policy = HedgePolicy(delay=0.01, max_hedge_percent=50)
+        for _ in range(4):
+            policy.send(lambda i: time.sleep(0.05) or f'r{i}', lambda r: None)
+        self.assertEqual(4, policy.requests)
+        self.assertEqual(2, policy.hedges_issued)
+        policy.close()
+
+
+class TestClientHedge(unittest.TestCase):
+
+    def test_get_object_hedged(self):
+        http_client = _SlowFirstHttpClient()
+        policy = HedgePolicy(delay=0.02)
+        c = _client(http_client, hedge_policy=policy)
+
+        result = c.get_object(models.GetObjectRequest(bucket='bucket', key='key'))
+        self.assertEqual('id-1', result.request_id)
+        self.assertEqual(b'data', result.body.content)
+        self.assertEqual(1, policy.hedges_won)
+        self.assertEqual(2, len(http_client.requests))
+        # the hedge is signed with its own request
+        self.assertIsNot(http_client.requests[0], http_client.requests[1])
+        self.assertIsNot(http_client.requests[0].headers, http_client.requests[1].headers)
+        self.assertIn('authorization', [k.lower() for k in http_client.requests[1].headers])
+
+        time.sleep(0.4)
+        self.assertTrue(http_client.responses[1].is_closed)
+        self.assertFalse(http_client.responses[0].is_closed)
+        policy.close()
+
+    def test_hedge_per_operation(self):
+        http_client = _SlowFirstHttpClient(slow=0.1)
+        policy = HedgePolicy(delay=0.02)
+        c = _client(http_client)
+
+        result = c.head_object(models.HeadObjectRequest(bucket='bucket', key='key'), hedge_policy=policy)
+        self.assertEqual('id-1', result.request_id)
+        self.assertEqual(1, policy.hedges_issued)
+        policy.close()
+
+    def test_not_hedged(self):
+        http_client = _SlowFirstHttpClient(slow=0.1)
+        policy = HedgePolicy(delay=0.01)
+        c = _client(http_client, hedge_policy=policy)
+
+        result = c.put_object(models.PutObjectRequest(bucket='bucket', key='key', body=b'hello'))
+        self.assertEqual('id-0', result.request_id)
+        self.assertEqual(0, policy.requests)
+        self.assertEqual(1, len(http_client.requests))
+
+    def test_service_error(self):
+        http_client = _SlowFirstHttpClient(slow=0.1, status_codes=[404, 404])
+        policy = HedgePolicy(delay=0.01)
+        c = _client(http_client, hedge_policy=policy)
+
+        with self.assertRaises(exceptions.OperationError) as ctx:
+            c.head_object(models.HeadObjectRequest(bucket='bucket', key='key'))
+        self.assertEqual(404, ctx.exception.unwrap().status_code)
+        self.assertEqual(1, policy.hedges_issued)
+        self.assertEqual(0, policy.hedges_won)
+        policy.close()
@@ -0,0 +1,138 @@
+# pylint: skip-file
+"""Unit tests for the lazy imports of alibabacloud_oss_v2."""
+import ast
+import os
+import subprocess
+import sys
+import unittest
+
+import alibabacloud_oss_v2 as oss
+from alibabacloud_oss_v2 import models, operations
+
+_PKG_DIR = os.path.dirname(oss.__file__)
+
+
+def _own_names(path):
+    """The public names defined at the top level of the module, i.e. exported by the star import."""
+    with open(path) as f:
+        tree = ast.parse(f.read())
+    names = []
+    for node in tree.body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            names.append(node.name)
+        elif isinstance(node, ast.Assign):
+            names.extend(t.id for t in node.targets if isinstance(t, ast.Name))
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            names.append(node.target.id)
+    return set(n for n in names if not n.startswith('_'))
+
+
+def _run(code):
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                          cwd=os.path.dirname(_PKG_DIR))
+
+
+class TestImportStructure(unittest.TestCase):
+
+    def test_models_structure(self):
+        files = sorted(f[:-3] for f in os.listdir(os.path.join(_PKG_DIR, 'models'))
+                       if f.endswith('.py') and not f.startswith('_'))
+        # structs is not exported by the package
+        self.assertEqual(sorted(set(files) - {'structs'}), sorted(models._import_structure))
+        for module, names in models._import_structure.items():
+            self.assertEqual(_own_names(os.path.join(_PKG_DIR, 'models', module + '.py')), set(names), module)
+
+    def test_operations_structure(self):
+        files = sorted(f[:-3] for f in os.listdir(os.path.join(_PKG_DIR, 'operations'))
+                       if f.endswith('.py') and not f.startswith('_'))
+        self.assertEqual(files, sorted(operations._import_structure))
+        for module, names in operations._import_structure.items():
+            own = _own_names(os.path.join(_PKG_DIR, 'operations', module + '.py'))
+            self.assertTrue(set(names) <= own, module)
+
+    def test_names(self):
+        self.assertIs(oss.PutObjectRequest, models.object_basic.PutObjectRequest)
+        self.assertIs(oss.models.PutObjectRequest, models.object_basic.PutObjectRequest)
+        # a later module takes precedence, as the star imports did
+        self.assertIs(oss.PublicAccessBlockConfiguration, models.public_access_block.PublicAccessBlockConfiguration)
+        self.assertIs(oss.Tagging, models.bucket_tags.Tagging)
+        self.assertIs(operations.put_object, operations.object_basic.put_object)
+        self.assertIs(oss.Client, oss.client.Client)
+        self.assertIs(oss.config.Config, oss.Config)
+        self.assertIn('GetObjectRequest', dir(oss))
+        self.assertIn('Downloader', dir(oss))
+        self.assertIn('put_object', dir(operations))
+
+        with self.assertRaises(AttributeError):
+            oss.NoSuchName
+        with self.assertRaises(AttributeError):
+            models.NoSuchName
+        self.assertFalse(hasattr(oss, 'no_such_module'))
+
+    def test_star_import(self):
+        proc = _run(
+            "from alibabacloud_oss_v2 import *\n"
+            "assert Client is not None and PutObjectRequest is not None and Downloader is not None\n"
+            "assert ListBucketsResult is not None and HttpRequest is not None\n"
+            "print('OK')\n")
+        self.assertEqual(0, proc.returncode, proc.stderr)
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_import_loads_few_modules(self):
+        # importing the package must not load the models, the operations, the client or crypto
+        proc = _run(
+            "import sys\n"
+            "import alibabacloud_oss_v2\n"
+            "print('\\n'.join(m for m in sys.modules if m.startswith('alibabacloud_oss_v2')))\n")
+        self.assertEqual(0, proc.returncode, proc.stderr)
+        loaded = set(proc.stdout.split())
+        self.assertEqual({
+            'alibabacloud_oss_v2',
+            'alibabacloud_oss_v2._lazy',
+            'alibabacloud_oss_v2._version',
+            'alibabacloud_oss_v2.exceptions',
+            'alibabacloud_oss_v2.models',
+            'alibabacloud_oss_v2.types',
+        }, loaded)
+
+    def test_client_loads_only_used_models(self):
+        proc = _run(
+            "import sys\n"
+            "import alibabacloud_oss_v2 as oss\n"
+            "oss.Client\n"
+            "oss.PutObjectRequest\n"
+            "print('\\n'.join(m for m in sys.modules if m.startswith('alibabacloud_oss_v2')))\n")
+        self.assertEqual(0, proc.returncode, proc.stderr)
+        loaded = set(proc.stdout.split())
+        self.assertIn('alibabacloud_oss_v2.client', loaded)
+        self.assertIn('alibabacloud_oss_v2.models.object_basic', loaded)
+        for module in ['models.bucket_cors', 'models.bucket_replication', 'models.bucket_meta_query',
+                       'operations.bucket_cors', 'crypto', 'encryption_client', 'tables', 'vectors']:
+            self.assertNotIn(f'alibabacloud_oss_v2.{module}', loaded)
+
+    def test_import_loads_no_heavy_modules(self):
+        # the transport, xml, json, crc and crypto dependencies are loaded on demand
+        proc = _run(
+            "import sys\n"
+            "import alibabacloud_oss_v2\n"
+            "print('\\n'.join(sys.modules))\n")
+        self.assertEqual(0, proc.returncode, proc.stderr)
+        loaded = set(proc.stdout.split())
+        for module in ['requests', 'urllib3', 'aiohttp', 'xml.etree.ElementTree', 'json',
+                       'crcmod', 'Crypto', 'concurrent.futures', 'http.client', 'ssl']:
+            self.assertNotIn(module, loaded)
+
+        proc = _run(
+            "import sys\n"
+            "import alibabacloud_oss_v2 as oss\n"
+            "assert oss.CaseInsensitiveDict is oss.types.CaseInsensitiveDict\n"
+            "assert 'requests' in sys.modules\n"
+            "print('OK')\n")
+        self.assertEqual(0, proc.returncode, proc.stderr)
+
+    def test_models_serde(self):
+        from alibabacloud_oss_v2 import serde
+        self.assertIs(serde, models.serde)
+        self.assertIn('serde', dir(models))
@@ -0,0 +1,179 @@
+# pylint: skip-file
+"""Unit tests for alibabacloud_oss_v2.lister."""
+import json
+import threading
+import time
+import unittest
+
+from alibabacloud_oss_v2 import models, exceptions
+from alibabacloud_oss_v2.lister import ShardedLister, ListShard
+from alibabacloud_oss_v2.paginator import ListObjectsV2APIClient
+
+
+class _MockListClient(ListObjectsV2APIClient):
+    """Lists the keys in memory like ListObjectsV2, the continuation token is the last listed key."""
+
+    def __init__(self, keys, delay=0.0, fail_prefix=None):
+        self._keys = sorted(keys)
+        self._delay = delay
+        self._fail_prefix = fail_prefix
+        self._lock = threading.Lock()
+        self.requests = []
+        self.running = 0
+        self.max_running = 0
+
+    def list_objects_v2(self, request, **kwargs):
+        with self._lock:
+            self.requests.append(request)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            if self._delay:
+                time.sleep(self._delay)
+            if self._fail_prefix is not None and request.prefix == self._fail_prefix:
+                raise exceptions.OperationError(name='mock', error=ValueError('mock list error'))
+            return self._list(request)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def _list(self, request):
+        prefix = request.prefix or ''
+        after = request.continuation_token or request.start_after or ''
+        max_keys = request.max_keys or 1000
+        contents = []
+        prefixes = []
+        last = None
+        truncated = False
+        for key in self._keys:
+            if not key.startswith(prefix) or key <= after:
+                continue
+            if request.delimiter:
+                pos = key.find(request.delimiter, len(prefix))
+                if pos >= 0:
+                    cp = key[:pos + 1]
+                    if cp <= after or (prefixes and prefixes[-1] == cp):
+                        continue
+                    if len(contents) + len(prefixes) >= max_keys:
+                        truncated = True
+                        break
+                    prefixes.append(cp)
+                    last = cp + '\U0010ffff'
+                    continue
+            if len(contents) + len(prefixes) >= max_keys:
+                truncated = True
+                break
+            contents.append(models.ObjectProperties(key=key, size=len(key)))
+            last = key
+
+        return models.ListObjectsV2Result(
+            prefix=request.prefix,
+            contents=contents,
+            common_prefixes=[models.CommonPrefix(prefix=p) for p in prefixes],
+            is_truncated=truncated,
+            next_continuation_token=last if truncated else None,
+        )
+
+
+def _keys():
+    keys = ['a.txt', 'm.txt', 'z.txt']
+    for d in ['dir1/', 'dir2/', 'n/']:
+        for i in range(7):
+            keys.append(f'{d}key-{i:02d}')
+    keys.append('dir2/sub/key')
+    return keys
+
+
+class TestShardedLister(unittest.TestCase):
+
+    def test_discover_shards(self):
+        client = _MockListClient(_keys())
+        lister = ShardedLister(client, limit=2)
+        shards = lister.discover_shards(models.ListObjectsV2Request(bucket='bucket'))
+        self.assertEqual('/', shards[0].delimiter)
+        self.assertEqual(['dir1/', 'dir2/', 'n/'], [s.prefix for s in shards[1:]])
+        self.assertTrue(all(r.delimiter == '/' for r in client.requests))
+        self.assertTrue(all(r.max_keys == 2 for r in client.requests))
+
+        shards = lister.discover_shards(models.ListObjectsV2Request(bucket='bucket', prefix='dir1/', start_after='dir1/a'),
+                                        split_keys=['dir1/key-04', 'dir1/key-02', 'dir1/0'])
+        self.assertEqual([('dir1/a', 'dir1/key-02'), ('dir1/key-02', 'dir1/key-04'), ('dir1/key-04', None)],
+                         [(s.start_after, s.end_key) for s in shards])
+        self.assertTrue(all(s.prefix == 'dir1/' for s in shards))
+
+    def test_discover_shards_truncated(self):
+        keys = [f'key-{i:04d}' for i in range(1000)] + _keys()
+        client = _MockListClient(keys, delay=0.001)
+        lister = ShardedLister(client, limit=10, parallel_num=3, max_discovery_pages=1)
+        shards = lister.discover_shards(models.ListObjectsV2Request(bucket='bucket'))
+        # only the first page is listed, the key space is split by the keys found in it
+        self.assertEqual(1, len(client.requests))
+        self.assertTrue(all(s.delimiter is None for s in shards))
+        self.assertEqual([None, 'dir1/', 'dir2/', 'key-0006'], [s.start_after for s in shards])
+        self.assertEqual(['dir1/', 'dir2/', 'key-0006', None], [s.end_key for s in shards])
+
+        result = [o.key for o in lister.iter_objects(models.ListObjectsV2Request(bucket='bucket'))]
+        self.assertEqual(sorted(keys), result)
+        self.assertTrue(all(s.done for s in lister.shards))
+
+    def test_iter_objects_ordered(self):
+        keys = _keys()
+        client = _MockListClient(keys, delay=0.001)
+        lister = ShardedLister(client, limit=2, parallel_num=3)
+        result = [o.key for o in lister.iter_objects(models.ListObjectsV2Request(bucket='bucket'))]
+        self.assertEqual(sorted(keys), result)
+        self.assertTrue(all(s.done for s in lister.shards))
+        self.assertTrue(all(s.continuation_token is None for s in lister.shards))
+        self.assertLessEqual(client.max_running, 3)
+
+    def test_iter_objects_unordered(self):
+        keys = _keys()
+        client = _MockListClient(keys, delay=0.001)
+        lister = ShardedLister(client, limit=3, parallel_num=4, ordered=False)
+        result = [o.key for o in lister.iter_objects(models.ListObjectsV2Request(bucket='bucket'))]
+        self.assertEqual(len(keys), len(result))
+        self.assertEqual(sorted(keys), sorted(result))
+
+    def test_iter_objects_split_keys(self):
+        keys = _keys()
+        client = _MockListClient(keys)
+        lister = ShardedLister(client, limit=2, compact=True)
+        result = list(lister.iter_objects(models.ListObjectsV2Request(bucket='bucket', prefix='dir'),
+                                          split_keys=['dir1/key-03', 'dir2/key-01']))
+        self.assertEqual(sorted(k for k in keys if k.startswith('dir')), [o.key for o in result])
+        self.assertIsInstance(result[0], models.ObjectRecord)
+        self.assertEqual(3, len(lister.shards))
+        self.assertTrue(all(r.delimiter is None for r in client.requests))
+
+    def test_resume(self):
+        keys = _keys()
+        client = _MockListClient(keys)
+        lister = ShardedLister(client, limit=2, parallel_num=2)
+        listed = []
+        for obj in lister.iter_objects(models.ListObjectsV2Request(bucket='bucket')):
+            listed.append(obj.key)
+            if obj.key == 'dir2/key-03':
+                break
+        saved = json.dumps([s.to_dict() for s in lister.shards])
+        self.assertTrue(lister.shards[1].done)
+        self.assertFalse(lister.shards[2].done)
+        self.assertIsNotNone(lister.shards[2].continuation_token)
+
+        shards = [ListShard.from_dict(s) for s in json.loads(saved)]
+        client = _MockListClient(keys)
+        lister = ShardedLister(client, limit=2, parallel_num=2)
+        resumed = [o.key for o in lister.iter_objects(models.ListObjectsV2Request(bucket='bucket'), shards=shards)]
+        self.assertEqual(sorted(keys), sorted(set(listed + resumed)))
+        # the objects of the partly consumed page may be listed again, the others are not
+        self.assertLessEqual(len(listed) + len(resumed), len(keys) + 2)
+        self.assertNotIn('dir1/key-00', resumed)
+
+    def test_error(self):
+        client = _MockListClient(_keys(), fail_prefix='dir2/')
+        lister = ShardedLister(client, limit=2)
+        with self.assertRaises(exceptions.OperationError):
+            list(lister.iter_objects(models.ListObjectsV2Request(bucket='bucket')))
+        self.assertFalse(lister.shards[2].done)
+
+        with self.assertRaises(exceptions.ParamInvalidError):
+            ShardedLister(client, parallel_num=0)
@@ -0,0 +1,142 @@
+# pylint: skip-file
+"""Unit tests for alibabacloud_oss_v2.progress."""
+import unittest
+from unittest import mock
+
+from alibabacloud_oss_v2 import progress, defaults, io_utils
+from alibabacloud_oss_v2.progress import Progress, ThrottledProgress, ProgressStats
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestThrottledProgress(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = _Clock()
+        patcher = mock.patch.object(progress.time, 'monotonic', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.events = []
+
+    def _fn(self, *args):
+        self.events.append(args)
+
+    def test_time_interval(self):
+        p = ThrottledProgress(self._fn)
+        self.assertEqual(defaults.DEFAULT_PROGRESS_INTERVAL, p._time_interval)
+
+        written = 0
+        for _ in range(10):
+            written += 10
+            p(10, written, 1000)
+        self.assertEqual([], self.events)
+
+        self.clock.now += defaults.DEFAULT_PROGRESS_INTERVAL
+        written += 10
+        p(10, written, 1000)
+        self.assertEqual([(110, 110, 1000)], self.events)
+
+        # the completion is always reported
+        p(890, 1000, 1000)
+        self.assertEqual([(110, 110, 1000), (890, 1000, 1000)], self.events)
+
+    def test_bytes_and_percent_interval(self):
+        p = ThrottledProgress(self._fn, bytes_interval=300)
+        for i in range(1, 11):
+            p(100, i * 100, -1)
+        self.assertEqual([(300, 300, -1), (300, 600, -1), (300, 900, -1)], self.events)
+        p.flush()
+        self.assertEqual((100, 1000, -1), self.events[-1])
+        p.flush()
+        self.assertEqual(4, len(self.events))
+
+        self.events.clear()
+        p = ThrottledProgress(self._fn, percent_interval=25)
+        for i in range(1, 11):
+            p(100, i * 100, 1000)
+        self.assertEqual([300, 600, 900, 1000], [e[1] for e in self.events])
+        self.assertEqual(1000, sum(e[0] for e in self.events))
+
+    def test_with_stats(self):
+        p = ThrottledProgress(self._fn, bytes_interval=500, with_stats=True)
+        p(100, 100, 1000)
+        self.clock.now += 2.0
+        p(400, 500, 1000)
+        self.assertEqual(1, len(self.events))
+        increment, transferred, total, stats = self.events[0]
+        self.assertEqual((500, 500, 1000), (increment, transferred, total))
+        self.assertIsInstance(stats, ProgressStats)
+        self.assertEqual(2.0, stats.elapsed)
+        self.assertEqual(250.0, stats.rate)
+        self.assertEqual(2.0, stats.eta)
+
+        self.assertIsNone(ThrottledProgress(self._fn).stats.eta)
+
+    def test_restart(self):
+        p = ThrottledProgress(self._fn, bytes_interval=100)
+        p(100, 100, 200)
+        # the transfer is restarted, e.g. the request is retried
+        p(50, 50, 200)
+        p(150, 200, 200)
+        self.assertEqual([(100, 100, 200), (200, 200, 200)], self.events)
+
+    def test_with_progress_writer(self):
+        p = Progress(ThrottledProgress(self._fn, bytes_interval=4096), 10000)
+        for _ in range(10000 // 100):
+            p.write(b'x' * 100)
+        self.assertEqual([4100, 8200, 10000], [e[1] for e in self.events])
+
+
+class TestProgress(unittest.TestCase):
+
+    def setUp(self):
+        self.events = []
+
+    def _fn(self, *args):
+        self.events.append(args)
+
+    def test_every_write(self):
+        p = Progress(self._fn, 300)
+        for _ in range(3):
+            p.write(b'x' * 100)
+        self.assertEqual([(100, 100, 300), (100, 200, 300), (100, 300, 300)], self.events)
+
+    def test_flush_size(self):
+        p = Progress(self._fn, 1000, flush_size=300)
+        for _ in range(10):
+            p.write(b'x' * 100)
+        # the completion is always reported
+        self.assertEqual([(300, 300, 1000), (300, 600, 1000), (300, 900, 1000), (100, 1000, 1000)], self.events)
+
+        # the total is unknown
+        self.events.clear()
+        p = Progress(self._fn, -1, flush_size=300)
+        for _ in range(5):
+            p.write(b'x' * 100)
+        self.assertEqual([(300, 300, -1)], self.events)
+        p.flush()
+        self.assertEqual((200, 500, -1), self.events[-1])
+        p.flush()
+        self.assertEqual(2, len(self.events))
+
+    def test_flush_size_reset(self):
+        p = Progress(self._fn, 1000, flush_size=300)
+        for _ in range(4):
+            p.write(b'x' * 100)
+        # retried, the written bytes are not reported again
+        p.reset()
+        for _ in range(10):
+            p.write(b'x' * 100)
+        self.assertEqual([(300, 300, 1000), (300, 600, 1000), (300, 900, 1000), (100, 1000, 1000)], self.events)
+
+    def test_tee_iterator_flush(self):
+        p = Progress(self._fn, -1, flush_size=300)
+        body = io_utils.TeeIterator.from_source(iter([b'x' * 100] * 5), [p])
+        self.assertEqual(b'x' * 500, b''.join(body))
+        self.assertEqual([(300, 300, -1), (200, 500, -1)], self.events)
@@ -67,8 +67,11 @@ class HttpResponseStub(HttpResponse):
     def read(self) -> bytes:
         return self.content
 
-    def iter_bytes(self):
-        return iter([])
+    def iter_bytes(self, **kwargs):
+        data = self._data.encode() if isinstance(self._data, str) else self._data
+        if not data:
+            return iter([])
+        return iter(data[i:i + 4096] for i in range(0, len(data), 4096))
 
 
 class TestSerdeXml(unittest.TestCase):
@@ -2070,3 +2073,237 @@ class TestSerdeUtils(unittest.TestCase):
         self.assertEqual(1234, result.file_size)
         self.assertEqual('object-123', result.key)
         self.assertEqual('ok', result.process_status)
+
+
+class TestSerdePlan(unittest.TestCase):
+    def test_xml_plan_cached(self):
+        class Item(serde.Model):
+            _attribute_map = {
+                "name": {"tag": "xml", "rename": "Name"},
+                "size": {"tag": "xml", "rename": "Size", "type": "int"},
+            }
+
+            def __init__(self, name: Optional[str] = None, size: Optional[int] = None, **kwargs):
+                super().__init__(**kwargs)
+                self.name = name
+                self.size = size
+
+        class Listing(serde.Model):
+            _attribute_map = {
+                "items": {"tag": "xml", "rename": "Items/Item", "type": "[Item]"},
+                "marker": {"tag": "xml", "rename": "Marker"},
+                "modified": {"tag": "xml", "rename": "Modified", "type": "datetime"},
+                "truncated": {"tag": "xml", "rename": "IsTruncated", "type": "bool"},
+            }
+            _dependency_map = {
+                "Item": {"new": lambda: Item()},
+            }
+
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.items = None
+                self.marker = None
+                self.modified = None
+                self.truncated = None
+
+        xml_data = ('<Listing><Items><Item><Name>a</Name><Size>1</Size></Item>'
+                    '<Item><Name>b</Name><Size></Size></Item></Items>'
+                    '<Marker></Marker><Modified>2024-01-02T03:04:05.000Z</Modified>'
+                    '<IsTruncated>true</IsTruncated></Listing>')
+
+        for _ in range(2):
+            result = Listing()
+            serde.deserialize_xml(xml_data, result, expect_tag='Listing')
+            self.assertEqual(2, len(result.items))
+            self.assertEqual('a', result.items[0].name)
+            self.assertEqual(1, result.items[0].size)
+            self.assertEqual('b', result.items[1].name)
+            self.assertIsNone(result.items[1].size)
+            self.assertIsNone(result.marker)
+            self.assertEqual(datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc), result.modified)
+            self.assertTrue(result.truncated)
+
+        plan = serde._PLANS[Listing]['xml']
+        self.assertIs(Listing._attribute_map, plan[0])
+        self.assertEqual(['items', 'marker', 'modified', 'truncated'], [p[0] for p in plan[1]])
+        self.assertIn(Item, serde._PLANS)
+
+        serde.deserialize_xml(xml_data, Listing(), expect_tag='Listing')
+        self.assertIs(plan, serde._PLANS[Listing]['xml'])
+
+        # a replaced attribute map is compiled again
+        Listing._attribute_map = {
+            "marker": {"tag": "xml", "rename": "IsTruncated"},
+        }
+        result = Listing()
+        serde.deserialize_xml(xml_data, result, expect_tag='Listing')
+        self.assertEqual('true', result.marker)
+        self.assertIsNone(result.items)
+
+    def test_xml_plan_errors_on_use(self):
+        class Listing(serde.Model):
+            _attribute_map = {
+                "unknown": {"tag": "xml", "rename": "Unknown", "type": "UnknownModel"},
+                "value": {"tag": "xml", "rename": "Value", "type": "decimal"},
+            }
+
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.unknown = None
+                self.value = None
+
+        # the elements are absent, nothing is converted
+        serde.deserialize_xml('<Listing></Listing>', Listing())
+
+        with self.assertRaises(exceptions.DeserializationError) as err:
+            serde.deserialize_xml('<Listing><Unknown></Unknown></Listing>', Listing())
+        self.assertIn('Can not create object with UnknownModel type', str(err.exception))
+
+        with self.assertRaises(exceptions.DeserializationError) as err:
+            serde.deserialize_xml('<Listing><Value>1.0</Value></Listing>', Listing())
+        self.assertIn('Unsupport type decimal', str(err.exception))
+
+    def test_input_and_headers_plan_cached(self):
+        class PutApiRequest(serde.RequestModel):
+            _attribute_map = {
+                "bucket": {"tag": "input", "position": "host", "required": True},
+                "acl": {"tag": "input", "position": "header", "rename": "x-oss-acl"},
+                "max_keys": {"tag": "input", "position": "query", "rename": "max-keys", "type": "int"},
+            }
+
+            def __init__(self, bucket=None, acl=None, max_keys=None, **kwargs):
+                super().__init__(**kwargs)
+                self.bucket = bucket
+                self.acl = acl
+                self.max_keys = max_keys
+
+        class PutApiResult(serde.ResultModel):
+            _attribute_map = {
+                "size": {"tag": "output", "position": "header", "rename": "x-oss-size", "type": "int"},
+                "meta": {"tag": "output", "position": "header", "rename": "x-oss-meta-", "type": "dict"},
+            }
+
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.size = None
+                self.meta = None
+
+        for _ in range(2):
+            op_input = serde.serialize_input(
+                PutApiRequest(bucket='bucket', acl='private', max_keys=10),
+                OperationInput(op_name='PutApi', method='PUT'))
+            self.assertEqual('private', op_input.headers.get('x-oss-acl'))
+            self.assertEqual('10', op_input.parameters.get('max-keys'))
+
+            with self.assertRaises(exceptions.ParamRequiredError):
+                serde.serialize_input(PutApiRequest(), OperationInput(op_name='PutApi', method='PUT'))
+
+            result = PutApiResult()
+            serde.deserialize_output_headers(result, OperationOutput(
+                status='OK', status_code=200,
+                headers=CaseInsensitiveDict({'x-oss-size': '123', 'x-oss-meta-key': 'value'})))
+            self.assertEqual(123, result.size)
+            self.assertEqual('value', result.meta.get('key'))
+
+        self.assertIn('input', serde._PLANS[PutApiRequest])
+        self.assertIn('headers', serde._PLANS[PutApiResult])
+
+    def test_iter_deserialize_xml(self):
+        class Item(serde.Model):
+            _attribute_map = {
+                "name": {"tag": "xml", "rename": "Name"},
+                "size": {"tag": "xml", "rename": "Size", "type": "int"},
+            }
+
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.name = None
+                self.size = None
+
+        class Listing(serde.Model):
+            _attribute_map = {
+                "name": {"tag": "xml", "rename": "Name"},
+                "items": {"tag": "xml", "rename": "Item", "type": "[Item]"},
+                "groups": {"tag": "xml", "rename": "Groups/Group", "type": "[str]"},
+                "marker": {"tag": "xml", "rename": "Marker"},
+                "count": {"tag": "xml", "rename": "Count", "type": "int"},
+            }
+            _dependency_map = {
+                "Item": {"new": lambda: Item()},
+            }
+
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.name = None
+                self.items = None
+                self.groups = None
+                self.marker = None
+                self.count = None
+
+        xml_data = ('<?xml version="1.0" encoding="UTF-8"?><Listing><Name>first</Name><Name>second</Name>'
+                    + ''.join(f'<Item><Name>item-{i}</Name><Size>{i}</Size></Item>' for i in range(50))
+                    + '<Groups><Group>a</Group><Group>b</Group></Groups><Groups><Group>c</Group></Groups>'
+                    '<Unknown><Name>x</Name></Unknown><Marker></Marker><Count>50</Count></Listing>').encode()
+
+        expect = Listing()
+        serde.deserialize_xml(xml_data, expect, expect_tag='Listing')
+        self.assertEqual('first', expect.name)
+        self.assertEqual(50, len(expect.items))
+        self.assertEqual(['a', 'b', 'c'], expect.groups)
+
+        for size in [1, 7, 64, len(xml_data)]:
+            chunks = [xml_data[i:i + size] for i in range(0, len(xml_data), size)]
+            result = Listing()
+            serde.deserialize_xml_stream(chunks, result, expect_tag='Listing')
+            self.assertEqual(expect, result)
+
+        # streamed items are yielded in order and not stored
+        result = Listing()
+        gen = serde.iter_deserialize_xml(iter([xml_data[:200], xml_data[200:]]), result, stream_attrs=['items'])
+        attr, item = next(gen)
+        self.assertEqual('items', attr)
+        self.assertEqual('item-0', item.name)
+        self.assertIsNone(result.count)
+        items = [item] + [item for _, item in gen]
+        self.assertEqual(expect.items, items)
+        self.assertIsNone(result.items)
+        self.assertEqual(['a', 'b', 'c'], result.groups)
+        self.assertEqual(50, result.count)
+
+        with self.assertRaises(exceptions.DeserializationError) as err:
+            serde.deserialize_xml_stream([xml_data], Listing(), expect_tag='Other')
+        self.assertIn('Expect root tag is Other, gots Listing', str(err.exception))
+
+        with self.assertRaises(ET.ParseError):
+            serde.deserialize_xml_stream([xml_data[:-5]], Listing())
+
+    def test_deserialize_output_xmlbody_stream(self):
+        class Listing(serde.ResultModel):
+            _attribute_map = {
+                "names": {"tag": "xml", "rename": "Name", "type": "[str]"},
+            }
+            _xml_map = {
+                "name": "Listing"
+            }
+
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.names = None
+
+        xml_data = '<Listing>' + ''.join(f'<Name>name-{i}</Name>' for i in range(20000)) + '</Listing>'
+        op_output = OperationOutput(
+            status='OK',
+            status_code=200,
+            http_response=HttpResponseStub(data=xml_data)
+        )
+        result = serde.deserialize_output_xmlbody_stream(Listing(), op_output)
+        self.assertEqual(20000, len(result.names))
+        self.assertEqual('name-19999', result.names[-1])
+
+        op_output = OperationOutput(
+            status='OK',
+            status_code=200,
+            http_response=HttpResponseStub(data='')
+        )
+        result = serde.deserialize_output_xmlbody_stream(Listing(), op_output)
+        self.assertIsNone(result.names)
@@ -0,0 +1,68 @@
+# pylint: skip-file
+"""Unit tests for alibabacloud_oss_v2.tuner."""
+import unittest
+from unittest import mock
+
+from alibabacloud_oss_v2 import exceptions, defaults
+from alibabacloud_oss_v2.tuner import TransferTuner, is_throttling_error
+
+
+def _service_error(status_code, code):
+    return exceptions.ServiceError(
+        status_code=status_code, code=code, message='', request_id='id',
+        ec='', timestamp='', request_target='')
+
+
+class TestTransferTuner(unittest.TestCase):
+
+    def _run_round(self, tuner, clock, seconds, size, latency, error=None):
+        with mock.patch('alibabacloud_oss_v2.tuner.time.monotonic', return_value=clock + seconds):
+            for _ in range(tuner.parallel_num):
+                tuner.record(size, latency, error)
+        return clock + seconds
+
+    def test_grow_and_shrink_parallel(self):
+        with mock.patch('alibabacloud_oss_v2.tuner.time.monotonic', return_value=0.0):
+            tuner = TransferTuner(parallel_num=2, part_size=1024, tune_part_size=False)
+
+        clock = self._run_round(tuner, 0.0, 1.0, 1000, 2.0)
+        self.assertEqual(3, tuner.parallel_num)
+        self.assertEqual('throughput increased', tuner.decisions[-1].reason)
+
+        # same bytes per round in the same time -> lower throughput per round
+        clock = self._run_round(tuner, clock, 2.0, 500, 2.0)
+        self.assertEqual(2, tuner.parallel_num)
+        self.assertEqual('throughput decreased', tuner.decisions[-1].reason)
+        self.assertEqual(1024, tuner.part_size)
+
+    def test_throttled_halves_parallel(self):
+        with mock.patch('alibabacloud_oss_v2.tuner.time.monotonic', return_value=0.0):
+            tuner = TransferTuner(parallel_num=8, part_size=1024, tune_part_size=False)
+        self._run_round(tuner, 0.0, 1.0, 1000, 2.0,
+                        exceptions.OperationError(name='UploadPart', error=_service_error(503, 'SlowDown')))
+        self.assertEqual(4, tuner.parallel_num)
+        self.assertEqual('throttled', tuner.decisions[-1].reason)
+
+    def test_tune_part_size(self):
+        with mock.patch('alibabacloud_oss_v2.tuner.time.monotonic', return_value=0.0):
+            tuner = TransferTuner(parallel_num=1, part_size=1024, max_parallel_num=1, max_part_size=4096)
+
+        clock = self._run_round(tuner, 0.0, 0.1, 1024, 0.1)
+        self.assertEqual(2048, tuner.part_size)
+        clock = self._run_round(tuner, clock, 0.1, 2048, 0.1)
+        self.assertEqual(4096, tuner.part_size)
+        clock = self._run_round(tuner, clock, 0.1, 4096, 0.1)
+        self.assertEqual(4096, tuner.part_size)
+
+        slow = defaults.DEFAULT_AUTO_TUNE_MAX_PART_LATENCY + 1
+        clock = self._run_round(tuner, clock, slow, 4096, slow)
+        clock = self._run_round(tuner, clock, slow, 4096, slow)
+        clock = self._run_round(tuner, clock, slow, 4096, slow)
+        self.assertEqual(1024, tuner.part_size)
+
+    def test_is_throttling_error(self):
+        self.assertTrue(is_throttling_error(_service_error(503, 'ServiceUnavailable')))
+        self.assertTrue(is_throttling_error(_service_error(429, 'TooManyRequests')))
+        self.assertTrue(is_throttling_error(_service_error(400, 'SlowDown')))
+        self.assertFalse(is_throttling_error(_service_error(404, 'NoSuchKey')))
+        self.assertFalse(is_throttling_error(ValueError('error')))
@@ -1,14 +1,23 @@
 # pylint: skip-file
 """Unit tests for alibabacloud_oss_v2.uploader.
 """
+import base64
 import io
+import json
 import os
 import shutil
 import tempfile
+import threading
 import unittest
+from urllib.parse import urlsplit, parse_qs
 
-from alibabacloud_oss_v2 import models, defaults
+from alibabacloud_oss_v2 import models, defaults, config, credentials, client, retry
+from alibabacloud_oss_v2.types import HttpClient
 from alibabacloud_oss_v2.uploader import Uploader, UploadAPIClient, UploadError, _UploaderDelegate
+from alibabacloud_oss_v2.encryption_client import EncryptionClient
+from alibabacloud_oss_v2.crypto import MasterCipher, CipherData
+from alibabacloud_oss_v2.crypto.aes_ctr import _AesCtr
+from . import MockHttpResponse
 
 
 def _make_result(cls, **kwargs):
@@ -374,3 +383,314 @@ class TestUploaderIterUploadedPartError(unittest.TestCase):
         self.assertIsNone(delegate._upload_id)
         self.assertEqual([], delegate._uploaded_parts)
         self.assertIsNone(delegate._part_number)
+
+
+class TestUploaderPartWindow(unittest.TestCase):
+    """Tests the bounded part window of the parallel multipart upload."""
+
+    PART_SIZE = 1024
+
+    class _CountingStream:
+        """A non-seekable stream that records how many parts are read ahead of the uploads."""
+
+        def __init__(self, data, client):
+            self._buf = io.BytesIO(data)
+            self._client = client
+            self.max_outstanding = 0
+
+        def read(self, n=-1):
+            d = self._buf.read(n)
+            if d:
+                outstanding = self._client.read_parts - self._client.upload_part_calls + 1
+                self.max_outstanding = max(self.max_outstanding, outstanding)
+                self._client.read_parts += 1
+            return d
+
+    def _new_client(self, **kwargs):
+        client = _MockUploadClient(**kwargs)
+        client.read_parts = 0
+        return client
+
+    def test_non_seekable_stream_reads_in_window(self):
+        client = self._new_client()
+        uploader = Uploader(client, part_size=self.PART_SIZE, parallel_num=3)
+        stream = self._CountingStream(b'\xcd' * (self.PART_SIZE * 20 + 10), client)
+
+        progress = []
+        request = models.PutObjectRequest(
+            bucket='test-bucket', key='test-key',
+            progress_fn=lambda n, written, total: progress.append(written))
+        result = uploader.upload_from(request, stream)
+
+        self.assertEqual('"final-etag"', result.etag)
+        self.assertEqual(21, client.upload_part_calls)
+        self.assertLessEqual(stream.max_outstanding, 3)
+        self.assertEqual(sorted(progress), progress)
+        self.assertEqual(self.PART_SIZE * 20 + 10, progress[-1])
+
+    def test_stop_scheduling_after_part_fails(self):
+        client = self._new_client(fail_after_n_parts=2)
+        uploader = Uploader(client, part_size=self.PART_SIZE, parallel_num=3)
+        stream = self._CountingStream(b'\xcd' * (self.PART_SIZE * 50), client)
+
+        request = models.PutObjectRequest(bucket='test-bucket', key='test-key')
+        with self.assertRaises(UploadError):
+            uploader.upload_from(request, stream)
+
+        self.assertLess(client.read_parts, 10)
+        self.assertEqual(0, client.complete_calls)
+        self.assertEqual(1, client.abort_calls)
+
+
+class _ThrottlingHttpClient(HttpClient):
+    """Serves a multipart upload, the first attempt of the first parts is throttled with 503 SlowDown."""
+
+    def __init__(self, throttled_parts):
+        super().__init__()
+        self._throttled_parts = throttled_parts
+        self._lock = threading.Lock()
+        self._seen = set()
+        self.throttled = 0
+
+    def send(self, request, **kwargs):
+        query = parse_qs(urlsplit(request.url).query, keep_blank_values=True)
+        status_code = 200
+        headers = {'x-oss-request-id': 'id-1234', 'Date': 'Fri, 24 Feb 2017 03:15:40 GMT'}
+        body = b''
+        if request.method == 'POST' and 'uploads' in query:
+            body = (b'<InitiateMultipartUploadResult><Bucket>test-bucket</Bucket><Key>test-key</Key>'
+                    b'<UploadId>upload-id</UploadId></InitiateMultipartUploadResult>')
+        elif request.method == 'PUT' and 'partNumber' in query:
+            part_number = int(query['partNumber'][0])
+            with self._lock:
+                throttle = part_number <= self._throttled_parts and part_number not in self._seen
+                self._seen.add(part_number)
+                if throttle:
+                    self.throttled += 1
+            if throttle:
+                status_code = 503
+                headers['Content-Type'] = 'application/xml'
+                body = b'<Error><Code>SlowDown</Code><Message>Please reduce your request rate.</Message></Error>'
+            else:
+                headers['ETag'] = f'"etag-{part_number}"'
+        elif request.method == 'POST':
+            body = (b'<CompleteMultipartUploadResult><Bucket>test-bucket</Bucket><Key>test-key</Key>'
+                    b'<ETag>"final-etag"</ETag></CompleteMultipartUploadResult>')
+        elif request.method == 'DELETE':
+            status_code = 204
+        response = MockHttpResponse(status_code=status_code, reason='OK', headers=headers, body=body)
+        response._request = request
+        return response
+
+    def open(self):
+        return
+
+    def close(self):
+        return
+
+
+class TestUploaderAutoTune(unittest.TestCase):
+    """Tests the multipart upload with auto tuning."""
+
+    def test_upload_with_auto_tune(self):
+        part_size = 1024
+        data = os.urandom(part_size * 40 + 7)
+        client = _MockUploadClient()
+        bodies = {}
+        upload_part = client.upload_part
+
+        def _upload_part(request, **kwargs):
+            bodies[request.part_number] = request.body.read()
+            return upload_part(request, **kwargs)
+        client.upload_part = _upload_part
+
+        uploader = Uploader(client, part_size=part_size, parallel_num=1, auto_tune=True)
+        request = models.PutObjectRequest(bucket='test-bucket', key='test-key')
+        result = uploader.upload_from(request, io.BytesIO(data))
+
+        self.assertEqual('"final-etag"', result.etag)
+        self.assertEqual(data, b''.join(bodies[i] for i in sorted(bodies)))
+        self.assertGreater(len(result.tune_decisions), 0)
+        self.assertGreater(result.tune_decisions[-1].part_size, part_size)
+        self.assertLess(len(bodies), 41)
+
+    def test_upload_throttled_attempts(self):
+        # the first attempt of the first parts is throttled, the retries succeed
+        http_client = _ThrottlingHttpClient(throttled_parts=4)
+        cfg = config.load_default()
+        cfg.region = 'cn-hangzhou'
+        cfg.credentials_provider = credentials.AnonymousCredentialsProvider()
+        cfg.http_client = http_client
+        cfg.retryer = retry.StandardRetryer(backoff_delayer=retry.FixedDelayBackoff(0.001))
+        c = client.Client(cfg)
+
+        uploader = Uploader(c, part_size=1024, parallel_num=4, auto_tune=True)
+        request = models.PutObjectRequest(bucket='test-bucket', key='test-key')
+        result = uploader.upload_from(request, io.BytesIO(b'\x00' * 1024 * 16))
+
+        self.assertEqual('"final-etag"', result.etag)
+        self.assertEqual(4, http_client.throttled)
+        self.assertEqual('throttled', result.tune_decisions[0].reason.split(', ')[0])
+        self.assertEqual(2, result.tune_decisions[0].parallel_num)
+
+    def test_no_tune_decisions_by_default(self):
+        client = _MockUploadClient()
+        uploader = Uploader(client, part_size=1024, parallel_num=2)
+        request = models.PutObjectRequest(bucket='test-bucket', key='test-key')
+        result = uploader.upload_from(request, io.BytesIO(b'\x00' * 4096))
+        self.assertEqual([], result.tune_decisions)
+
+
+class TestUploaderEncryptionClient(unittest.TestCase):
+    """Tests the multipart upload with EncryptionClient."""
+
+    PART_SIZE = 1000
+
+    class _ReverseMasterCipher(MasterCipher):
+        def encrypt(self, data):
+            return data[::-1]
+
+        def decrypt(self, data):
+            return data[::-1]
+
+        def get_wrap_algorithm(self):
+            return 'RSA/NONE/PKCS1Padding'
+
+        def get_mat_desc(self):
+            return ''
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp(prefix='oss-uploader-test-')
+        self._cp_arg = os.path.join(self.workdir, '_placeholder')
+        self.data = os.urandom(self.PART_SIZE * 10 + 7)
+        self.filepath = os.path.join(self.workdir, 'data.bin')
+        with open(self.filepath, 'wb') as f:
+            f.write(self.data)
+        self.request = models.PutObjectRequest(bucket='mock-bucket', key='mock-key')
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def _new_eclient(self, mock_client):
+        cfg = config.load_default()
+        cfg.region = 'cn-hangzhou'
+        cfg.credentials_provider = credentials.AnonymousCredentialsProvider()
+        c = client.Client(cfg)
+        for name in ['initiate_multipart_upload', 'complete_multipart_upload',
+                     'abort_multipart_upload', 'list_parts', 'put_object']:
+            setattr(c, name, getattr(mock_client, name))
+
+        mock_client.bodies = {}
+        mock_client.headers = {}
+        mock_client.init_requests = []
+        upload_part = mock_client.upload_part
+        initiate_multipart_upload = mock_client.initiate_multipart_upload
+
+        def _upload_part(request, **kwargs):
+            body = request.body
+            mock_client.bodies[request.part_number] = body if isinstance(body, bytes) else body.read()
+            mock_client.headers[request.part_number] = dict(request.headers)
+            return upload_part(request, **kwargs)
+
+        def _initiate_multipart_upload(request, **kwargs):
+            mock_client.init_requests.append(request)
+            return initiate_multipart_upload(request, **kwargs)
+
+        c.upload_part = _upload_part
+        c.initiate_multipart_upload = _initiate_multipart_upload
+        return EncryptionClient(c, self._ReverseMasterCipher())
+
+    def _decrypt(self, mock_client, bodies):
+        request = mock_client.init_requests[0]
+        key = base64.b64decode(request.headers['x-oss-meta-client-side-encryption-key'])[::-1]
+        iv = base64.b64decode(request.headers['x-oss-meta-client-side-encryption-start'])[::-1]
+        cd = CipherData(iv=iv, key=key, encrypted_iv=b'', encrypted_key=b'',
+                        mat_desc='', wrap_algorithm='', cek_algorithm='')
+        return _AesCtr(cd, 0).decrypt(b''.join(bodies[i] for i in sorted(bodies)))
+
+    def test_upload_file_parallel(self):
+        mock_client = _MockUploadClient()
+        eclient = self._new_eclient(mock_client)
+        uploader = Uploader(eclient, part_size=self.PART_SIZE, parallel_num=3)
+
+        result = uploader.upload_file(self.request, self.filepath)
+        self.assertEqual('"final-etag"', result.etag)
+
+        init = mock_client.init_requests[0]
+        self.assertEqual(1008, init.cse_part_size)
+        self.assertEqual(len(self.data), init.cse_data_size)
+        self.assertEqual(10, len(mock_client.bodies))
+        self.assertTrue(all(len(mock_client.bodies[i]) == 1008 for i in range(1, 10)))
+        self.assertTrue(all(h['x-oss-meta-client-side-encryption-part-size'] == '1008'
+                            for h in mock_client.headers.values()))
+        self.assertNotEqual(self.data, b''.join(mock_client.bodies[i] for i in sorted(mock_client.bodies)))
+        self.assertEqual(self.data, self._decrypt(mock_client, mock_client.bodies))
+
+    def test_upload_from_stream(self):
+        mock_client = _MockUploadClient()
+        eclient = self._new_eclient(mock_client)
+        uploader = Uploader(eclient, part_size=1024, parallel_num=2, auto_tune=True)
+
+        result = uploader.upload_from(self.request, _NonSeekableStream(self.data))
+        self.assertEqual('"final-etag"', result.etag)
+
+        init = mock_client.init_requests[0]
+        self.assertEqual(1024, init.cse_part_size)
+        self.assertIsNone(init.cse_data_size)
+        self.assertTrue(all(len(mock_client.bodies[i]) == 1024 for i in sorted(mock_client.bodies)[:-1]))
+        self.assertEqual(self.data, self._decrypt(mock_client, mock_client.bodies))
+
+    def test_resume_with_checkpoint(self):
+        mock_client = _MockUploadClient(fail_after_n_parts=2)
+        eclient = self._new_eclient(mock_client)
+        uploader = Uploader(eclient, part_size=self.PART_SIZE, parallel_num=1,
+                            enable_checkpoint=True, checkpoint_dir=self._cp_arg)
+        with self.assertRaises(UploadError):
+            uploader.upload_file(self.request, self.filepath)
+
+        ucp_files = [n for n in os.listdir(self.workdir) if n.endswith('.ucp')]
+        with open(os.path.join(self.workdir, ucp_files[0]), 'rb') as f:
+            cse_context = json.loads(f.read())['Data']['UploadInfo']['CseContext']
+        self.assertEqual(1008, cse_context['PartSize'])
+        self.assertNotIn('Key', cse_context)
+
+        phase1_bodies = {n: mock_client.bodies[n] for n in [1, 2]}
+        parts = [models.Part(part_number=n, etag=f'"p{n}"', size=1008) for n in [1, 2]]
+        mock_client2 = _MockUploadClient(list_parts_pages=[parts])
+        eclient2 = self._new_eclient(mock_client2)
+        uploader2 = Uploader(eclient2, part_size=self.PART_SIZE, parallel_num=3,
+                             enable_checkpoint=True, checkpoint_dir=self._cp_arg)
+        result = uploader2.upload_file(self.request, self.filepath)
+
+        self.assertEqual('"final-etag"', result.etag)
+        self.assertEqual(0, mock_client2.initiate_calls)
+        self.assertEqual(list(range(3, 11)), sorted(mock_client2.bodies))
+        bodies = dict(phase1_bodies)
+        bodies.update(mock_client2.bodies)
+        self.assertEqual(self.data, self._decrypt(mock_client, bodies))
+
+    def test_resume_without_envelope(self):
+        mock_client = _MockUploadClient(fail_after_n_parts=2)
+        uploader = Uploader(mock_client, part_size=1008, parallel_num=1,
+                            enable_checkpoint=True, checkpoint_dir=self._cp_arg)
+        with self.assertRaises(UploadError):
+            uploader.upload_file(self.request, self.filepath)
+
+        # the checkpoint of the plain upload can not be resumed by EncryptionClient
+        parts = [models.Part(part_number=n, etag=f'"p{n}"', size=1008) for n in [1, 2]]
+        mock_client2 = _MockUploadClient(list_parts_pages=[parts])
+        eclient2 = self._new_eclient(mock_client2)
+        uploader2 = Uploader(eclient2, part_size=1008, parallel_num=1,
+                             enable_checkpoint=True, checkpoint_dir=self._cp_arg)
+        uploader2.upload_file(self.request, self.filepath)
+        self.assertEqual(1, mock_client2.initiate_calls)
+        self.assertEqual(0, mock_client2.list_parts_calls)
+        self.assertEqual(self.data, self._decrypt(mock_client2, mock_client2.bodies))
+
+
+class _NonSeekableStream:
+    def __init__(self, data):
+        self._buf = io.BytesIO(data)
+
+    def read(self, n=-1):
+        return self._buf.read(n)
@@ -1,5 +1,10 @@
+import socket
+import time
 import unittest
-from alibabacloud_oss_v2.transport.requests_client import convert_proxy_host
+from unittest import mock
+import requests
+import alibabacloud_oss_v2 as oss
+from alibabacloud_oss_v2.transport.requests_client import convert_proxy_host, RequestsHttpClient
 from alibabacloud_oss_v2 import exceptions
 
 
@@ -32,3 +37,105 @@ class TestRequestsClient(unittest.TestCase):
         with self.assertRaises(exceptions.RequestError) as cm:
             convert_proxy_host(12345)
         self.assertIn("proxy_host must be str or dict", str(cm.exception))
+
+
+class TestRequestsClientPool(unittest.TestCase):
+    def test_pool_settings(self):
+        client = RequestsHttpClient(max_connections=8, pool_block=True,
+                                    idle_connection_timeout=5, keep_alive_timeout=12)
+        client.open()
+        adapter = client.adapter
+        self.assertEqual(8, adapter._pool_maxsize)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(8, adapter.poolmanager.connection_pool_kw['maxsize'])
+        options = adapter.poolmanager.connection_pool_kw['socket_options']
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), options)
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            self.assertIn((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 12), options)
+        client.close()
+
+    def test_idle_connection_timeout(self):
+        client = RequestsHttpClient(idle_connection_timeout=5)
+        client.open()
+        adapter = client.adapter
+
+        def _get_pool(url):
+            return adapter.get_connection_with_tls_context(requests.Request('GET', url).prepare(), True)
+
+        pool_a = _get_pool('http://a.example.com/')
+        pool_b = _get_pool('http://b.example.com/')
+        self.assertIsNot(pool_a, pool_b)
+        conn_a = mock.MagicMock()
+        conn_b = mock.MagicMock()
+        # the connections are released to the pools after use
+        for pool, conn in [(pool_a, conn_a), (pool_b, conn_b)]:
+            pool.pool.get(block=False)
+            pool._put_conn(conn)
+
+        self.assertIs(pool_a, _get_pool('http://a.example.com/'))
+        conn_a.close.assert_not_called()
+
+        # only the connections of the idle endpoint are dropped
+        adapter._last_used[pool_a] = time.monotonic() - 6
+        self.assertIs(pool_a, _get_pool('http://a.example.com/'))
+        conn_a.close.assert_called_once()
+        conn_b.close.assert_not_called()
+        self.assertEqual(adapter._pool_maxsize, pool_a.pool.qsize())
+        self.assertIsNone(pool_a.pool.get(block=False))
+        client.close()
+
+    def test_reserve_connections(self):
+        client = RequestsHttpClient(max_connections=4)
+        client.reserve_connections(2)
+        self.assertEqual(4, client.max_connections)
+
+        client.open()
+        adapter = client.adapter
+        poolmanager = adapter.poolmanager
+        pool = poolmanager.connection_from_url('http://a.example.com/')
+        proxy_manager = adapter.proxy_manager_for('http://proxy.example.com:8080')
+        with mock.patch.object(poolmanager, 'clear') as clear:
+            client.reserve_connections(10)
+            clear.assert_not_called()
+        self.assertEqual(10, client.max_connections)
+        self.assertIs(poolmanager, adapter.poolmanager)
+        self.assertEqual(10, poolmanager.connection_pool_kw['maxsize'])
+        self.assertIn('socket_options', poolmanager.connection_pool_kw)
+        self.assertEqual(10, proxy_manager.connection_pool_kw['maxsize'])
+        # the pool in use is resized in place
+        self.assertEqual(10, pool.pool.maxsize)
+        self.assertEqual(10, pool.pool.qsize())
+        self.assertEqual(10, adapter.proxy_manager_for('http://proxy2.example.com:8080').connection_pool_kw['maxsize'])
+        client.close()
+
+        # the pool is given by user
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=4)
+        client = RequestsHttpClient(adapter=adapter, max_connections=4)
+        with self.assertWarns(RuntimeWarning):
+            client.reserve_connections(10)
+        self.assertEqual(4, client.max_connections)
+
+    def test_reserve_connections_by_transfer_managers(self):
+        cfg = oss.config.Config(
+            region='cn-hangzhou',
+            credentials_provider=oss.credentials.AnonymousCredentialsProvider(),
+        )
+        client = oss.Client(cfg)
+        http_client = client._client._options.http_client
+        self.assertEqual(20, http_client.max_connections)
+
+        uploader = client.uploader(parallel_num=10)
+        uploader._delegate(oss.PutObjectRequest(bucket='bucket', key='key'))
+        self.assertEqual(20, http_client.max_connections)
+
+        uploader = client.uploader(parallel_num=32)
+        uploader._delegate(oss.PutObjectRequest(bucket='bucket', key='key'))
+        self.assertEqual(32, http_client.max_connections)
+
+        downloader = client.downloader(parallel_num=40)
+        downloader._delegate(oss.GetObjectRequest(bucket='bucket', key='key'))
+        self.assertEqual(40, http_client.max_connections)
+
+        copier = client.copier(parallel_num=48)
+        copier._delegate(oss.CopyObjectRequest(bucket='bucket', key='key', source_key='src'))
+        self.assertEqual(48, http_client.max_connections)